@@ -39,6 +39,7 @@ import tokenize
 import keyword
 import builtins
 from collections import defaultdict, Counter
+from collections.abc import Sequence
 import statistics
 
 # Project root setup
@@ -173,6 +174,125 @@ class SemanticMode(Enum):
     AGGRESSIVE = "aggressive"      # More speculative improvements
 
 
+# =============================================================================
+# Single-Pass File Model
+# =============================================================================
+
+# Fields holding the nested statements of compound statements
+_BLOCK_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _header_end(node: ast.AST) -> int:
+    """Last line owned by ``node`` itself (compound statements: header only)."""
+    first_child = None
+    for field_name in _BLOCK_FIELDS:
+        for child in getattr(node, field_name, None) or ():
+            line = getattr(child, "lineno", None) or getattr(getattr(child, "pattern", None), "lineno", None)
+            if line is not None and (first_child is None or line < first_child):
+                first_child = line
+    if first_child is None:
+        return getattr(node, "end_lineno", None) or node.lineno
+    return max(node.lineno, first_child - 1)
+
+
+class LineWindow(Sequence):
+    """Read-only window over the shared line list (no per-line copies)."""
+    
+    __slots__ = ("_lines", "_start", "_stop")
+    
+    def __init__(self, lines: List[str], start: int, stop: int):
+        self._lines = lines
+        self._start = start
+        self._stop = stop
+    
+    def __len__(self) -> int:
+        return self._stop - self._start
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._lines[self._start + i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line window index out of range")
+        return self._lines[self._start + index]
+    
+    def __repr__(self) -> str:
+        return f"LineWindow({self[:]!r})"
+
+
+@dataclass
+class FileModel:
+    """
+    Everything the line analyzer needs about a file, built with one AST walk.
+    
+    ``line_nodes[n]`` is the innermost statement owning line ``n`` (compound
+    statements own only their header lines; expression statements are
+    unwrapped to their value), so every line of a multi-line statement maps
+    to it. ``context`` is the file-level context shared by all lines.
+    """
+    file_path: str
+    lines: List[str]
+    ast_tree: Optional[ast.AST]
+    line_nodes: List[Optional[ast.AST]]
+    imports: List[str]
+    classes: List[str]
+    functions: List[ast.FunctionDef]
+    context: Dict[str, Any]
+    
+    @classmethod
+    def build(cls, file_path: str, content: str, ast_tree: Optional[ast.AST] = None) -> "FileModel":
+        lines = content.splitlines()
+        line_nodes: List[Optional[ast.AST]] = [None] * (len(lines) + 2)
+        classes: List[str] = []
+        functions: List[ast.FunctionDef] = []
+        
+        if ast_tree is not None:
+            # BFS visits parents before children, so with "first claim wins"
+            # a header line shared with its body (``if x: return y``) keeps the
+            # outer statement; other statement spans are disjoint.
+            for node in ast.walk(ast_tree):
+                if isinstance(node, ast.ClassDef):
+                    classes.append(node.name)
+                elif isinstance(node, ast.FunctionDef):
+                    functions.append(node)
+                if not isinstance(node, (ast.stmt, ast.excepthandler)):
+                    continue
+                owner = node.value if isinstance(node, ast.Expr) else node
+                end = min(_header_end(node), len(lines))
+                # Comments/blank lines between a header and its body are not the header's
+                while end > node.lineno and (not lines[end - 1].strip() or lines[end - 1].lstrip().startswith('#')):
+                    end -= 1
+                for line in range(node.lineno, end + 1):
+                    if line_nodes[line] is None:
+                        line_nodes[line] = owner
+        
+        imports = [
+            stripped for stripped in (line.strip() for line in lines)
+            if stripped.startswith(('import ', 'from '))
+        ]
+        context = {
+            "total_lines": len(lines),
+            "file_path": file_path,
+            "imports": imports,
+            "classes": classes,
+            "functions": [node.name for node in functions],
+        }
+        return cls(file_path, lines, ast_tree, line_nodes, imports, classes, functions, context)
+    
+    def node_at(self, line_number: int) -> Optional[ast.AST]:
+        """Innermost statement owning ``line_number`` (1-based), if any."""
+        if 0 < line_number < len(self.line_nodes):
+            return self.line_nodes[line_number]
+        return None
+    
+    def window(self, line_number: int, before: int = 5, after: int = 5) -> LineWindow:
+        """Lines ``line_number - before .. line_number + after`` as a shared view."""
+        start = max(0, line_number - before - 1)
+        stop = min(len(self.lines), line_number + after)
+        return LineWindow(self.lines, start, stop)
+
+
 # =============================================================================
 # Semantic Code Understanding Engine
 # =============================================================================
@@ -881,44 +1001,26 @@ class IntelligentCodeAgent:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            lines = content.splitlines()
-            
             # Parse AST for structural understanding
             try:
                 ast_tree = ast.parse(content)
-                ast_map = self._create_ast_line_mapping(ast_tree)
             except SyntaxError as e:
                 self.logger.warning("Syntax error in %s: %s", file_path, e)
                 ast_tree = None
-                ast_map = {}
+            
+            # One pass: line -> node index and file-level context, shared by all lines
+            model = FileModel.build(file_path, content, ast_tree)
+            lines = model.lines
             
             # Analyze each line with semantic understanding
             line_analyses = []
             for i, line in enumerate(lines, 1):
-                # Get surrounding context (5 lines before and after)
-                context_start = max(0, i - 6)
-                context_end = min(len(lines), i + 5)
-                surrounding_context = lines[context_start:context_end]
-                
-                # File-level context
-                file_context = {
-                    "total_lines": len(lines),
-                    "file_path": file_path,
-                    "imports": self._extract_imports(lines),
-                    "classes": self._extract_classes(ast_tree) if ast_tree else [],
-                    "functions": self._extract_functions(ast_tree) if ast_tree else []
-                }
-                
-                # Get AST node for this line
-                ast_node = ast_map.get(i)
-                
-                # Perform semantic analysis
                 line_analysis = self.semantic_engine.analyze_line_semantically(
                     line_number=i,
                     line_content=line,
-                    ast_node=ast_node,
-                    surrounding_context=surrounding_context,
-                    file_context=file_context
+                    ast_node=model.node_at(i),
+                    surrounding_context=model.window(i),
+                    file_context=model.context
                 )
                 
                 line_analyses.append(line_analysis)
@@ -1014,13 +1116,13 @@ class IntelligentCodeAgent:
         }
     
     # Helper methods for analysis
-    def _create_ast_line_mapping(self, ast_tree: ast.AST) -> Dict[int, ast.AST]:
-        """Create mapping from line numbers to AST nodes."""
-        line_map = {}
-        for node in ast.walk(ast_tree):
-            if hasattr(node, 'lineno'):
-                line_map[node.lineno] = node
-        return line_map
+    @staticmethod
+    def _function_line_analyses(
+        node: ast.FunctionDef, line_analyses: List[LineAnalysis]
+    ) -> List[LineAnalysis]:
+        """Line analyses inside ``node`` (``line_analyses[i]`` is line ``i + 1``)."""
+        end = node.end_lineno or node.lineno + 50
+        return line_analyses[node.lineno - 1:end]
     
     def _extract_imports(self, lines: List[str]) -> List[str]:
         """Extract import statements from file."""
@@ -1309,10 +1411,7 @@ class IntelligentCodeAgent:
         if ast_tree:
             for node in ast.walk(ast_tree):
                 if isinstance(node, ast.FunctionDef):
-                    func_lines = [
-                        line for line in line_analyses 
-                        if node.lineno <= line.line_number <= (node.end_lineno or node.lineno + 50)
-                    ]
+                    func_lines = self._function_line_analyses(node, line_analyses)
                     
                     total_complexity = sum(line.complexity_contribution for line in func_lines)
                     if total_complexity > 15:
@@ -1409,10 +1508,7 @@ class IntelligentCodeAgent:
         complex_functions = 0
         for node in ast.walk(ast_tree):
             if isinstance(node, ast.FunctionDef):
-                func_lines = [
-                    line for line in line_analyses 
-                    if node.lineno <= line.line_number <= (node.end_lineno or node.lineno + 50)
-                ]
+                func_lines = self._function_line_analyses(node, line_analyses)
                 total_complexity = sum(line.complexity_contribution for line in func_lines)
                 if total_complexity > 10:
                     complex_functions += 1
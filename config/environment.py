@@ -89,6 +89,7 @@ class MonitoringConfig:
     """Monitoring and observability configuration."""
     enable_health_check: bool = True
     health_check_port: int = 8080
+    health_check_interval_seconds: float = 15.0  # background refresh of the probe snapshot
     enable_metrics: bool = False
     metrics_port: int = 9090
     
@@ -277,6 +278,9 @@ class EnvironmentConfigLoader:
         if log_level := os.getenv("LOG_LEVEL"):
             config.security.log_level = log_level.upper()
         
+        if health_interval := os.getenv("HEALTH_CHECK_INTERVAL_SECONDS"):
+            config.monitoring.health_check_interval_seconds = float(health_interval)
+        
         return config
     
     def _validate_config(self, config: AppConfig) -> None:
@@ -15,13 +15,20 @@ Key fixes from audit:
 - Add holiday calendar integration
 - Implement caching for repeated calculations
 - Support for different business calendars (BR, US, etc.)
+
+Business-day counting is backed by a per-calendar prefix index: a cumulative
+count of business days per calendar day (ordinal), built lazily one year at a
+time. Counting a range is two lookups (O(1)) and adding business days is a
+binary search over the index (O(log n)). Batch variants accept NumPy arrays
+for recomputing durations across many epics at once.
 """
 
 import sys
 import os
+import threading
+from bisect import bisect_left
 from datetime import date, datetime, timedelta
-from typing import Set, Dict, List, Optional, Union, Tuple
-from functools import lru_cache
+from typing import Any, Set, Dict, List, Optional, Union
 from enum import Enum
 import json
 from pathlib import Path
@@ -34,6 +41,17 @@ except ImportError:
     HOLIDAYS_AVAILABLE = False
     holidays = None
 
+# Optional NumPy for the batch APIs
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+    NUMPY_AVAILABLE = False
+
+# date.toordinal() of 1970-01-01 (datetime64[D] epoch)
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 # Import our duration system
 sys.path.append(str(Path(__file__).parent))
 from duration_calculator import DurationUnit
@@ -59,10 +77,10 @@ class BusinessCalendar:
     Optimized business calendar with holiday support and caching.
     
     Features:
-    - O(1) amortized business day calculations for common ranges
+    - O(1) business day counting via a lazily built prefix index
+    - O(log n) business day addition/subtraction (binary search on the index)
     - Holiday calendar integration with fallback graceful degradation
     - Configurable weekend patterns
-    - LRU caching for performance
     - Support for multiple countries/regions
     """
     
@@ -80,8 +98,15 @@ class BusinessCalendar:
         # Holiday cache by year
         self._holiday_cache: Dict[int, Set[date]] = {}
         
-        # Pre-computed business day cache
-        self._business_day_cache: Dict[Tuple[date, date], int] = {}
+        # Business-day prefix index: _prefix[i] = business days in
+        # [_prefix_base, _prefix_base + i), covering whole years
+        # _prefix_first_year.._prefix_last_year (built lazily)
+        self._prefix: List[int] = [0]
+        self._prefix_base: int = 0
+        self._prefix_first_year: Optional[int] = None
+        self._prefix_last_year: Optional[int] = None
+        self._prefix_array: Any = None  # NumPy copy of _prefix for batch APIs
+        self._prefix_lock = threading.RLock()
         
         # Weekend days mapping
         self.weekend_days = self._get_weekend_days()
@@ -116,7 +141,6 @@ class BusinessCalendar:
                 # Fallback if holidays library has issues
                 self.holiday_system = None
     
-    @lru_cache(maxsize=1000)
     def get_holidays_for_year(self, year: int) -> Set[date]:
         """Get all holidays for a given year with caching."""
         if year in self._holiday_cache:
@@ -171,37 +195,79 @@ class BusinessCalendar:
         
         return True
     
+    # ------------------------------------------------------------------
+    # Prefix index
+    # ------------------------------------------------------------------
+    
+    def _year_business_flags(self, year: int) -> List[int]:
+        """1/0 business-day flag for every day of the year, in order."""
+        first = date(year, 1, 1).toordinal()
+        last = date(year, 12, 31).toordinal()
+        holiday_ordinals = {d.toordinal() for d in self.get_holidays_for_year(year)}
+        weekend_days = self.weekend_days
+        # date.fromordinal(o).weekday() == (o + 6) % 7
+        return [
+            0 if (o + 6) % 7 in weekend_days or o in holiday_ordinals else 1
+            for o in range(first, last + 1)
+        ]
+    
+    def _ensure_years(self, first_year: int, last_year: int) -> None:
+        """Extend the prefix index so it covers first_year..last_year."""
+        first_year = max(first_year, date.min.year)
+        last_year = min(last_year, date.max.year)
+        with self._prefix_lock:
+            if self._prefix_first_year is None:
+                self._prefix_base = date(first_year, 1, 1).toordinal()
+                self._prefix = [0]
+                self._prefix_first_year = first_year
+                self._prefix_last_year = first_year - 1
+            
+            # Forward: append years, O(days added)
+            while self._prefix_last_year < last_year:
+                self._prefix_last_year += 1
+                total = self._prefix[-1]
+                for flag in self._year_business_flags(self._prefix_last_year):
+                    total += flag
+                    self._prefix.append(total)
+                self._prefix_array = None
+            
+            # Backward: prepend years and shift the existing counts (rare)
+            if first_year < self._prefix_first_year:
+                head = [0]
+                total = 0
+                for year in range(first_year, self._prefix_first_year):
+                    for flag in self._year_business_flags(year):
+                        total += flag
+                        head.append(total)
+                self._prefix = head + [count + total for count in self._prefix[1:]]
+                self._prefix_base = date(first_year, 1, 1).toordinal()
+                self._prefix_first_year = first_year
+                self._prefix_array = None
+    
+    def _prefix_index(self, ordinal: int) -> int:
+        """Index of the ordinal in _prefix, extending the index if needed."""
+        year = date.fromordinal(ordinal).year
+        if (self._prefix_first_year is None
+                or not self._prefix_first_year <= year <= self._prefix_last_year):
+            self._ensure_years(year, year)
+        return ordinal - self._prefix_base
+    
     def count_business_days_optimized(self, start_date: date, end_date: date) -> int:
         """
-        Optimized business day calculation with O(1) amortized complexity.
+        Count business days in [start_date, end_date] in O(1).
         
-        Uses mathematical formulas for common cases and caching for performance.
+        Two lookups on the prefix index (years are indexed lazily on first use).
         """
         # Normalize dates
         if start_date > end_date:
             return 0
         
-        if start_date == end_date:
-            return 1 if self.is_business_day(start_date) else 0
-        
-        # Check cache first
-        cache_key = (start_date, end_date)
-        if cache_key in self._business_day_cache:
-            return self._business_day_cache[cache_key]
-        
-        # For short ranges (< 30 days), use direct calculation
-        delta = (end_date - start_date).days
-        if delta < 30:
-            count = self._count_business_days_direct(start_date, end_date)
-        else:
-            # For longer ranges, use optimized algorithm
-            count = self._count_business_days_mathematical(start_date, end_date)
-        
-        # Cache result
-        if len(self._business_day_cache) < 1000:  # Limit cache size
-            self._business_day_cache[cache_key] = count
-        
-        return count
+        with self._prefix_lock:
+            # Extending the index backwards shifts the base: index end first
+            self._prefix_index(end_date.toordinal())
+            start_index = self._prefix_index(start_date.toordinal())
+            end_index = end_date.toordinal() - self._prefix_base
+            return self._prefix[end_index + 1] - self._prefix[start_index]
     
     def _count_business_days_direct(self, start_date: date, end_date: date) -> int:
         """Direct counting for short date ranges."""
@@ -215,31 +281,6 @@ class BusinessCalendar:
         
         return count
     
-    def _count_business_days_mathematical(self, start_date: date, end_date: date) -> int:
-        """
-        Mathematical approach for longer ranges to achieve O(1) complexity.
-        
-        Algorithm:
-        1. Calculate total days
-        2. Calculate weekend days mathematically
-        3. Calculate holidays in range
-        4. Return total - weekends - holidays
-        """
-        total_days = (end_date - start_date).days + 1
-        
-        # Calculate weekend days mathematically
-        weekend_days = self._count_weekend_days_mathematical(start_date, end_date)
-        
-        # Calculate holidays in range
-        holiday_days = self._count_holidays_in_range(start_date, end_date)
-        
-        # Business days = total - weekends - holidays + overlap (holidays on weekends)
-        weekend_holidays_overlap = self._count_weekend_holidays_overlap(start_date, end_date)
-        
-        business_days = total_days - weekend_days - holiday_days + weekend_holidays_overlap
-        
-        return max(0, business_days)
-    
     def _count_weekend_days_mathematical(self, start_date: date, end_date: date) -> int:
         """Calculate weekend days using mathematical approach."""
         total_days = (end_date - start_date).days + 1
@@ -262,49 +303,19 @@ class BusinessCalendar:
     
     def _count_holidays_in_range(self, start_date: date, end_date: date) -> int:
         """Count holidays in date range efficiently."""
-        holiday_count = 0
-        
-        # Get unique years in range
-        years = set()
-        current_year = start_date.year
-        end_year = end_date.year
-        
-        for year in range(current_year, end_year + 1):
-            years.add(year)
-        
-        # Count holidays for each year
-        for year in years:
-            year_holidays = self.get_holidays_for_year(year)
-            
-            for holiday in year_holidays:
-                if start_date <= holiday <= end_date:
-                    holiday_count += 1
-        
-        return holiday_count
-    
-    def _count_weekend_holidays_overlap(self, start_date: date, end_date: date) -> int:
-        """Count holidays that fall on weekends (to avoid double-counting)."""
-        overlap_count = 0
-        
-        # Get unique years in range
-        current_year = start_date.year
-        end_year = end_date.year
-        
-        for year in range(current_year, end_year + 1):
-            year_holidays = self.get_holidays_for_year(year)
-            
-            for holiday in year_holidays:
-                if start_date <= holiday <= end_date:
-                    if holiday.weekday() in self.weekend_days:
-                        overlap_count += 1
-        
-        return overlap_count
+        return sum(
+            1
+            for year in range(start_date.year, end_date.year + 1)
+            for holiday in self.get_holidays_for_year(year)
+            if start_date <= holiday <= end_date
+        )
     
     def add_business_days_optimized(self, start_date: date, business_days: int) -> date:
         """
-        Add business days to a date with optimization.
+        Add business days to a date in O(log n).
         
-        Uses binary search approach for large business day additions.
+        Returns the n-th business day after start_date (before it when
+        business_days is negative), found by binary search on the prefix index.
         """
         if business_days == 0:
             return start_date
@@ -312,64 +323,130 @@ class BusinessCalendar:
         if business_days < 0:
             return self.subtract_business_days_optimized(start_date, abs(business_days))
         
-        # For small additions, use direct method
-        if business_days <= 30:
-            return self._add_business_days_direct(start_date, business_days)
-        
-        # For large additions, use estimation + refinement
-        return self._add_business_days_estimated(start_date, business_days)
+        ordinal = start_date.toordinal()
+        with self._prefix_lock:
+            index = self._prefix_index(ordinal)
+            target = self._prefix[index + 1] + business_days
+            # ~5 business days per 7 calendar days; extend until the target fits
+            while self._prefix[-1] < target:
+                if self._prefix_last_year >= date.max.year:
+                    raise OverflowError("date value out of range")
+                years = max(1, (target - self._prefix[-1]) // 200)
+                self._ensure_years(self._prefix_first_year, self._prefix_last_year + years)
+            # Smallest i with _prefix[i] >= target: day i - 1 is the target day
+            return date.fromordinal(self._prefix_base + bisect_left(self._prefix, target) - 1)
     
-    def _add_business_days_direct(self, start_date: date, business_days: int) -> date:
-        """Direct method for adding small numbers of business days."""
-        current_date = start_date
-        days_added = 0
-        
-        while days_added < business_days:
-            current_date += timedelta(days=1)
-            if self.is_business_day(current_date):
-                days_added += 1
-        
-        return current_date
-    
-    def _add_business_days_estimated(self, start_date: date, business_days: int) -> date:
+    def subtract_business_days_optimized(self, start_date: date, business_days: int) -> date:
+        """Subtract business days from a date (binary search on the prefix index)."""
+        if business_days <= 0:
+            return self.add_business_days_optimized(start_date, -business_days)
+        
+        ordinal = start_date.toordinal()
+        with self._prefix_lock:
+            self._prefix_index(ordinal)
+            # Business days in [base, start) must reach business_days
+            while self._prefix[ordinal - self._prefix_base] < business_days:
+                if self._prefix_first_year <= date.min.year:
+                    raise OverflowError("date value out of range")
+                years = max(1, (business_days - self._prefix[ordinal - self._prefix_base]) // 200)
+                self._ensure_years(self._prefix_first_year - years, self._prefix_last_year)
+            target = self._prefix[ordinal - self._prefix_base] - business_days + 1
+            return date.fromordinal(self._prefix_base + bisect_left(self._prefix, target) - 1)
+    
+    # ------------------------------------------------------------------
+    # Batch APIs (NumPy)
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _to_ordinals(dates: Any) -> Any:
+        """datetime64/date array-like -> (int64 ordinals, NaT mask)."""
+        values = np.asarray(dates, dtype="datetime64[D]")
+        missing = np.isnat(values)
+        ordinals = values.astype(np.int64) + _UNIX_EPOCH_ORDINAL
+        ordinals[missing] = _UNIX_EPOCH_ORDINAL
+        return ordinals, missing
+    
+    def _ensure_ordinals(self, ordinals: Any) -> Any:
+        """Index the years spanned by the ordinals; return the NumPy prefix."""
+        if ordinals.size:
+            first = max(int(ordinals.min()), 1)
+            last = min(int(ordinals.max()), date.max.toordinal())
+            self._ensure_years(date.fromordinal(first).year, date.fromordinal(last).year)
+        if self._prefix_array is None:
+            self._prefix_array = np.asarray(self._prefix, dtype=np.int64)
+        return self._prefix_array
+    
+    def count_business_days_batch(self, start_dates: Any, end_dates: Any) -> Any:
         """
-        Estimated method for adding large numbers of business days.
+        Vectorized count_business_days_optimized.
         
-        Uses average business days per week (5 for standard calendar)
-        then refines the result.
+        Args:
+            start_dates: Array-like of dates/datetime64 (NaT allowed)
+            end_dates: Array-like of the same length
+            
+        Returns:
+            int64 array of business day counts (0 for reversed ranges or NaT).
+            Without NumPy, a list computed with the scalar method.
         """
-        # Estimate calendar days needed
-        business_days_per_week = 7 - len(self.weekend_days)  # Usually 5
-        estimated_weeks = business_days / business_days_per_week
-        estimated_calendar_days = int(estimated_weeks * 7)
-        
-        # Start with estimated date
-        estimated_date = start_date + timedelta(days=estimated_calendar_days)
-        
-        # Count actual business days to estimated date
-        actual_business_days = self.count_business_days_optimized(start_date, estimated_date)
-        
-        # Refine the result
-        if actual_business_days < business_days:
-            # Need to go forward
-            return self._add_business_days_direct(estimated_date, business_days - actual_business_days)
-        elif actual_business_days > business_days:
-            # Need to go backward
-            return self.subtract_business_days_optimized(estimated_date, actual_business_days - business_days)
-        else:
-            return estimated_date
-    
-    def subtract_business_days_optimized(self, start_date: date, business_days: int) -> date:
-        """Subtract business days from a date."""
-        current_date = start_date
-        days_subtracted = 0
-        
-        while days_subtracted < business_days:
-            current_date -= timedelta(days=1)
-            if self.is_business_day(current_date):
-                days_subtracted += 1
+        if not NUMPY_AVAILABLE:
+            return [
+                self.count_business_days_optimized(start, end) if start and end else 0
+                for start, end in zip(start_dates, end_dates)
+            ]
+        
+        starts, start_missing = self._to_ordinals(start_dates)
+        ends, end_missing = self._to_ordinals(end_dates)
+        with self._prefix_lock:
+            prefix = self._ensure_ordinals(np.concatenate([starts, ends]))
+            base = self._prefix_base
+            counts = prefix[ends - base + 1] - prefix[starts - base]
+        counts[(starts > ends) | start_missing | end_missing] = 0
+        return counts
+    
+    def add_business_days_batch(self, start_dates: Any, business_days: Any) -> Any:
+        """
+        Vectorized add_business_days_optimized.
         
-        return current_date
+        Args:
+            start_dates: Array-like of dates/datetime64 (NaT allowed)
+            business_days: Array-like of ints (negative subtracts)
+            
+        Returns:
+            datetime64[D] array (NaT where the start is NaT).
+            Without NumPy, a list computed with the scalar method.
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                self.add_business_days_optimized(start, int(days)) if start else None
+                for start, days in zip(start_dates, business_days)
+            ]
+        
+        starts, missing = self._to_ordinals(start_dates)
+        days = np.asarray(business_days, dtype=np.int64)
+        days = np.where(missing, 0, days)
+        # Index start ± 2x the business days in calendar days; widen until
+        # every target falls inside the index (holiday-heavy calendars)
+        span = np.abs(days) * 2 + 14
+        with self._prefix_lock:
+            while True:
+                prefix = self._ensure_ordinals(np.concatenate([starts - span, starts + span]))
+                index = starts - self._prefix_base
+                forward = prefix[index + 1] + days
+                backward = prefix[index] + days + 1
+                if (forward[days > 0] <= prefix[-1]).all() and (backward[days < 0] >= 1).all():
+                    break
+                if span.max() > date.max.toordinal():
+                    raise OverflowError("date value out of range")
+                span = span * 2
+            result = np.where(
+                days > 0,
+                np.searchsorted(prefix, forward, side="left") - 1,
+                np.searchsorted(prefix, backward, side="left") - 1,
+            )
+            result = np.where(days == 0, index, result) + self._prefix_base
+        out = (result - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+        out[missing] = np.datetime64("NaT")
+        return out
     
     def get_next_business_day(self, start_date: date) -> date:
         """Get the next business day after the given date."""
@@ -390,18 +467,26 @@ class BusinessCalendar:
         return prev_date
     
     def clear_cache(self):
-        """Clear all caches to free memory."""
-        self._holiday_cache.clear()
-        self._business_day_cache.clear()
-        # Clear LRU cache
-        self.get_holidays_for_year.cache_clear()
+        """Clear all caches to free memory (holidays and prefix index)."""
+        with self._prefix_lock:
+            self._holiday_cache.clear()
+            self._prefix = [0]
+            self._prefix_base = 0
+            self._prefix_first_year = None
+            self._prefix_last_year = None
+            self._prefix_array = None
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for monitoring."""
+        indexed_years = (
+            self._prefix_last_year - self._prefix_first_year + 1
+            if self._prefix_first_year is not None else 0
+        )
         return {
             "holiday_cache_size": len(self._holiday_cache),
-            "business_day_cache_size": len(self._business_day_cache),
-            "lru_cache_info": dict(self.get_holidays_for_year.cache_info()._asdict()) if hasattr(self.get_holidays_for_year, 'cache_info') else {}
+            # Years covered by the prefix index (replaces the per-range cache)
+            "business_day_cache_size": indexed_years,
+            "prefix_index_days": len(self._prefix) - 1,
         }
 
 
@@ -484,6 +484,10 @@ class RateLimiter:
             self.stats["memory_usage_kb"] = len(self._states) * 0.5  # Rough estimate
             
             return self.stats.copy()
+    
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Counters and tracked entity count without taking the lock (for metrics scrapes)."""
+        return {**self.stats, "active_entities": len(self._states)}
 
 
 # Global rate limiter instance
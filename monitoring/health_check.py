@@ -10,6 +10,19 @@ This module provides:
 - System resource monitoring
 - Service dependency checks
 - Kubernetes/Docker readiness probe support
+
+Checks run concurrently in a worker pool, each with its own deadline. A
+background scheduler refreshes a cached snapshot every ``refresh_interval``
+seconds; the probe endpoints serve that snapshot instead of re-running the
+suite on every request. ``/metrics`` answers Prometheus scrapes
+(``?format=prometheus`` or a text/OpenMetrics ``Accept`` header) with the
+exposition built by ``monitoring.prometheus_metrics``; other clients keep
+getting the JSON summary.
+
+Those metrics describe the process serving them, so the server Prometheus
+scrapes must run inside the application: ``start_embedded_health_server``
+(called by ``streamlit_app``) does that. Running this module standalone
+still serves the probes, but its application counters stay empty.
 """
 
 import os
@@ -18,10 +31,11 @@ import time
 import json
 import sqlite3
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import logging
 
@@ -45,6 +59,23 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REFRESH_INTERVAL = 15.0
+DEFAULT_MAX_WORKERS = 8
+
+_default_executor: Optional[ThreadPoolExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> ThreadPoolExecutor:
+    """Shared pool for checks run outside a HealthCheckManager."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="health-check"
+            )
+        return _default_executor
+
 
 class HealthStatus:
     """Health status enumeration."""
@@ -64,16 +95,32 @@ class HealthCheck:
         self.last_check_time = None
         self.last_result = None
         self.last_error = None
+        self._in_flight: Optional[Future] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, executor: Optional[ThreadPoolExecutor] = None) -> Tuple[Future, float]:
+        """
+        Start the check in ``executor`` and return ``(future, start_time)``.
+        
+        A previous run that overran its deadline is still occupying a worker;
+        it is reused instead of piling another call onto a hung dependency.
+        """
+        with self._lock:
+            if self._in_flight is not None and not self._in_flight.done():
+                return self._in_flight, time.time()
+            future = (executor or _get_default_executor()).submit(self.check_func)
+            self._in_flight = future
+            return future, time.time()
     
     # TODO: Consider extracting this block into a separate method
     # TODO: Consider extracting this block into a separate method
-    def run(self) -> Dict[str, Any]:
-        """Run health check with timeout."""
-        start_time = time.time()
+    def run(self, pending: Optional[Tuple[Future, float]] = None) -> Dict[str, Any]:
+        """Run health check with timeout (or collect a run started by ``submit``)."""
+        future, start_time = pending or self.submit()
         
         try:
-            # Run check with timeout
-            result = self._run_with_timeout()
+            # Wait for the check until its deadline
+            result = self._run_with_timeout(future, start_time)
             self.last_check_time = datetime.now(timezone.utc)
             self.last_result = result
             self.last_error = None
@@ -107,48 +154,58 @@ class HealthCheck:
     
 # TODO: Consider extracting this block into a separate method
     
-    def _run_with_timeout(self) -> Dict[str, Any]:
-        """Run check function with timeout."""
-        import signal
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Health check '{self.name}' timed out after {self.timeout}s")
-        
-        # Set timeout (Unix only)
-        if hasattr(signal, 'SIGALRM'):
-            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(int(self.timeout))
-        
+    def _run_with_timeout(self, future: Future, start_time: float) -> Dict[str, Any]:
+        """Wait for the check result until ``start_time + timeout``."""
+        remaining = max(0.0, start_time + self.timeout - time.time())
         try:
-            result = self.check_func()
-            return result if isinstance(result, dict) else {"status": HealthStatus.HEALTHY}
-        finally:
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
+            result = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Health check '{self.name}' timed out after {self.timeout}s")
+        return result if isinstance(result, dict) else {"status": HealthStatus.HEALTHY}
 
 
 # TODO: Consider extracting this block into a separate method
 # TODO: Consider extracting this block into a separate method
 class HealthCheckManager:
-    """Manages multiple health checks and provides endpoints."""
+    """
+    Manages multiple health checks and provides endpoints.
+    
+    ``run_checks`` runs every check concurrently; ``get_snapshot`` serves the
+    last result, kept fresh by ``start_scheduler`` (or refreshed inline once
+    it is older than ``max_snapshot_age``).
+    """
     
-    def __init__(self):
+    def __init__(self, refresh_interval: Optional[float] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         self.checks: List[HealthCheck] = []
         self.start_time = datetime.now(timezone.utc)
         self.version = "1.0.0"
         self.environment = "unknown"
+        self.refresh_interval = DEFAULT_REFRESH_INTERVAL
         
         if CONFIG_AVAILABLE:
             try:
                 config = get_config()
                 self.environment = config.environment
                 self.version = config.version
+                self.refresh_interval = config.monitoring.health_check_interval_seconds
             except Exception:
                 # TODO: Consider extracting this block into a separate method
                 # TODO: Consider extracting this block into a separate method
                 pass
         
+        if refresh_interval is not None:
+            self.refresh_interval = refresh_interval
+        # Stale snapshots (scheduler stopped or stuck) are refreshed by the next probe
+        self.max_snapshot_age = self.refresh_interval * 2
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="health-check")
+        # (result, time.time() it was taken), replaced as a whole
+        self._latest: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._scheduler_thread: Optional[threading.Thread] = None
+        
         self._register_default_checks()
     
     def _register_default_checks(self):
@@ -179,14 +236,12 @@ class HealthCheckManager:
         logger.info(f"Added health check: {name}")
     
     def run_checks(self) -> Dict[str, Any]:
-        """Run all health checks and return aggregated results."""
+        """Run all health checks concurrently and return aggregated results."""
         start_time = time.time()
-        check_results = []
         
-        # Run all checks
-        for check in self.checks:
-            result = check.run()
-            check_results.append(result)
+        # Start every check first, then collect each one against its own deadline
+        pending = [(check, check.submit(self._executor)) for check in list(self.checks)]
+        check_results = [check.run(started) for check, started in pending]
         
         # Calculate overall status
         overall_status = self._calculate_overall_status(check_results)
@@ -204,8 +259,74 @@ class HealthCheckManager:
             "checks": check_results
         }
         
+        self._latest = (response, time.time())
         return response
     
+    def get_snapshot(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Last ``run_checks`` result, refreshed inline when missing or older
+        than ``max_age`` (default ``max_snapshot_age``).
+        
+        Concurrent callers that find the snapshot stale share a single refresh.
+        """
+        max_age = self.max_snapshot_age if max_age is None else max_age
+        if self._is_stale(max_age):
+            with self._refresh_lock:
+                if self._is_stale(max_age):
+                    self.run_checks()
+        result, taken_at = self._latest
+        snapshot = dict(result)
+        snapshot["snapshot_age_seconds"] = round(time.time() - taken_at, 2)
+        return snapshot
+    
+    def latest_snapshot(self) -> Tuple[Optional[Dict[str, Any]], float]:
+        """``(result, taken_at)`` of the last run, without ever running checks."""
+        return self._latest
+    
+    def _is_stale(self, max_age: float) -> bool:
+        result, taken_at = self._latest
+        return result is None or time.time() - taken_at > max_age
+    
+    def refresh(self) -> Dict[str, Any]:
+        """Re-run the checks now (one refresh at a time)."""
+        with self._refresh_lock:
+            return self.run_checks()
+    
+    def start_scheduler(self, interval: Optional[float] = None) -> None:
+        """Refresh the snapshot in a background thread every ``interval`` seconds."""
+        if interval is not None:
+            self.refresh_interval = interval
+            self.max_snapshot_age = interval * 2
+        if self._scheduler_thread is not None and self._scheduler_thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._scheduler_thread = threading.Thread(
+            target=self._scheduler_loop, name="health-check-scheduler", daemon=True
+        )
+        self._scheduler_thread.start()
+        logger.info(f"Health check scheduler started (every {self.refresh_interval}s)")
+    
+    def _scheduler_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Health check refresh failed: {e}")
+            self._stop_event.wait(self.refresh_interval)
+    
+    def stop_scheduler(self) -> None:
+        """Stop the background refresh."""
+        self._stop_event.set()
+        if self._scheduler_thread is not None:
+            self._scheduler_thread.join(timeout=5)
+            self._scheduler_thread = None
+    
+    def shutdown(self) -> None:
+        """Stop the scheduler and release the worker pool (hung checks are abandoned)."""
+        self.stop_scheduler()
+        self._executor.shutdown(wait=False)
+    
     def _calculate_overall_status(self, check_results: List[Dict[str, Any]]) -> str:
         """Calculate overall health status from individual checks."""
         critical_failed = any(
@@ -425,8 +546,9 @@ class HealthCheckManager:
 class HealthCheckRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for health check endpoints."""
     
-    def __init__(self, health_manager: HealthCheckManager, *args, **kwargs):
+    def __init__(self, health_manager: HealthCheckManager, *args, metrics_registry=None, **kwargs):
         self.health_manager = health_manager
+        self.metrics_registry = metrics_registry
         super().__init__(*args, **kwargs)
     
     def do_GET(self):
@@ -442,19 +564,22 @@ class HealthCheckRequestHandler(BaseHTTPRequestHandler):
         elif parsed_path.path == "/live":
             self._handle_liveness_check()
         elif parsed_path.path == "/metrics":
-            self._handle_metrics()
+            if self._wants_prometheus(parse_qs(parsed_path.query)):
+                self._handle_prometheus_metrics()
+            else:
+                self._handle_metrics()
         else:
             self._send_response(404, {"error": "Not found"})
     
     def _handle_health_check(self):
-        """Handle full health check."""
-        result = self.health_manager.run_checks()
+        """Handle full health check (served from the cached snapshot)."""
+        result = self.health_manager.get_snapshot()
         status_code = 200 if result["status"] == HealthStatus.HEALTHY else 503
         self._send_response(status_code, result)
     
     def _handle_readiness_check(self):
         """Handle Kubernetes readiness probe."""
-        result = self.health_manager.run_checks()
+        result = self.health_manager.get_snapshot()
         
         # Ready if no critical checks are failing
         critical_failed = any(
@@ -483,9 +608,29 @@ class HealthCheckRequestHandler(BaseHTTPRequestHandler):
             "timestamp": datetime.now(timezone.utc).isoformat()
         })
     
+    def _wants_prometheus(self, query: Dict[str, List[str]]) -> bool:
+        """Prometheus text for ``?format=prometheus`` or a text/OpenMetrics Accept header."""
+        if self.metrics_registry is None:
+            return False
+        if "format" in query:
+            return query["format"][0] == "prometheus"
+        accept = self.headers.get("Accept", "")
+        return "openmetrics" in accept or "text/plain" in accept
+    
+    def _handle_prometheus_metrics(self):
+        """Handle Prometheus scrape (text exposition format)."""
+        from monitoring.prometheus_metrics import CONTENT_TYPE
+        
+        body = self.metrics_registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
     def _handle_metrics(self):
-        """Handle basic metrics endpoint."""
-        result = self.health_manager.run_checks()
+        """Handle basic metrics endpoint (JSON summary of the health snapshot)."""
+        result = self.health_manager.get_snapshot()
         
         # Convert to simple metrics format
         metrics = {
@@ -494,7 +639,8 @@ class HealthCheckRequestHandler(BaseHTTPRequestHandler):
             "total_checks": len(result["checks"]),
             "failed_checks": sum(1 for check in result["checks"]
                                if check["status"] != HealthStatus.HEALTHY),
-            "check_duration_ms": result["duration_ms"]
+            "check_duration_ms": result["duration_ms"],
+            "snapshot_age_seconds": result["snapshot_age_seconds"]
         }
         
         self._send_response(200, metrics)
@@ -521,10 +667,17 @@ class HealthCheckRequestHandler(BaseHTTPRequestHandler):
 class HealthCheckServer:
     """HTTP server for health check endpoints."""
     
-    def __init__(self, host: str = "0.0.0.0", port: int = 8080):
+    def __init__(self, host: str = "0.0.0.0", port: int = 8080,
+                 refresh_interval: Optional[float] = None):
         self.host = host
         self.port = port
-        self.health_manager = HealthCheckManager()
+        self.health_manager = HealthCheckManager(refresh_interval=refresh_interval)
+        self.metrics_registry = None
+        try:
+            from monitoring.prometheus_metrics import create_default_registry
+            self.metrics_registry = create_default_registry(self.health_manager)
+        except ImportError as e:
+            logger.warning(f"Prometheus metrics not available: {e}")
         self.server = None
         self.server_thread = None
     
@@ -532,11 +685,15 @@ class HealthCheckServer:
         """Start the health check server."""
         # Create request handler with health manager
         def handler_factory(*args, **kwargs):
-            return HealthCheckRequestHandler(self.health_manager, *args, **kwargs)
+            return HealthCheckRequestHandler(
+                self.health_manager, *args, metrics_registry=self.metrics_registry, **kwargs
+            )
         
         try:
-            self.server = HTTPServer((self.host, self.port), handler_factory)
+            # One thread per request: a slow scrape never holds up a probe
+            self.server = ThreadingHTTPServer((self.host, self.port), handler_factory)
             logger.info(f"Health check server starting on {self.host}:{self.port}")
+            self.health_manager.start_scheduler()
             
             if blocking:
                 self.server.serve_forever()
@@ -552,6 +709,7 @@ class HealthCheckServer:
     
     def stop(self):
         """Stop the health check server."""
+        self.health_manager.stop_scheduler()
         if self.server:
             logger.info("Stopping health check server")
             self.server.shutdown()
@@ -565,17 +723,56 @@ class HealthCheckServer:
 _health_server: Optional[HealthCheckServer] = None
 
 
-def start_health_check_server(host: str = "0.0.0.0", port: int = 8080, blocking: bool = False) -> HealthCheckServer:
+def start_health_check_server(host: str = "0.0.0.0", port: int = 8080, blocking: bool = False,
+                              refresh_interval: Optional[float] = None) -> HealthCheckServer:
     """Start the global health check server."""
     global _health_server
     
     if _health_server is None:
-        _health_server = HealthCheckServer(host, port)
+        _health_server = HealthCheckServer(host, port, refresh_interval)
     
     _health_server.start(blocking=blocking)
     return _health_server
 
 
+_embedded_lock = threading.Lock()
+_embedded_attempted = False
+
+
+def start_embedded_health_server(host: Optional[str] = None,
+                                 port: Optional[int] = None) -> Optional[HealthCheckServer]:
+    """
+    Serve the probes and ``/metrics`` from a background thread of this process.
+
+    Meant for the application process, whose counters the Prometheus
+    collectors read. Only the first call per process tries to start the
+    server (Streamlit reruns the script on every interaction). The address
+    defaults to ``HEALTH_CHECK_HOST`` (127.0.0.1: loopback only) and the port
+    to ``HEALTH_CHECK_PORT`` (8080; ``0`` disables). A failure, such as the
+    port being taken, is logged instead of raised.
+    """
+    global _health_server, _embedded_attempted
+    
+    with _embedded_lock:
+        if _embedded_attempted:
+            return _health_server
+        _embedded_attempted = True
+        try:
+            if port is None:
+                port = int(os.getenv("HEALTH_CHECK_PORT", "8080"))
+            if port <= 0:
+                return None
+            if host is None:
+                host = os.getenv("HEALTH_CHECK_HOST", "127.0.0.1")
+            return start_health_check_server(host, port)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedded health check server not started: {e}")
+            if _health_server is not None:
+                _health_server.health_manager.shutdown()
+                _health_server = None
+            return None
+
+
 def stop_health_check_server():
     """Stop the global health check server."""
     global _health_server
@@ -588,7 +785,10 @@ def stop_health_check_server():
 def get_health_status() -> Dict[str, Any]:
     """Get current health status without starting server."""
     health_manager = HealthCheckManager()
-    return health_manager.run_checks()
+    try:
+        return health_manager.run_checks()
+    finally:
+        health_manager.shutdown()
 
 
 if __name__ == "__main__":
@@ -599,6 +799,8 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8080, help="Server port")
     parser.add_argument("--host", default="0.0.0.0", help="Server host")
     parser.add_argument("--check-only", action="store_true", help="Run checks and exit")
+    parser.add_argument("--interval", type=float, default=None,
+                        help="Seconds between background check refreshes")
     
     args = parser.parse_args()
     
@@ -632,7 +834,8 @@ if __name__ == "__main__":
         # Start server
         try:
             logging.basicConfig(level=logging.INFO)
-            server = start_health_check_server(args.host, args.port, blocking=True)
+            server = start_health_check_server(args.host, args.port, blocking=True,
+                                               refresh_interval=args.interval)
         except KeyboardInterrupt:
             print("\nShutting down health check server...")
             stop_health_check_server()
\ No newline at end of file
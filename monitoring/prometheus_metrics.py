@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+📈 Prometheus Metrics Exporter
+
+Renders the counters the application already keeps in the Prometheus text
+exposition format (version 0.0.4), for the ``/metrics`` endpoint of the
+health check server.
+
+The collectors read module globals, so they only see the counters of the
+process they run in: the exporter must be embedded in the application
+process (``monitoring.health_check.start_embedded_health_server``, started by
+``streamlit_app``). A standalone ``python monitoring/health_check.py`` still
+serves the probes, but its counters stay empty. Exported:
+
+- connection pool and query cache (``OptimizedConnectionPool``)
+- ``AdvancedCache`` and the Redis ``CacheMetrics``
+- execution plan, session aggregate and dashboard loader caches
+- ``RateLimiter`` statistics
+- circuit breakers (both registries)
+- per-service operation latencies (``services.operation_metrics``)
+- the last health check snapshot
+
+Scraping is lock-light: collectors copy the raw counter dicts (a single
+C-level copy under the GIL) instead of calling ``get_stats`` methods that
+hold component locks or touch the disk, only read components that already
+exist (a scrape never instantiates a cache or limiter), and the collector
+list itself is copy-on-write, so a scrape never waits on request threads.
+"""
+
+import logging
+import math
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_NAMESPACE = "tdd_framework"
+SUMMARY_QUANTILES = (50, 90, 99, 99.9)
+
+Labels = Dict[str, str]
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
+
+def sanitize_name(name: str) -> str:
+    """Turn an arbitrary counter key into a valid metric name fragment."""
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(int(value)) if value.is_integer() and abs(value) < 1e15 else repr(value)
+
+
+class MetricFamily:
+    """One metric (name, type, help) and its labelled samples."""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = name
+        self.type = metric_type
+        self.help = help_text
+        self.samples: List[Tuple[str, Labels, float]] = []
+
+    def add(self, value: float, labels: Optional[Labels] = None, suffix: str = "") -> "MetricFamily":
+        self.samples.append((self.name + suffix, labels or {}, value))
+        return self
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.help)}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        for name, labels, value in self.samples:
+            if labels:
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+        return lines
+
+
+Collector = Callable[["MetricsRegistry"], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """
+    Named collectors evaluated on every scrape.
+
+    Registration replaces an immutable tuple under a lock; ``collect`` reads
+    the current tuple without locking. A failing collector is reported in
+    ``<namespace>_collector_errors_total`` instead of failing the scrape.
+    """
+
+    def __init__(self, namespace: str = DEFAULT_NAMESPACE):
+        self.namespace = namespace
+        self._collectors: Tuple[Tuple[str, Collector], ...] = ()
+        self._lock = threading.Lock()
+        self._collector_errors: Dict[str, int] = {}
+
+    def metric(self, name: str, metric_type: str, help_text: str) -> MetricFamily:
+        """New family named ``<namespace>_<name>``."""
+        return MetricFamily(f"{self.namespace}_{name}", metric_type, help_text)
+
+    def register(self, name: str, collector: Collector) -> None:
+        """Add (or replace) the collector called ``name``."""
+        with self._lock:
+            others = tuple(item for item in self._collectors if item[0] != name)
+            self._collectors = others + ((name, collector),)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._collectors = tuple(item for item in self._collectors if item[0] != name)
+
+    def collector_names(self) -> List[str]:
+        return [name for name, _ in self._collectors]
+
+    def collect(self) -> List[MetricFamily]:
+        families: List[MetricFamily] = []
+        durations = self.metric("collector_duration_seconds", "gauge", "Time spent in each collector during the last scrape")
+        for name, collector in self._collectors:
+            start = time.perf_counter()
+            try:
+                families.extend(collector(self))
+            except Exception as e:
+                self._collector_errors[name] = self._collector_errors.get(name, 0) + 1
+                logger.warning(f"Metrics collector '{name}' failed: {e}")
+            durations.add(time.perf_counter() - start, {"collector": name})
+
+        errors = self.metric("collector_errors_total", "counter", "Collector failures since start")
+        for name, count in dict(self._collector_errors).items():
+            errors.add(count, {"collector": name})
+        families.append(durations)
+        families.append(errors)
+        return families
+
+    def render(self) -> str:
+        """Prometheus text exposition of every collector."""
+        lines: List[str] = []
+        for family in self.collect():
+            if family.samples:
+                lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# Default collectors
+# =============================================================================
+
+def _counter_dict(registry: MetricsRegistry, prefix: str, help_text: str, stats: Dict[str, Any],
+                  counters: Iterable[str], gauges: Iterable[str] = (),
+                  labels: Optional[Labels] = None) -> List[MetricFamily]:
+    """One family per numeric key of ``stats``; ``counters`` get ``_total``."""
+    families = []
+    for key in counters:
+        value = stats.get(key)
+        if isinstance(value, (int, float)):
+            families.append(registry.metric(f"{prefix}_{sanitize_name(key)}_total", "counter",
+                                            f"{help_text}: {key}").add(value, labels))
+    for key in gauges:
+        value = stats.get(key)
+        if isinstance(value, (int, float)):
+            families.append(registry.metric(f"{prefix}_{sanitize_name(key)}", "gauge",
+                                            f"{help_text}: {key}").add(value, labels))
+    return families
+
+
+def collect_connection_pool(registry: MetricsRegistry) -> List[MetricFamily]:
+    from streamlit_extension.database import connection
+
+    stats = connection._optimized_pool.stats_snapshot()
+    stats.update({
+        "wait_seconds": stats.get("total_wait_ms", 0.0) / 1000.0,
+        "max_wait_seconds": stats.get("max_wait_ms", 0.0) / 1000.0,
+    })
+    return _counter_dict(
+        registry, "db_pool", "Connection pool", stats,
+        counters=("connections_created", "connections_reused", "connections_closed",
+                  "read_checkouts", "write_checkouts", "checkout_waits", "checkout_timeouts",
+                  "wait_seconds", "cache_hits", "cache_misses", "cache_invalidations"),
+        gauges=("max_wait_seconds", "open_readers", "idle_readers", "max_readers",
+                "writer_open", "cache_entries"),
+    )
+
+
+def collect_advanced_cache(registry: MetricsRegistry) -> List[MetricFamily]:
+    from streamlit_extension.utils import cache
+
+    instance = cache._global_cache
+    if instance is None:
+        return []
+    return _counter_dict(
+        registry, "advanced_cache", "AdvancedCache", instance.stats_snapshot(),
+        counters=("hits", "misses", "evictions", "disk_hits", "disk_writes", "disk_evictions"),
+        gauges=("memory_entries", "memory_bytes", "max_size"),
+    )
+
+
+def collect_redis_cache(registry: MetricsRegistry) -> List[MetricFamily]:
+    from streamlit_extension.utils import redis_cache
+
+    manager = redis_cache._cache_manager
+    if manager is None:
+        return []
+    stats = dict(manager.metrics.stats)
+    stats["available"] = bool(getattr(manager, "is_available", False))
+    return _counter_dict(
+        registry, "redis_cache", "Redis cache", stats,
+        counters=("hits", "misses", "errors", "total_requests", "l1_hits", "l1_misses"),
+        gauges=("avg_response_time", "available"),
+    )
+
+
+def collect_internal_caches(registry: MetricsRegistry) -> List[MetricFamily]:
+    from streamlit_extension.database import loader
+    from streamlit_extension.services import plan_cache, session_aggregates
+
+    events = registry.metric("internal_cache_events_total", "counter", "Process-wide cache events")
+    sizes = registry.metric("internal_cache_size", "gauge", "Entries (or in-flight loads) of process-wide caches")
+    # stats_snapshot(), not get_stats(): the latter take the cache locks
+    for cache_name, stats in (
+        ("execution_plan", plan_cache.get_plan_cache().stats_snapshot()),
+        ("session_aggregates", session_aggregates.get_session_aggregate_cache().stats_snapshot()),
+        ("dashboard_loader", loader.get_loader().stats_snapshot()),
+    ):
+        for event, value in stats.items():
+            if not isinstance(value, (int, float)):
+                continue
+            if event in ("entries", "in_flight"):
+                sizes.add(value, {"cache": cache_name, "kind": event})
+            else:
+                events.add(value, {"cache": cache_name, "event": event})
+    return [events, sizes]
+
+
+def collect_rate_limiter(registry: MetricsRegistry) -> List[MetricFamily]:
+    from duration_system import rate_limiter
+
+    limiter = rate_limiter._global_rate_limiter
+    if limiter is None:
+        return []
+    return _counter_dict(
+        registry, "rate_limiter", "RateLimiter", limiter.stats_snapshot(),
+        counters=("total_checks", "allowed_requests", "blocked_requests", "violations",
+                  "cleanups_performed"),
+        gauges=("active_entities",),
+    )
+
+
+def collect_circuit_breakers(registry: MetricsRegistry) -> List[MetricFamily]:
+    from duration_system import circuit_breaker as duration_breakers
+    from streamlit_extension.utils import circuit_breaker as extension_breakers
+
+    open_state = registry.metric("circuit_breaker_open", "gauge", "1 while the circuit is open, 0.5 half-open")
+    calls = registry.metric("circuit_breaker_calls_total", "counter", "Circuit breaker calls by outcome")
+    opened = registry.metric("circuit_breaker_opened_total", "counter", "Times the circuit opened")
+    state_values = {"closed": 0, "half_open": 0.5, "open": 1}
+
+    for name, breaker in dict(extension_breakers._circuit_breakers).items():
+        labels = {"breaker": name, "registry": "extension"}
+        stats = breaker.stats
+        open_state.add(state_values.get(breaker.state.value, 0), labels)
+        calls.add(stats.successful_requests, {**labels, "outcome": "success"})
+        calls.add(stats.failed_requests, {**labels, "outcome": "failure"})
+        opened.add(stats.circuit_opened_count, labels)
+
+    for name, breaker in dict(duration_breakers._circuit_breakers).items():
+        labels = {"breaker": name, "registry": "duration"}
+        stats = dict(breaker.stats)
+        open_state.add(state_values.get(stats.get("current_state"), 0), labels)
+        calls.add(stats.get("successful_calls", 0), {**labels, "outcome": "success"})
+        calls.add(stats.get("failed_calls", 0), {**labels, "outcome": "failure"})
+        calls.add(stats.get("blocked_calls", 0), {**labels, "outcome": "blocked"})
+        opened.add(stats.get("state_changes", 0), labels)
+    return [open_state, calls, opened]
+
+
+def collect_service_operations(registry: MetricsRegistry) -> List[MetricFamily]:
+    from streamlit_extension.services.operation_metrics import get_operation_metrics
+
+    latency = registry.metric("service_operation_duration_seconds", "summary", "Service operation latency")
+    errors = registry.metric("service_operation_errors_total", "counter", "Failed service operations")
+    for (service, operation), (histogram, error_count) in sorted(get_operation_metrics().snapshot().items()):
+        labels = {"service": service, "operation": operation}
+        for label, value_ms in histogram.percentiles(SUMMARY_QUANTILES).items():
+            quantile = f"{float(label[1:]) / 100:g}"
+            latency.add(value_ms / 1000.0, {**labels, "quantile": quantile})
+        latency.add(histogram.total / 1000.0, labels, suffix="_sum")
+        latency.add(histogram.count, labels, suffix="_count")
+        errors.add(error_count, labels)
+    return [latency, errors]
+
+
+DEFAULT_COLLECTORS: Tuple[Tuple[str, Collector], ...] = (
+    ("connection_pool", collect_connection_pool),
+    ("advanced_cache", collect_advanced_cache),
+    ("redis_cache", collect_redis_cache),
+    ("internal_caches", collect_internal_caches),
+    ("rate_limiter", collect_rate_limiter),
+    ("circuit_breakers", collect_circuit_breakers),
+    ("service_operations", collect_service_operations),
+)
+
+
+def health_collector(health_manager) -> Collector:
+    """Collector for the last snapshot of a ``HealthCheckManager`` (never runs checks)."""
+    from monitoring.health_check import HealthStatus
+
+    status_values = {HealthStatus.HEALTHY: 1, HealthStatus.DEGRADED: 0.5, HealthStatus.UNHEALTHY: 0}
+
+    def collect(registry: MetricsRegistry) -> List[MetricFamily]:
+        snapshot, taken_at = health_manager.latest_snapshot()
+        if snapshot is None:
+            return []
+        overall = registry.metric("health_status", "gauge", "Overall health: 1 healthy, 0.5 degraded, 0 unhealthy")
+        overall.add(status_values.get(snapshot["status"], 0))
+        checks = registry.metric("health_check_status", "gauge", "Health check status: 1 healthy, 0.5 degraded, 0 unhealthy")
+        durations = registry.metric("health_check_duration_seconds", "gauge", "Duration of the last run of each check")
+        for check in snapshot["checks"]:
+            labels = {"check": check["name"], "critical": str(check["critical"]).lower()}
+            checks.add(status_values.get(check["status"], 0), labels)
+            durations.add(check["duration_ms"] / 1000.0, labels)
+        age = registry.metric("health_snapshot_age_seconds", "gauge", "Age of the health check snapshot")
+        age.add(time.time() - taken_at)
+        uptime = registry.metric("uptime_seconds", "gauge", "Process uptime")
+        uptime.add(snapshot["uptime_seconds"])
+        return [overall, checks, durations, age, uptime]
+
+    return collect
+
+
+def create_default_registry(health_manager=None, namespace: str = DEFAULT_NAMESPACE) -> MetricsRegistry:
+    """Registry with the default collectors (plus health, when a manager is given)."""
+    registry = MetricsRegistry(namespace)
+    for name, collector in DEFAULT_COLLECTORS:
+        registry.register(name, collector)
+    if health_manager is not None:
+        registry.register("health", health_collector(health_manager))
+    return registry
+
+
+_default_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Process-wide registry with the default collectors."""
+    global _default_registry
+    with _registry_lock:
+        if _default_registry is None:
+            _default_registry = create_default_registry()
+        return _default_registry
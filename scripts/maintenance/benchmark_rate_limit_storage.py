@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+⚡ Rate Limit Storage Benchmark
+
+Compares the atomic rate limiting path (one server-side script per check) of
+RedisRateLimitStorage against the in-memory backend.
+
+Uses the Redis at REDIS_URL when set, otherwise an in-process fakeredis
+server (requires ``fakeredis`` and ``lupa``). fakeredis has no network hop,
+so against a real server expect the Redis numbers to be dominated by RTT:
+one round trip per check, down from two to four with the old
+read-modify-write path.
+
+Usage:
+    python scripts/maintenance/benchmark_rate_limit_storage.py [iterations]
+"""
+
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from streamlit_extension.middleware.rate_limiting.algorithms import (  # noqa: E402
+    FixedWindowRateLimiter,
+    SlidingWindowRateLimiter,
+    TokenBucketRateLimiter,
+)
+from streamlit_extension.middleware.rate_limiting.storage import (  # noqa: E402
+    MemoryRateLimitStorage,
+    RedisRateLimitStorage,
+)
+
+
+def redis_client():
+    """Real Redis when REDIS_URL is set, otherwise an in-process stand-in."""
+    url = os.environ.get("REDIS_URL")
+    if url:
+        import redis
+
+        return redis.Redis.from_url(url), url
+    import fakeredis
+
+    return fakeredis.FakeRedis(), "fakeredis (in-process)"
+
+
+def make_limiters(storage, prefix):
+    return {
+        "token_bucket": TokenBucketRateLimiter(1000, 1000, storage=storage, key=f"{prefix}:tb"),
+        "sliding_window": SlidingWindowRateLimiter(1, 1000, storage=storage, key=f"{prefix}:sw"),
+        "fixed_window": FixedWindowRateLimiter(1, 1000, storage=storage, key=f"{prefix}:fw"),
+    }
+
+
+def time_checks(limiter, iterations):
+    """Per-check latencies in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        limiter.is_allowed()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(backend, name, samples):
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    ops = 1_000_000 / statistics.mean(samples)
+    print(f"  {backend:<8} {name:<15} p50={p50:8.1f}µs  p99={p99:8.1f}µs  {ops:10.0f} checks/s")
+
+
+def check_concurrent_limit(storage, workers=8, per_worker=200, limit=500):
+    """Independent limiters sharing one key must admit exactly ``limit``."""
+    admitted = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter = SlidingWindowRateLimiter(60, limit, storage=storage, key="bench:concurrent")
+        count = sum(limiter.is_allowed() for _ in range(per_worker))
+        with lock:
+            admitted.append(count)
+
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(admitted)
+
+
+def run_benchmark(iterations):
+    print("⚡ Rate Limit Storage Benchmark")
+    print("=" * 50)
+
+    client, label = redis_client()
+    redis_storage = RedisRateLimitStorage(client)
+    print(f"Redis: {label} (atomic scripts: {redis_storage.atomic})")
+    print(f"Iterations per algorithm: {iterations}\n")
+
+    backends = [("memory", MemoryRateLimitStorage()), ("redis", redis_storage)]
+    for name in ("token_bucket", "sliding_window", "fixed_window"):
+        for backend, storage in backends:
+            limiter = make_limiters(storage, f"bench:{time.time_ns()}")[name]
+            report(backend, name, time_checks(limiter, iterations))
+
+    print("\n🔒 Concurrency (8 workers x 200 checks, limit 500):")
+    for backend, storage in backends:
+        admitted = check_concurrent_limit(storage)
+        status = "✅" if admitted == 500 else "❌"
+        print(f"  {status} {backend}: {admitted} admitted")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+⚡ Task Scoring Benchmark
+
+Compares the legacy per-task scoring loop with the columnar batch engine
+(models.scoring.calc_task_scores_batch) for all presets at 1k/10k/100k tasks.
+The legacy loop is quadratic, so it is only timed up to --legacy-limit tasks
+(10k by default).
+
+Usage:
+    python scripts/maintenance/benchmark_scoring.py
+    python scripts/maintenance/benchmark_scoring.py --sizes 1000 5000 --legacy-limit 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from streamlit_extension.models.scoring import (  # noqa: E402
+    NUMPY_AVAILABLE,
+    ScoringSystem,
+    aging_score,
+    calc_task_scores_batch,
+    critical_path_score,
+    tdd_bonus_score,
+    unblock_score,
+    value_density_score,
+)
+
+
+def legacy_calc_task_scores(tasks, adjacency, critical_time, critical_nodes, w):
+    """Previous loop: one task at a time, max(critical_time) per task (O(n²))."""
+    totals = {}
+    for task in tasks:
+        tkey = task.task_key
+        prio_score = 6 - (getattr(task, "priority", 3) or 3)
+        totals[tkey] = (
+            w.priority * prio_score
+            + w.value_density * value_density_score(task)
+            + w.unblock * unblock_score(tkey, adjacency)
+            + w.critical_path * critical_path_score(tkey, critical_time, critical_nodes)
+            + w.tdd_bonus * tdd_bonus_score(task)
+            + w.aging * aging_score(task)
+        )
+    return totals
+
+
+def generate_workload(size, seed=42):
+    """Synthetic tasks, inverted dependency graph and critical-path data."""
+    rng = random.Random(seed)
+    tasks = [
+        SimpleNamespace(
+            task_key=f"TASK_{i:06d}",
+            priority=rng.randint(1, 5),
+            effort_estimate=rng.choice([None, 1, 2, 3, 5, 8]),
+            estimate_minutes=rng.randint(15, 480),
+            story_points=None,
+            tdd_order=rng.choice([None, 1, 2, 3]),
+            created_at="2025-01-01" if rng.random() < 0.7 else None,
+        )
+        for i in range(size)
+    ]
+    adjacency = {}
+    for i in range(1, size):
+        for _ in range(rng.randint(0, 2)):
+            adjacency.setdefault(tasks[rng.randrange(i)].task_key, set()).add(tasks[i].task_key)
+    critical_time = {t.task_key: rng.randint(1, 10_000) for t in tasks}
+    critical_nodes = {t.task_key for t in tasks if rng.random() < 0.05}
+    return tasks, adjacency, critical_time, critical_nodes
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run_benchmark(sizes, legacy_limit):
+    system = ScoringSystem()
+    presets = {name: system.get_preset(name).weights for name in system.list_presets()}
+
+    print("⚡ Task Scoring Benchmark")
+    print(f"NumPy: {'available' if NUMPY_AVAILABLE else 'not installed (pure Python columns)'}")
+    print(f"Presets per run: {len(presets)}")
+    print("=" * 64)
+    print(f"{'tasks':>8} | {'legacy (ms)':>12} | {'batch (ms)':>12} | {'speedup':>8}")
+    print("-" * 64)
+
+    for size in sizes:
+        workload = generate_workload(size)
+        batch_ms, batch = time_call(calc_task_scores_batch, *workload, presets)
+
+        if size > legacy_limit:
+            print(f"{size:>8} | {'skipped':>12} | {batch_ms:>12.1f} | {'-':>8}")
+            continue
+
+        legacy_ms = 0.0
+        for name, weights in presets.items():
+            elapsed, legacy = time_call(legacy_calc_task_scores, *workload, weights)
+            legacy_ms += elapsed
+            mismatches = sum(
+                1 for tkey, total in legacy.items() if batch[name][tkey].total_score != total
+            )
+            if mismatches:
+                print(f"❌ {name}: {mismatches} scores differ from the legacy loop")
+                return False
+
+        speedup = legacy_ms / batch_ms if batch_ms else float("inf")
+        print(f"{size:>8} | {legacy_ms:>12.1f} | {batch_ms:>12.1f} | {speedup:>7.1f}x")
+
+    print("\n✅ Scoring benchmark completed (results identical to legacy loop)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task scoring engines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--legacy-limit",
+        type=int,
+        default=10_000,
+        help="skip the O(n²) legacy loop above this many tasks",
+    )
+    args = parser.parse_args()
+    return run_benchmark(args.sizes, args.legacy_limit)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
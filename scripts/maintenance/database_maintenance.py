@@ -576,6 +576,24 @@ def health_check_only():
     maintenance.run_health_checks()
     print("✅ Health check completed")
 
+def rebuild_rollups_only(framework_db="framework.db"):
+    """Recalcula as tabelas de agregados (rollups) a partir das tabelas base."""
+    import sys
+
+    print("📊 Rollup Rebuild Mode")
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from streamlit_extension.database.rollups import rebuild_rollups
+
+    conn = sqlite3.connect(framework_db)
+    try:
+        counts = rebuild_rollups(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    for table, rows in counts.items():
+        print(f"  ✅ {table}: {rows} rows")
+    print("✅ Rollup rebuild completed")
+
 if __name__ == "__main__":
     import sys
     
@@ -585,8 +603,10 @@ if __name__ == "__main__":
             quick_backup()
         elif mode == "health":
             health_check_only()
+        elif mode == "rollups":
+            rebuild_rollups_only()
         else:
-            print("Usage: python database_maintenance.py [backup|health]")
+            print("Usage: python database_maintenance.py [backup|health|rollups]")
     else:
         success = main()
         sys.exit(0 if success else 1)
\ No newline at end of file
@@ -132,7 +132,8 @@ def fetch_epics() -> List[Dict[str, Any]]:
         default_return=[], 
         operation_name="list_epics"
     )
-    return _ensure_list(result)
+    # Linhas do cache de consultas são RowView; st.cache_data guarda dicts
+    return [dict(row) for row in _ensure_list(result)]
 
 @cache_data(ttl=30)
 def fetch_tasks(epic_id: Any) -> List[Dict[str, Any]]:
@@ -145,7 +146,7 @@ def fetch_tasks(epic_id: Any) -> List[Dict[str, Any]]:
         default_return=[], 
         operation_name=f"list_tasks_{epic_id}"
     )
-    return _ensure_list(result)
+    return [dict(row) for row in _ensure_list(result)]
 
 @cache_data(ttl=20)
 def fetch_health() -> Dict[str, Any]:
@@ -30,6 +30,7 @@ from .queries import (
     get_achievements,
 )
 from .schema import create_schema_if_needed
+from .rollups import rebuild_rollups
 from .seed import seed_initial_data
 # Auth imports removed - using official Streamlit OAuth
 
@@ -53,5 +54,6 @@ __all__ = [
     "get_user_stats",
     "get_achievements",
     "create_schema_if_needed",
+    "rebuild_rollups",
     "seed_initial_data",
 ]
\ No newline at end of file
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import atexit
+import hashlib
+import logging
 import os
+import queue
+import re
 import sqlite3
 import threading
 import time
 from collections import OrderedDict, deque
+from collections.abc import MutableMapping
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.request import pathname2url
 
 # Legacy compatibility layer - removed monolith dependency
 
@@ -19,8 +26,12 @@ from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 # Removed legacy DatabaseManager singleton
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB_FILENAME = "framework.db"
 ENV_DB_PATH = "FRAMEWORK_DB"
+# Cache de statements preparados por conexão (padrão do sqlite3 é 128)
+STATEMENT_CACHE_SIZE = 512
 
 def _resolve_db_path() -> str:
     """
@@ -49,15 +60,42 @@ def _configure_sqlite_connection(conn: sqlite3.Connection) -> None:
     conn.execute("PRAGMA foreign_keys = ON;")
 
 
-def _new_sqlite_connection() -> sqlite3.Connection:
+def _configure_read_only_connection(conn: sqlite3.Connection) -> None:
+    """
+    Configura uma conexão somente leitura (sem alterar journal_mode).
+    """
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    # Defesa em profundidade além de mode=ro
+    conn.execute("PRAGMA query_only = ON;")
+
+
+def _new_sqlite_connection(read_only: bool = False, pooled: bool = False) -> sqlite3.Connection:
     """
     Cria uma nova conexão SQLite com configurações padrão do módulo.
+
+    Args:
+        read_only: abre com ``mode=ro`` (URI) e ``PRAGMA query_only``.
+        pooled: conexão compartilhada entre threads pelo pool (o pool
+            garante uso exclusivo por checkout, então check_same_thread=False).
     """
+    path = _resolve_db_path()
+    if read_only:
+        conn = sqlite3.connect(
+            f"file:{pathname2url(os.path.abspath(path))}?mode=ro",
+            uri=True,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        _configure_read_only_connection(conn)
+        return conn
+
     conn = sqlite3.connect(
-        _resolve_db_path(),
+        path,
         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-        # Segurança: cada thread tem sua própria conexão; check_same_thread=True é adequado.
-        check_same_thread=True,
+        check_same_thread=not pooled,
+        cached_statements=STATEMENT_CACHE_SIZE,
     )
     _configure_sqlite_connection(conn)
     return conn
@@ -99,7 +137,7 @@ def release_connection(conn: Any) -> None:
 @contextmanager
 def transaction() -> Iterator[sqlite3.Connection]:
     """Context manager para transações usando pool otimizado."""
-    with _optimized_pool.get_optimized_connection() as conn:
+    with _optimized_pool.get_optimized_connection(read_only=False) as conn:
         try:
             yield conn
             conn.commit()
@@ -154,12 +192,129 @@ def _is_select(sql: str) -> bool:
     return sql.lstrip().upper().startswith("SELECT")
 
 
+# Curinga usado quando não é possível determinar as tabelas de uma consulta:
+# entradas marcadas com ele são invalidadas por qualquer escrita.
+ALL_TABLES = "*"
+
+_IDENT = r'["`\[]?([A-Za-z_][A-Za-z0-9_]*)["`\]]?'
+_ALIASED = _IDENT + r'(?:\s+(?:AS\s+)?[A-Za-z_][A-Za-z0-9_]*)?'
+# FROM aceita lista separada por vírgula (join implícito: ``FROM a, b x``)
+_READ_TABLES_RE = re.compile(
+    r"\b(?:FROM|JOIN)\s+(" + _ALIASED + r"(?:\s*,\s*" + _ALIASED + r")*)", re.IGNORECASE
+)
+_IDENT_RE = re.compile(_IDENT)
+_WRITE_TABLE_RE = re.compile(
+    r"^\s*(?:"
+    r"INSERT(?:\s+OR\s+\w+)?\s+INTO"
+    r"|REPLACE\s+INTO"
+    r"|UPDATE(?:\s+OR\s+\w+)?"
+    r"|DELETE\s+FROM"
+    r"|(?:CREATE|DROP|ALTER)\s+(?:TEMP(?:ORARY)?\s+)?TABLE(?:\s+IF\s+(?:NOT\s+)?EXISTS)?"
+    r")\s+" + _IDENT,
+    re.IGNORECASE,
+)
+
+
+def _normalize_tables(tables: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(t.strip().lower() for t in tables if t and t.strip())
+
+
+def extract_read_tables(sql: str) -> FrozenSet[str]:
+    """
+    Extrai as tabelas lidas por um SELECT (cláusulas FROM/JOIN, incluindo
+    listas com vírgula em FROM).
+
+    Subconsultas em FROM/JOIN são ignoradas pelo padrão, mas as tabelas
+    internas a elas são capturadas normalmente. Retorna ``{ALL_TABLES}``
+    quando nenhuma tabela é reconhecida, para que a entrada seja tratada
+    de forma conservadora.
+    """
+    tables = _normalize_tables(
+        _IDENT_RE.match(item.strip()).group(1)
+        for match in _READ_TABLES_RE.finditer(sql)
+        for item in match.group(1).split(",")
+    )
+    return tables or frozenset({ALL_TABLES})
+
+
+def extract_write_tables(sql: str) -> FrozenSet[str]:
+    """
+    Extrai a tabela alterada por um comando INSERT/UPDATE/DELETE/DDL.
+
+    Retorna ``{ALL_TABLES}`` quando o comando não é reconhecido (PRAGMA,
+    scripts com múltiplos comandos, CTEs de escrita), forçando invalidação
+    completa do cache.
+    """
+    match = _WRITE_TABLE_RE.match(sql)
+    if not match:
+        return frozenset({ALL_TABLES})
+    return _normalize_tables([match.group(1)])
+
+
+@lru_cache(maxsize=1024)
+def _statement_info(sql: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Calcula uma única vez por texto SQL o ID compacto do statement
+    (blake2b de 8 bytes) e as tabelas lidas por ele.
+    """
+    statement_id = hashlib.blake2b(sql.encode("utf-8"), digest_size=8).hexdigest()
+    return statement_id, extract_read_tables(sql)
+
+
+class RowView(MutableMapping):
+    """
+    Visão leve (dict-like) sobre uma linha em tupla de um resultado cacheado.
+
+    Compartilha o índice coluna -> posição com as demais linhas do mesmo
+    resultado, evitando um dict por linha. Escritas materializam uma cópia
+    privada (copy-on-write), então nunca alteram o cache.
+    """
+
+    __slots__ = ("_index", "_values", "_data")
+
+    def __init__(self, index: Dict[str, int], values: Tuple[Any, ...]) -> None:
+        self._index = index
+        self._values = values
+        self._data: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        return self._values[self._index[key]]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.to_dict()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data if self._data is not None else self._index)
+
+    def __len__(self) -> int:
+        return len(self._data if self._data is not None else self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in (self._data if self._data is not None else self._index)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materializa a linha como dict (a visão passa a usá-lo dali em diante)."""
+        if self._data is None:
+            self._data = {name: self._values[pos] for name, pos in self._index.items()}
+        return self._data
+
+
 def execute(sql: str, params: Optional[Iterable[Any]] = None) -> Any:
     """
     Execução genérica de SQL usando pool otimizado.
-    - Invalida o cache global quando detectar uma operação não-SELECT.
+    - Em operações não-SELECT, invalida apenas as entradas do cache que
+      dependem da tabela alterada (ver ``extract_write_tables``).
+    - SELECTs usam um leitor do pool; demais comandos, o escritor único.
     """
-    with _optimized_pool.get_optimized_connection() as conn:
+    with _optimized_pool.get_optimized_connection(read_only=_is_select(sql)) as conn:
         cursor = conn.execute(sql, tuple(params or ()))
         if cursor.description:
             # SELECT query - return rows as list of dicts
@@ -170,8 +325,8 @@ def execute(sql: str, params: Optional[Iterable[Any]] = None) -> Any:
             result = cursor.rowcount
         
         if not _is_select(sql):
-            _optimized_pool.clear_cache()
             conn.commit()  # Commit non-SELECT operations
+            _optimized_pool.invalidate_tables(extract_write_tables(sql))
         
         return result
 
@@ -180,14 +335,20 @@ def execute(sql: str, params: Optional[Iterable[Any]] = None) -> Any:
 # Optimized Connection Pool + Query Cache
 # =============================================================================
 
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Nenhuma conexão do pool ficou disponível dentro do tempo de espera."""
+
+
 class OptimizedConnectionPool:
     """
     Pool de conexões de alta performance, thread-safe, com:
-    - Reuso por thread_id (compatível com check_same_thread=True do SQLite)
-    - Limite de conexões com evicção LRU
-    - Limpeza por timeout de inatividade (TTL)
+    - N conexões de leitura (``mode=ro`` + ``PRAGMA query_only``) com checkout/retorno
+    - 1 conexão de escrita serializada atrás de uma fila (um escritor por vez)
+    - Reentrância: o thread que detém o escritor o reutiliza também para leituras
+    - Limpeza de leitores ociosos por timeout de inatividade (TTL)
     - Cache LRU de resultados SELECT com TTL
-    - Métricas de operação
+    - Invalidação do cache por tabela (índice tabela -> chaves)
+    - Métricas de operação e de tempo de espera no checkout
     """
 
     def __init__(
@@ -195,21 +356,37 @@ class OptimizedConnectionPool:
         max_connections: int = 10,
         connection_timeout: int = 300,
         query_cache_capacity: int = 256,
+        checkout_timeout: float = 30.0,
     ) -> None:
+        # max_connections inclui o escritor; sempre há ao menos um leitor.
         self.max_connections = max_connections
+        self.max_readers = max(1, max_connections - 1)
         self.connection_timeout = connection_timeout
+        self.checkout_timeout = checkout_timeout
 
-        # Pool: thread_id -> info
-        self._pool: Dict[int, Dict[str, Any]] = {}
+        # Leitores: pilha de conexões ociosas (conn, last_used) + total aberto
         self._pool_lock = threading.RLock()
+        self._readers_available = threading.Condition(self._pool_lock)
+        self._idle_readers: deque[Tuple[sqlite3.Connection, float]] = deque()
+        self._open_readers = 0
 
-        # LRU para acompanhar ordem de uso de threads (para evicção por limite)
-        self._lru_threads: deque[int] = deque()
+        # Escritor único; a fila de tamanho 1 serializa os checkouts (FIFO)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_queue: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=1)
+
+        # Conexões em uso pelo thread atual (reentrância)
+        self._local = threading.local()
 
         # Cache LRU para SELECTs
         self._cache_lock = threading.RLock()
         self._query_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._query_cache_capacity = query_cache_capacity
+        # Índice reverso: tabela -> chaves de cache que a leem
+        self._table_index: Dict[str, Set[Hashable]] = {}
+        # Versões de invalidação: impedem que um SELECT concorrente com uma
+        # invalidação grave no cache um resultado já obsoleto
+        self._table_versions: Dict[str, int] = {}
+        self._cache_clears = 0
 
         # Métricas
         self._metrics_lock = threading.RLock()
@@ -217,8 +394,15 @@ class OptimizedConnectionPool:
             "connections_created": 0,
             "connections_reused": 0,
             "connections_closed": 0,
+            "read_checkouts": 0,
+            "write_checkouts": 0,
+            "checkout_waits": 0,
+            "checkout_timeouts": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "cache_invalidations": 0,
         }
 
         self._last_cleanup = time.time()
@@ -226,92 +410,154 @@ class OptimizedConnectionPool:
 
     # ---------- Pool de Conexões ----------
 
-    def _lru_touch(self, thread_id: int) -> None:
-        # move thread_id para o final (mais recentemente usado)
+    def _record_checkout(self, kind: str, waited: float, reused: bool) -> None:
+        wait_ms = waited * 1000
+        with self._metrics_lock:
+            self._metrics[f"{kind}_checkouts"] += 1
+            self._metrics["connections_reused" if reused else "connections_created"] += 1
+            self._metrics["total_wait_ms"] += wait_ms
+            self._metrics["max_wait_ms"] = max(self._metrics["max_wait_ms"], wait_ms)
+            # Espera relevante = checkout que precisou bloquear (>= 1ms)
+            if wait_ms >= 1.0:
+                self._metrics["checkout_waits"] += 1
+
+    def _record_timeout(self, kind: str) -> PoolTimeoutError:
+        with self._metrics_lock:
+            self._metrics["checkout_timeouts"] += 1
+        return PoolTimeoutError(
+            f"Timeout aguardando conexão de {kind} após {self.checkout_timeout}s"
+        )
+
+    def _close_connection(self, conn: sqlite3.Connection) -> None:
         try:
-            self._lru_threads.remove(thread_id)
-        except ValueError:
+            conn.close()
+        except Exception:
             pass
-        self._lru_threads.append(thread_id)
-
-    def _evict_if_needed(self) -> None:
-        # Evict LRU enquanto exceder max_connections
-        while len(self._pool) > self.max_connections and self._lru_threads:
-            victim_tid = self._lru_threads.popleft()
-            info = self._pool.pop(victim_tid, None)
-            if info:
-                try:
-                    info["connection"].close()
-                except Exception:
-                    pass
-                with self._metrics_lock:
-                    self._metrics["connections_closed"] += 1
-
-    def _cleanup_old_connections(self) -> None:
-        """Fecha conexões não usadas por além do TTL."""
-        current_time = time.time()
-        with self._pool_lock:
-            stale_tids: list[int] = []
-            for tid, info in self._pool.items():
-                if current_time - info["last_used"] > self.connection_timeout:
-                    try:
-                        info["connection"].close()
-                    except Exception:
-                        pass
-                    stale_tids.append(tid)
-
-            for tid in stale_tids:
-                self._pool.pop(tid, None)
-                try:
-                    self._lru_threads.remove(tid)
-                except ValueError:
-                    pass
-                with self._metrics_lock:
-                    self._metrics["connections_closed"] += 1
-
-        self._last_cleanup = current_time
+        with self._metrics_lock:
+            self._metrics["connections_closed"] += 1
 
-    @contextmanager
-    def get_optimized_connection(self) -> Iterator[sqlite3.Connection]:
-        """
-        Fornece uma conexão otimizada para o thread atual.
-        - Reuso por thread_id
-        - Evicção LRU se exceder o limite
-        - Cleanup periódico por TTL
-        - Rollback automático em exceção com transação aberta
-        """
-        tid = threading.get_ident()
-        do_cleanup = False
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
 
+    def _ensure_writer(self) -> None:
+        """Cria o escritor sob demanda (garante arquivo e modo WAL antes dos leitores)."""
         with self._pool_lock:
-            info = self._pool.get(tid)
-            if info:
-                conn = info["connection"]
-                info["last_used"] = time.time()
-                self._lru_touch(tid)
-                with self._metrics_lock:
-                    self._metrics["connections_reused"] += 1
-            else:
-                conn = _new_sqlite_connection()
-                now = time.time()
-                self._pool[tid] = {
-                    "connection": conn,
-                    "created_at": now,
-                    "last_used": now,
-                }
-                self._lru_touch(tid)
+            if self._writer is None:
+                self._writer = _new_sqlite_connection(pooled=True)
+                self._writer_queue.put_nowait(self._writer)
                 with self._metrics_lock:
                     self._metrics["connections_created"] += 1
 
-            # Evicção por excesso
-            self._evict_if_needed()
-            # Cleanup periódico (a cada 60s)
-            if time.time() - self._last_cleanup > 60:
-                do_cleanup = True
+    def _cleanup_old_connections(self) -> None:
+        """Fecha leitores ociosos por além do TTL."""
+        current_time = time.time()
+        stale: list[sqlite3.Connection] = []
+        with self._pool_lock:
+            # Os mais antigos ficam à esquerda (retorno é sempre à direita)
+            while self._idle_readers and current_time - self._idle_readers[0][1] > self.connection_timeout:
+                conn, _ = self._idle_readers.popleft()
+                self._open_readers -= 1
+                stale.append(conn)
+            self._last_cleanup = current_time
+        for conn in stale:
+            self._close_connection(conn)
+
+    def _checkout_reader(self) -> sqlite3.Connection:
+        self._ensure_writer()
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        create = False
+        with self._readers_available:
+            while True:
+                if self._idle_readers:
+                    conn, _ = self._idle_readers.pop()
+                    break
+                if self._open_readers < self.max_readers:
+                    self._open_readers += 1
+                    create = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._readers_available.wait(remaining):
+                    raise self._record_timeout("leitura")
+            do_cleanup = time.time() - self._last_cleanup > 60
+
+        if create:
+            try:
+                conn = _new_sqlite_connection(read_only=True)
+            except Exception:
+                with self._readers_available:
+                    self._open_readers -= 1
+                    self._readers_available.notify()
+                raise
 
+        self._record_checkout("read", time.monotonic() - start, reused=not create)
         if do_cleanup:
             self._cleanup_old_connections()
+        return conn
+
+    def _return_reader(self, conn: sqlite3.Connection, healthy: bool) -> None:
+        with self._readers_available:
+            if healthy:
+                self._idle_readers.append((conn, time.time()))
+            else:
+                self._open_readers -= 1
+            self._readers_available.notify()
+        if not healthy:
+            self._close_connection(conn)
+
+    def _checkout_writer(self) -> sqlite3.Connection:
+        self._ensure_writer()
+        start = time.monotonic()
+        try:
+            conn = self._writer_queue.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise self._record_timeout("escrita") from None
+        self._record_checkout("write", time.monotonic() - start, reused=True)
+        return conn
+
+    def _return_writer(self, conn: sqlite3.Connection, healthy: bool) -> None:
+        if not healthy:
+            # Substitui o escritor quebrado para não travar a fila
+            self._close_connection(conn)
+            with self._pool_lock:
+                self._writer = None
+            self._ensure_writer()
+            return
+        self._writer_queue.put_nowait(conn)
 
+    @contextmanager
+    def get_optimized_connection(self, *, read_only: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Faz checkout de uma conexão do pool e a devolve ao sair do contexto.
+        - ``read_only=True``: um dos N leitores (escritas falham com ``query_only``)
+        - ``read_only=False``: o escritor único; checkouts concorrentes aguardam na fila
+        - Padrão ``read_only=False`` (compatível com chamadas antigas);
+          leituras devem declarar ``read_only=True`` para não disputar a
+          fila do escritor
+        - Reentrante: chamadas aninhadas no mesmo thread reutilizam a conexão
+          já obtida (o escritor também atende leituras, vendo suas próprias escritas)
+        - Rollback automático de transação aberta, com ou sem exceção: quem
+          escreve confirma explicitamente (transação esquecida gera aviso no log)
+        - ``PoolTimeoutError`` se nenhuma conexão ficar livre em ``checkout_timeout``
+        """
+        held_writer = getattr(self._local, "writer", None)
+        held_reader = getattr(self._local, "reader", None)
+        if held_writer is not None:
+            yield held_writer
+            return
+        if read_only and held_reader is not None:
+            yield held_reader
+            return
+
+        slot = "reader" if read_only else "writer"
+        conn = self._checkout_reader() if read_only else self._checkout_writer()
+        setattr(self._local, slot, conn)
+        healthy = True
         try:
             yield conn
         except Exception:
@@ -321,66 +567,144 @@ class OptimizedConnectionPool:
                     conn.rollback()
             except Exception:
                 pass
-            # Conexão problemática? Retira do pool deste thread
-            with self._pool_lock:
-                self._pool.pop(tid, None)
-                try:
-                    self._lru_threads.remove(tid)
-                except ValueError:
-                    pass
+            # Conexão problemática? Não volta ao pool
+            healthy = self._is_healthy(conn)
             raise
         finally:
-            # Marca último uso
-            with self._pool_lock:
-                if tid in self._pool:
-                    self._pool[tid]["last_used"] = time.time()
-                    self._lru_touch(tid)
+            setattr(self._local, slot, None)
+            if healthy and conn.in_transaction:
+                # Transação esquecida aberta não pode vazar para outro thread;
+                # escritas sem commit() explícito são descartadas
+                logger.warning("Transação aberta ao devolver conexão ao pool; aplicando rollback")
+                try:
+                    conn.rollback()
+                except Exception:
+                    healthy = False
+            if read_only:
+                self._return_reader(conn, healthy)
+            else:
+                self._return_writer(conn, healthy)
 
     def _close_all(self) -> None:
-        """Fecha todas as conexões do pool (atexit)."""
+        """Fecha todas as conexões ociosas do pool e o escritor (atexit)."""
         with self._pool_lock:
-            for tid, info in list(self._pool.items()):
+            readers = [conn for conn, _ in self._idle_readers]
+            self._idle_readers.clear()
+            self._open_readers -= len(readers)
+            writer, self._writer = self._writer, None
+            if writer is not None:
                 try:
-                    info["connection"].close()
-                except Exception:
+                    self._writer_queue.get_nowait()
+                except queue.Empty:
                     pass
-                with self._metrics_lock:
-                    self._metrics["connections_closed"] += 1
-            self._pool.clear()
-            self._lru_threads.clear()
+        for conn in readers:
+            self._close_connection(conn)
+        if writer is not None:
+            self._close_connection(writer)
 
     # ---------- Cache de Consultas (SELECT) ----------
 
-    def _make_cache_key(self, sql: str, params: Optional[Tuple[Any, ...]]) -> str:
-        safe_params = tuple(params or ())
-        return f"{sql}|{safe_params!r}"
+    def _make_cache_key(self, statement_id: str, params: Tuple[Any, ...]) -> Hashable:
+        try:
+            hash(params)
+            return (statement_id, params)
+        except TypeError:
+            # Parâmetros não-hasheáveis (ex.: listas) caem no repr
+            return (statement_id, repr(params))
+
+    @staticmethod
+    def _to_row_views(item: Dict[str, Any]) -> List[RowView]:
+        index = item["index"]
+        return [RowView(index, values) for values in item["rows"]]
+
+    def _drop_cache_entry(self, key: Hashable) -> None:
+        """Remove uma entrada do cache e do índice de tabelas (com _cache_lock)."""
+        item = self._query_cache.pop(key, None)
+        if not item:
+            return
+        for table in item["tables"]:
+            keys = self._table_index.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_index[table]
+
+    def _dependency_snapshot(self, tables: Iterable[str]) -> Tuple[int, Tuple[int, ...]]:
+        """Versões de invalidação das tabelas de uma entrada (com _cache_lock)."""
+        return (
+            self._cache_clears,
+            tuple(self._table_versions.get(table, 0) for table in sorted(tables)),
+        )
 
     def clear_cache(self) -> None:
         with self._cache_lock:
+            dropped = len(self._query_cache)
             self._query_cache.clear()
+            self._table_index.clear()
+            self._cache_clears += 1
+        with self._metrics_lock:
+            self._metrics["cache_invalidations"] += dropped
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """
+        Invalida as entradas do cache que dependem de alguma das tabelas.
+
+        - Entradas sem tabelas conhecidas (``ALL_TABLES``) são sempre invalidadas.
+        - Se ``tables`` contiver ``ALL_TABLES``, o cache inteiro é limpo.
+
+        Returns:
+            Número de entradas removidas.
+        """
+        tables = _normalize_tables(tables)
+        if ALL_TABLES in tables:
+            with self._cache_lock:
+                dropped = len(self._query_cache)
+            self.clear_cache()
+            return dropped
+
+        with self._cache_lock:
+            keys: Set[Hashable] = set(self._table_index.get(ALL_TABLES, ()))
+            for table in tables | {ALL_TABLES}:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+            for table in tables:
+                keys.update(self._table_index.get(table, ()))
+            for key in keys:
+                self._drop_cache_entry(key)
+
+        if keys:
+            with self._metrics_lock:
+                self._metrics["cache_invalidations"] += len(keys)
+        return len(keys)
 
     def execute_cached(
         self,
         sql: str,
         params: Optional[Iterable[Any]] = None,
         cache_ttl: int = 60,
-    ) -> list[dict]:
+        tables: Optional[Iterable[str]] = None,
+    ) -> List[RowView]:
         """
         Executa SELECT com cache LRU controlado por TTL.
         - Apenas SELECT é cacheado.
-        - Resultados são convertidos para lista de dicts.
+        - A chave do cache é (ID compacto do statement, parâmetros).
+        - O cache guarda nomes de colunas + linhas em tupla; cada chamada
+          recebe uma lista nova de ``RowView`` (dict-like, copy-on-write).
+        - Cada entrada registra as tabelas de que depende: as declaradas em
+          ``tables`` ou, na ausência delas, as extraídas do SQL.
         """
         if not _is_select(sql):
             # Não cachear; executar direto com conexão do pool
-            with self.get_optimized_connection() as conn:
+            with self.get_optimized_connection(read_only=False) as conn:
                 cur = conn.execute(sql, tuple(params or ()))
-                if cur.description:
-                    cols = [c[0] for c in cur.description]
-                    return [dict(zip(cols, row)) for row in cur.fetchall()]
-                return []
+                rows = cur.fetchall() if cur.description else []
+                cols = [c[0] for c in cur.description] if cur.description else []
+                conn.commit()
+                return [dict(zip(cols, row)) for row in rows]
 
         now = time.time()
-        key = self._make_cache_key(sql, tuple(params or ()))
+        bound_params = tuple(params or ())
+        statement_id, read_tables = _statement_info(sql)
+        key = self._make_cache_key(statement_id, bound_params)
 
         with self._cache_lock:
             if key in self._query_cache:
@@ -390,29 +714,47 @@ class OptimizedConnectionPool:
                     self._query_cache.move_to_end(key)
                     with self._metrics_lock:
                         self._metrics["cache_hits"] += 1
-                    return item["data"]
+                    return self._to_row_views(item)
                 # expirado
-                del self._query_cache[key]
+                self._drop_cache_entry(key)
 
         # miss
         with self._metrics_lock:
             self._metrics["cache_misses"] += 1
 
-        with self.get_optimized_connection() as conn:
-            cur = conn.execute(sql, tuple(params or ()))
-            if cur.description:
-                cols = [c[0] for c in cur.description]
-                data = [dict(zip(cols, row)) for row in cur.fetchall()]
-            else:
-                data = []
-
+        depends_on = _normalize_tables(tables) if tables else read_tables
+        with self._cache_lock:
+            snapshot = self._dependency_snapshot(depends_on)
+
+        with self.get_optimized_connection(read_only=True) as conn:
+            cur = conn.cursor()
+            # Tuplas puras: evita sqlite3.Row por linha no caminho quente
+            cur.row_factory = None
+            cur.execute(sql, bound_params)
+            columns = tuple(c[0] for c in cur.description) if cur.description else ()
+            rows = cur.fetchall() if columns else []
+
+        item = {
+            "columns": columns,
+            "index": {name: pos for pos, name in enumerate(columns)},
+            "rows": rows,
+            "ts": now,
+            "tables": depends_on,
+        }
         with self._cache_lock:
-            self._query_cache[key] = {"data": data, "ts": now}
+            if self._dependency_snapshot(depends_on) != snapshot:
+                # Invalidado durante a consulta: devolve o resultado sem cachear
+                return self._to_row_views(item)
+            self._drop_cache_entry(key)
+            self._query_cache[key] = item
+            for table in depends_on:
+                self._table_index.setdefault(table, set()).add(key)
             # Evict LRU se necessário
             while len(self._query_cache) > self._query_cache_capacity:
-                self._query_cache.popitem(last=False)
+                oldest = next(iter(self._query_cache))
+                self._drop_cache_entry(oldest)
 
-        return data
+        return self._to_row_views(item)
 
     # ---------- Métricas ----------
 
@@ -422,13 +764,27 @@ class OptimizedConnectionPool:
             hit_rate = (self._metrics["cache_hits"] / total_cache * 100) if total_cache else 0.0
             return {
                 **self._metrics,
-                "active_connections": len(self._pool),
-                "lru_size": len(self._lru_threads),
+                "active_connections": self._open_readers + (1 if self._writer else 0),
+                "max_readers": self.max_readers,
+                "idle_readers": len(self._idle_readers),
+                "writer_busy": self._writer is not None and self._writer_queue.empty(),
                 "cache_entries": len(self._query_cache),
+                "cached_tables": len(self._table_index),
                 "cache_hit_rate": round(hit_rate, 2),
                 "db_path": _resolve_db_path(),
             }
 
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Contadores e tamanhos do pool sem tomar locks (para scrapes de métricas)."""
+        return {
+            **dict(self._metrics),
+            "open_readers": self._open_readers,
+            "idle_readers": len(self._idle_readers),
+            "max_readers": self.max_readers,
+            "writer_open": self._writer is not None,
+            "cache_entries": len(self._query_cache),
+        }
+
 
 # Instância global do pool otimizado
 _optimized_pool = OptimizedConnectionPool()
@@ -438,23 +794,31 @@ _optimized_pool = OptimizedConnectionPool()
 # Facade Helpers
 # =============================================================================
 
-def get_optimized_connection() -> Iterator[sqlite3.Connection]:
-    """Atalho para obter conexão do pool (context manager)."""
-    return _optimized_pool.get_optimized_connection()
+def get_optimized_connection(*, read_only: bool = False) -> Iterator[sqlite3.Connection]:
+    """Atalho para obter conexão do pool (context manager); ver ``read_only`` no pool."""
+    return _optimized_pool.get_optimized_connection(read_only=read_only)
 
 
 def execute_cached_query(
     sql: str,
     params: Optional[Iterable[Any]] = None,
     cache_ttl: int = 60,
-) -> list[dict]:
-    """Executa SELECT com cache por TTL."""
-    return _optimized_pool.execute_cached(sql, params, cache_ttl)
+    tables: Optional[Iterable[str]] = None,
+) -> List[RowView]:
+    """Executa SELECT com cache por TTL (dependências de tabela opcionais)."""
+    return _optimized_pool.execute_cached(sql, params, cache_ttl, tables=tables)
 
 
 def invalidate_cache() -> None:
     """Invalida todo o cache de consultas."""
     _optimized_pool.clear_cache()
+
+
+def invalidate_tables(*tables: str) -> int:
+    """Invalida apenas as consultas cacheadas que leem as tabelas informadas."""
+    return _optimized_pool.invalidate_tables(tables)
+
+
 def get_connection_metrics() -> Dict[str, Any]:
     """Retorna métricas de performance do pool e cache."""
     return _optimized_pool.get_performance_metrics()
\ No newline at end of file
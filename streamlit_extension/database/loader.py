@@ -0,0 +1,161 @@
+"""
+Carregamento concorrente de consultas de leitura (dashboards).
+
+As páginas de dashboard fazem várias consultas independentes em sequência, e
+cada sessão do Streamlit repete as mesmas consultas. ``ConcurrentLoader``:
+
+- distribui as chamadas num pool pequeno de threads; cada uma usa um leitor
+  do ``OptimizedConnectionPool`` (SQLite libera o GIL durante a consulta),
+  então a latência total fica próxima à da consulta mais lenta;
+- agrupa chamadas idênticas em andamento (*single-flight*): N sessões
+  pedindo a mesma chave enquanto ela executa compartilham uma única execução.
+
+A chave identifica a consulta e seus parâmetros; chamadas com a mesma chave
+devem produzir o mesmo resultado. Resultados agrupados são compartilhados
+entre os chamadores: trate-os como somente leitura.
+
+Uso:
+    from streamlit_extension.database.loader import load_concurrently
+
+    data = load_concurrently({
+        "epics": (("list_epics",), queries.list_epics),
+        "stats": (("user_stats", 1), lambda: queries.get_user_stats_optimized(1)),
+    })
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+LoadCall = Tuple[Hashable, Callable[[], Any]]
+
+
+class ConcurrentLoader:
+    """
+    Executor de leituras com single-flight por chave.
+
+    Args:
+        max_workers: Threads de carga (limite as consultas simultâneas abaixo
+            do número de leitores do pool de conexões)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(1, int(max_workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._local = threading.local()
+        self._stats = {"executions": 0, "coalesced": 0, "inline": 0, "errors": 0}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Criado sob self._lock (ver submit)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="db-loader"
+            )
+        return self._executor
+
+    def _run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        self._local.active = True
+        try:
+            return fn()
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            self._local.active = False
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> Future:
+        """
+        Agenda ``fn`` sob ``key``; se a chave já está em execução, devolve o
+        mesmo Future (nenhuma nova execução).
+
+        Chamado de dentro de uma carga (carga aninhada), executa na própria
+        thread, para não esperar por vagas do pool que ela mesma ocupa.
+        """
+        if getattr(self._local, "active", False):
+            future: Future = Future()
+            try:
+                future.set_result(fn())
+            except Exception as e:
+                future.set_exception(e)
+            with self._lock:
+                self._stats["inline"] += 1
+            return future
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future
+            self._stats["executions"] += 1
+            future = self._get_executor().submit(self._run, key, fn)
+            # _run só remove a chave com self._lock, ou seja, após este registro
+            self._in_flight[key] = future
+            return future
+
+    def load(self, calls: Mapping[str, LoadCall], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Executa as chamadas concorrentemente e espera todas.
+
+        Args:
+            calls: ``{nome: (chave, função sem argumentos)}``
+            timeout: Espera máxima por resultado (segundos)
+
+        Returns:
+            ``{nome: resultado}``
+
+        Raises:
+            A exceção da primeira chamada que falhou (na ordem de ``calls``),
+            depois de todas terminarem, como na execução sequencial.
+        """
+        futures = {name: self.submit(key, fn) for name, (key, fn) in calls.items()}
+        results: Dict[str, Any] = {}
+        error: Optional[BaseException] = None
+        for name, future in futures.items():
+            try:
+                results[name] = future.result(timeout=timeout)
+            except Exception as e:
+                logger.debug("Concurrent load %r failed: %s", name, e)
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._in_flight)}
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        """Como ``get_stats``, mas sem o lock (para scrapes de métricas)."""
+        return {**self._stats, "in_flight": len(self._in_flight)}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Instância global por processo (compartilhada entre sessões do Streamlit)
+_loader = ConcurrentLoader()
+
+
+def get_loader() -> ConcurrentLoader:
+    """Loader global."""
+    return _loader
+
+
+def load_concurrently(calls: Mapping[str, LoadCall], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Atalho para ``get_loader().load(calls, timeout)``."""
+    return _loader.load(calls, timeout=timeout)
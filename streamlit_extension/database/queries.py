@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import sqlite3
 import threading
 from typing import Any, Dict, List, Optional
 
-from .connection import execute_cached_query, get_optimized_connection, get_connection_context
+from .connection import RowView, execute_cached_query, get_optimized_connection, get_connection_context
+from .rollups import ROLLUP_GLOBAL_ID, USER_STATS_SOURCE_TABLES, rebuild_rollups
 
 # Removed legacy DatabaseManager dependencies
 
@@ -15,12 +17,12 @@ from .connection import execute_cached_query, get_optimized_connection, get_conn
 # Adaptação compatível com a API legada (delegação ao DatabaseManager)
 # =============================================================================
 
-def list_epics() -> List[Dict[str, Any]]:
+def list_epics() -> List[RowView]:
     """Lista epics usando consulta direta otimizada."""
     return list_epics_optimized()
 
 
-def list_all_epics() -> List[Dict[str, Any]]:
+def list_all_epics() -> List[RowView]:
     """Lista todos os epics (incluindo arquivados/deletados)."""
     sql = """
         SELECT
@@ -32,12 +34,12 @@ def list_all_epics() -> List[Dict[str, Any]]:
     return execute_cached_query(sql, cache_ttl=300)
 
 
-def list_tasks(epic_id: int) -> List[Dict[str, Any]]:
+def list_tasks(epic_id: int) -> List[RowView]:
     """Lista tasks de um epic específico usando consulta direta."""
     return list_tasks_optimized(epic_id)
 
 
-def list_all_tasks() -> List[Dict[str, Any]]:
+def list_all_tasks() -> List[RowView]:
     """Lista todas as tasks com dados do epic (otimizada)."""
     sql = """
         SELECT
@@ -52,7 +54,7 @@ def list_all_tasks() -> List[Dict[str, Any]]:
     return execute_cached_query(sql, cache_ttl=240)
 
 
-def list_timer_sessions() -> List[Dict[str, Any]]:
+def list_timer_sessions() -> List[RowView]:
     """Retorna sessões de timer com dados de task/epic."""
     return get_recent_timer_sessions_optimized(days=30)
 
@@ -62,7 +64,7 @@ def get_user_stats(user_id: int) -> Dict[str, Any]:
     return get_user_stats_optimized(user_id)
 
 
-def get_achievements(user_id: int) -> List[Dict[str, Any]]:
+def get_achievements(user_id: int) -> List[RowView]:
     """Conquistas/gamificação do usuário usando consulta direta."""
     sql = """
         SELECT
@@ -81,7 +83,7 @@ def get_achievements(user_id: int) -> List[Dict[str, Any]]:
 # PROJECT QUERIES (for projects.py migration)
 # =============================================================================
 
-def list_all_projects() -> List[Dict[str, Any]]:
+def list_all_projects() -> List[RowView]:
     """Lista todos os projetos (incluindo inativos) - compatível com get_projects(include_inactive=True)."""
     sql = """
         SELECT
@@ -93,7 +95,7 @@ def list_all_projects() -> List[Dict[str, Any]]:
     return execute_cached_query(sql, cache_ttl=300)
 
 
-def list_active_projects() -> List[Dict[str, Any]]:
+def list_active_projects() -> List[RowView]:
     """Lista apenas projetos ativos.""" 
     sql = """
         SELECT
@@ -110,7 +112,7 @@ def list_active_projects() -> List[Dict[str, Any]]:
 # ⚡ PERFORMANCE-OPTIMIZED QUERIES (alinhadas ao schema atual)
 # =============================================================================
 
-def list_epics_optimized(cache_ttl: int = 300) -> List[Dict[str, Any]]:
+def list_epics_optimized(cache_ttl: int = 300) -> List[RowView]:
     """
     Lista epics com SELECT enxuto + cache.
 
@@ -135,7 +137,7 @@ def list_epics_optimized(cache_ttl: int = 300) -> List[Dict[str, Any]]:
     return execute_cached_query(sql, cache_ttl=cache_ttl)
 
 
-def list_tasks_optimized(epic_id: int, cache_ttl: int = 120) -> List[Dict[str, Any]]:
+def list_tasks_optimized(epic_id: int, cache_ttl: int = 120) -> List[RowView]:
     """
     Lista tasks de um epic com JOIN para trazer dados do epic.
 
@@ -203,38 +205,47 @@ def get_epic_summary_optimized(epic_id: int, cache_ttl: int = 180) -> Optional[D
             e.priority, e.duration_days, e.progress
     """
     results = execute_cached_query(sql, params=(epic_id,), cache_ttl=cache_ttl)
-    return results[0] if results else None
+    # Linha única sai como dict real (isinstance/json.dumps nos chamadores)
+    return dict(results[0]) if results else None
 
 
 def get_user_stats_optimized(user_id: int = 1, cache_ttl: int = 240) -> Dict[str, Any]:
     """
     Estatísticas agregadas do usuário (com cache).
 
-    Tabelas/colunas usadas (schema atual):
-      - epics: id
-      - tasks: id, epic_id, status
-      - work_sessions: id, task_id, duration_minutes, focus_score
-      - user_achievements: id, user_id
+    Lê uma linha de ``user_stats_rollup`` (totais do workspace, mantidos por
+    triggers) e a linha do próprio usuário (conquistas), sem JOIN entre
+    epics, tasks, work_sessions e user_achievements.
     """
-    sql = """
+    sql = f"""
         SELECT
-            COUNT(DISTINCT e.id) AS total_epics,
-            COUNT(DISTINCT t.id) AS total_tasks,
-            COUNT(DISTINCT CASE WHEN t.status = 'completed' THEN t.id END) AS completed_tasks,
-            COUNT(DISTINCT ws.id) AS total_sessions,
-            COALESCE(SUM(ws.duration_minutes), 0) AS total_minutes,
-            COALESCE(AVG(ws.focus_score), 0) AS avg_focus_score,
-            COUNT(DISTINCT ua.id) AS total_achievements
-        FROM framework_epics AS e
-        LEFT JOIN framework_tasks AS t ON e.id = t.epic_id
-        LEFT JOIN work_sessions AS ws ON t.id = ws.task_id
-        LEFT JOIN user_achievements AS ua ON ua.user_id = ?
+            g.total_epics,
+            g.total_tasks,
+            g.completed_tasks,
+            g.total_sessions,
+            g.total_minutes,
+            CASE WHEN g.focus_score_count > 0
+                 THEN g.focus_score_sum / g.focus_score_count
+                 ELSE 0
+            END AS avg_focus_score,
+            COALESCE(u.total_achievements, 0) AS total_achievements
+        FROM user_stats_rollup AS g
+        LEFT JOIN user_stats_rollup AS u ON u.user_id = ?
+        WHERE g.user_id = {ROLLUP_GLOBAL_ID}
     """
-    results = execute_cached_query(sql, params=(user_id,), cache_ttl=cache_ttl)
-    return results[0] if results else {}
-
-
-def get_recent_timer_sessions_optimized(days: int = 7, cache_ttl: int = 60) -> List[Dict[str, Any]]:
+    tables = ("user_stats_rollup",) + USER_STATS_SOURCE_TABLES
+    try:
+        results = execute_cached_query(sql, params=(user_id,), cache_ttl=cache_ttl, tables=tables)
+    except sqlite3.OperationalError as e:
+        if "no such table" not in str(e):
+            raise
+        # Banco criado fora de create_schema_if_needed: cria e popula o rollup
+        rebuild_rollups()
+        results = execute_cached_query(sql, params=(user_id,), cache_ttl=cache_ttl, tables=tables)
+    return dict(results[0]) if results else {}
+
+
+def get_recent_timer_sessions_optimized(days: int = 7, cache_ttl: int = 60) -> List[RowView]:
     """
     Lista sessões de timer recentes (últimos N dias) com JOIN em task/epic.
 
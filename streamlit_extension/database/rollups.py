@@ -0,0 +1,531 @@
+"""
+Tabelas de agregados (rollups) mantidas incrementalmente por triggers.
+
+- ``user_stats_rollup``: contadores do dashboard. A linha ``ROLLUP_GLOBAL_ID``
+  guarda os totais do workspace (epics, tasks, sessões, minutos, foco);
+  as linhas por ``user_id`` guardam as conquistas de cada usuário.
+
+- ``epic_revisions``: contador de revisão por épico, incrementado a cada
+  escrita em tarefas/dependências do épico (chave do cache de planos).
+
+- ``task_time_totals``: tempo total, número de sessões e última sessão por
+  tarefa, substituindo o ``SUM(duration_minutes) ... GROUP BY task_id`` sobre
+  todo o histórico de ``work_sessions``. Mantido a cada início, fim ou
+  remoção de sessão (TimerService ou qualquer outro escritor).
+
+Os triggers atualizam os contadores na mesma transação da escrita original,
+então leitores nunca veem o agregado fora de sincronia. ``rebuild_rollups``
+recalcula tudo a partir das tabelas base (backfill ou reparo).
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import Any, Dict, Optional
+
+from .connection import get_connection_context, invalidate_tables
+
+logger = logging.getLogger(__name__)
+
+# Linha que guarda os totais do workspace (user_id reais começam em 1)
+ROLLUP_GLOBAL_ID = 0
+
+# Tabelas base cujas escritas alteram user_stats_rollup (via triggers)
+USER_STATS_SOURCE_TABLES = (
+    "framework_epics",
+    "framework_tasks",
+    "work_sessions",
+    "user_achievements",
+)
+
+_USER_STATS_TABLE = """
+    CREATE TABLE IF NOT EXISTS user_stats_rollup (
+        user_id INTEGER PRIMARY KEY,
+        total_epics INTEGER NOT NULL DEFAULT 0,
+        total_tasks INTEGER NOT NULL DEFAULT 0,
+        completed_tasks INTEGER NOT NULL DEFAULT 0,
+        total_sessions INTEGER NOT NULL DEFAULT 0,
+        total_minutes INTEGER NOT NULL DEFAULT 0,
+        focus_score_sum REAL NOT NULL DEFAULT 0,
+        focus_score_count INTEGER NOT NULL DEFAULT 0,
+        total_achievements INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Garante a linha global antes de cada UPDATE incremental
+_ENSURE_GLOBAL = f"INSERT OR IGNORE INTO user_stats_rollup (user_id) VALUES ({ROLLUP_GLOBAL_ID});"
+
+_SESSION_DELTA = """
+    UPDATE user_stats_rollup SET
+        total_sessions = total_sessions + {sign},
+        total_minutes = total_minutes + {sign} * COALESCE({row}.duration_minutes, 0),
+        focus_score_sum = focus_score_sum + {sign} * COALESCE({row}.focus_score, 0),
+        focus_score_count = focus_score_count + {sign} * ({row}.focus_score IS NOT NULL),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE user_id = {global_id} AND {row}.task_id IS NOT NULL;
+"""
+
+_USER_STATS_TRIGGERS = {
+    "trg_rollup_epics_insert": f"""
+        AFTER INSERT ON framework_epics BEGIN
+            {_ENSURE_GLOBAL}
+            UPDATE user_stats_rollup SET total_epics = total_epics + 1, updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = {ROLLUP_GLOBAL_ID};
+        END
+    """,
+    "trg_rollup_epics_delete": f"""
+        AFTER DELETE ON framework_epics BEGIN
+            {_ENSURE_GLOBAL}
+            UPDATE user_stats_rollup SET total_epics = total_epics - 1, updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = {ROLLUP_GLOBAL_ID};
+        END
+    """,
+    "trg_rollup_tasks_insert": f"""
+        AFTER INSERT ON framework_tasks BEGIN
+            {_ENSURE_GLOBAL}
+            UPDATE user_stats_rollup SET
+                total_tasks = total_tasks + 1,
+                completed_tasks = completed_tasks + (NEW.status IS 'completed'),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = {ROLLUP_GLOBAL_ID};
+        END
+    """,
+    "trg_rollup_tasks_delete": f"""
+        AFTER DELETE ON framework_tasks BEGIN
+            {_ENSURE_GLOBAL}
+            UPDATE user_stats_rollup SET
+                total_tasks = total_tasks - 1,
+                completed_tasks = completed_tasks - (OLD.status IS 'completed'),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = {ROLLUP_GLOBAL_ID};
+        END
+    """,
+    "trg_rollup_tasks_status": f"""
+        AFTER UPDATE OF status ON framework_tasks
+        WHEN (OLD.status IS 'completed') != (NEW.status IS 'completed') BEGIN
+            {_ENSURE_GLOBAL}
+            UPDATE user_stats_rollup SET
+                completed_tasks = completed_tasks
+                    + (NEW.status IS 'completed') - (OLD.status IS 'completed'),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = {ROLLUP_GLOBAL_ID};
+        END
+    """,
+    "trg_rollup_sessions_insert": f"""
+        AFTER INSERT ON work_sessions BEGIN
+            {_ENSURE_GLOBAL}
+            {_SESSION_DELTA.format(sign="1", row="NEW", global_id=ROLLUP_GLOBAL_ID)}
+        END
+    """,
+    "trg_rollup_sessions_delete": f"""
+        AFTER DELETE ON work_sessions BEGIN
+            {_ENSURE_GLOBAL}
+            {_SESSION_DELTA.format(sign="-1", row="OLD", global_id=ROLLUP_GLOBAL_ID)}
+        END
+    """,
+    "trg_rollup_sessions_update": f"""
+        AFTER UPDATE OF task_id, duration_minutes, focus_score ON work_sessions BEGIN
+            {_ENSURE_GLOBAL}
+            {_SESSION_DELTA.format(sign="-1", row="OLD", global_id=ROLLUP_GLOBAL_ID)}
+            {_SESSION_DELTA.format(sign="1", row="NEW", global_id=ROLLUP_GLOBAL_ID)}
+        END
+    """,
+    "trg_rollup_achievements_insert": """
+        AFTER INSERT ON user_achievements BEGIN
+            INSERT OR IGNORE INTO user_stats_rollup (user_id) VALUES (NEW.user_id);
+            UPDATE user_stats_rollup SET
+                total_achievements = total_achievements + 1,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = NEW.user_id;
+        END
+    """,
+    "trg_rollup_achievements_delete": """
+        AFTER DELETE ON user_achievements BEGIN
+            UPDATE user_stats_rollup SET
+                total_achievements = total_achievements - 1,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = OLD.user_id;
+        END
+    """,
+    "trg_rollup_achievements_user": """
+        AFTER UPDATE OF user_id ON user_achievements
+        WHEN OLD.user_id IS NOT NEW.user_id BEGIN
+            UPDATE user_stats_rollup SET total_achievements = total_achievements - 1
+            WHERE user_id = OLD.user_id;
+            INSERT OR IGNORE INTO user_stats_rollup (user_id) VALUES (NEW.user_id);
+            UPDATE user_stats_rollup SET total_achievements = total_achievements + 1
+            WHERE user_id = NEW.user_id;
+        END
+    """,
+}
+
+
+_EPIC_REVISIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS epic_revisions (
+        epic_id INTEGER PRIMARY KEY,
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+# Sem épico (tarefa sem epic_id ou dependência órfã) não há revisão a
+# incrementar; inserir NULL na INTEGER PRIMARY KEY geraria um id novo
+_BUMP_EPIC = """
+    INSERT OR IGNORE INTO epic_revisions (epic_id) SELECT {epic} WHERE {epic} IS NOT NULL;
+    UPDATE epic_revisions SET revision = revision + 1 WHERE epic_id = {epic};
+"""
+
+_DEPENDENT_EPIC = "(SELECT epic_id FROM framework_tasks WHERE id = {row}.task_id)"
+
+_EPIC_REVISION_TRIGGERS = {
+    "trg_revision_tasks_insert": f"""
+        AFTER INSERT ON framework_tasks BEGIN
+            {_BUMP_EPIC.format(epic="NEW.epic_id")}
+        END
+    """,
+    "trg_revision_tasks_update": f"""
+        AFTER UPDATE ON framework_tasks BEGIN
+            {_BUMP_EPIC.format(epic="NEW.epic_id")}
+        END
+    """,
+    "trg_revision_tasks_move": f"""
+        AFTER UPDATE OF epic_id ON framework_tasks
+        WHEN OLD.epic_id IS NOT NEW.epic_id BEGIN
+            {_BUMP_EPIC.format(epic="OLD.epic_id")}
+        END
+    """,
+    "trg_revision_tasks_delete": f"""
+        AFTER DELETE ON framework_tasks BEGIN
+            {_BUMP_EPIC.format(epic="OLD.epic_id")}
+        END
+    """,
+}
+
+# task_dependencies só existe após a migração de dependências: ver
+# ensure_dependency_revision_triggers
+_DEPENDENCY_REVISION_TRIGGERS = {
+    "trg_revision_deps_insert": f"""
+        AFTER INSERT ON task_dependencies BEGIN
+            {_BUMP_EPIC.format(epic=_DEPENDENT_EPIC.format(row="NEW"))}
+        END
+    """,
+    "trg_revision_deps_update": f"""
+        AFTER UPDATE ON task_dependencies BEGIN
+            {_BUMP_EPIC.format(epic=_DEPENDENT_EPIC.format(row="OLD"))}
+            {_BUMP_EPIC.format(epic=_DEPENDENT_EPIC.format(row="NEW"))}
+        END
+    """,
+    "trg_revision_deps_delete": f"""
+        AFTER DELETE ON task_dependencies BEGIN
+            {_BUMP_EPIC.format(epic=_DEPENDENT_EPIC.format(row="OLD"))}
+        END
+    """,
+}
+
+# Revisão + "task_dependencies existe sem todos os seus triggers"
+_READ_REVISION_SQL = f"""
+    SELECT
+        (SELECT revision FROM epic_revisions WHERE epic_id = ?),
+        EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_dependencies')
+        AND (SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN
+             ({", ".join(f"'{name}'" for name in _DEPENDENCY_REVISION_TRIGGERS)}))
+            < {len(_DEPENDENCY_REVISION_TRIGGERS)}
+"""
+
+# Equivalente calculado na hora, para bancos criados sem
+# create_schema_if_needed (sem o rollup): mesmas colunas usadas nas leituras
+TASK_TIME_TOTALS_FALLBACK = (
+    "(SELECT task_id, SUM(duration_minutes) AS total_minutes "
+    "FROM work_sessions GROUP BY task_id)"
+)
+
+
+def task_time_source(execute_query: Any) -> str:
+    """
+    Relação a usar em ``LEFT JOIN ... tt ON t.id = tt.task_id``: a tabela
+    ``task_time_totals`` se existir, senão ``TASK_TIME_TOTALS_FALLBACK``.
+    """
+    try:
+        execute_query("SELECT 1 FROM task_time_totals LIMIT 0")
+        return "task_time_totals"
+    except Exception:
+        logger.warning("task_time_totals ausente; agregando work_sessions diretamente")
+        return TASK_TIME_TOTALS_FALLBACK
+
+
+_TASK_TIME_TOTALS_TABLE = """
+    CREATE TABLE IF NOT EXISTS task_time_totals (
+        task_id INTEGER PRIMARY KEY,
+        total_minutes INTEGER NOT NULL DEFAULT 0,
+        session_count INTEGER NOT NULL DEFAULT 0,
+        last_session_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Momento da sessão: fim, ou início enquanto ela está ativa
+_SESSION_AT = "COALESCE({row}.end_time, {row}.start_time)"
+
+_ADD_SESSION_TIME = f"""
+    INSERT OR IGNORE INTO task_time_totals (task_id)
+    SELECT NEW.task_id WHERE NEW.task_id IS NOT NULL;
+    UPDATE task_time_totals SET
+        total_minutes = total_minutes + COALESCE(NEW.duration_minutes, 0),
+        session_count = session_count + 1,
+        last_session_at = CASE
+            WHEN last_session_at IS NULL OR {_SESSION_AT.format(row="NEW")} > last_session_at
+            THEN {_SESSION_AT.format(row="NEW")} ELSE last_session_at END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE task_id = NEW.task_id;
+"""
+
+# MAX só é recalculado (via idx_work_sessions_task_id) se a sessão removida
+# era a mais recente da tarefa
+_REMOVE_SESSION_TIME = f"""
+    UPDATE task_time_totals SET
+        total_minutes = total_minutes - COALESCE(OLD.duration_minutes, 0),
+        session_count = session_count - 1,
+        last_session_at = CASE
+            WHEN last_session_at IS {_SESSION_AT.format(row="OLD")}
+            THEN (SELECT MAX({_SESSION_AT.format(row="ws")}) FROM work_sessions AS ws
+                  WHERE ws.task_id = OLD.task_id)
+            ELSE last_session_at END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE task_id = OLD.task_id;
+    DELETE FROM task_time_totals WHERE task_id = OLD.task_id AND session_count <= 0;
+"""
+
+_TASK_TIME_TRIGGERS = {
+    "trg_time_totals_sessions_insert": f"""
+        AFTER INSERT ON work_sessions BEGIN
+            {_ADD_SESSION_TIME}
+        END
+    """,
+    "trg_time_totals_sessions_delete": f"""
+        AFTER DELETE ON work_sessions BEGIN
+            {_REMOVE_SESSION_TIME}
+        END
+    """,
+    "trg_time_totals_sessions_update": f"""
+        AFTER UPDATE OF task_id, duration_minutes, start_time, end_time ON work_sessions BEGIN
+            {_REMOVE_SESSION_TIME}
+            {_ADD_SESSION_TIME}
+        END
+    """,
+}
+
+
+def _table_exists(conn: Any, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def create_rollups(conn: Any, verbose: bool = False) -> None:
+    """
+    Cria as tabelas de rollup e seus triggers (idempotente).
+
+    Na primeira criação, popula os agregados a partir das tabelas base.
+    Requer que as tabelas base já existam.
+    """
+    is_new = not _table_exists(conn, "user_stats_rollup")
+    conn.execute(_USER_STATS_TABLE)
+    for name, body in _USER_STATS_TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    if is_new:
+        rebuild_user_stats_rollup(conn)
+
+    create_epic_revisions(conn)
+
+    is_new = not _table_exists(conn, "task_time_totals")
+    conn.execute(_TASK_TIME_TOTALS_TABLE)
+    for name, body in _TASK_TIME_TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    if is_new:
+        rebuild_task_time_totals(conn)
+
+    if verbose:
+        logger.info("Created rollup tables (user_stats_rollup, epic_revisions, task_time_totals)")
+
+
+def _replace_trigger(conn: Any, name: str, body: str) -> bool:
+    """
+    Cria o trigger, recriando-o se o corpo salvo no banco for de outra versão.
+
+    Returns:
+        True se o trigger foi criado ou recriado.
+    """
+    sql = f"CREATE TRIGGER {name} {body}"
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,)
+    ).fetchone()
+    if row is not None and row[0] == sql:
+        return False
+    if row is not None:
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute(sql)
+    return True
+
+
+def create_epic_revisions(conn: Any) -> None:
+    """
+    Cria ``epic_revisions`` e seus triggers (idempotente).
+
+    Revisões só crescem; épicos sem linha estão na revisão 0. Os triggers de
+    ``task_dependencies`` só podem existir junto com a tabela: ver
+    ``ensure_dependency_revision_triggers``.
+    """
+    conn.execute(_EPIC_REVISIONS_TABLE)
+    for name, body in _EPIC_REVISION_TRIGGERS.items():
+        _replace_trigger(conn, name, body)
+    ensure_dependency_revision_triggers(conn)
+
+
+def ensure_dependency_revision_triggers(conn: Any) -> bool:
+    """
+    Cria os triggers de revisão de ``task_dependencies`` (idempotente).
+
+    Chame após criar a tabela de dependências; ``read_epic_revision`` também
+    verifica, para bancos migrados depois de ``create_epic_revisions``.
+    Instalar triggers faltantes incrementa todas as revisões: dependências
+    alteradas enquanto eles não existiam não foram contadas.
+
+    Returns:
+        True se a tabela existe e os triggers estão instalados.
+    """
+    if not _table_exists(conn, "task_dependencies"):
+        return False
+    created = [
+        _replace_trigger(conn, name, body)
+        for name, body in _DEPENDENCY_REVISION_TRIGGERS.items()
+    ]
+    if any(created):
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO epic_revisions (epic_id)
+            SELECT DISTINCT epic_id FROM framework_tasks WHERE epic_id IS NOT NULL
+            """
+        )
+        conn.execute("UPDATE epic_revisions SET revision = revision + 1")
+    return True
+
+
+def read_epic_revision(conn: Any, epic_id: int) -> Optional[int]:
+    """
+    Revisão atual dos dados de planejamento do épico.
+
+    Se ``task_dependencies`` existir sem os triggers de revisão (tabela
+    criada depois de ``create_epic_revisions``), tenta instalá-los; sem eles,
+    mudanças de dependências não mudariam a revisão.
+
+    Returns:
+        Contador de revisão, ou None se ``epic_revisions`` não existir ou os
+        triggers de dependências faltarem (o chamador não deve cachear).
+    """
+    try:
+        revision, missing_triggers = conn.execute(_READ_REVISION_SQL, (epic_id,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if missing_triggers:
+        in_transaction = getattr(conn, "in_transaction", True)
+        try:
+            ensure_dependency_revision_triggers(conn)
+            if not in_transaction:
+                conn.commit()
+        except sqlite3.Error as e:
+            if not in_transaction:
+                conn.rollback()
+            logger.warning("Triggers de revisão de task_dependencies ausentes: %s", e)
+            return None
+        # Instalar os triggers incrementou as revisões: relê
+        return read_epic_revision(conn, epic_id)
+    return int(revision) if revision is not None else 0
+
+
+def rebuild_user_stats_rollup(conn: Any) -> None:
+    """
+    Recalcula ``user_stats_rollup`` do zero, com um agregado por tabela base
+    (sem o fan-out de JOINs entre epics, tasks, sessões e conquistas).
+    """
+    conn.execute("DELETE FROM user_stats_rollup")
+    conn.execute(
+        f"""
+        INSERT INTO user_stats_rollup (
+            user_id, total_epics, total_tasks, completed_tasks,
+            total_sessions, total_minutes, focus_score_sum, focus_score_count
+        )
+        SELECT
+            {ROLLUP_GLOBAL_ID},
+            (SELECT COUNT(*) FROM framework_epics),
+            t.total_tasks, t.completed_tasks,
+            s.total_sessions, s.total_minutes, s.focus_score_sum, s.focus_score_count
+        FROM
+            (SELECT COUNT(*) AS total_tasks,
+                    COALESCE(SUM(status = 'completed'), 0) AS completed_tasks
+             FROM framework_tasks) AS t,
+            (SELECT COUNT(*) AS total_sessions,
+                    COALESCE(SUM(duration_minutes), 0) AS total_minutes,
+                    COALESCE(SUM(focus_score), 0) AS focus_score_sum,
+                    COUNT(focus_score) AS focus_score_count
+             FROM work_sessions WHERE task_id IS NOT NULL) AS s
+        """
+    )
+    conn.execute(
+        """
+        INSERT INTO user_stats_rollup (user_id, total_achievements)
+        SELECT user_id, COUNT(*) FROM user_achievements
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+        """
+    )
+
+
+def rebuild_task_time_totals(conn: Any) -> None:
+    """Recalcula ``task_time_totals`` do zero (um único GROUP BY por tarefa)."""
+    conn.execute("DELETE FROM task_time_totals")
+    conn.execute(
+        f"""
+        INSERT INTO task_time_totals (task_id, total_minutes, session_count, last_session_at)
+        SELECT
+            task_id,
+            COALESCE(SUM(duration_minutes), 0),
+            COUNT(*),
+            MAX({_SESSION_AT.format(row="work_sessions")})
+        FROM work_sessions
+        WHERE task_id IS NOT NULL
+        GROUP BY task_id
+        """
+    )
+
+
+def rebuild_rollups(conn: Optional[Any] = None) -> Dict[str, int]:
+    """
+    Recalcula todas as tabelas de rollup (comando de reparo/backfill).
+
+    Args:
+        conn: conexão opcional; sem ela, usa uma conexão direta ao banco
+            e faz commit ao final.
+
+    Returns:
+        Número de linhas por tabela de rollup após a reconstrução.
+    """
+    if conn is None:
+        with get_connection_context() as own_conn:
+            result = rebuild_rollups(own_conn)
+            own_conn.commit()
+        # Conexão fora do pool: o cache não viu a escrita
+        invalidate_tables(*result)
+        return result
+
+    # epic_revisions não é reconstruída: revisões nunca voltam atrás
+    create_rollups(conn)
+    rebuild_user_stats_rollup(conn)
+    rebuild_task_time_totals(conn)
+    return {
+        table: int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+        for table in ("user_stats_rollup", "task_time_totals")
+    }
@@ -6,6 +6,8 @@ from typing import Optional, Protocol, runtime_checkable
 
 # Modular imports for schema management
 from .connection import get_connection_context
+from .rollups import create_rollups
+from .search import create_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,12 @@ def create_schema_if_needed(verbose: bool = False) -> None:
             # Create indexes for performance
             _create_indexes(conn, verbose)
             
+            # Create trigger-maintained aggregate tables
+            create_rollups(conn, verbose)
+            
+            # Create full-text search index (skipped without FTS5)
+            create_search_index(conn, verbose)
+            
             conn.commit()
             
             if verbose:
@@ -0,0 +1,277 @@
+"""
+Índice de busca textual (FTS5) para tarefas e épicos.
+
+``search_index`` é uma tabela virtual FTS5 com uma linha por tarefa/épico:
+
+- ``item_key``: task_key / epic_key
+- ``title``: título (tarefas) ou nome/título/resumo (épicos)
+- ``body``: descrição e responsável
+- ``criteria``: campos JSON de critérios (test/acceptance criteria, goals,
+  definition of done), indexados como texto (o tokenizador ignora a pontuação)
+
+Triggers em ``framework_tasks``/``framework_epics`` mantêm o índice na mesma
+transação da escrita. O rowid codifica a entidade (tarefa: ``2*id``,
+épico: ``2*id + 1``), então atualizar/remover é uma operação por rowid.
+
+As colunas variam entre versões do schema; os triggers são gerados só com as
+colunas que existem. Sem FTS5 (SQLite compilado sem o módulo) ou sem o
+índice, ``search`` cai para ``LIKE`` (varredura completa, mas correta).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = "search_index"
+
+ENTITY_TASK = "task"
+ENTITY_EPIC = "epic"
+
+# Colunas candidatas por coluna do índice (usadas se existirem na tabela)
+_INDEXED_COLUMNS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    ENTITY_TASK: {
+        "item_key": ("task_key",),
+        "title": ("title",),
+        "body": ("description", "assigned_to"),
+        "criteria": ("test_criteria", "acceptance_criteria"),
+    },
+    ENTITY_EPIC: {
+        "item_key": ("epic_key",),
+        "title": ("name", "title", "summary"),
+        "body": ("description",),
+        "criteria": ("goals", "definition_of_done", "test_criteria", "acceptance_criteria"),
+    },
+}
+
+_SOURCE_TABLES = {ENTITY_TASK: "framework_tasks", ENTITY_EPIC: "framework_epics"}
+_ROWID = {ENTITY_TASK: "2 * {row}.id", ENTITY_EPIC: "2 * {row}.id + 1"}
+
+# Pesos bm25 por coluna: entity, entity_id, item_key, title, body, criteria
+_BM25_WEIGHTS = "0, 0, 10.0, 5.0, 1.0, 0.5"
+
+_SEARCH_TABLE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        entity UNINDEXED,
+        entity_id UNINDEXED,
+        item_key,
+        title,
+        body,
+        criteria,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+"""
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _table_exists(conn: Any, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = ?", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def _table_columns(conn: Any, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def fts5_available(conn: Any) -> bool:
+    """True se o SQLite da conexão tem o módulo FTS5."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE IF EXISTS temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _column_expressions(conn: Any, entity: str, row: str) -> List[str]:
+    """Expressões SQL (item_key, title, body, criteria) para a linha ``row``."""
+    existing = set(_table_columns(conn, _SOURCE_TABLES[entity]))
+    expressions = []
+    for candidates in _INDEXED_COLUMNS[entity].values():
+        present = [f"COALESCE({row}.{col}, '')" for col in candidates if col in existing]
+        expressions.append(" || ' ' || ".join(present) if present else "''")
+    return expressions
+
+
+def _indexed_columns(conn: Any, entity: str) -> List[str]:
+    existing = set(_table_columns(conn, _SOURCE_TABLES[entity]))
+    return [
+        col for candidates in _INDEXED_COLUMNS[entity].values()
+        for col in candidates if col in existing
+    ]
+
+
+def _insert_sql(conn: Any, entity: str, row: str) -> str:
+    columns = ", ".join(_column_expressions(conn, entity, row))
+    rowid = _ROWID[entity].format(row=row)
+    return (
+        f"INSERT INTO {SEARCH_TABLE} "
+        f"(rowid, entity, entity_id, item_key, title, body, criteria) "
+        f"VALUES ({rowid}, '{entity}', {row}.id, {columns});"
+    )
+
+
+def _delete_sql(entity: str, row: str) -> str:
+    return f"DELETE FROM {SEARCH_TABLE} WHERE rowid = {_ROWID[entity].format(row=row)};"
+
+
+def create_search_index(conn: Any, verbose: bool = False) -> bool:
+    """
+    Cria ``search_index`` e seus triggers (idempotente).
+
+    Na primeira criação, indexa as linhas existentes.
+
+    Returns:
+        False se o SQLite não tiver FTS5 (as buscas usam o fallback LIKE).
+    """
+    if not fts5_available(conn):
+        logger.warning("SQLite sem FTS5: busca textual usará LIKE")
+        return False
+
+    is_new = not _table_exists(conn, SEARCH_TABLE)
+    conn.execute(_SEARCH_TABLE_SQL)
+    for entity, table in _SOURCE_TABLES.items():
+        if not _table_exists(conn, table):
+            continue
+        triggers = {
+            f"trg_search_{entity}_insert": f"AFTER INSERT ON {table} BEGIN {_insert_sql(conn, entity, 'NEW')} END",
+            # Só reindexa quando uma coluna indexada muda (não em status etc.)
+            f"trg_search_{entity}_update": (
+                f"AFTER UPDATE OF {', '.join(['id'] + _indexed_columns(conn, entity))} ON {table} BEGIN "
+                f"{_delete_sql(entity, 'OLD')} {_insert_sql(conn, entity, 'NEW')} END"
+            ),
+            f"trg_search_{entity}_delete": f"AFTER DELETE ON {table} BEGIN {_delete_sql(entity, 'OLD')} END",
+        }
+        for name, body in triggers.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    if is_new:
+        rebuild_search_index(conn)
+
+    if verbose:
+        logger.info("Created full-text search index (%s)", SEARCH_TABLE)
+    return True
+
+
+def rebuild_search_index(conn: Any) -> int:
+    """Reindexa todas as tarefas e épicos; retorna o número de linhas indexadas."""
+    conn.execute(f"DELETE FROM {SEARCH_TABLE}")
+    for entity, table in _SOURCE_TABLES.items():
+        if not _table_exists(conn, table):
+            continue
+        columns = ", ".join(_column_expressions(conn, entity, "src"))
+        conn.execute(
+            f"""
+            INSERT INTO {SEARCH_TABLE} (rowid, entity, entity_id, item_key, title, body, criteria)
+            SELECT {_ROWID[entity].format(row="src")}, '{entity}', src.id, {columns}
+            FROM {table} AS src
+            """
+        )
+    return int(conn.execute(f"SELECT COUNT(*) FROM {SEARCH_TABLE}").fetchone()[0])
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Converte a entrada do usuário numa expressão FTS5 segura.
+
+    Cada palavra vira um termo entre aspas (sem operadores/sintaxe do
+    usuário); a última é busca por prefixo, para busca enquanto digita:
+    ``"login bu"`` → ``"login" "bu"*``. Retorna None se não houver palavras.
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    if not (text or "").endswith(" "):
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+def fts_search_sql(entity: str) -> str:
+    """
+    Subconsulta ``(entity_id, rank)`` das linhas que casam com ``MATCH ?``,
+    para JOIN com a tabela da entidade (menor rank = mais relevante).
+    """
+    return f"""
+        SELECT entity_id, bm25({SEARCH_TABLE}, {_BM25_WEIGHTS}) AS rank
+        FROM {SEARCH_TABLE}
+        WHERE {SEARCH_TABLE} MATCH ? AND entity = '{entity}'
+    """
+
+
+def like_search_sql(conn_or_columns: Any, entity: str, alias: str) -> Tuple[str, int]:
+    """
+    Condição ``LIKE`` equivalente (fallback sem FTS5).
+
+    Args:
+        conn_or_columns: conexão (para descobrir colunas) ou lista de colunas
+        entity: ``task`` | ``epic``
+        alias: alias da tabela na consulta
+
+    Returns:
+        (condição SQL, número de parâmetros ``%termo%`` esperados)
+    """
+    if isinstance(conn_or_columns, (list, tuple, set)):
+        existing = set(conn_or_columns)
+        columns = [
+            col for candidates in _INDEXED_COLUMNS[entity].values()
+            for col in candidates if col in existing
+        ]
+    else:
+        columns = _indexed_columns(conn_or_columns, entity)
+    condition = " OR ".join(f"{alias}.{col} LIKE ?" for col in columns) or "0"
+    return f"({condition})", len(columns)
+
+
+def search(
+    conn: Any,
+    text: str,
+    entity: Optional[str] = None,
+    limit: int = 20,
+) -> List[Dict[str, Any]]:
+    """
+    Busca ranqueada em tarefas/épicos.
+
+    Returns:
+        ``[{"entity", "entity_id", "rank"}]`` do mais ao menos relevante.
+        Sem FTS5/índice, faz LIKE sobre as mesmas colunas (rank 0).
+    """
+    entities: Sequence[str] = (entity,) if entity else (ENTITY_TASK, ENTITY_EPIC)
+    match = build_match_query(text)
+    if match is None:
+        return []
+
+    try:
+        entity_filter = " OR ".join(f"entity = '{e}'" for e in entities)
+        rows = conn.execute(
+            f"""
+            SELECT entity, entity_id, bm25({SEARCH_TABLE}, {_BM25_WEIGHTS}) AS rank
+            FROM {SEARCH_TABLE}
+            WHERE {SEARCH_TABLE} MATCH ? AND ({entity_filter})
+            ORDER BY rank
+            LIMIT ?
+            """,
+            (match, limit),
+        ).fetchall()
+        return [{"entity": r[0], "entity_id": r[1], "rank": r[2]} for r in rows]
+    except sqlite3.OperationalError as e:
+        logger.debug("FTS search unavailable, falling back to LIKE: %s", e)
+
+    results: List[Dict[str, Any]] = []
+    pattern = f"%{text.strip()}%"
+    for name in entities:
+        condition, count = like_search_sql(conn, name, "src")
+        rows = conn.execute(
+            f"SELECT id FROM {_SOURCE_TABLES[name]} AS src WHERE {condition} ORDER BY id LIMIT ?",
+            [pattern] * count + [limit],
+        ).fetchall()
+        results.extend({"entity": name, "entity_id": r[0], "rank": 0.0} for r in rows)
+    return results[:limit]
@@ -28,9 +28,24 @@ class TokenBucketRateLimiter:
         self._key = key
         self.tokens = float(capacity)
         self.last_refill = time.time()
-        if self._storage and self._key:
+        if self._atomic():
+            # Creates the bucket if missing without resetting one shared with other workers
+            self._acquire(0)
+        elif self._storage and self._key:
             self._storage.update_bucket_state(self._key, tokens=self.tokens, last_refill=self.last_refill)
 
+    def _atomic(self) -> bool:
+        return bool(self._storage and self._key and getattr(self._storage, "atomic", False))
+
+    def _acquire(self, tokens_requested: float) -> bool:
+        return self._storage.acquire_token(
+            self._key,
+            capacity=self.capacity,
+            refill_rate=self.refill_rate,
+            refill_period=self.refill_period,
+            requested=tokens_requested,
+        )
+
     def _refill_tokens(self) -> None:
         now = time.time()
         if self._storage and self._key:
@@ -51,6 +66,8 @@ class TokenBucketRateLimiter:
 
     def is_allowed(self, tokens_requested: int = 1) -> bool:
         """Return True if the requested number of tokens is available."""
+        if self._atomic():
+            return self._acquire(tokens_requested)
         self._refill_tokens()
         if self._storage and self._key:
             state = self._storage.get_bucket_state(self._key)
@@ -89,6 +106,10 @@ class SlidingWindowRateLimiter:
         if timestamp is None:
             timestamp = time.time()
         cutoff = timestamp - self.window_size
+        if self._storage and self._key and getattr(self._storage, "atomic", False):
+            return self._storage.acquire_window_slot(
+                self._key, window_size=self.window_size, max_requests=self.max_requests, timestamp=timestamp
+            )
         if self._storage and self._key:
             self._storage.prune(self._key, cutoff)
             count = self._storage.increment(self._key, timestamp)
@@ -122,6 +143,10 @@ class FixedWindowRateLimiter:
         if timestamp is None:
             timestamp = time.time()
         current_window = int(timestamp) // self.window_size
+        if self._storage and self._key and getattr(self._storage, "atomic", False):
+            return self._storage.acquire_fixed_window(
+                self._key, window_size=self.window_size, max_requests=self.max_requests, timestamp=timestamp
+            )
         if self._storage and self._key:
             state = self._storage.get_counter_state(self._key)
             window_start = state.get("window_start")
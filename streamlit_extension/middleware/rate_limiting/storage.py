@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import math
 import threading
 import time
+import uuid
 from typing import Any, Dict, Optional
 from collections import deque
 import sqlite3
@@ -17,6 +19,9 @@ except Exception:  # pragma: no cover
 class MemoryRateLimitStorage:
     """In-memory storage suitable for tests and single process usage."""
 
+    # Provides acquire_* (check and update in one step); see algorithms.py
+    atomic = True
+
     def __init__(self) -> None:
         # key -> {"tokens": float, "last_refill": float, "timestamps": deque, "window_start": int|None, "counter": int}
         self.data: Dict[str, Dict[str, Any]] = {}
@@ -69,6 +74,117 @@ class MemoryRateLimitStorage:
             st["window_start"] = window_start
             st["counter"] = counter
 
+    # Atomic check-and-update (same semantics as the Redis scripts)
+    def acquire_token(
+        self, key: str, *, capacity: float, refill_rate: float, refill_period: float,
+        requested: float = 1, now: Optional[float] = None,
+    ) -> bool:
+        now = time.time() if now is None else now
+        with self.lock:
+            state = self.data.setdefault(key, {})
+            tokens = float(state.get("tokens", capacity))
+            last_refill = float(state.get("last_refill", now))
+            elapsed = max(0.0, now - last_refill)
+            tokens = min(capacity, tokens + (elapsed / refill_period) * refill_rate)
+            allowed = tokens >= requested
+            if allowed:
+                tokens -= requested
+            state["tokens"] = tokens
+            state["last_refill"] = now
+            return allowed
+
+    def acquire_window_slot(self, key: str, *, window_size: float, max_requests: int, timestamp: float) -> bool:
+        cutoff = timestamp - window_size
+        with self.lock:
+            window = self.data.setdefault(key, {"timestamps": deque()}).setdefault("timestamps", deque())
+            while window and window[0] <= cutoff:
+                window.popleft()
+            if len(window) < max_requests:
+                window.append(timestamp)
+                return True
+            return False
+
+    def acquire_fixed_window(self, key: str, *, window_size: int, max_requests: int, timestamp: float) -> bool:
+        current_window = int(timestamp) // window_size
+        with self.lock:
+            st = self.data.setdefault(key, {})
+            if st.get("window_start") != current_window:
+                st["window_start"] = current_window
+                st["counter"] = 0
+            if st["counter"] < max_requests:
+                st["counter"] += 1
+                return True
+            return False
+
+
+# Server-side scripts: each reads, decides and writes in one round trip, so
+# concurrent workers cannot interleave between the check and the update.
+# Every script sets a TTL after which a missing key means "fresh" state.
+
+# The token bucket reads the Redis server clock (TIME) unless ARGV[4] pins
+# "now", so workers with skewed clocks cannot refill each other's buckets.
+_TOKEN_BUCKET_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+if not now then
+  local time = redis.call('TIME')
+  now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+end
+local ttl = tonumber(ARGV[5])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(state[1]) or capacity
+local last_refill = tonumber(state[2]) or now
+local elapsed = math.max(0, now - last_refill)
+tokens = math.min(capacity, tokens + elapsed * rate)
+local allowed = 0
+if tokens >= requested then
+  tokens = tokens - requested
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_refill', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+return allowed
+"""
+
+_SLIDING_WINDOW_LUA = """
+local window = tonumber(ARGV[1])
+local max_requests = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local allowed = 0
+if redis.call('ZCARD', KEYS[1]) < max_requests then
+  redis.call('ZADD', KEYS[1], now, ARGV[4])
+  allowed = 1
+end
+redis.call('EXPIRE', KEYS[1], math.ceil(window) + 1)
+return allowed
+"""
+
+_FIXED_WINDOW_LUA = """
+local window_start = ARGV[1]
+local max_requests = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'window_start', 'counter')
+local counter = 0
+if state[1] == window_start then
+  counter = tonumber(state[2]) or 0
+end
+local allowed = 0
+if counter < max_requests then
+  counter = counter + 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'window_start', window_start, 'counter', counter)
+redis.call('EXPIRE', KEYS[1], ttl)
+return allowed
+"""
+
+# Cap for bucket TTLs when the refill rate is zero or tiny
+_MAX_STATE_TTL = 86400
+
 
 class RedisRateLimitStorage:
     """Redis-backed storage for rate limiting."""
@@ -77,10 +193,18 @@ class RedisRateLimitStorage:
         if redis is None:
             raise RuntimeError("redis-py não está instalado. `pip install redis`")
         self.r = client
+        # Clients without scripting fall back to the read-modify-write methods
+        self.atomic = hasattr(client, "register_script")
+        if self.atomic:
+            self._token_bucket = client.register_script(_TOKEN_BUCKET_LUA)
+            self._sliding_window = client.register_script(_SLIDING_WINDOW_LUA)
+            self._fixed_window = client.register_script(_FIXED_WINDOW_LUA)
 
     def get_bucket_state(self, key: str) -> Dict[str, Any]:
         h = self.r.hgetall(f"rl:bucket:{key}")
         if not h:
+            if self.atomic:
+                return {}  # expired or never used: callers treat it as a full bucket
             return {"tokens": 0.0, "last_refill": time.time()}
         tokens = float(h.get(b"tokens", b"0") or 0)
         last_refill = float(h.get(b"last_refill", b"0") or 0) or time.time()
@@ -118,6 +242,32 @@ class RedisRateLimitStorage:
             mapping={"window_start": window_start if window_start is not None else -1, "counter": counter},
         )
 
+    # Atomic check-and-update: one EVALSHA per request
+    def acquire_token(
+        self, key: str, *, capacity: float, refill_rate: float, refill_period: float,
+        requested: float = 1, now: Optional[float] = None,
+    ) -> bool:
+        # now=None uses the Redis server clock, shared by every worker
+        rate = refill_rate / refill_period  # tokens per second
+        ttl = min(_MAX_STATE_TTL, math.ceil(capacity / rate) + 1) if rate > 0 else _MAX_STATE_TTL
+        return bool(self._token_bucket(
+            keys=[f"rl:bucket:{key}"],
+            args=[capacity, rate, requested, "" if now is None else repr(now), ttl],
+        ))
+
+    def acquire_window_slot(self, key: str, *, window_size: float, max_requests: int, timestamp: float) -> bool:
+        member = f"{timestamp!r}:{uuid.uuid4().hex[:12]}"  # same-instant requests stay distinct
+        return bool(self._sliding_window(
+            keys=[f"rl:win:{key}"], args=[window_size, max_requests, repr(timestamp), member]
+        ))
+
+    def acquire_fixed_window(self, key: str, *, window_size: int, max_requests: int, timestamp: float) -> bool:
+        current_window = int(timestamp) // window_size
+        ttl = (current_window + 1) * window_size - int(timestamp) + 1
+        return bool(self._fixed_window(
+            keys=[f"rl:fixed:{key}"], args=[current_window, max_requests, ttl]
+        ))
+
 
 class SQLiteRateLimitStorage:
     """SQLite-backed storage for rate limiting."""
@@ -11,6 +11,7 @@ Principais pontos:
 - Cálculo de value density e de desbloqueio (fan-out)
 - Suporte a caminho crítico (tempo crítico + nós críticos)
 - Tie-breakers determinísticos para heap (estável)
+- Cálculo em lote colunar (NumPy opcional) para vários presets de uma vez
 - API compatível com a versão anterior
 
 Uso:
@@ -29,6 +30,13 @@ from typing import Dict, Set, Optional, List, Tuple
 
 from .task_models import Task, TaskPriorityScore
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 # 🎛️ PESOS PADRÃO (tunable via config/env)
 W_PRIORITY = 10.0       # Prioridade explícita da tarefa (1=crítico, 5=backlog)
 W_VALUE_DENSITY = 6.0   # Valor/esforço ratio
@@ -45,6 +53,17 @@ TDD_BONUS_RED_FIRST: Dict[int, float] = {
 }
 
 
+# Ordem dos componentes nas colunas do cálculo em lote
+SCORE_COMPONENTS: Tuple[str, ...] = (
+    "priority",
+    "value_density",
+    "unblock",
+    "critical_path",
+    "tdd_bonus",
+    "aging",
+)
+
+
 # =============================================================================
 # Utilidades de cálculo
 # =============================================================================
@@ -158,41 +177,137 @@ def calc_task_scores(
         Dict mapeando task_key → TaskPriorityScore
     """
     w = weights or ScoringWeights()
-    scores: Dict[str, TaskPriorityScore] = {}
+    return calc_task_scores_batch(tasks, adjacency, critical_time, critical_nodes, {"": w})[""]
+
 
-    for task in tasks:
+def _extract_score_columns(
+    tasks: List[Task],
+    adjacency: Dict[str, Set[str]],
+    critical_time: Dict[str, int],
+    critical_nodes: Set[str],
+) -> Tuple[List[str], List[List[float]]]:
+    """
+    Extrai os componentes de score de cada tarefa em colunas (uma passada).
+
+    Returns:
+        (task_keys, colunas na ordem de SCORE_COMPONENTS)
+    """
+    n = len(tasks)
+    keys: List[str] = [""] * n
+    prio_raw: List[float] = [0.0] * n
+    prio_clamped: List[float] = [0.0] * n
+    effort: List[float] = [1.0] * n
+    unblock: List[float] = [0.0] * n
+    task_ct: List[float] = [0.0] * n
+    tdd: List[float] = [0.0] * n
+    aging: List[float] = [0.0] * n
+
+    # max(critical_time) uma única vez (antes era recalculado por tarefa)
+    max_ct = (max(critical_time.values()) or 0) if critical_time else 0
+
+    for i, task in enumerate(tasks):
         tkey = task.task_key
+        keys[i] = tkey
+        prio = getattr(task, "priority", 3) or 3
+        prio_raw[i] = prio
+        prio_clamped[i] = max(1, min(5, prio))
+        effort[i] = task_effort_safe(task)
+        unblock[i] = len(adjacency.get(tkey, ()))
+        if max_ct > 0 and tkey in critical_nodes:
+            task_ct[i] = critical_time.get(tkey, 0)
+        tdd[i] = tdd_bonus_score(task)
+        aging[i] = aging_score(task)
+
+    if NUMPY_AVAILABLE:
+        prio_col = 6 - np.asarray(prio_raw, dtype=np.float64)
+        density_col = (6 - np.asarray(prio_clamped, dtype=np.float64)) / np.asarray(effort, dtype=np.float64)
+        unblock_col = np.asarray(unblock, dtype=np.float64)
+        cpath_col = (np.asarray(task_ct, dtype=np.float64) / max_ct) * 10.0 if max_ct > 0 else np.zeros(n)
+        columns = [prio_col, density_col, unblock_col, cpath_col, np.asarray(tdd), np.asarray(aging)]
+    else:
+        columns = [
+            [6.0 - p for p in prio_raw],
+            [(6 - p) / e for p, e in zip(prio_clamped, effort)],
+            [float(u) for u in unblock],
+            [(ct / max_ct) * 10.0 for ct in task_ct] if max_ct > 0 else [0.0] * n,
+            tdd,
+            aging,
+        ]
+    return keys, columns
+
+
+def _weighted_totals(columns: List[List[float]], presets: List[ScoringWeights]) -> List[List[float]]:
+    """
+    Score total ponderado de todas as tarefas para cada preset.
 
-        # Componentes individuais
-        prio_score = 6 - (getattr(task, "priority", 3) or 3)  # 1=5pts, 5=1pt
-        v_density = value_density_score(task)
-        unblock = unblock_score(tkey, adjacency)
-        cpath = critical_path_score(tkey, critical_time, critical_nodes)
-        tdd = tdd_bonus_score(task)
-        aging = aging_score(task)
-
-        # Score ponderado
-        total = (
-            w.priority * prio_score
-            + w.value_density * v_density
-            + w.unblock * unblock
-            + w.critical_path * cpath
-            + w.tdd_bonus * tdd
-            + w.aging * aging
-        )
+    Soma os componentes na mesma ordem do cálculo escalar, então o resultado
+    é idêntico (bit a bit) ao laço por tarefa.
+    """
+    weight_rows = [[getattr(w, name) for name in SCORE_COMPONENTS] for w in presets]
+
+    if NUMPY_AVAILABLE:
+        matrix = np.asarray(weight_rows, dtype=np.float64)  # (presets, componentes)
+        totals = matrix[:, :1] * columns[0]
+        for k in range(1, len(SCORE_COMPONENTS)):
+            totals = totals + matrix[:, k:k + 1] * columns[k]
+        return totals.tolist()
+
+    results = []
+    for row in weight_rows:
+        totals = [row[0] * c for c in columns[0]]
+        for k in range(1, len(SCORE_COMPONENTS)):
+            wk = row[k]
+            totals = [t + wk * c for t, c in zip(totals, columns[k])]
+        results.append(totals)
+    return results
 
-        scores[tkey] = TaskPriorityScore(
-            task_key=tkey,
-            total_score=float(total),
-            priority_score=float(prio_score),
-            value_density_score=float(v_density),
-            unblock_score=float(unblock),
-            critical_path_score=float(cpath),
-            tdd_bonus_score=float(tdd),
-            aging_score=float(aging),
-        )
 
-    return scores
+def calc_task_scores_batch(
+    tasks: List[Task],
+    adjacency: Dict[str, Set[str]],
+    critical_time: Dict[str, int],
+    critical_nodes: Set[str],
+    presets: Dict[str, ScoringWeights],
+) -> Dict[str, Dict[str, TaskPriorityScore]]:
+    """
+    Calcula scores de todas as tarefas para vários presets de uma vez.
+
+    Os componentes são extraídos em colunas uma única vez e o total ponderado
+    é calculado de forma vetorizada (NumPy, se disponível) para todos os presets.
+
+    Args:
+        tasks: Lista de tarefas
+        adjacency: Grafo de dependências invertido {task_key: {dependentes}}
+        critical_time: Tempo crítico (distância) por tarefa
+        critical_nodes: Conjunto de tarefas que compõem o caminho crítico
+        presets: {nome: ScoringWeights}
+
+    Returns:
+        Dict mapeando nome do preset → {task_key → TaskPriorityScore}
+    """
+    names = list(presets)
+    if not names:
+        return {}
+    keys, columns = _extract_score_columns(tasks, adjacency, critical_time, critical_nodes)
+    totals = _weighted_totals(columns, [presets[name] for name in names])
+    components = list(zip(*(c.tolist() if NUMPY_AVAILABLE else c for c in columns)))
+
+    results: Dict[str, Dict[str, TaskPriorityScore]] = {}
+    for name, preset_totals in zip(names, totals):
+        scores: Dict[str, TaskPriorityScore] = {}
+        for tkey, total, (prio, density, unblock, cpath, tdd, aging) in zip(keys, preset_totals, components):
+            scores[tkey] = TaskPriorityScore(
+                task_key=tkey,
+                total_score=float(total),
+                priority_score=float(prio),
+                value_density_score=float(density),
+                unblock_score=float(unblock),
+                critical_path_score=float(cpath),
+                tdd_bonus_score=float(tdd),
+                aging_score=float(aging),
+            )
+        results[name] = scores
+    return results
 
 
 def priority_tuple(task: Task, score: TaskPriorityScore) -> Tuple[float, float, int, str]:
@@ -364,10 +479,25 @@ class ScoringSystem:
         # fallback seguro e explícito
         return 1.0
 
+    def calculate_scores(self, tasks: List[Task], preset: ScoringPreset) -> Dict[str, float]:
+        """
+        Calcula o score de várias tarefas em lote (mesmo contexto mínimo de
+        `calculate_score`), em uma única passada colunar.
+        """
+        result = calc_task_scores_batch(
+            tasks=tasks,
+            adjacency={},
+            critical_time={},
+            critical_nodes=set(),
+            presets={preset.name: preset.weights},
+        )[preset.name]
+        return {tkey: float(score.total_score) for tkey, score in result.items()}
+
 
 # 📊 EXPORTAÇÕES
 __all__ = [
     "calc_task_scores",
+    "calc_task_scores_batch",
     "priority_tuple",
     "task_effort_safe",
     "tdd_bonus_score",
@@ -376,6 +506,7 @@ __all__ = [
     "ScoringSystem",
     "ScoringPreset",
     "TDD_BONUS_RED_FIRST",
+    "SCORE_COMPONENTS",
     "validate_scoring_monotonicity",
     "SCORING_PRESET_BALANCED",
     "SCORING_PRESET_CRITICAL_PATH_FOCUS",
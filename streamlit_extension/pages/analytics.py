@@ -20,17 +20,23 @@ except ImportError:
 
 # Migrated to modular database API
 from streamlit_extension.database import queries
+from streamlit_extension.database.loader import load_concurrently
 
 def get_analytics_data() -> Dict[str, Any]:
     """Get analytics data using modular database API."""
     
     try:
-        # Use modular queries for all data operations
-        epics = queries.list_epics()
-        tasks = queries.list_all_tasks()
-        
-        # Get user statistics using optimized query
-        user_stats = queries.get_user_stats_optimized(user_id=1)
+        # Use modular queries for all data operations (independent reads run
+        # concurrently; concurrent viewers share in-flight queries)
+        loaded = load_concurrently({
+            'epics': (("queries.list_epics",), queries.list_epics),
+            'tasks': (("queries.list_all_tasks",), queries.list_all_tasks),
+            # Get user statistics using optimized query
+            'user_stats': (("queries.user_stats", 1), lambda: queries.get_user_stats_optimized(user_id=1)),
+        })
+        epics = loaded['epics']
+        tasks = loaded['tasks']
+        user_stats = loaded['user_stats']
         
         # Calculate analytics from the retrieved data
         analytics = {
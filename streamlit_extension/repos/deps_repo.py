@@ -10,6 +10,7 @@ Usage:
     
     repo = DepsRepo(connection)
     deps = repo.list_by_epic(epic_id=1)
+    project_deps = repo.list_by_project(project_id=1)
     
 Features:
 - ✅ JOIN para trazer dependent_task_key (simplifica adjacency building)
@@ -75,6 +76,46 @@ class DepsRepo:
         """
         self.conn = connection
     
+    def _parse_rows(self, rows, label: str) -> List[TaskDependency]:
+        """
+        Converte linhas em dependências, registrando erros de parse sem abortar.
+        
+        dependent_task_key não faz parte do TaskDependency model, mas é
+        anexado como atributo extra por ser útil para building adjacency graphs.
+        
+        Args:
+            rows: Linhas retornadas pela consulta (com dependent_task_key)
+            label: Identificação da operação usada nos logs
+            
+        Returns:
+            Lista de dependências que foram convertidas com sucesso
+        """
+        dependencies = []
+        parse_errors = 0
+        error_examples = []
+        
+        for row in rows:
+            row_dict = dict(row)
+            try:
+                dep = TaskDependency.from_db_row(row_dict)
+                dep.dependent_task_key = row_dict.get('dependent_task_key')
+                dependencies.append(dep)
+            except Exception as e:
+                # Parse error seguro
+                dep_id = row_dict.get('id', 'unknown')
+                depends_on = row_dict.get('depends_on_task_key', 'unknown')
+                logger.warning(f"Parse error dependência {dep_id} ({depends_on}): {e}", exc_info=True)
+                
+                parse_errors += 1
+                if len(error_examples) < 3:
+                    error_examples.append(f"{dep_id}({depends_on})")
+        
+        if parse_errors > 0:
+            examples_str = ", ".join(error_examples)
+            logger.error(f"{label}: {parse_errors} erros de parse. Exemplos: {examples_str}")
+        
+        return dependencies
+    
     def list_by_epic(
         self, 
         epic_id: int,
@@ -111,36 +152,7 @@ class DepsRepo:
             with dict_rows(self.conn):
                 rows = self.conn.execute(sql, params).fetchall()
             
-            dependencies = []
-            parse_errors = 0
-            error_examples = []
-            
-            for row in rows:
-                try:
-                    # Converter row para dict e criar TaskDependency
-                    row_dict = dict(row)
-                    # dependent_task_key não faz parte do TaskDependency model,
-                    # mas é útil para building adjacency graphs
-                    dep = TaskDependency.from_db_row(row_dict)
-                    
-                    # Adicionar dependent_task_key como atributo extra se necessário
-                    dep.dependent_task_key = row_dict.get('dependent_task_key')
-                    
-                    dependencies.append(dep)
-                except Exception as e:
-                    # Parse error seguro
-                    row_dict = dict(row)
-                    dep_id = row_dict.get('id', 'unknown')
-                    depends_on = row_dict.get('depends_on_task_key', 'unknown')
-                    logger.warning(f"Parse error dependência {dep_id} ({depends_on}): {e}", exc_info=True)
-                    
-                    parse_errors += 1
-                    if len(error_examples) < 3:
-                        error_examples.append(f"{dep_id}({depends_on})")
-            
-            if parse_errors > 0:
-                examples_str = ", ".join(error_examples)
-                logger.error(f"list_by_epic({epic_id}): {parse_errors} erros de parse. Exemplos: {examples_str}")
+            dependencies = self._parse_rows(rows, f"list_by_epic({epic_id})")
             
             logger.info(f"Carregadas {len(dependencies)} dependências do épico {epic_id}")
             return dependencies
@@ -148,6 +160,41 @@ class DepsRepo:
         except Exception as e:
             raise RepoError(f"list_by_epic({epic_id}) falhou: {e}") from e
     
+    def list_by_project(self, project_id: int) -> List[TaskDependency]:
+        """
+        Lista dependências das tarefas de todos os épicos de um projeto,
+        incluindo dependências entre épicos, em uma única consulta.
+        
+        Args:
+            project_id: ID do projeto
+            
+        Returns:
+            Lista de dependências ordenadas por ID
+            
+        Raises:
+            RepoError: Em caso de erro na query ou parsing
+        """
+        sql = f"""
+            SELECT {DEPS_BASE_FIELDS}
+            FROM task_dependencies td
+            JOIN framework_tasks ft ON td.task_id = ft.id
+            JOIN framework_epics fe ON fe.id = ft.epic_id
+            WHERE fe.project_id = ?
+            ORDER BY td.id
+        """
+        
+        try:
+            with dict_rows(self.conn):
+                rows = self.conn.execute(sql, (project_id,)).fetchall()
+            
+            dependencies = self._parse_rows(rows, f"list_by_project({project_id})")
+            
+            logger.info(f"Carregadas {len(dependencies)} dependências do projeto {project_id}")
+            return dependencies
+            
+        except Exception as e:
+            raise RepoError(f"list_by_project({project_id}) falhou: {e}") from e
+    
     def list_by_task_id(self, task_id: int) -> List[TaskDependency]:
         """
         Lista dependências de uma tarefa específica.
@@ -173,25 +220,7 @@ class DepsRepo:
             with dict_rows(self.conn):
                 rows = self.conn.execute(sql, (task_id,)).fetchall()
             
-            dependencies = []
-            parse_errors = 0
-            
-            for row in rows:
-                try:
-                    row_dict = dict(row)
-                    dep = TaskDependency.from_db_row(row_dict)
-                    dep.dependent_task_key = row_dict.get('dependent_task_key')
-                    dependencies.append(dep)
-                except Exception as e:
-                    row_dict = dict(row)
-                    dep_id = row_dict.get('id', 'unknown')
-                    logger.warning(f"Parse error dependência {dep_id}: {e}", exc_info=True)
-                    parse_errors += 1
-            
-            if parse_errors > 0:
-                logger.error(f"list_by_task_id({task_id}): {parse_errors} erros de parse")
-            
-            return dependencies
+            return self._parse_rows(rows, f"list_by_task_id({task_id})")
             
         except Exception as e:
             raise RepoError(f"list_by_task_id({task_id}) falhou: {e}") from e
@@ -221,25 +250,7 @@ class DepsRepo:
             with dict_rows(self.conn):
                 rows = self.conn.execute(sql, (depends_on_task_key,)).fetchall()
             
-            dependencies = []
-            parse_errors = 0
-            
-            for row in rows:
-                try:
-                    row_dict = dict(row)
-                    dep = TaskDependency.from_db_row(row_dict)
-                    dep.dependent_task_key = row_dict.get('dependent_task_key')
-                    dependencies.append(dep)
-                except Exception as e:
-                    row_dict = dict(row)
-                    dep_id = row_dict.get('id', 'unknown')
-                    logger.warning(f"Parse error dependência {dep_id}: {e}", exc_info=True)
-                    parse_errors += 1
-            
-            if parse_errors > 0:
-                logger.error(f"list_by_depends_on_task_key({depends_on_task_key}): {parse_errors} erros de parse")
-            
-            return dependencies
+            return self._parse_rows(rows, f"list_by_depends_on_task_key({depends_on_task_key})")
             
         except Exception as e:
             raise RepoError(f"list_by_depends_on_task_key({depends_on_task_key}) falhou: {e}") from e
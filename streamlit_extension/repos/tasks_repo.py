@@ -10,6 +10,7 @@ Usage:
     
     repo = TasksRepo(connection)
     tasks = repo.list_by_epic(epic_id=1, limit=100)
+    project_tasks = repo.list_by_project(project_id=1)
     
 Features:
 - ✅ Ordenação humana (task_sequence > task_key)
@@ -78,6 +79,40 @@ class TasksRepo:
         """
         self.conn = connection
     
+    def _parse_rows(self, rows, label: str) -> List[Task]:
+        """
+        Converte linhas em tarefas, registrando erros de parse sem abortar.
+        
+        PATCH 3: task_key seguro em parse errors
+        
+        Args:
+            rows: Linhas retornadas pela consulta
+            label: Identificação da operação usada nos logs
+            
+        Returns:
+            Lista de tarefas que foram convertidas com sucesso
+        """
+        tasks = []
+        parse_errors = 0
+        error_examples = []
+        
+        for row in rows:
+            try:
+                tasks.append(Task.from_db_row(dict(row)))
+            except Exception as e:
+                task_key = dict(row).get('task_key', 'unknown')
+                logger.warning(f"Parse error tarefa {task_key}: {e}", exc_info=True)
+                
+                parse_errors += 1
+                if len(error_examples) < 3:  # Até 3 exemplos para debugging
+                    error_examples.append(task_key)
+        
+        if parse_errors > 0:
+            examples_str = ", ".join(error_examples)
+            logger.error(f"{label}: {parse_errors} erros de parse. Exemplos: {examples_str}")
+        
+        return tasks
+    
     def list_by_epic(
         self, 
         epic_id: int, 
@@ -116,27 +151,7 @@ class TasksRepo:
             with dict_rows(self.conn):
                 rows = self.conn.execute(sql, params).fetchall()
             
-            tasks = []
-            parse_errors = 0
-            error_examples = []
-            
-            for row in rows:
-                try:
-                    task = Task.from_db_row(dict(row))
-                    tasks.append(task)
-                except Exception as e:
-                    # PATCH 3: task_key seguro em parse errors
-                    row_dict = dict(row)
-                    task_key = row_dict.get('task_key', 'unknown')
-                    logger.warning(f"Parse error tarefa {task_key}: {e}", exc_info=True)
-                    
-                    parse_errors += 1
-                    if len(error_examples) < 3:  # Até 3 exemplos para debugging
-                        error_examples.append(task_key)
-            
-            if parse_errors > 0:
-                examples_str = ", ".join(error_examples)
-                logger.error(f"list_by_epic({epic_id}): {parse_errors} erros de parse. Exemplos: {examples_str}")
+            tasks = self._parse_rows(rows, f"list_by_epic({epic_id})")
             
             logger.info(f"Carregadas {len(tasks)} tarefas do épico {epic_id}")
             return tasks
@@ -144,6 +159,42 @@ class TasksRepo:
         except Exception as e:
             raise RepoError(f"list_by_epic({epic_id}) falhou: {e}") from e
     
+    def list_by_project(self, project_id: int) -> List[Task]:
+        """
+        Lista tarefas de todos os épicos de um projeto em uma única consulta.
+        
+        Usado pelo planejamento por projeto (evita uma consulta por épico).
+        
+        Args:
+            project_id: ID do projeto
+            
+        Returns:
+            Lista de tarefas ordenadas por épico e ordenação humana
+            
+        Raises:
+            RepoError: Em caso de erro na query ou parsing
+        """
+        fields = ", ".join(f"ft.{name.strip()}" for name in BASE_FIELDS.split(","))
+        sql = f"""
+            SELECT {fields}
+            FROM framework_tasks ft
+            JOIN framework_epics fe ON fe.id = ft.epic_id
+            WHERE fe.project_id = ? AND ft.deleted_at IS NULL
+            ORDER BY ft.epic_id, COALESCE(ft.task_sequence, 1e9), ft.task_key
+        """
+        
+        try:
+            with dict_rows(self.conn):
+                rows = self.conn.execute(sql, (project_id,)).fetchall()
+            
+            tasks = self._parse_rows(rows, f"list_by_project({project_id})")
+            
+            logger.info(f"Carregadas {len(tasks)} tarefas do projeto {project_id}")
+            return tasks
+            
+        except Exception as e:
+            raise RepoError(f"list_by_project({project_id}) falhou: {e}") from e
+    
     def get_by_task_key(self, task_key: str) -> Optional[Task]:
         """
         Busca tarefa por task_key.
@@ -201,9 +252,7 @@ class TasksRepo:
                 unique_keys.append(key)
         
         CHUNK_SIZE = 900  # SQLite limit ~999 parâmetros
-        tasks = []
-        parse_errors = 0
-        error_examples = []
+        rows = []
         
         try:
             with dict_rows(self.conn):
@@ -218,27 +267,9 @@ class TasksRepo:
                         ORDER BY COALESCE(task_sequence, 1e9), task_key
                     """
                     
-                    rows = self.conn.execute(sql, chunk).fetchall()
-                    
-                    for row in rows:
-                        try:
-                            task = Task.from_db_row(dict(row))
-                            tasks.append(task)
-                        except Exception as e:
-                            # PATCH 3: task_key seguro em parse errors
-                            row_dict = dict(row)
-                            task_key = row_dict.get('task_key', 'unknown')
-                            logger.warning(f"Parse error tarefa {task_key}: {e}", exc_info=True)
-                            
-                            parse_errors += 1
-                            if len(error_examples) < 3:
-                                error_examples.append(task_key)
+                    rows.extend(self.conn.execute(sql, chunk).fetchall())
             
-            if parse_errors > 0:
-                examples_str = ", ".join(error_examples)
-                logger.error(f"list_by_task_keys({len(task_keys)} keys): {parse_errors} erros de parse. Exemplos: {examples_str}")
-            
-            return tasks
+            return self._parse_rows(rows, f"list_by_task_keys({len(task_keys)} keys)")
             
         except Exception as e:
             raise RepoError(f"list_by_task_keys({len(task_keys)} keys) falhou: {e}") from e
@@ -15,9 +15,11 @@ from collections.abc import Iterable, Mapping
 
 from .base import (
     BaseService, ServiceResult, ServiceError, ServiceErrorType,
-    BaseRepository
+    BaseRepository, timed_operation
 )
+from .session_aggregates import SCOPE_ALL, get_session_aggregate_cache
 from ..database import queries as db_queries
+from ..database.loader import load_concurrently
 from ..database.connection import transaction, get_connection_context, execute
 from ..config.constants import TaskStatus, EpicStatus, ProjectStatus, TDDPhase
 # Auth imports
@@ -93,16 +95,12 @@ class AnalyticsRepository(BaseRepository):
                     SUM(CASE WHEN e.status = 'completed' THEN 1 ELSE 0 END) as completed_epics,
                     SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
                     AVG(CASE WHEN t.status = 'completed' THEN 100.0 ELSE 0.0 END) as completion_percentage,
-                    SUM(COALESCE(ws.total_time, 0)) as total_time_minutes,
+                    SUM(COALESCE(tt.total_minutes, 0)) as total_time_minutes,
                     SUM(t.estimated_hours) as total_estimated_hours
                 FROM framework_projects p
                 LEFT JOIN framework_epics e ON p.id = e.project_id
                 LEFT JOIN framework_tasks t ON e.id = t.epic_id
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 {where_clause}
                 GROUP BY p.id, p.name, p.status
                 ORDER BY p.created_at DESC
@@ -121,17 +119,13 @@ class AnalyticsRepository(BaseRepository):
             date_filter = datetime.now() - timedelta(days=days)
             
             # Tasks by TDD phase
-            phase_query = """
+            phase_query = f"""
                 SELECT 
                     t.tdd_phase,
                     COUNT(*) as task_count,
-                    AVG(COALESCE(ws.total_time, 0)) as avg_time_minutes
+                    AVG(COALESCE(tt.total_minutes, 0)) as avg_time_minutes
                 FROM framework_tasks t
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 WHERE t.created_at >= ?
                 GROUP BY t.tdd_phase
             """
@@ -141,16 +135,12 @@ class AnalyticsRepository(BaseRepository):
             )
             
             # TDD cycle completions (tasks that went through full RED -> GREEN -> REFACTOR)
-            cycle_query = """
+            cycle_query = f"""
                 SELECT 
                     COUNT(*) as completed_cycles,
-                    AVG(COALESCE(ws.total_time, 0)) as avg_cycle_time
+                    AVG(COALESCE(tt.total_minutes, 0)) as avg_cycle_time
                 FROM framework_tasks t
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 WHERE t.status = 'completed' 
                 AND t.tdd_phase = 'refactor'
                 AND t.created_at >= ?
@@ -176,53 +166,22 @@ class AnalyticsRepository(BaseRepository):
         try:
             date_filter = datetime.now() - timedelta(days=days)
             
-            # Daily productivity
-            daily_query = """
-                SELECT 
-                    DATE(ws.start_time) as work_date,
-                    COUNT(DISTINCT ws.task_id) as tasks_worked,
-                    COUNT(ws.id) as total_sessions,
-                    SUM(ws.duration_minutes) as total_minutes,
-                    AVG(ws.duration_minutes) as avg_session_minutes
-                FROM work_sessions ws
-                WHERE ws.start_time >= ?
-                GROUP BY DATE(ws.start_time)
-                ORDER BY work_date DESC
-            """
-            
-            daily_results = _ensure_dict_list(
-                self.db_manager.execute_query(daily_query, [date_filter])
-            )
-            
-            # Focus patterns (sessions by hour of day)
-            focus_query = """
-                SELECT 
-                    CAST(strftime('%H', ws.start_time) AS INTEGER) as hour_of_day,
-                    COUNT(*) as session_count,
-                    SUM(ws.duration_minutes) as total_minutes,
-                    AVG(ws.duration_minutes) as avg_session_minutes
-                FROM work_sessions ws
-                WHERE ws.start_time >= ?
-                GROUP BY hour_of_day
-                ORDER BY hour_of_day
-            """
-            
-            focus_results = _ensure_dict_list(
-                self.db_manager.execute_query(focus_query, [date_filter])
+            # Daily productivity and focus patterns (sessions by hour of day):
+            # one cached pass over all sessions of the window
+            daily_results, focus_results = get_session_aggregate_cache().read(
+                self.db_manager, SCOPE_ALL, days, None,
+                self.db_manager.execute_query,
+                lambda agg: (agg.daily_productivity(), agg.focus_patterns())
             )
             
             # Estimate accuracy
-            accuracy_query = """
+            accuracy_query = f"""
                 SELECT 
                     t.estimated_hours,
-                    COALESCE(ws.total_time, 0) / 60.0 as actual_hours,
-                    ABS(t.estimated_hours - COALESCE(ws.total_time, 0) / 60.0) as variance_hours
+                    COALESCE(tt.total_minutes, 0) / 60.0 as actual_hours,
+                    ABS(t.estimated_hours - COALESCE(tt.total_minutes, 0) / 60.0) as variance_hours
                 FROM framework_tasks t
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 WHERE t.estimated_hours IS NOT NULL 
                 AND t.estimated_hours > 0
                 AND t.created_at >= ?
@@ -248,7 +207,7 @@ class AnalyticsRepository(BaseRepository):
             date_filter = datetime.now() - timedelta(days=days)
             
             # Epic completion and points
-            epic_query = """
+            epic_query = f"""
                 SELECT 
                     e.difficulty,
                     e.priority,
@@ -256,14 +215,10 @@ class AnalyticsRepository(BaseRepository):
                     e.status,
                     COUNT(t.id) as total_tasks,
                     SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
-                    SUM(COALESCE(ws.total_time, 0)) as total_time_minutes
+                    SUM(COALESCE(tt.total_minutes, 0)) as total_time_minutes
                 FROM framework_epics e
                 LEFT JOIN framework_tasks t ON e.id = t.epic_id
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 WHERE e.created_at >= ?
                 GROUP BY e.id, e.difficulty, e.priority, e.points, e.status
             """
@@ -307,6 +262,7 @@ class AnalyticsService(BaseService):
         self.repository = AnalyticsRepository()
         super().__init__(self.repository)
     
+    @timed_operation
     def get_dashboard_summary(self, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get comprehensive dashboard summary metrics.
@@ -324,13 +280,20 @@ class AnalyticsService(BaseService):
             if days < 1 or days > 365:
                 return ServiceResult.validation_error("Days must be between 1 and 365", "days")
             
-            # Get all metrics
-            project_metrics = _ensure_dict_list(
-                self.repository.get_project_progress_metrics()
-            )
-            tdd_metrics = self.repository.get_tdd_cycle_metrics(days=days)
-            productivity_metrics = self.repository.get_productivity_metrics(days=days)
-            gamification_metrics = self.repository.get_gamification_metrics(days=days)
+            # Get all metrics (independent queries, loaded concurrently and
+            # shared with other sessions requesting the same dashboard)
+            repo = self.repository
+            source = id(repo.db_manager)
+            metrics = load_concurrently({
+                'projects': (("analytics.projects", source), repo.get_project_progress_metrics),
+                'tdd': (("analytics.tdd", source, days), lambda: repo.get_tdd_cycle_metrics(days=days)),
+                'productivity': (("analytics.productivity", source, days), lambda: repo.get_productivity_metrics(days=days)),
+                'gamification': (("analytics.gamification", source, days), lambda: repo.get_gamification_metrics(days=days)),
+            })
+            project_metrics = _ensure_dict_list(metrics['projects'])
+            tdd_metrics = metrics['tdd']
+            productivity_metrics = metrics['productivity']
+            gamification_metrics = metrics['gamification']
             
             # Calculate derived metrics
             completion_rates = self._calculate_completion_rates({})
@@ -364,6 +327,7 @@ class AnalyticsService(BaseService):
             logger.warning("Operation failed: %s", str(e))
     
     
+    @timed_operation
     def get_project_analytics(self, project_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get analytics for a specific project.
@@ -402,6 +366,7 @@ class AnalyticsService(BaseService):
         except Exception as e:
             logger.warning("Operation failed: %s", str(e))
     
+    @timed_operation
     def get_productivity_report(self, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get comprehensive productivity report.
@@ -441,6 +406,7 @@ class AnalyticsService(BaseService):
         except Exception as e:
             logger.warning("Operation failed: %s", str(e))
     
+    @timed_operation
     def get_tdd_metrics_report(self, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get TDD-specific metrics and analysis.
@@ -480,6 +446,7 @@ class AnalyticsService(BaseService):
         except Exception as e:
             logger.warning("Operation failed: %s", str(e))
     
+    @timed_operation
     def get_time_tracking_report(self, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get time tracking analysis report.
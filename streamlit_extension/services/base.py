@@ -9,9 +9,15 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union, Generic, TypeVar, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import base64
+import functools
+import json
 import logging
+import time
 from contextlib import contextmanager
 from streamlit_extension.auth.middleware import require_auth, require_admin
+from streamlit_extension.database.rollups import task_time_source
+from streamlit_extension.services.operation_metrics import get_operation_metrics
 from streamlit_extension.auth.user_model import UserRole
 
 # Type variable for generic result types
@@ -128,6 +134,12 @@ class BaseRepository(ABC):
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
     
+    def task_time_source(self) -> str:
+        """Per-task time totals relation for joins (checked once per repository)."""
+        if getattr(self, '_task_time_source', None) is None:
+            self._task_time_source = task_time_source(self.db_manager.execute_query)
+        return self._task_time_source
+    
     @contextmanager
     def transaction(self):
         """Context manager for database transactions."""
@@ -141,6 +153,33 @@ class BaseRepository(ABC):
             raise
 
 
+def timed_operation(func):
+    """
+    Record the latency and outcome of a service operation.
+    
+    Apply to the public operations that should show up in
+    ``operation_metrics`` (and on ``/metrics``). Calls are keyed by the
+    defining class and the method name; exceptions and failed
+    ``ServiceResult`` values count as errors.
+    """
+    service = func.__qualname__.rsplit(".", 2)[-2]
+    operation = func.__name__
+    metrics = get_operation_metrics()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        success = False
+        try:
+            result = func(*args, **kwargs)
+            success = not isinstance(result, ServiceResult) or result.success
+            return result
+        finally:
+            metrics.record(service, operation, time.perf_counter() - start, success)
+    
+    return wrapper
+
+
 class BaseService(ABC):
     """
     Base class for all service implementations.
@@ -156,7 +195,11 @@ class BaseService(ABC):
     def log_operation(self, operation: str, **kwargs) -> None:
         """Log service operations for audit and debugging."""
         self.logger.info(f"Service operation: {operation}", extra=kwargs)
-    
+
+    def _log_operation_start(self, operation: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Log the start of an operation with its input parameters."""
+        self.logger.debug(f"Service operation started: {operation} {params or {}}")
+
     def validate_required_fields(self, data: Dict[str, Any], required_fields: List[str]) -> List[ServiceError]:
         """Validate that required fields are present and not empty."""
         errors = []
@@ -203,25 +246,39 @@ class BaseService(ABC):
 
 
 class PaginatedResult(Generic[T]):
-    """Result wrapper for paginated data."""
+    """
+    Result wrapper for paginated data.
+    
+    ``total``/``total_pages`` are None when the count was skipped
+    (``include_total=False``). ``next_cursor`` is an opaque keyset token for
+    the following page, or None on the last page. ``cursor_mode`` marks
+    results built by ``KeysetPage.finish``, whose look-ahead row makes
+    ``next_cursor`` authoritative for ``has_next``.
+    """
     
     def __init__(
         self,
         items: List[T],
-        total: int,
+        total: Optional[int],
         page: int,
         page_size: int,
-        total_pages: int
+        total_pages: Optional[int],
+        next_cursor: Optional[str] = None,
+        cursor_mode: bool = False
     ):
         self.items = items
         self.total = total
         self.page = page
         self.page_size = page_size
         self.total_pages = total_pages
+        self.next_cursor = next_cursor
+        self.cursor_mode = cursor_mode
     
     @property
     def has_next(self) -> bool:
         """Check if there are more pages."""
+        if self.cursor_mode or self.total_pages is None:
+            return self.next_cursor is not None
         return self.page < self.total_pages
     
     @property
@@ -261,6 +318,96 @@ class SortCriteria:
         return f"{self.field} {direction}"
 
 
+class KeysetPage:
+    """
+    Keyset (cursor) pagination on ``ORDER BY sort_expr, id_expr``.
+    
+    Instead of ``LIMIT ? OFFSET ?`` (which scans and discards every earlier
+    row), each page continues after the (sort value, id) of the previous
+    page's last row. Ties are broken by id in the same direction, and NULLs
+    follow SQLite's ordering (first ascending, last descending).
+    
+    Args:
+        sort_expr: Qualified SQL expression to sort by (from a whitelist)
+        id_expr: Unique tiebreaker column, e.g. ``t.id``
+        ascending: Sort direction
+        cursor: Token from ``PaginatedResult.next_cursor`` (None = first page)
+        
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    
+    SORT_KEY_ALIAS = "_keyset_sort"
+    
+    def __init__(self, sort_expr: str, id_expr: str, ascending: bool = True,
+                 cursor: Optional[str] = None):
+        self.sort_expr = sort_expr
+        self.id_expr = id_expr
+        self.ascending = ascending
+        self.signature = f"{sort_expr}:{'asc' if ascending else 'desc'}"
+        self.after = self.decode_cursor(cursor) if cursor else None
+    
+    def decode_cursor(self, cursor: str) -> Tuple[Any, Any]:
+        """Decode a token into (sort value, id)."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            sort_value, last_id = payload["k"]
+            signature = payload["s"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {e}") from e
+        if signature != self.signature:
+            raise ValueError("Pagination cursor does not match the requested sort")
+        return sort_value, last_id
+    
+    def encode_cursor(self, sort_value: Any, last_id: Any) -> str:
+        """Opaque URL-safe token for the row (sort value, id)."""
+        payload = json.dumps({"s": self.signature, "k": [sort_value, last_id]}, default=str)
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+    
+    @property
+    def select_column(self) -> str:
+        """Extra SELECT column carrying the sort value of each row."""
+        return f"{self.sort_expr} AS {self.SORT_KEY_ALIAS}"
+    
+    def condition(self) -> Tuple[Optional[str], List[Any]]:
+        """SQL predicate (and params) for rows after the cursor; None on page 1."""
+        if self.after is None:
+            return None, []
+        sort_value, last_id = self.after
+        sort, rid = self.sort_expr, self.id_expr
+        if self.ascending:
+            if sort_value is None:
+                return f"(({sort}) IS NOT NULL OR {rid} > ?)", [last_id]
+            return (f"(({sort}) > ? OR (({sort}) = ? AND {rid} > ?))",
+                    [sort_value, sort_value, last_id])
+        if sort_value is None:
+            return f"(({sort}) IS NULL AND {rid} < ?)", [last_id]
+        return (f"(({sort}) < ? OR (({sort}) = ? AND {rid} < ?) OR ({sort}) IS NULL)",
+                [sort_value, sort_value, last_id])
+    
+    def order_clause(self) -> str:
+        direction = "ASC" if self.ascending else "DESC"
+        return f" ORDER BY {self.sort_expr} {direction}, {self.id_expr} {direction}"
+    
+    def finish(self, rows: List[Dict[str, Any]], page_size: int,
+               id_key: str = "id") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Trim the look-ahead row (query with ``LIMIT page_size + 1``) and build
+        the next cursor; strips the sort-key column from the items.
+        """
+        rows = [dict(row) for row in rows]
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = self.encode_cursor(last.get(self.SORT_KEY_ALIAS), last.get(id_key))
+        for row in rows:
+            row.pop(self.SORT_KEY_ALIAS, None)
+        return rows, next_cursor
+
+
 # Utility functions for service layer
 @require_auth()
 def create_success_result(data: T) -> ServiceResult[T]:
@@ -12,7 +12,7 @@ import re
 
 from .base import (
     BaseService, ServiceResult, ServiceError, ServiceErrorType,
-    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria
+    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria, KeysetPage, timed_operation
 )
 from ..database import queries as db_queries
 from ..database.connection import transaction, get_connection_context, execute
@@ -71,20 +71,58 @@ class EpicRepository(BaseRepository):
             self.db_manager.logger.error(f"Error finding epic by key {epic_key}: {e}")
             return None
     
+    # Sortable fields -> qualified SQL expressions (keyset pagination)
+    SORT_COLUMNS = {
+        'title': 'e.title',
+        'status': 'e.status',
+        'priority': 'e.priority',
+        'difficulty': 'e.difficulty',
+        'points': 'e.points',
+        'epic_key': 'e.epic_key',
+        'created_at': 'e.created_at',
+        'id': 'e.id',
+        'project_name': 'p.name',
+        'progress': (
+            "(SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) * 100.0"
+            " / NULLIF(COUNT(t.id), 0))"
+        ),
+    }
+    # Aggregate sort expressions: keyset condition goes in HAVING
+    AGGREGATE_SORTS = {'progress'}
+    
     def find_all(
         self, 
         filters: Optional[FilterCriteria] = None,
         sort: Optional[SortCriteria] = None,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> PaginatedResult[Dict[str, Any]]:
-        """Find all epics with filtering, sorting, and pagination."""
+        """
+        Find all epics with filtering, sorting, and pagination.
+        
+        Pages are fetched by keyset on (sort column, id): pass the previous
+        result's ``next_cursor`` as ``cursor`` to continue without OFFSET.
+        ``include_total=False`` skips the COUNT(*) query.
+        
+        Raises:
+            ValueError: Unknown sort field or invalid cursor
+        """
+        sort_field = sort.field if sort else 'id'
+        if sort_field not in self.SORT_COLUMNS:
+            raise ValueError(f"Invalid sort field: {sort_field}")
+        keyset = KeysetPage(
+            self.SORT_COLUMNS[sort_field], 'e.id',
+            ascending=sort.ascending if sort else True, cursor=cursor
+        )
         try:
             # Build base query with project information
-            base_query = """
+            base_query = f"""
                 SELECT e.*, p.name as project_name,
                        COUNT(t.id) as task_count,
-                       SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed_tasks
+                       SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END) as completed_tasks,
+                       {keyset.select_column}
                 FROM framework_epics e
                 LEFT JOIN framework_projects p ON e.project_id = p.id
                 LEFT JOIN framework_tasks t ON e.id = t.epic_id
@@ -130,40 +168,41 @@ class EpicRepository(BaseRepository):
             where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             group_clause = " GROUP BY e.id"
             
-            # Build ORDER BY clause
-            order_clause = ""
-            if sort:
-                # Map sort fields to qualified column names
-                sort_field = sort.field
-                if sort_field in ['title', 'status', 'priority', 'difficulty', 'points', 'epic_key']:
-                    sort_field = f"e.{sort_field}"
-                elif sort_field in ['project_name']:
-                    sort_field = f"p.name"
-                elif sort_field == 'progress':
-                    sort_field = "(completed_tasks * 100.0 / NULLIF(task_count, 0))"
-                
-                order_clause = f" ORDER BY {sort_field} {'ASC' if sort.ascending else 'DESC'}"
-            
-            # Count total records (need subquery for GROUP BY)
-            count_query = f"""
-                SELECT COUNT(*) FROM (
-                    SELECT e.id
-                    FROM framework_epics e
-                    LEFT JOIN framework_projects p ON e.project_id = p.id
-                    {where_clause}
-                    GROUP BY e.id
-                )
-            """
-            total_count = self.db_manager.execute_query(count_query, params)[0]['COUNT(*)']
+            # Count total records (optional: deep pages shouldn't pay for it)
+            total_count = total_pages = None
+            if include_total:
+                count_query = f"""
+                    SELECT COUNT(*) FROM (
+                        SELECT e.id
+                        FROM framework_epics e
+                        LEFT JOIN framework_projects p ON e.project_id = p.id
+                        {where_clause}
+                        GROUP BY e.id
+                    )
+                """
+                total_count = self.db_manager.execute_query(count_query, params)[0]['COUNT(*)']
+                total_pages = (total_count + page_size - 1) // page_size
             
-            # Calculate pagination
-            offset = (page - 1) * page_size
-            total_pages = (total_count + page_size - 1) // page_size
+            # Keyset condition continues after the cursor row; OFFSET only
+            # for page-number requests without a cursor
+            after_sql, after_params = keyset.condition()
+            having_clause = ""
+            if after_sql and sort_field in self.AGGREGATE_SORTS:
+                having_clause = f" HAVING {after_sql}"
+            elif after_sql:
+                where_conditions.append(after_sql)
+            data_where = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+            offset = 0 if cursor else (page - 1) * page_size
             
-            # Get paginated results
-            data_query = f"{base_query}{where_clause}{group_clause}{order_clause} LIMIT ? OFFSET ?"
-            data_params = params + [page_size, offset]
-            epics = self.db_manager.execute_query(data_query, data_params)
+            # Get paginated results (one look-ahead row tells if there's more)
+            data_query = (
+                f"{base_query}{data_where}{group_clause}{having_clause}"
+                f"{keyset.order_clause()} LIMIT ? OFFSET ?"
+            )
+            data_params = params + after_params + [page_size + 1, offset]
+            epics, next_cursor = keyset.finish(
+                self.db_manager.execute_query(data_query, data_params), page_size
+            )
             
             # Calculate progress percentage for each epic
             for epic in epics:
@@ -178,7 +217,9 @@ class EpicRepository(BaseRepository):
                 total=total_count,
                 page=page,
                 page_size=page_size,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                cursor_mode=True
             )
             
         except Exception as e:
@@ -550,6 +591,7 @@ class EpicService(BaseService):
         
         return errors
     
+    @timed_operation
     def create_epic(self, epic_data: Dict[str, Any]) -> ServiceResult[int]:
         """
         Create a new epic with validation and gamification.
@@ -606,6 +648,7 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("create_epic", e)
     
+    @timed_operation
     def get_epic(self, epic_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get epic by ID with project information.
@@ -642,6 +685,7 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_epic", e)
     
+    @timed_operation
     def update_epic(self, epic_id: int, epic_data: Dict[str, Any]) -> ServiceResult[bool]:
         """
         Update existing epic.
@@ -697,6 +741,7 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("update_epic", e)
     
+    @timed_operation
     def delete_epic(self, epic_id: int) -> ServiceResult[bool]:
         """
         Delete epic (soft delete).
@@ -735,13 +780,16 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("delete_epic", e)
     
+    @timed_operation
     def list_epics(
         self,
         filters: Optional[Dict[str, Any]] = None,
         sort_by: str = "priority",
         sort_ascending: bool = False,  # Default to highest priority first
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> ServiceResult[PaginatedResult[Dict[str, Any]]]:
         """
         List epics with filtering, sorting, and pagination.
@@ -750,8 +798,10 @@ class EpicService(BaseService):
             filters: Filter criteria dictionary
             sort_by: Field to sort by
             sort_ascending: Sort direction
-            page: Page number (1-based)
+            page: Page number (1-based), used when no cursor is given
             page_size: Items per page
+            cursor: ``next_cursor`` of the previous page (keyset pagination)
+            include_total: Whether to run the COUNT(*) for total/total_pages
             
         Returns:
             ServiceResult with paginated epic list
@@ -773,7 +823,14 @@ class EpicService(BaseService):
             sort_criteria = SortCriteria(sort_by, sort_ascending)
             
             # Get paginated results
-            result = self.repository.find_all(filter_criteria, sort_criteria, page, page_size)
+            try:
+                result = self.repository.find_all(
+                    filter_criteria, sort_criteria, page, page_size,
+                    cursor=cursor, include_total=include_total
+                )
+            except ValueError as e:
+                field = "cursor" if "cursor" in str(e) else "sort_by"
+                return ServiceResult.validation_error(str(e), field)
             
             # Process JSON fields for each epic
             for epic in result.items:
@@ -799,6 +856,7 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("list_epics", e)
     
+    @timed_operation
     def get_epics_by_project(self, project_id: int) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get all epics for a specific project.
@@ -839,6 +897,7 @@ class EpicService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_epics_by_project", e)
     
+    @timed_operation
     def get_epic_summary(self, epic_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get epic summary with metrics and gamification data.
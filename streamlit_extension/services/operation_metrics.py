@@ -0,0 +1,69 @@
+"""
+Per-service operation latencies.
+
+Service operations decorated with ``base.timed_operation`` are recorded
+here, keyed by ``(service, operation)``. Latencies go into a
+``ConcurrentHistogram`` so the hot path takes no lock; failures (exceptions
+or failed ``ServiceResult``) are counted separately. ``snapshot`` merges the
+per-thread histograms for exporters such as ``monitoring.prometheus_metrics``.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Tuple
+
+from tdah_tools.histogram import ConcurrentHistogram, LatencyHistogram
+
+OperationKey = Tuple[str, str]
+
+
+class _Operation:
+    __slots__ = ("latency_ms", "errors")
+
+    def __init__(self) -> None:
+        self.latency_ms = ConcurrentHistogram()
+        self.errors = 0
+
+
+class OperationMetrics:
+    """Latency histogram and error count per ``(service, operation)``."""
+
+    def __init__(self) -> None:
+        self._operations: Dict[OperationKey, _Operation] = {}
+        self._lock = threading.Lock()
+
+    def _operation(self, key: OperationKey) -> _Operation:
+        operation = self._operations.get(key)
+        if operation is None:
+            with self._lock:
+                operation = self._operations.setdefault(key, _Operation())
+        return operation
+
+    def record(self, service: str, operation: str, seconds: float, success: bool = True) -> None:
+        """Record one call of ``service.operation`` that took ``seconds``."""
+        entry = self._operation((service, operation))
+        entry.latency_ms.record(seconds * 1000.0)
+        if not success:
+            with self._lock:
+                entry.errors += 1
+
+    def snapshot(self) -> Dict[OperationKey, Tuple[LatencyHistogram, int]]:
+        """``{(service, operation): (merged latency histogram in ms, errors)}``."""
+        operations = dict(self._operations)
+        return {
+            key: (operation.latency_ms.snapshot(), operation.errors)
+            for key, operation in operations.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+
+
+_operation_metrics = OperationMetrics()
+
+
+def get_operation_metrics() -> OperationMetrics:
+    """Process-wide operation metrics."""
+    return _operation_metrics
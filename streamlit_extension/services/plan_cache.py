@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗄️ SERVICES - Execution Plan Cache
+
+Cache de planos de execução por processo, compartilhado entre instâncias do
+TaskExecutionPlanner (que são criadas por requisição).
+
+Chave: (banco, epic_id, preset, hash dos pesos customizados). O banco é o
+caminho absoluto do arquivo principal da conexão; bancos sem caminho (em
+memória) usam um token que vive enquanto o dono da conexão existir, então
+épicos de bancos diferentes nunca compartilham planos. Cada entrada guarda a
+revisão do épico (``epic_revisions``, incrementada por triggers a cada escrita
+em tarefas/dependências) e um snapshot dos campos das tarefas e das arestas:
+
+- revisão igual → plano cacheado devolvido sem tocar nas tarefas
+- revisão diferente, mesmas tarefas/arestas → plano corrigido (patch)
+- mudança estrutural → plano reconstruído do zero
+
+Planos cacheados são compartilhados: trate-os como somente leitura.
+
+Usage:
+    from streamlit_extension.services.plan_cache import get_plan_cache
+
+    get_plan_cache().get_stats()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+# Campos da tarefa que entram no snapshot (mudanças disparam patch)
+SNAPSHOT_FIELDS: Tuple[str, ...] = (
+    "epic_id",
+    "title",
+    "tdd_phase",
+    "tdd_order",
+    "priority",
+    "story_points",
+    "task_type",
+    "status",
+    "task_group",
+    "task_sequence",
+    "estimate_minutes",
+    "effort_estimate",
+    "created_at",
+)
+
+PlanCacheKey = Tuple[Hashable, int, str, str]
+
+
+def database_path(connection: Any) -> Optional[str]:
+    """Caminho absoluto do banco principal da conexão (None: em memória ou desconhecido)."""
+    try:
+        rows = connection.execute("PRAGMA database_list").fetchall()
+    except Exception:
+        return None
+    for row in rows:
+        if row[1] == "main":
+            return os.path.abspath(row[2]) if row[2] else None
+    return None
+
+
+def task_snapshot(tasks: List[Any]) -> Dict[str, Tuple[Any, ...]]:
+    """Snapshot {task_key: valores de SNAPSHOT_FIELDS} para detectar mudanças."""
+    return {
+        t.task_key: tuple(getattr(t, name, None) for name in SNAPSHOT_FIELDS)
+        for t in tasks
+    }
+
+
+def graph_edges(adjacency: Dict[str, Any]) -> FrozenSet[Tuple[str, str]]:
+    """Arestas (dependente, pré-requisito) do grafo de adjacência."""
+    return frozenset(
+        (task_key, prerequisite)
+        for task_key, prerequisites in adjacency.items()
+        for prerequisite in prerequisites
+    )
+
+
+@dataclass
+class CachedPlan:
+    """Entrada do cache: plano + dados necessários para corrigi-lo."""
+    revision: int
+    plan: Any  # ExecutionPlan
+    context: Any  # PlanningContext
+    snapshot: Dict[str, Tuple[Any, ...]]
+    edges: FrozenSet[Tuple[str, str]]
+
+
+class ExecutionPlanCache:
+    """
+    Cache LRU thread-safe de planos de execução.
+
+    Args:
+        max_entries: Número máximo de planos mantidos (LRU)
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Hashable, CachedPlan]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "patches": 0, "rebuilds": 0, "evictions": 0}
+        self._owner_tokens: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        self._token_counter = itertools.count()
+
+    def database_key(self, connection: Any, owner: Any) -> Hashable:
+        """
+        Identidade do banco da conexão para ``make_key``.
+
+        Bancos em arquivo são identificados pelo caminho (planners sobre o
+        mesmo arquivo compartilham planos). Os demais recebem um token que
+        vive enquanto ``owner`` existir; ao contrário de ``id()``, nunca é
+        reaproveitado por outro objeto.
+        """
+        path = database_path(connection)
+        if path:
+            return ("path", path)
+        with self._lock:
+            token = self._owner_tokens.get(owner)
+            if token is None:
+                token = self._owner_tokens.setdefault(owner, next(self._token_counter))
+        return ("owner", token)
+
+    @staticmethod
+    def make_key(
+        database: Hashable,
+        epic_id: int,
+        scoring_preset: str,
+        custom_weights: Optional[Dict[str, float]] = None,
+    ) -> PlanCacheKey:
+        """Chave (banco, epic_id, preset, hash estável dos pesos customizados)."""
+        payload = json.dumps(custom_weights or {}, sort_keys=True, default=str)
+        weights_hash = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+        return (database, epic_id, scoring_preset, weights_hash)
+
+    def get(self, key: Hashable) -> Optional[CachedPlan]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: CachedPlan) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate_epic(self, epic_id: int) -> int:
+        """Remove os planos do épico (em todos os bancos); retorna quantos foram removidos."""
+        with self._lock:
+            keys = [key for key in self._entries if key[1] == epic_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, outcome: str) -> None:
+        """Contabiliza 'hits' | 'patches' | 'rebuilds'."""
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        """Como ``get_stats``, mas sem o lock (para scrapes de métricas)."""
+        return {**self._stats, "entries": len(self._entries)}
+
+
+# Instância global por processo
+_plan_cache = ExecutionPlanCache()
+
+
+def get_plan_cache() -> ExecutionPlanCache:
+    """Cache global de planos de execução."""
+    return _plan_cache
@@ -13,7 +13,7 @@ import logging
 
 from .base import (
     BaseService, ServiceResult, ServiceError, ServiceErrorType,
-    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria
+    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria, timed_operation
 )
 from ..database import queries as db_queries
 from ..database.connection import transaction, get_connection_context, execute
@@ -289,6 +289,7 @@ class ProjectService(BaseService):
         self.repository = ProjectRepository()
         self.logger = logging.getLogger(__name__)
     
+    @timed_operation
     def get_all_projects(self, include_inactive: bool = False) -> ServiceResult[List[Dict[str, Any]]]:
         """Get all projects, optionally including inactive ones."""
         try:
@@ -305,6 +306,7 @@ class ProjectService(BaseService):
                 ServiceError(ServiceErrorType.DATABASE_ERROR, str(e))
             )
     
+    @timed_operation
     def get_project_by_id(self, project_id: int) -> ServiceResult[Optional[Dict[str, Any]]]:
         """Get project by ID."""
         try:
@@ -317,6 +319,7 @@ class ProjectService(BaseService):
                 ServiceError(ServiceErrorType.DATABASE_ERROR, str(e))
             )
     
+    @timed_operation
     def create_project(self, project_data: Dict[str, Any]) -> ServiceResult[int]:
         """Create new project with validation."""
         # Validate project data
@@ -347,6 +350,7 @@ class ProjectService(BaseService):
                 ServiceError(ServiceErrorType.DATABASE_ERROR, str(e))
             )
     
+    @timed_operation
     def update_project(self, project_id: int, project_data: Dict[str, Any]) -> ServiceResult[bool]:
         """Update project with validation."""
         # Validate project data
@@ -384,6 +388,7 @@ class ProjectService(BaseService):
                 ServiceError(ServiceErrorType.DATABASE_ERROR, str(e))
             )
     
+    @timed_operation
     def delete_project(self, project_id: int) -> ServiceResult[bool]:
         """Delete project (soft delete)."""
         try:
@@ -409,6 +414,7 @@ class ProjectService(BaseService):
                 ServiceError(ServiceErrorType.DATABASE_ERROR, str(e))
             )
     
+    @timed_operation
     def get_project_metrics(self, project_id: int) -> ServiceResult[Dict[str, Any]]:
         """Get project metrics."""
         try:
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ SERVICES - Work Session Aggregates
+
+Single-pass aggregation of work sessions for the timer and analytics pages.
+
+One query reads the session "facts" of a window (hour, weekday and date are
+derived by SQLite, so grouping matches the original ``strftime`` queries) and
+one iteration feeds every grouping at once:
+
+- overall statistics (counts, sums, averages, min/max, duration percentiles)
+- by hour of day, by day of week, by session type and by date
+
+Aggregates are cached per process, keyed by (database, scope, days,
+day boundary, task). The window starts at midnight, so an entry stays valid
+for the whole day and rolls over by itself. TimerRepository applies its own
+writes to the cached aggregates (remove the old row, add the new one), so
+completing a session does not trigger a rescan. Writers that bypass the
+repository are covered by ``max_age_seconds``.
+
+Usage:
+    from streamlit_extension.services.session_aggregates import get_session_aggregate_cache
+
+    get_session_aggregate_cache().get_stats()
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+SCOPE_COMPLETED = "completed"
+SCOPE_ALL = "all"
+
+# Numeric columns averaged/summed with SQL NULL semantics
+_MEASURES: Tuple[str, ...] = (
+    "duration_minutes",
+    "focus_rating",
+    "energy_level",
+    "mood_rating",
+    "interruption_count",
+)
+
+PERCENTILES: Tuple[int, ...] = (50, 90, 95)
+
+SESSION_FACTS_SQL = """
+    SELECT
+        id, task_id, status, session_type, start_time,
+        CAST(strftime('%H', start_time) AS INTEGER) AS hour_of_day,
+        CAST(strftime('%w', start_time) AS INTEGER) AS day_of_week,
+        DATE(start_time) AS work_date,
+        duration_minutes, focus_rating, energy_level, mood_rating, interruption_count
+    FROM work_sessions
+"""
+
+
+def window_start(days: int, today: Optional[date] = None) -> str:
+    """First instant of the ``days`` window, as stored in ``start_time``."""
+    first_day = (today or date.today()) - timedelta(days=days)
+    return datetime.combine(first_day, datetime.min.time()).isoformat(" ")
+
+
+def session_facts_query(
+    scope: str, since: str, task_id: Optional[int] = None
+) -> Tuple[str, List[Any]]:
+    """SQL and parameters selecting the facts of one aggregate."""
+    conditions, params = ["start_time >= ?"], [since]
+    if scope == SCOPE_COMPLETED:
+        conditions.append("status = 'completed'")
+    if task_id is not None:
+        conditions.append("task_id = ?")
+        params.append(task_id)
+    return f"{SESSION_FACTS_SQL} WHERE {' AND '.join(conditions)}", params
+
+
+def fact_by_id_query(session_id: int) -> Tuple[str, List[Any]]:
+    """SQL and parameters selecting the fact of one session."""
+    return f"{SESSION_FACTS_SQL} WHERE id = ?", [session_id]
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Linearly interpolated percentile of a sorted list."""
+    if not values:
+        return None
+    rank = (len(values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+class _Bucket:
+    """Running totals of one group; supports adding and removing rows."""
+
+    __slots__ = ("rows", "sums", "counts", "durations", "tasks")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.sums = {name: 0 for name in _MEASURES}
+        self.counts = {name: 0 for name in _MEASURES}
+        self.durations: List[Any] = []
+        self.tasks: Counter = Counter()
+
+    def apply(self, fact: Dict[str, Any], sign: int) -> None:
+        self.rows += sign
+        for name in _MEASURES:
+            value = fact.get(name)
+            if value is not None:
+                self.sums[name] += sign * value
+                self.counts[name] += sign
+        duration = fact.get("duration_minutes")
+        if duration is not None:
+            if sign > 0:
+                insort(self.durations, duration)
+            else:
+                index = bisect_left(self.durations, duration)
+                if index < len(self.durations) and self.durations[index] == duration:
+                    del self.durations[index]
+        task_id = fact.get("task_id")
+        if task_id is not None:
+            self.tasks[task_id] += sign
+            if self.tasks[task_id] <= 0:
+                del self.tasks[task_id]
+
+    def total(self, name: str) -> Any:
+        """SQL ``SUM``: None when every value is NULL."""
+        return self.sums[name] if self.counts[name] else None
+
+    def mean(self, name: str) -> Optional[float]:
+        """SQL ``AVG``: None when every value is NULL."""
+        count = self.counts[name]
+        return self.sums[name] / count if count else None
+
+
+def _sort_key(key: Any) -> Tuple[bool, Any]:
+    # SQLite orders NULL before any value
+    return (key is not None, key if key is not None else 0)
+
+
+class SessionAggregate:
+    """All groupings of one session window, maintained in a single pass."""
+
+    _GROUPS = ("hour_of_day", "day_of_week", "session_type", "work_date")
+
+    def __init__(self) -> None:
+        self.overall = _Bucket()
+        self.groups: Dict[str, Dict[Any, _Bucket]] = {name: {} for name in self._GROUPS}
+
+    def apply(self, fact: Dict[str, Any], sign: int = 1) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) one session fact."""
+        self.overall.apply(fact, sign)
+        for name, buckets in self.groups.items():
+            key = fact.get(name)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+            bucket.apply(fact, sign)
+            if bucket.rows <= 0:
+                del buckets[key]
+
+    @classmethod
+    def from_rows(cls, rows: Any) -> "SessionAggregate":
+        aggregate = cls()
+        for row in rows:
+            aggregate.apply(row)
+        return aggregate
+
+    def _grouped(
+        self, name: str, row: Callable[[Any, _Bucket], Dict[str, Any]], descending: bool = False
+    ) -> List[Dict[str, Any]]:
+        buckets = self.groups[name]
+        keys = sorted(buckets, key=_sort_key, reverse=descending)
+        return [row(key, buckets[key]) for key in keys]
+
+    # Timer page
+
+    def statistics(self) -> Dict[str, Any]:
+        """Same keys as the former ``get_session_statistics`` query, plus percentiles."""
+        bucket = self.overall
+        stats = {
+            "total_sessions": bucket.rows,
+            "total_minutes": bucket.total("duration_minutes"),
+            "avg_duration": bucket.mean("duration_minutes"),
+            "max_duration": bucket.durations[-1] if bucket.durations else None,
+            "min_duration": bucket.durations[0] if bucket.durations else None,
+            "avg_focus_rating": bucket.mean("focus_rating"),
+            "avg_energy_level": bucket.mean("energy_level"),
+            "avg_mood_rating": bucket.mean("mood_rating"),
+            "total_interruptions": bucket.total("interruption_count"),
+            "avg_interruptions_per_session": bucket.mean("interruption_count"),
+        }
+        for pct in PERCENTILES:
+            stats[f"p{pct}_duration"] = _percentile(bucket.durations, pct)
+        return stats
+
+    def patterns(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Hourly, weekday and session type patterns."""
+
+        def pattern_row(field: str) -> Callable[[Any, _Bucket], Dict[str, Any]]:
+            return lambda key, bucket: {
+                field: key,
+                "session_count": bucket.rows,
+                "total_minutes": bucket.total("duration_minutes"),
+                "avg_focus": bucket.mean("focus_rating"),
+            }
+
+        return {
+            "hourly_patterns": self._grouped("hour_of_day", pattern_row("hour_of_day")),
+            "daily_patterns": self._grouped("day_of_week", pattern_row("day_of_week")),
+            "type_distribution": self._grouped("session_type", pattern_row("session_type")),
+        }
+
+    # Analytics page
+
+    def daily_productivity(self) -> List[Dict[str, Any]]:
+        return self._grouped(
+            "work_date",
+            lambda key, bucket: {
+                "work_date": key,
+                "tasks_worked": len(bucket.tasks),
+                "total_sessions": bucket.rows,
+                "total_minutes": bucket.total("duration_minutes"),
+                "avg_session_minutes": bucket.mean("duration_minutes"),
+            },
+            descending=True,
+        )
+
+    def focus_patterns(self) -> List[Dict[str, Any]]:
+        return self._grouped(
+            "hour_of_day",
+            lambda key, bucket: {
+                "hour_of_day": key,
+                "session_count": bucket.rows,
+                "total_minutes": bucket.total("duration_minutes"),
+                "avg_session_minutes": bucket.mean("duration_minutes"),
+            },
+        )
+
+
+class _Entry:
+    __slots__ = ("scope", "since", "task_id", "aggregate", "built_at")
+
+    def __init__(self, scope: str, since: str, task_id: Optional[int], aggregate: SessionAggregate):
+        self.scope = scope
+        self.since = since
+        self.task_id = task_id
+        self.aggregate = aggregate
+        self.built_at = time.monotonic()
+
+    def covers(self, fact: Optional[Dict[str, Any]]) -> bool:
+        """Whether ``fact`` belongs to this window (same predicate as the query)."""
+        if not fact or fact.get("start_time") is None:
+            return False
+        if self.scope == SCOPE_COMPLETED and fact.get("status") != "completed":
+            return False
+        if self.task_id is not None and fact.get("task_id") != self.task_id:
+            return False
+        return str(fact["start_time"]) >= self.since
+
+
+def _owner_key(owner: Any, tokens: "weakref.WeakKeyDictionary[Any, int]", counter: Any) -> Hashable:
+    """
+    Stable cache identity of a database manager.
+
+    File databases are keyed by absolute path (managers on the same file
+    share aggregates). Anything else gets a token that lives as long as the
+    owner; unlike ``id()``, it is never handed to a later object.
+    """
+    path = getattr(owner, "framework_db_path", None) or getattr(owner, "db_path", None)
+    if path and str(path) != ":memory:":
+        return ("path", os.path.abspath(str(path)))
+    token = tokens.get(owner)
+    if token is None:
+        token = tokens.setdefault(owner, next(counter))
+    return ("owner", token)
+
+
+class SessionAggregateCache:
+    """
+    Thread-safe LRU cache of session aggregates.
+
+    Args:
+        max_entries: Maximum number of aggregates kept (LRU)
+        max_age_seconds: Rebuild entries older than this (writes outside TimerRepository)
+    """
+
+    def __init__(self, max_entries: int = 64, max_age_seconds: float = 300.0):
+        self.max_entries = max(1, int(max_entries))
+        self.max_age_seconds = max_age_seconds
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "builds": 0, "applied": 0, "evictions": 0, "stale_builds": 0}
+        self._owner_tokens: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+        self._token_counter = itertools.count()
+        # Bumped by every apply_change; a build that raced a write is not cached
+        self._version = 0
+        self._building: Counter = Counter()  # owner -> builds in flight
+
+    def _owner(self, owner: Any) -> Hashable:
+        with self._lock:
+            return _owner_key(owner, self._owner_tokens, self._token_counter)
+
+    def read(
+        self,
+        owner: Any,
+        scope: str,
+        days: int,
+        task_id: Optional[int],
+        load: Callable[[str, List[Any]], Any],
+        view: Callable[[SessionAggregate], Any],
+    ) -> Any:
+        """
+        Return ``view(aggregate)`` for the window, building it on a miss.
+
+        Args:
+            owner: Database manager the sessions come from
+            scope: ``SCOPE_COMPLETED`` or ``SCOPE_ALL``
+            days: Window length in days (starting at midnight)
+            task_id: Optional task filter
+            load: ``load(sql, params)`` returning the fact rows
+            view: Builds the result while the cache lock is held
+        """
+        since = window_start(days)
+        key = (self._owner(owner), scope, days, since, task_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.built_at <= self.max_age_seconds:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return view(entry.aggregate)
+            version = self._version
+            self._building[key[0]] += 1
+
+        try:
+            sql, params = session_facts_query(scope, since, task_id)
+            aggregate = SessionAggregate.from_rows(load(sql, params))
+        finally:
+            with self._lock:
+                self._building[key[0]] -= 1
+                if self._building[key[0]] <= 0:
+                    del self._building[key[0]]
+
+        with self._lock:
+            if self._version != version:
+                # A write landed during the load and may be missing from it
+                self._stats["stale_builds"] += 1
+                return view(aggregate)
+            self._entries[key] = _Entry(scope, since, task_id, aggregate)
+            self._entries.move_to_end(key)
+            self._stats["builds"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+            return view(aggregate)
+
+    def tracks(self, owner: Any) -> bool:
+        """True if any aggregate of ``owner`` is cached or being built (writes must be applied)."""
+        owner_id = self._owner(owner)
+        with self._lock:
+            return owner_id in self._building or any(key[0] == owner_id for key in self._entries)
+
+    def apply_change(
+        self,
+        owner: Any,
+        before: Optional[Dict[str, Any]],
+        after: Optional[Dict[str, Any]],
+    ) -> None:
+        """
+        Apply one session write to every cached aggregate of ``owner``.
+
+        Args:
+            before: Session fact before the write (None for inserts)
+            after: Session fact after the write (None for deletes)
+        """
+        owner_id = self._owner(owner)
+        with self._lock:
+            self._version += 1
+            for key, entry in self._entries.items():
+                if key[0] != owner_id:
+                    continue
+                if entry.covers(before):
+                    entry.aggregate.apply(before, -1)
+                if entry.covers(after):
+                    entry.aggregate.apply(after, 1)
+            self._stats["applied"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def stats_snapshot(self) -> Dict[str, int]:
+        """Like ``get_stats`` but without the lock (for metrics scrapes)."""
+        return {**self._stats, "entries": len(self._entries)}
+
+
+# Process-wide instance
+_session_aggregate_cache = SessionAggregateCache()
+
+
+def get_session_aggregate_cache() -> SessionAggregateCache:
+    """Global session aggregate cache."""
+    return _session_aggregate_cache
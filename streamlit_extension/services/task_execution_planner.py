@@ -12,6 +12,7 @@ Usage:
 
     planner = TaskExecutionPlanner(db_connection)
     result = planner.plan_execution(epic_id=1, scoring_preset="balanced")
+    result = planner.plan_project_execution(project_id=1)  # DAG global do projeto
 
 Features:
 - ✅ Ordenação topológica (Kahn) com priorização via heap (tie-breaks estáveis)
@@ -20,13 +21,15 @@ Features:
 - ✅ Repository pattern (TasksRepo / DepsRepo)
 - ✅ Error handling com ServiceResult
 - ✅ Métricas consolidadas do plano
+- ✅ Planejamento por projeto (todos os épicos, dependências entre épicos)
+- ✅ Cache de planos por revisão do épico, com patch incremental (plan_cache)
 """
 
 from __future__ import annotations
 
 import heapq
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
 
@@ -36,8 +39,16 @@ from ..repos.tasks_repo import TasksRepo, RepoError
 from ..repos.deps_repo import DepsRepo
 from ..models.task_models import Task, TaskDependency
 from ..models.scoring import ScoringSystem, ScoringPreset
-from ..utils.graph_algorithms import GraphAlgorithms
-from ..services.base import BaseService, ServiceResult
+from ..utils.graph_algorithms import CriticalPathResult, GraphAlgorithms, ReachabilityIndex
+from ..services.base import BaseService, ServiceResult, timed_operation
+from ..services.plan_cache import (
+    CachedPlan,
+    ExecutionPlanCache,
+    get_plan_cache,
+    graph_edges,
+    task_snapshot,
+)
+from ..database.rollups import read_epic_revision
 
 logger = logging.getLogger(__name__)
 
@@ -49,13 +60,17 @@ logger = logging.getLogger(__name__)
 @dataclass
 class ExecutionPlan:
     """Resultado do planejamento de execução."""
-    epic_id: int
+    epic_id: Optional[int]
     execution_order: List[str]
     task_scores: Dict[str, float]
     critical_path: List[str]
     execution_metrics: Dict[str, Any]
     dag_validation: Dict[str, Any]
     created_at: datetime = field(default_factory=datetime.now)
+    # task_key -> {earliest_start, earliest_finish, latest_start, latest_finish, slack} (minutos)
+    task_schedule: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # preenchido no planejamento por projeto (epic_id fica None)
+    project_id: Optional[int] = None
 
 
 @dataclass
@@ -69,6 +84,22 @@ class PlanningContext:
     inverted_graph: Dict[str, Set[str]]
     task_weights: Dict[str, int]
     task_metadata: Dict[str, Dict[str, Any]]
+    _reachability: Optional[ReachabilityIndex] = field(default=None, init=False, repr=False)
+
+    @property
+    def reachability(self) -> ReachabilityIndex:
+        """Índice prerequisite -> dependentes transitivos (construído sob demanda)."""
+        if self._reachability is None:
+            self._reachability = ReachabilityIndex(self.inverted_graph)
+        return self._reachability
+
+    def unblocked_by(self, task_key: str) -> Set[str]:
+        """Tarefas que dependem (direta ou transitivamente) de ``task_key``."""
+        return self.reachability.descendants(task_key)
+
+    def would_create_cycle(self, task_key: str, prerequisite_key: str) -> bool:
+        """True se ``task_key`` passar a depender de ``prerequisite_key`` fechar um ciclo."""
+        return self.reachability.would_create_cycle(prerequisite_key, task_key)
 
 
 # ============================================================================ #
@@ -83,36 +114,49 @@ class TaskExecutionPlanner(BaseService):
     - TasksRepo / DepsRepo (acesso a dados)
     - ScoringSystem (priorização configurável)
     - GraphAlgorithms (validação DAG / caminho crítico)
+    - ExecutionPlanCache (planos por revisão do épico)
     """
 
-    def __init__(self, connection):
+    # Acima desta fração de tarefas alteradas, reconstruir é mais barato que corrigir
+    PATCH_MAX_CHANGED_RATIO = 0.25
+
+    def __init__(self, connection, plan_cache: Optional[ExecutionPlanCache] = None):
         """
         Args:
             connection: Objeto de conexão de banco.
+            plan_cache: Cache de planos (padrão: cache global do processo).
         """
         super().__init__()
         self.connection = connection
         self.tasks_repo = TasksRepo(connection)
         self.deps_repo = DepsRepo(connection)
         self.scoring_system = ScoringSystem()
+        self.plan_cache = plan_cache if plan_cache is not None else get_plan_cache()
 
     # --------------------------------------------------------------------- #
     # Orquestração
     # --------------------------------------------------------------------- #
 
+    @timed_operation
     def plan_execution(
         self,
         epic_id: int,
         scoring_preset: str = "balanced",
         custom_weights: Optional[Dict[str, float]] = None,
+        use_cache: bool = True,
     ) -> ServiceResult[ExecutionPlan]:
         """
         Planeja execução de tarefas com ordenação topológica e priorização.
 
+        Com ``use_cache``, o plano é reaproveitado enquanto a revisão do épico
+        não muda e corrigido incrementalmente quando só atributos de algumas
+        tarefas mudaram (status, estimativa, prioridade...).
+
         Args:
             epic_id: ID do épico
             scoring_preset: "balanced" | "critical_path" | "tdd_workflow" | "business_value"
             custom_weights: pesos customizados para sobrescrever preset
+            use_cache: usar o cache de planos por revisão
 
         Returns:
             ServiceResult contendo ExecutionPlan ou erros.
@@ -128,67 +172,286 @@ class TaskExecutionPlanner(BaseService):
             if not validation_result.success:
                 return validation_result
 
-            # 2) Carregar contexto (tarefas, deps, grafos, pesos, metadados)
+            # 2) Cache por revisão (None = banco sem epic_revisions → sem cache)
+            revision = self._read_epic_revision(epic_id) if use_cache else None
+            cache_key = cached = None
+            if revision is not None:
+                cache_key = ExecutionPlanCache.make_key(
+                    self.plan_cache.database_key(self.connection, self),
+                    epic_id,
+                    scoring_preset,
+                    custom_weights,
+                )
+                cached = self.plan_cache.get(cache_key)
+            if cached is not None and cached.revision == revision:
+                self.plan_cache.record("hits")
+                return ServiceResult.ok(cached.plan)
+
+            # 3) Carregar contexto (tarefas, deps, grafos, pesos, metadados)
             ctx_result = self._load_planning_context(epic_id)
             if not ctx_result.success:
                 return ctx_result
             context = ctx_result.data
 
-            # 3) Validar DAG
-            dag_validation = self._validate_dag_structure(context)
-            if not dag_validation["is_valid"]:
-                return ServiceResult.validation_error(
-                    f"DAG inválido para épico {epic_id}: {dag_validation['error']}"
-                )
+            if cached is not None:
+                patched = self._patch_cached_plan(cached, context, scoring_preset, custom_weights)
+                if patched is not None:
+                    self.plan_cache.record("patches")
+                    self._store_cached_plan(cache_key, revision, patched, context)
+                    return ServiceResult.ok(patched)
 
-            # 4) Configurar Scoring
-            scoring_cfg_res = self._configure_scoring_system(scoring_preset, custom_weights)
-            if not scoring_cfg_res.success:
-                return scoring_cfg_res
-            scoring_cfg = scoring_cfg_res.data
+            result = self._build_execution_plan(
+                context, scoring_preset, custom_weights, epic_id=epic_id
+            )
+            if revision is not None and result.success:
+                self.plan_cache.record("rebuilds")
+                self._store_cached_plan(cache_key, revision, result.data, context)
+            return result
 
-            # 5) Pontuar tarefas
-            task_scores = self._calculate_task_scores(context, scoring_cfg)
+        except Exception as e:
+            logger.exception("Falha no planejamento de execução (epic_id=%s): %s", epic_id, e)
+            return ServiceResult.validation_error(f"Falha no planejamento: {str(e)}")
 
-            # 6) Ordenação topológica com prioridade (usa inverted_graph do contexto)
-            execution_order = self._topological_sort_with_priority(context, task_scores)
+    @timed_operation
+    def plan_project_execution(
+        self,
+        project_id: int,
+        scoring_preset: str = "balanced",
+        custom_weights: Optional[Dict[str, float]] = None,
+    ) -> ServiceResult[ExecutionPlan]:
+        """
+        Planeja a execução de todas as tarefas de um projeto em um único DAG.
 
-            # 7) Caminho crítico (usa mesmo grafo invertido + pesos)
-            critical_path = self._calculate_critical_path(context)
+        Tarefas e dependências de todos os épicos são carregadas em consultas
+        únicas; dependências entre épicos do projeto são mantidas, gerando uma
+        só ordem priorizada e um só caminho crítico.
 
-            # 8) Métricas
-            execution_metrics = self._calculate_execution_metrics(context, task_scores, execution_order)
+        Args:
+            project_id: ID do projeto
+            scoring_preset: "balanced" | "critical_path" | "tdd_workflow" | "business_value"
+            custom_weights: pesos customizados para sobrescrever preset
 
-            # 9) Montar plano
-            plan = ExecutionPlan(
-                epic_id=epic_id,
-                execution_order=execution_order,
-                task_scores=task_scores,
-                critical_path=critical_path,
-                execution_metrics=execution_metrics,
-                dag_validation=dag_validation,
+        Returns:
+            ServiceResult contendo ExecutionPlan (epic_id=None, project_id preenchido).
+        """
+        try:
+            self._log_operation_start(
+                "plan_project_execution",
+                {"project_id": project_id, "preset": scoring_preset},
             )
 
-            logger.info(
-                "Plano de execução criado (epic_id=%s): %s tarefas.",
-                epic_id,
-                len(execution_order),
+            validation_result = self._validate_planning_inputs(
+                project_id, scoring_preset, id_field="project_id"
+            )
+            if not validation_result.success:
+                return validation_result
+
+            ctx_result = self._load_project_planning_context(project_id)
+            if not ctx_result.success:
+                return ctx_result
+
+            return self._build_execution_plan(
+                ctx_result.data, scoring_preset, custom_weights, project_id=project_id
             )
-            return ServiceResult.ok(plan)
 
         except Exception as e:
-            logger.exception("Falha no planejamento de execução (epic_id=%s): %s", epic_id, e)
+            logger.exception("Falha no planejamento do projeto (project_id=%s): %s", project_id, e)
             return ServiceResult.validation_error(f"Falha no planejamento: {str(e)}")
 
+    def _build_execution_plan(
+        self,
+        context: PlanningContext,
+        scoring_preset: str,
+        custom_weights: Optional[Dict[str, float]],
+        epic_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+    ) -> ServiceResult[ExecutionPlan]:
+        """Etapas comuns (DAG, scoring, ordenação, caminho crítico, métricas)."""
+        scope = f"épico {epic_id}" if project_id is None else f"projeto {project_id}"
+
+        # 3) Validar DAG
+        dag_validation = self._validate_dag_structure(context)
+        if not dag_validation["is_valid"]:
+            return ServiceResult.validation_error(
+                f"DAG inválido para {scope}: {dag_validation['error']}"
+            )
+
+        # 4) Configurar Scoring
+        scoring_cfg_res = self._configure_scoring_system(scoring_preset, custom_weights)
+        if not scoring_cfg_res.success:
+            return scoring_cfg_res
+        scoring_cfg = scoring_cfg_res.data
+
+        # 5) Pontuar tarefas
+        task_scores = self._calculate_task_scores(context, scoring_cfg)
+
+        # 6) Ordenação topológica com prioridade (usa inverted_graph do contexto)
+        execution_order = self._topological_sort_with_priority(context, task_scores)
+
+        # 7) Caminho crítico + folgas CPM (usa mesmo grafo invertido + pesos)
+        cpm = self._calculate_critical_path(context)
+        critical_path = cpm.critical_nodes if cpm else []
+
+        # 8) Métricas
+        execution_metrics = self._calculate_execution_metrics(context, task_scores, execution_order)
+
+        # 9) Montar plano
+        plan = ExecutionPlan(
+            epic_id=epic_id,
+            execution_order=execution_order,
+            task_scores=task_scores,
+            critical_path=critical_path,
+            execution_metrics=execution_metrics,
+            dag_validation=dag_validation,
+            task_schedule=cpm.schedule() if cpm else {},
+            project_id=project_id,
+        )
+
+        logger.info(
+            "Plano de execução criado (%s): %s tarefas.",
+            scope,
+            len(execution_order),
+        )
+        return ServiceResult.ok(plan)
+
+    # --------------------------------------------------------------------- #
+    # Cache de planos
+    # --------------------------------------------------------------------- #
+
+    def _read_epic_revision(self, epic_id: int) -> Optional[int]:
+        try:
+            return read_epic_revision(self.connection, epic_id)
+        except Exception as e:
+            logger.warning("Revisão do épico %s indisponível, cache ignorado: %s", epic_id, e)
+            return None
+
+    def _store_cached_plan(
+        self,
+        key: Any,
+        revision: int,
+        plan: ExecutionPlan,
+        context: PlanningContext,
+    ) -> None:
+        self.plan_cache.put(
+            key,
+            CachedPlan(
+                revision=revision,
+                plan=plan,
+                context=context,
+                snapshot=task_snapshot(context.tasks),
+                edges=graph_edges(context.adjacency_graph),
+            ),
+        )
+
+    def _patch_cached_plan(
+        self,
+        cached: CachedPlan,
+        context: PlanningContext,
+        scoring_preset: str,
+        custom_weights: Optional[Dict[str, float]],
+    ) -> Optional[ExecutionPlan]:
+        """
+        Corrige um plano cacheado quando só atributos de tarefas mudaram.
+
+        Re-pontua apenas as tarefas alteradas, reordena a partir da fronteira
+        afetada (o prefixo da ordem anterior é preservado) e recalcula o CPM
+        só se alguma estimativa mudou. Retorna None se a mudança for estrutural
+        (tarefas/dependências adicionadas ou removidas) ou grande demais.
+        """
+        snapshot = task_snapshot(context.tasks)
+        if snapshot.keys() != cached.snapshot.keys():
+            return None
+        if graph_edges(context.adjacency_graph) != cached.edges:
+            return None
+
+        old_plan: ExecutionPlan = cached.plan
+        changed = [key for key, values in snapshot.items() if values != cached.snapshot[key]]
+        if not changed:
+            return old_plan
+        if len(changed) > max(1, int(len(snapshot) * self.PATCH_MAX_CHANGED_RATIO)):
+            return None
+
+        scoring_cfg_res = self._configure_scoring_system(scoring_preset, custom_weights)
+        if not scoring_cfg_res.success:
+            return None
+
+        changed_set = set(changed)
+        task_scores = dict(old_plan.task_scores)
+        task_scores.update(
+            self._calculate_task_scores(
+                replace(context, tasks=[t for t in context.tasks if t.task_key in changed_set]),
+                scoring_cfg_res.data,
+            )
+        )
+
+        # Ordem só muda se o critério do heap de alguma tarefa alterada mudou
+        old_meta = cached.context.task_metadata
+        reorder = [
+            key for key in changed
+            if task_scores[key] != old_plan.task_scores.get(key)
+            or context.task_metadata[key]["tdd_order"] != old_meta[key]["tdd_order"]
+            or context.task_metadata[key]["priority"] != old_meta[key]["priority"]
+        ]
+        execution_order = old_plan.execution_order
+        if reorder:
+            execution_order = self._topological_sort_with_priority(
+                context,
+                task_scores,
+                prefix=self._unaffected_prefix(context, old_plan.execution_order, reorder),
+            )
+
+        critical_path = old_plan.critical_path
+        task_schedule = old_plan.task_schedule
+        if any(context.task_weights[key] != cached.context.task_weights[key] for key in changed):
+            cpm = self._calculate_critical_path(context)
+            critical_path = cpm.critical_nodes if cpm else []
+            task_schedule = cpm.schedule() if cpm else {}
+
+        return ExecutionPlan(
+            epic_id=old_plan.epic_id,
+            execution_order=execution_order,
+            task_scores=task_scores,
+            critical_path=critical_path,
+            execution_metrics=self._calculate_execution_metrics(context, task_scores, execution_order),
+            dag_validation=old_plan.dag_validation,
+            task_schedule=task_schedule,
+            project_id=old_plan.project_id,
+        )
+
+    @staticmethod
+    def _unaffected_prefix(
+        context: PlanningContext,
+        previous_order: List[str],
+        changed: List[str],
+    ) -> List[str]:
+        """
+        Prefixo da ordem anterior que não depende das tarefas alteradas.
+
+        Uma tarefa só entra no heap após o último pré-requisito sair; até esse
+        passo o heap é idêntico ao da execução anterior, então os pops também.
+        """
+        position = {key: i for i, key in enumerate(previous_order)}
+        cut = len(previous_order)
+        for key in changed:
+            prerequisites = context.adjacency_graph.get(key, ())
+            ready_at = max((position.get(p, -1) for p in prerequisites), default=-1) + 1
+            cut = min(cut, ready_at)
+        return previous_order[:cut]
+
     # --------------------------------------------------------------------- #
     # Carregamento e validações
     # --------------------------------------------------------------------- #
 
-    def _validate_planning_inputs(self, epic_id: int, scoring_preset: str) -> ServiceResult[bool]:
+    def _validate_planning_inputs(
+        self,
+        scope_id: int,
+        scoring_preset: str,
+        id_field: str = "epic_id",
+    ) -> ServiceResult[bool]:
         errors: List[str] = []
 
-        if not isinstance(epic_id, int) or epic_id <= 0:
-            errors.append(f"epic_id deve ser inteiro positivo, recebido: {epic_id}")
+        if not isinstance(scope_id, int) or scope_id <= 0:
+            errors.append(f"{id_field} deve ser inteiro positivo, recebido: {scope_id}")
 
         valid_presets = {"balanced", "critical_path", "tdd_workflow", "business_value"}
         if scoring_preset not in valid_presets:
@@ -204,47 +467,93 @@ class TaskExecutionPlanner(BaseService):
             tasks = self.tasks_repo.list_by_epic(epic_id)
             if not tasks:
                 return ServiceResult.not_found("tasks", f"epic_id={epic_id}")
+            duplicates = self._duplicate_task_keys(tasks)
+            if duplicates:
+                return ServiceResult.validation_error(
+                    f"task_key duplicado no épico {epic_id}: {', '.join(duplicates)}"
+                )
 
             dependencies = self.deps_repo.list_by_epic(epic_id)
+            return ServiceResult.ok(self._build_planning_context(tasks, dependencies))
 
-            adjacency = self._build_adjacency_graph(tasks, dependencies)
-            inverted = self._build_inverted_graph(adjacency)
+        except RepoError as e:
+            return ServiceResult.validation_error(f"Erro no repository: {e}")
+        except Exception as e:
+            return ServiceResult.validation_error(f"Erro ao carregar contexto: {e}")
 
-            task_weights = {
-                t.task_key: max(t.estimate_minutes or 60, 1)  # mínimo 1 min
-                for t in tasks
-            }
-            task_metadata = {
-                t.task_key: {
-                    "id": t.id,
-                    "title": t.title,
-                    "tdd_phase": t.tdd_phase,
-                    "tdd_order": t.tdd_order,
-                    "priority": t.priority,
-                    "story_points": t.story_points,
-                    "task_type": t.task_type,
-                    "status": t.status,
-                    "task_group": t.task_group,
-                    "task_sequence": t.task_sequence,
-                }
-                for t in tasks
-            }
+    def _load_project_planning_context(self, project_id: int) -> ServiceResult[PlanningContext]:
+        """
+        Carrega todas as tarefas/dependências do projeto (duas consultas, não
+        uma por épico) e constrói o DAG global, mantendo arestas entre épicos.
+        """
+        try:
+            tasks = self.tasks_repo.list_by_project(project_id)
+            if not tasks:
+                return ServiceResult.not_found("tasks", f"project_id={project_id}")
+            # O DAG é indexado por task_key; chaves repetidas entre épicos se
+            # sobrescreveriam em silêncio (o schema só garante unicidade por épico)
+            duplicates = self._duplicate_task_keys(tasks)
+            if duplicates:
+                return ServiceResult.validation_error(
+                    f"task_key duplicado entre épicos do projeto {project_id}: {', '.join(duplicates)}"
+                )
 
-            ctx = PlanningContext(
-                tasks=tasks,
-                dependencies=dependencies,
-                adjacency_graph=adjacency,
-                inverted_graph=inverted,
-                task_weights=task_weights,
-                task_metadata=task_metadata,
-            )
-            return ServiceResult.ok(ctx)
+            dependencies = self.deps_repo.list_by_project(project_id)
+            return ServiceResult.ok(self._build_planning_context(tasks, dependencies))
 
         except RepoError as e:
             return ServiceResult.validation_error(f"Erro no repository: {e}")
         except Exception as e:
             return ServiceResult.validation_error(f"Erro ao carregar contexto: {e}")
 
+    @staticmethod
+    def _duplicate_task_keys(tasks: List[Task]) -> List[str]:
+        """task_keys que aparecem em mais de uma tarefa (ordenados)."""
+        seen: Set[str] = set()
+        duplicates: Set[str] = set()
+        for t in tasks:
+            (duplicates if t.task_key in seen else seen).add(t.task_key)
+        return sorted(duplicates)
+
+    def _build_planning_context(
+        self,
+        tasks: List[Task],
+        dependencies: List[TaskDependency],
+    ) -> PlanningContext:
+        """Constrói grafos, pesos e metadados a partir das tarefas carregadas."""
+        adjacency = self._build_adjacency_graph(tasks, dependencies)
+        inverted = self._build_inverted_graph(adjacency)
+
+        task_weights = {
+            t.task_key: max(t.estimate_minutes or 60, 1)  # mínimo 1 min
+            for t in tasks
+        }
+        task_metadata = {
+            t.task_key: {
+                "id": t.id,
+                "epic_id": t.epic_id,
+                "title": t.title,
+                "tdd_phase": t.tdd_phase,
+                "tdd_order": t.tdd_order,
+                "priority": t.priority,
+                "story_points": t.story_points,
+                "task_type": t.task_type,
+                "status": t.status,
+                "task_group": t.task_group,
+                "task_sequence": t.task_sequence,
+            }
+            for t in tasks
+        }
+
+        return PlanningContext(
+            tasks=tasks,
+            dependencies=dependencies,
+            adjacency_graph=adjacency,
+            inverted_graph=inverted,
+            task_weights=task_weights,
+            task_metadata=task_metadata,
+        )
+
     @staticmethod
     def _build_adjacency_graph(
         tasks: List[Task],
@@ -335,6 +644,11 @@ class TaskExecutionPlanner(BaseService):
         context: PlanningContext,
         scoring_preset: ScoringPreset,
     ) -> Dict[str, float]:
+        try:
+            return self.scoring_system.calculate_scores(context.tasks, scoring_preset)
+        except Exception as e:
+            logger.warning("Erro no scoring em lote, recalculando por tarefa: %s", e)
+
         scores: Dict[str, float] = {}
         for task in context.tasks:
             try:
@@ -352,6 +666,7 @@ class TaskExecutionPlanner(BaseService):
         self,
         context: PlanningContext,
         task_scores: Dict[str, float],
+        prefix: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Ordenação topológica (Kahn) usando heap de max-prioridade.
@@ -360,6 +675,9 @@ class TaskExecutionPlanner(BaseService):
           2) menor tdd_order (se existir)
           3) maior prioridade (se existir)
           4) task_key alfabética
+
+        ``prefix``: ordem já decidida (ex.: prefixo inalterado de um plano
+        cacheado); a ordenação continua a partir da fronteira após ele.
         """
         inverted = context.inverted_graph
 
@@ -378,12 +696,19 @@ class TaskExecutionPlanner(BaseService):
             # Heapq é min-heap; usamos negativos onde maior é melhor.
             return (-score, tdd_order, -priority, task_key)
 
-        heap: List[tuple] = []
-        for tk, deg in in_degree.items():
-            if deg == 0:
-                heapq.heappush(heap, priority_tuple(tk))
+        # Prefixo já decidido: consome suas arestas antes de montar a fronteira
+        ordered: List[str] = list(prefix or [])
+        for current in ordered:
+            for dependent in inverted.get(current, set()):
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+        done = set(ordered)
+
+        heap: List[tuple] = [
+            priority_tuple(tk) for tk, deg in in_degree.items() if deg == 0 and tk not in done
+        ]
+        heapq.heapify(heap)
 
-        ordered: List[str] = []
         while heap:
             _, _, _, current = heapq.heappop(heap)
             ordered.append(current)
@@ -404,14 +729,14 @@ class TaskExecutionPlanner(BaseService):
     # Caminho Crítico / Métricas
     # --------------------------------------------------------------------- #
 
-    def _calculate_critical_path(self, context: PlanningContext) -> List[str]:
+    def _calculate_critical_path(self, context: PlanningContext) -> Optional[CriticalPathResult]:
         try:
-            return GraphAlgorithms.find_critical_path_nodes(
+            return GraphAlgorithms.critical_path_analysis(
                 context.inverted_graph, context.task_weights
             )
         except Exception as e:
             logger.exception("Erro ao calcular caminho crítico: %s", e)
-            return []
+            return None
 
     def _calculate_execution_metrics(
         self,
@@ -429,6 +754,14 @@ class TaskExecutionPlanner(BaseService):
             total_deps = sum(len(prs) for prs in context.adjacency_graph.values())
             avg_deps = (total_deps / total_tasks) if total_tasks else 0.0
 
+            epic_of = {k: meta.get("epic_id") for k, meta in context.task_metadata.items()}
+            cross_epic_deps = sum(
+                1
+                for task_key, prerequisites in context.adjacency_graph.items()
+                for prerequisite in prerequisites
+                if epic_of.get(task_key) != epic_of.get(prerequisite)
+            )
+
             priorities = [t.priority for t in context.tasks if getattr(t, "priority", None) is not None]
             avg_priority = (sum(priorities) / len(priorities)) if priorities else 0.0
 
@@ -441,6 +774,8 @@ class TaskExecutionPlanner(BaseService):
                 "total_estimated_hours": round(total_estimated_minutes / 60, 1),
                 "total_dependencies": total_deps,
                 "avg_dependencies_per_task": round(avg_deps, 2),
+                "epic_count": len(set(epic_of.values())),
+                "cross_epic_dependencies": cross_epic_deps,
                 "scoring_metrics": {
                     "avg_score": round(avg_score, 2),
                     "max_score": round(max(scores), 2) if scores else 0.0,
@@ -468,6 +803,7 @@ class TaskExecutionPlanner(BaseService):
             m = plan.execution_metrics
             return {
                 "epic_id": plan.epic_id,
+                "project_id": plan.project_id,
                 "total_tasks": m.get("total_tasks", 0),
                 "estimated_duration": {
                     "hours": m.get("total_estimated_hours", 0),
@@ -476,6 +812,9 @@ class TaskExecutionPlanner(BaseService):
                 "critical_path": {
                     "tasks": plan.critical_path,
                     "length": len(plan.critical_path),
+                    "duration_minutes": max(
+                        (t["earliest_finish"] for t in plan.task_schedule.values()), default=0
+                    ),
                 },
                 "complexity_indicators": {
                     "dependencies": m.get("total_dependencies", 0),
@@ -12,11 +12,14 @@ import re
 
 from .base import (
     BaseService, ServiceResult, ServiceError, ServiceErrorType,
-    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria
+    BaseRepository, PaginatedResult, FilterCriteria, SortCriteria, KeysetPage, timed_operation
 )
 from ..database import queries as db_queries
 from ..database.connection import transaction, get_connection_context, execute
 from ..config.constants import ValidationRules, TaskStatus, TDDPhase
+from ..database.search import (
+    ENTITY_TASK, SEARCH_TABLE, build_match_query, fts_search_sql, like_search_sql
+)
 from .task_execution_planner import TaskExecutionPlanner, ExecutionPlan
 
 
@@ -53,28 +56,59 @@ class TaskRepository(BaseRepository):
             self.db_manager.logger.error(f"Error finding task by key {task_key}: {e}")
             return None
     
+    # Sortable fields -> qualified SQL expressions (keyset pagination)
+    SORT_COLUMNS = {
+        'title': 't.title',
+        'status': 't.status',
+        'tdd_phase': 't.tdd_phase',
+        'priority': 't.priority',
+        'task_key': 't.task_key',
+        'due_date': 't.due_date',
+        'created_at': 't.created_at',
+        'id': 't.id',
+        'epic_title': 'e.title',
+        'project_name': 'p.name',
+        'total_time': 'COALESCE(tt.total_minutes, 0)',
+    }
+    
     def find_all(
         self, 
         filters: Optional[FilterCriteria] = None,
         sort: Optional[SortCriteria] = None,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> PaginatedResult[Dict[str, Any]]:
-        """Find all tasks with filtering, sorting, and pagination."""
+        """
+        Find all tasks with filtering, sorting, and pagination.
+        
+        Pages are fetched by keyset on (sort column, id): pass the previous
+        result's ``next_cursor`` as ``cursor`` to continue without OFFSET.
+        Without a cursor, ``page`` is used (OFFSET) for backward compatibility.
+        ``include_total=False`` skips the COUNT(*) query.
+        
+        Raises:
+            ValueError: Unknown sort field or invalid cursor
+        """
+        sort_field = sort.field if sort else 'id'
+        if sort_field not in self.SORT_COLUMNS:
+            raise ValueError(f"Invalid sort field: {sort_field}")
+        keyset = KeysetPage(
+            self.SORT_COLUMNS[sort_field], 't.id',
+            ascending=sort.ascending if sort else True, cursor=cursor
+        )
         try:
             # Build base query with epic and project information
-            base_query = """
+            base_query = f"""
                 SELECT t.*, e.title as epic_title, e.epic_key, 
                        p.name as project_name,
-                       COALESCE(ws.total_time, 0) as total_time_minutes
+                       COALESCE(tt.total_minutes, 0) as total_time_minutes,
+                       {keyset.select_column}
                 FROM framework_tasks t
                 LEFT JOIN framework_epics e ON t.epic_id = e.id
                 LEFT JOIN framework_projects p ON e.project_id = p.id
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
             """
             
             where_conditions = []
@@ -89,6 +123,11 @@ class TaskRepository(BaseRepository):
                     where_conditions.append("t.tdd_phase = ?")
                     params.append(filters.get('tdd_phase'))
                 
+                if filters.has('search'):
+                    condition, search_params = self._search_condition(filters.get('search'))
+                    where_conditions.append(condition)
+                    params.extend(search_params)
+                
                 if filters.has('title'):
                     where_conditions.append("t.title LIKE ?")
                     params.append(f"%{filters.get('title')}%")
@@ -128,64 +167,120 @@ class TaskRepository(BaseRepository):
             # Build WHERE clause
             where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
             
-            # Build ORDER BY clause
-            order_clause = ""
-            if sort:
-                # Map sort fields to qualified column names
-                sort_field = sort.field
-                if sort_field in ['title', 'status', 'tdd_phase', 'priority', 'task_key', 'due_date']:
-                    sort_field = f"t.{sort_field}"
-                elif sort_field in ['epic_title']:
-                    sort_field = f"e.title"
-                elif sort_field in ['project_name']:
-                    sort_field = f"p.name"
-                elif sort_field == 'total_time':
-                    sort_field = "total_time_minutes"
-                
-                order_clause = f" ORDER BY {sort_field} {'ASC' if sort.ascending else 'DESC'}"
-            
-            # Count total records
-            count_query = f"""
-                SELECT COUNT(*)
-                FROM framework_tasks t
-                LEFT JOIN framework_epics e ON t.epic_id = e.id
-                LEFT JOIN framework_projects p ON e.project_id = p.id
-                {where_clause}
-            """
-            total_count = self.db_manager.execute_query(count_query, params)[0]['COUNT(*)']
-            
-            # Calculate pagination
-            offset = (page - 1) * page_size
-            total_pages = (total_count + page_size - 1) // page_size
-            
-            # Get paginated results
-            data_query = f"{base_query}{where_clause}{order_clause} LIMIT ? OFFSET ?"
-            data_params = params + [page_size, offset]
-            tasks = self.db_manager.execute_query(data_query, data_params)
+            # Count total records (optional: deep pages shouldn't pay for it)
+            total_count = total_pages = None
+            if include_total:
+                count_query = f"""
+                    SELECT COUNT(*)
+                    FROM framework_tasks t
+                    LEFT JOIN framework_epics e ON t.epic_id = e.id
+                    LEFT JOIN framework_projects p ON e.project_id = p.id
+                    {where_clause}
+                """
+                total_count = self.db_manager.execute_query(count_query, params)[0]['COUNT(*)']
+                total_pages = (total_count + page_size - 1) // page_size
+            
+            # Keyset condition continues after the cursor row; OFFSET only
+            # for page-number requests without a cursor
+            after_sql, after_params = keyset.condition()
+            if after_sql:
+                where_conditions.append(after_sql)
+            data_where = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+            offset = 0 if cursor else (page - 1) * page_size
+            
+            # Get paginated results (one look-ahead row tells if there's more)
+            data_query = f"{base_query}{data_where}{keyset.order_clause()} LIMIT ? OFFSET ?"
+            data_params = params + after_params + [page_size + 1, offset]
+            rows = self.db_manager.execute_query(data_query, data_params)
+            tasks, next_cursor = keyset.finish(rows, page_size)
             
             return PaginatedResult(
                 items=tasks,
                 total=total_count,
                 page=page,
                 page_size=page_size,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                cursor_mode=True
             )
             
         except Exception as e:
             self.db_manager.logger.error(f"Error finding tasks: {e}")
             return PaginatedResult([], 0, page, page_size, 0)
     
+    # Colunas do fallback LIKE (presentes em todas as versões do schema)
+    SEARCH_FALLBACK_COLUMNS = ('task_key', 'title', 'description')
+    
+    def has_search_index(self) -> bool:
+        """Check (once per repository) whether the FTS5 search index exists."""
+        if getattr(self, '_has_search_index', None) is None:
+            try:
+                self.db_manager.execute_query(f"SELECT 1 FROM {SEARCH_TABLE} LIMIT 0")
+                self._has_search_index = True
+            except Exception:
+                self._has_search_index = False
+        return self._has_search_index
+    
+    def _search_condition(self, text: str) -> Tuple[str, List[Any]]:
+        """WHERE condition on ``t`` for a full-text search (FTS5 or LIKE)."""
+        match = build_match_query(text)
+        if match is None:
+            return "1 = 1", []
+        if self.has_search_index():
+            return (
+                f"t.id IN (SELECT entity_id FROM {SEARCH_TABLE} "
+                f"WHERE {SEARCH_TABLE} MATCH ? AND entity = '{ENTITY_TASK}')",
+                [match],
+            )
+        condition, count = like_search_sql(self.SEARCH_FALLBACK_COLUMNS, ENTITY_TASK, 't')
+        return condition, [f"%{text.strip()}%"] * count
+    
+    def search(self, text: str, limit: int = 20, epic_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over task key, title, description and criteria.
+        
+        Uses the FTS5 ``search_index`` (bm25 ranking, prefix match on the
+        last word for search-as-you-type); falls back to LIKE without it.
+        """
+        match = build_match_query(text)
+        if match is None:
+            return []
+        epic_clause = " AND t.epic_id = ?" if epic_id else ""
+        epic_params = [epic_id] if epic_id else []
+        try:
+            if self.has_search_index():
+                query = f"""
+                    SELECT t.*, e.title as epic_title, e.epic_key, s.rank as search_rank
+                    FROM ({fts_search_sql(ENTITY_TASK)}) s
+                    JOIN framework_tasks t ON t.id = s.entity_id
+                    LEFT JOIN framework_epics e ON t.epic_id = e.id
+                    WHERE 1 = 1{epic_clause}
+                    ORDER BY s.rank, t.id
+                    LIMIT ?
+                """
+                return self.db_manager.execute_query(query, [match] + epic_params + [limit])
+            
+            condition, params = self._search_condition(text)
+            query = f"""
+                SELECT t.*, e.title as epic_title, e.epic_key, 0.0 as search_rank
+                FROM framework_tasks t
+                LEFT JOIN framework_epics e ON t.epic_id = e.id
+                WHERE {condition}{epic_clause}
+                ORDER BY t.id
+                LIMIT ?
+            """
+            return self.db_manager.execute_query(query, params + epic_params + [limit])
+        except Exception as e:
+            self.db_manager.logger.error(f"Error searching tasks for {text!r}: {e}")
+            return []
+    
     def find_by_epic(self, epic_id: int) -> List[Dict[str, Any]]:
         """Find all tasks for a specific epic."""
         try:
-            query = """
-                SELECT t.*, COALESCE(ws.total_time, 0) as total_time_minutes
+            query = f"""
+                SELECT t.*, COALESCE(tt.total_minutes, 0) as total_time_minutes
                 FROM framework_tasks t
-                LEFT JOIN (
-                    SELECT task_id, SUM(duration_minutes) as total_time
-                    FROM work_sessions
-                    GROUP BY task_id
-                ) ws ON t.id = ws.task_id
+                LEFT JOIN {self.task_time_source()} tt ON t.id = tt.task_id
                 WHERE t.epic_id = ?
                 ORDER BY t.priority DESC, t.created_at ASC
             """
@@ -569,6 +664,7 @@ class TaskService(BaseService):
         
         return errors
     
+    @timed_operation
     def create_task(self, task_data: Dict[str, Any]) -> ServiceResult[int]:
         """
         Create a new task with TDD workflow validation.
@@ -625,6 +721,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("create_task", e)
     
+    @timed_operation
     def get_task(self, task_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get task by ID with epic and project information.
@@ -661,6 +758,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_task", e)
     
+    @timed_operation
     def update_task(self, task_id: int, task_data: Dict[str, Any]) -> ServiceResult[bool]:
         """
         Update existing task with TDD workflow validation.
@@ -716,6 +814,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("update_task", e)
     
+    @timed_operation
     def delete_task(self, task_id: int) -> ServiceResult[bool]:
         """
         Delete task (hard delete).
@@ -746,13 +845,16 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("delete_task", e)
     
+    @timed_operation
     def list_tasks(
         self,
         filters: Optional[Dict[str, Any]] = None,
         sort_by: str = "priority",
         sort_ascending: bool = False,  # Default to highest priority first
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = True
     ) -> ServiceResult[PaginatedResult[Dict[str, Any]]]:
         """
         List tasks with filtering, sorting, and pagination.
@@ -761,8 +863,10 @@ class TaskService(BaseService):
             filters: Filter criteria dictionary
             sort_by: Field to sort by
             sort_ascending: Sort direction
-            page: Page number (1-based)
+            page: Page number (1-based), used when no cursor is given
             page_size: Items per page
+            cursor: ``next_cursor`` of the previous page (keyset pagination)
+            include_total: Whether to run the COUNT(*) for total/total_pages
             
         Returns:
             ServiceResult with paginated task list
@@ -784,7 +888,14 @@ class TaskService(BaseService):
             sort_criteria = SortCriteria(sort_by, sort_ascending)
             
             # Get paginated results
-            result = self.repository.find_all(filter_criteria, sort_criteria, page, page_size)
+            try:
+                result = self.repository.find_all(
+                    filter_criteria, sort_criteria, page, page_size,
+                    cursor=cursor, include_total=include_total
+                )
+            except ValueError as e:
+                field = "cursor" if "cursor" in str(e) else "sort_by"
+                return ServiceResult.validation_error(str(e), field)
             
             # Process JSON fields for each task
             for task in result.items:
@@ -809,7 +920,36 @@ class TaskService(BaseService):
             
         except Exception as e:
             return self.handle_database_error("list_tasks", e)
-    
+
+    @timed_operation
+    def search_tasks(
+        self,
+        query: str,
+        limit: int = 20,
+        epic_id: Optional[int] = None
+    ) -> ServiceResult[List[Dict[str, Any]]]:
+        """
+        Ranked full-text search for search-as-you-type.
+
+        Args:
+            query: User input (plain words; the last one matches as a prefix)
+            limit: Maximum number of results (1-100)
+            epic_id: Optional epic filter
+
+        Returns:
+            ServiceResult with tasks, most relevant first
+        """
+        self.log_operation("search_tasks", query=query, limit=limit, epic_id=epic_id)
+
+        if limit < 1 or limit > 100:
+            return ServiceResult.validation_error("Limit must be between 1 and 100", "limit")
+
+        try:
+            return ServiceResult.ok(self.repository.search(query or "", limit, epic_id))
+        except Exception as e:
+            return self.handle_database_error("search_tasks", e)
+
+    @timed_operation
     def get_tasks_by_epic(self, epic_id: int) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get all tasks for a specific epic.
@@ -850,6 +990,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_tasks_by_epic", e)
     
+    @timed_operation
     def get_tasks_by_status(self, status: str, limit: Optional[int] = None) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get tasks by status for workflow management.
@@ -877,6 +1018,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_tasks_by_status", e)
     
+    @timed_operation
     def get_tasks_by_tdd_phase(self, tdd_phase: str, limit: Optional[int] = None) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get tasks by TDD phase for workflow management.
@@ -904,6 +1046,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_tasks_by_tdd_phase", e)
     
+    @timed_operation
     def advance_tdd_phase(self, task_id: int) -> ServiceResult[str]:
         """
         Advance task to next TDD phase (RED -> GREEN -> REFACTOR).
@@ -964,6 +1107,7 @@ class TaskService(BaseService):
         except Exception as e:
             return self.handle_database_error("advance_tdd_phase", e)
     
+    @timed_operation
     def get_task_summary(self, task_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get task summary with time tracking and TDD progress.
@@ -1137,6 +1281,7 @@ class TaskService(BaseService):
     # 🎯 TASK EXECUTION PLANNING - Integration with TaskExecutionPlanner
     # =============================================================================
     
+    @timed_operation
     def plan_epic_execution(
         self,
         epic_id: int,
@@ -1188,6 +1333,7 @@ class TaskService(BaseService):
             self._log_operation_error("plan_epic_execution", e)
             return ServiceResult.validation_error(f"Erro no planejamento de execução: {str(e)}")
     
+    @timed_operation
     def get_execution_summary(self, epic_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Obtém sumário executivo de um plano de execução.
@@ -1222,6 +1368,7 @@ class TaskService(BaseService):
             self._log_operation_error("get_execution_summary", e)
             return ServiceResult.validation_error(f"Erro ao obter sumário: {str(e)}")
     
+    @timed_operation
     def validate_epic_dependencies(self, epic_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Valida estrutura de dependências de um épico (DAG validation).
@@ -1264,6 +1411,7 @@ class TaskService(BaseService):
             self._log_operation_error("validate_epic_dependencies", e)
             return ServiceResult.validation_error(f"Erro na validação de dependências: {str(e)}")
     
+    @timed_operation
     def get_task_scoring_analysis(
         self,
         epic_id: int,
@@ -1322,6 +1470,7 @@ class TaskService(BaseService):
             self._log_operation_error("get_task_scoring_analysis", e)
             return ServiceResult.validation_error(f"Erro na análise de scoring: {str(e)}")
     
+    @timed_operation
     def optimize_task_sequence(
         self,
         epic_id: int,
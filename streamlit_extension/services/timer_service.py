@@ -12,7 +12,10 @@ from enum import Enum
 
 from .base import (
     BaseService, ServiceResult, ServiceError, ServiceErrorType,
-    BaseRepository
+    BaseRepository, PaginatedResult, KeysetPage, timed_operation
+)
+from .session_aggregates import (
+    SCOPE_COMPLETED, fact_by_id_query, get_session_aggregate_cache
 )
 from ..database import queries as db_queries
 from ..database.connection import transaction, get_connection_context, execute
@@ -216,6 +219,64 @@ class TimerRepository(BaseRepository):
             self.db_manager.logger.error(f"Error finding recent sessions: {e}")
             return []
     
+    def find_sessions_page(
+        self,
+        task_id: Optional[int] = None,
+        days: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 50
+    ) -> PaginatedResult[Dict[str, Any]]:
+        """Page through sessions, newest first, by keyset on (start_time, id).
+        
+        Args:
+            task_id: Only sessions of this task
+            days: Only sessions started in the last N days
+            cursor: ``next_cursor`` of the previous page
+            page_size: Sessions per page
+            
+        Returns:
+            PaginatedResult without totals (``total`` is None)
+            
+        Raises:
+            ValueError: If the cursor is invalid
+            DatabaseOperationError: If database operation fails
+        """
+        keyset = KeysetPage("ws.start_time", "ws.id", ascending=False, cursor=cursor)
+        conditions = []
+        params: List[Any] = []
+        if task_id:
+            conditions.append("ws.task_id = ?")
+            params.append(task_id)
+        if days:
+            conditions.append("ws.start_time >= ?")
+            params.append(datetime.now() - timedelta(days=days))
+        after_sql, after_params = keyset.condition()
+        if after_sql:
+            conditions.append(after_sql)
+            params.extend(after_params)
+        
+        try:
+            query = f"""
+                SELECT ws.*, t.title as task_title, t.task_key,
+                       e.title as epic_title, e.epic_key,
+                       {keyset.select_column}
+                FROM work_sessions ws
+                LEFT JOIN framework_tasks t ON ws.task_id = t.id
+                LEFT JOIN framework_epics e ON t.epic_id = e.id
+                {"WHERE " + " AND ".join(conditions) if conditions else ""}
+                {keyset.order_clause()}
+                LIMIT ?
+            """
+            rows = self.db_manager.execute_query(query, params + [page_size + 1])
+        except Exception as e:
+            self.db_manager.logger.error(f"Error paging sessions: {e}")
+            raise DatabaseOperationError(f"Database operation failed: {e}") from e
+        
+        sessions, next_cursor = keyset.finish(rows, page_size)
+        return PaginatedResult(
+            sessions, None, 1, page_size, None, next_cursor=next_cursor, cursor_mode=True
+        )
+    
     def create_session(self, session_data: Dict[str, Any]) -> Optional[int]:
         """Create new work session and return the ID."""
         try:
@@ -243,7 +304,10 @@ class TimerRepository(BaseRepository):
                 datetime.now()
             )
             
-            return self.db_manager.execute_insert(query, params)
+            session_id = self.db_manager.execute_insert(query, params)
+            if session_id:
+                self._apply_to_aggregates(None, session_id)
+            return session_id
             
         except Exception as e:
             self.db_manager.logger.error(f"Error creating session: {e}")
@@ -252,6 +316,7 @@ class TimerRepository(BaseRepository):
     def update_session(self, session_id: int, session_data: Dict[str, Any]) -> bool:
         """Update existing work session."""
         try:
+            before = self._tracked_fact(session_id)
             query = """
                 UPDATE work_sessions SET
                     status = ?, end_time = ?, duration_minutes = ?,
@@ -275,6 +340,8 @@ class TimerRepository(BaseRepository):
             )
             
             affected_rows = self.db_manager.execute_update(query, params)
+            if affected_rows > 0:
+                self._apply_to_aggregates(before, session_id)
             return affected_rows > 0
             
         except Exception as e:
@@ -284,103 +351,58 @@ class TimerRepository(BaseRepository):
     def delete_session(self, session_id: int) -> bool:
         """Delete work session."""
         try:
+            before = self._tracked_fact(session_id)
             query = "DELETE FROM work_sessions WHERE id = ?"
             affected_rows = self.db_manager.execute_update(query, (session_id,))
+            if affected_rows > 0 and before:
+                get_session_aggregate_cache().apply_change(self.db_manager, before, None)
             return affected_rows > 0
         except Exception as e:
             self.db_manager.logger.error(f"Error deleting session {session_id}: {e}")
             return False
     
+    def _tracked_fact(self, session_id: int) -> Optional[Dict[str, Any]]:
+        """Session fact for the aggregate cache (skipped while nothing is cached)."""
+        if not get_session_aggregate_cache().tracks(self.db_manager):
+            return None
+        rows = self.db_manager.execute_query(*fact_by_id_query(session_id))
+        return rows[0] if rows else None
+    
+    def _apply_to_aggregates(self, before: Optional[Dict[str, Any]], session_id: int) -> None:
+        """Patch cached aggregates after a write instead of rescanning sessions."""
+        after = self._tracked_fact(session_id)
+        if before or after:
+            get_session_aggregate_cache().apply_change(self.db_manager, before, after)
+    
+    def _completed_aggregate(self, days: int, task_id: Optional[int], view):
+        """Apply ``view`` to the (cached) aggregate of completed sessions."""
+        return get_session_aggregate_cache().read(
+            self.db_manager, SCOPE_COMPLETED, days, task_id,
+            self.db_manager.execute_query, view
+        )
+    
     def get_session_statistics(self, task_id: Optional[int] = None, days: int = 30) -> Dict[str, Any]:
-        """Get session statistics for analytics."""
+        """Get session statistics for analytics.
+        
+        Computed with the productivity patterns in a single pass over the
+        completed sessions since midnight ``days`` days ago, and cached.
+        Includes p50/p90/p95 session duration.
+        """
         try:
-            date_filter = datetime.now() - timedelta(days=days)
-            
-            if task_id:
-                where_clause = "WHERE task_id = ? AND start_time >= ?"
-                params = [task_id, date_filter]
-            else:
-                where_clause = "WHERE start_time >= ?"
-                params = [date_filter]
-            
-            query = f"""
-                SELECT 
-                    COUNT(*) as total_sessions,
-                    SUM(duration_minutes) as total_minutes,
-                    AVG(duration_minutes) as avg_duration,
-                    MAX(duration_minutes) as max_duration,
-                    MIN(duration_minutes) as min_duration,
-                    AVG(focus_rating) as avg_focus_rating,
-                    AVG(energy_level) as avg_energy_level,
-                    AVG(mood_rating) as avg_mood_rating,
-                    SUM(interruption_count) as total_interruptions,
-                    AVG(interruption_count) as avg_interruptions_per_session
-                FROM work_sessions
-                {where_clause}
-                AND status = 'completed'
-            """
-            
-            result = self.db_manager.execute_query(query, params)
-            return result[0] if result else {}
+            return self._completed_aggregate(days, task_id or None, lambda agg: agg.statistics())
             
         except Exception as e:
             self.db_manager.logger.error(f"Error getting session statistics: {e}")
             return {}
     
     def get_productivity_patterns(self, days: int = 30) -> Dict[str, Any]:
-        """Get productivity patterns for analysis."""
+        """Get productivity patterns for analysis.
+        
+        Hourly, weekday and session type groupings share one cached pass
+        with ``get_session_statistics``.
+        """
         try:
-            date_filter = datetime.now() - timedelta(days=days)
-            
-            # Sessions by hour of day
-            hourly_query = """
-                SELECT 
-                    CAST(strftime('%H', start_time) AS INTEGER) as hour_of_day,
-                    COUNT(*) as session_count,
-                    SUM(duration_minutes) as total_minutes,
-                    AVG(focus_rating) as avg_focus
-                FROM work_sessions
-                WHERE start_time >= ? AND status = 'completed'
-                GROUP BY hour_of_day
-                ORDER BY hour_of_day
-            """
-            
-            hourly_results = self.db_manager.execute_query(hourly_query, [date_filter])
-            
-            # Sessions by day of week
-            daily_query = """
-                SELECT 
-                    CAST(strftime('%w', start_time) AS INTEGER) as day_of_week,
-                    COUNT(*) as session_count,
-                    SUM(duration_minutes) as total_minutes,
-                    AVG(focus_rating) as avg_focus
-                FROM work_sessions
-                WHERE start_time >= ? AND status = 'completed'
-                GROUP BY day_of_week
-                ORDER BY day_of_week
-            """
-            
-            daily_results = self.db_manager.execute_query(daily_query, [date_filter])
-            
-            # Session type distribution
-            type_query = """
-                SELECT 
-                    session_type,
-                    COUNT(*) as session_count,
-                    SUM(duration_minutes) as total_minutes,
-                    AVG(focus_rating) as avg_focus
-                FROM work_sessions
-                WHERE start_time >= ? AND status = 'completed'
-                GROUP BY session_type
-            """
-            
-            type_results = self.db_manager.execute_query(type_query, [date_filter])
-            
-            return {
-                'hourly_patterns': hourly_results,
-                'daily_patterns': daily_results,
-                'type_distribution': type_results
-            }
+            return self._completed_aggregate(days, None, lambda agg: agg.patterns())
             
         except (AttributeError, TypeError) as e:
             self.db_manager.logger.error(f"Database manager error getting productivity patterns: {e}")
@@ -595,6 +617,7 @@ class TimerService(BaseService):
         
         return errors
     
+    @timed_operation
     def start_session(self, session_data: Dict[str, Any]) -> ServiceResult[int]:
         """
         Start a new work session.
@@ -652,6 +675,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("start_session", e)
     
+    @timed_operation
     def stop_session(self, session_id: int, completion_data: Optional[Dict[str, Any]] = None) -> ServiceResult[Dict[str, Any]]:
         """
         Stop/complete a work session.
@@ -729,6 +753,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("stop_session", e)
     
+    @timed_operation
     def pause_session(self, session_id: int) -> ServiceResult[bool]:
         """
         Pause an active work session.
@@ -765,6 +790,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("pause_session", e)
     
+    @timed_operation
     def resume_session(self, session_id: int) -> ServiceResult[bool]:
         """
         Resume a paused work session.
@@ -808,6 +834,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("resume_session", e)
     
+    @timed_operation
     def cancel_session(self, session_id: int, reason: Optional[str] = None) -> ServiceResult[bool]:
         """
         Cancel a work session.
@@ -849,6 +876,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("cancel_session", e)
     
+    @timed_operation
     def get_active_session(self) -> ServiceResult[Optional[Dict[str, Any]]]:
         """
         Get currently active work session.
@@ -872,6 +900,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_active_session", e)
     
+    @timed_operation
     def get_session(self, session_id: int) -> ServiceResult[Dict[str, Any]]:
         """
         Get work session by ID.
@@ -901,6 +930,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_session", e)
     
+    @timed_operation
     def get_sessions_for_task(self, task_id: int, limit: Optional[int] = None) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get all work sessions for a specific task.
@@ -921,6 +951,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_sessions_for_task", e)
     
+    @timed_operation
     def get_recent_sessions(self, days: int = 7, limit: int = 50) -> ServiceResult[List[Dict[str, Any]]]:
         """
         Get recent work sessions.
@@ -944,6 +975,41 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_recent_sessions", e)
     
+    @timed_operation
+    def list_sessions(
+        self,
+        task_id: Optional[int] = None,
+        days: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 50
+    ) -> ServiceResult[PaginatedResult[Dict[str, Any]]]:
+        """
+        List work sessions newest first with cursor pagination.
+        
+        Args:
+            task_id: Optional task filter
+            days: Optional look-back window in days
+            cursor: ``next_cursor`` of the previous page
+            page_size: Sessions per page (1-100)
+            
+        Returns:
+            ServiceResult with a page of sessions and its ``next_cursor``
+        """
+        self.log_operation("list_sessions", task_id=task_id, days=days, page_size=page_size)
+        
+        if page_size < 1 or page_size > 100:
+            return ServiceResult.validation_error("Page size must be between 1 and 100", "page_size")
+        
+        try:
+            return ServiceResult.ok(
+                self.repository.find_sessions_page(task_id, days, cursor, page_size)
+            )
+        except ValueError as e:
+            return ServiceResult.validation_error(str(e), "cursor")
+        except Exception as e:
+            return self.handle_database_error("list_sessions", e)
+    
+    @timed_operation
     def get_session_statistics(self, task_id: Optional[int] = None, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get session statistics for analytics.
@@ -975,6 +1041,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_session_statistics", e)
     
+    @timed_operation
     def get_productivity_patterns(self, days: int = 30) -> ServiceResult[Dict[str, Any]]:
         """
         Get productivity patterns for analysis.
@@ -1007,6 +1074,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("get_productivity_patterns", e)
     
+    @timed_operation
     def suggest_optimal_session(self, task_id: Optional[int] = None) -> ServiceResult[Dict[str, Any]]:
         """
         Suggest optimal session configuration based on patterns.
@@ -1034,6 +1102,7 @@ class TimerService(BaseService):
         except Exception as e:
             return self.handle_database_error("suggest_optimal_session", e)
     
+    @timed_operation
     def update_session_ratings(self, session_id: int, ratings: Dict[str, int]) -> ServiceResult[bool]:
         """
         Update session ratings (focus, energy, mood).
@@ -119,6 +119,28 @@ def setup_application() -> None:
     """Inicializa estado de sessão e dependências mínimas."""
     initialize_session_state()
     logger.info("Session state initialized.")
+    start_metrics_exporter()
+
+
+def start_metrics_exporter() -> None:
+    """
+    Sobe /health e /metrics dentro deste processo (uma vez por processo).
+
+    Os coletores do Prometheus leem os contadores do processo em que rodam;
+    um health server separado só exporta contadores vazios. Desligado por
+    padrão: exige ``monitoring.enable_metrics`` e ``enable_health_check``;
+    escuta em ``health_check_port``, só no loopback salvo ``HEALTH_CHECK_HOST``.
+    """
+    try:
+        from config.environment import get_config
+        from monitoring.health_check import start_embedded_health_server
+        monitoring = get_config().monitoring
+    except Exception as e:
+        logger.warning("Metrics exporter unavailable: %s", e)
+        return
+    if not (monitoring.enable_metrics and monitoring.enable_health_check):
+        return
+    start_embedded_health_server(port=monitoring.health_check_port)
 
 def _render_login_inline() -> None:
     """
@@ -2,7 +2,8 @@
 🔄 Advanced Caching System for Streamlit Extension
 
 Intelligent caching with TTL, invalidation, and performance optimization:
-- Multi-level caching (memory + disk)
+- Multi-level caching (memory + SQLite disk tier with write-behind)
+- Lock-striped memory tier with O(1) LRU and byte-budgeted eviction
 - TTL-based expiration
 - Smart cache invalidation
 - Database query caching
@@ -12,10 +13,13 @@ Intelligent caching with TTL, invalidation, and performance optimization:
 import sys
 import os
 import msgpack
+import sqlite3
 import hashlib
 import time
 from pathlib import Path
-from typing import Any, Optional, Dict, Callable, Union
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Optional, Dict, Callable, Union, List, Tuple
 from datetime import datetime, timedelta
 from functools import wraps
 from threading import Lock
@@ -23,6 +27,8 @@ import json
 import logging
 from inspect import signature
 
+from .disk_cache import DISK_CACHE_FILENAME, DiskCacheStore
+
 # Graceful imports
 try:
     import streamlit as st
@@ -38,11 +44,36 @@ def get_config():
     return _get_config()
 
 
+def _approximate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate in-memory footprint of a value in bytes.
+
+    Walks containers a few levels deep; deeper objects are charged their
+    shallow ``sys.getsizeof``. Good enough to budget the memory tier.
+    """
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        return 64
+    if _depth >= 3 or isinstance(value, (str, bytes, bytearray, int, float, bool)):
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            _approximate_size(k, _depth + 1) + _approximate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item, _depth + 1) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _approximate_size(vars(value), _depth + 1)
+    return size
+
+
 class CacheEntry:
     """Represents a single cache entry with metadata."""
     
-    def __init__(self, value: Any, ttl_seconds: int = 300):
+    def __init__(self, value: Any, ttl_seconds: int = 300, size: int = 0):
         self.value = value
+        self.size = size
         self.created_at = datetime.now()
         self.expires_at = self.created_at + timedelta(seconds=ttl_seconds)
         self.access_count = 0
@@ -72,6 +103,70 @@ class CacheEntry:
             self.expires_at = datetime.now() + timedelta(seconds=original_ttl)
 
 
+class _CacheShard:
+    """One lock stripe of the memory tier: an LRU-ordered dict and its counters."""
+
+    __slots__ = ("lock", "entries", "bytes", "stats", "version")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()  # oldest first
+        self.bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # Bumped by every set/delete/clear; a disk read that raced one is not
+        # installed into memory
+        self.version = 0
+
+    def pop(self, cache_key: str) -> Optional[CacheEntry]:
+        entry = self.entries.pop(cache_key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+
+class _MemoryTierView(Mapping):
+    """Read-only mapping over all shards, plus ``clear``.
+
+    Keeps ``cache._memory_cache`` usable by callers that inspect the memory
+    tier; iteration works on a per-shard snapshot so it never races writers.
+    """
+
+    def __init__(self, cache: "AdvancedCache"):
+        self._cache = cache
+
+    def _snapshot(self) -> List[Tuple[str, CacheEntry]]:
+        items = []
+        for shard in self._cache._shards:
+            with shard.lock:
+                items.extend(shard.entries.items())
+        return items
+
+    def __getitem__(self, cache_key: str) -> CacheEntry:
+        shard = self._cache._shard_for(cache_key)
+        with shard.lock:
+            return shard.entries[cache_key]
+
+    def __contains__(self, cache_key: object) -> bool:
+        if not isinstance(cache_key, str):
+            return False
+        return cache_key in self._cache._shard_for(cache_key).entries
+
+    def __iter__(self):
+        return iter([cache_key for cache_key, _ in self._snapshot()])
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._cache._shards)
+
+    def items(self):
+        return self._snapshot()
+
+    def values(self):
+        return [entry for _, entry in self._snapshot()]
+
+    def clear(self) -> None:
+        self._cache._clear_memory()
+
+
 class AdvancedCache:
     # Delegation to AdvancedCacheUiinteraction
     def __init__(self):
@@ -102,35 +197,47 @@ class AdvancedCache:
         self._advancedcachenetworking = AdvancedCacheNetworking()
     """Advanced caching system with multiple levels and smart invalidation."""
     
+    # Shard sizing: one stripe per this many entries, capped.
+    ENTRIES_PER_SHARD = 64
+    MAX_SHARDS = 16
+
     def __init__(self, default_ttl: int = 300, max_size: int = 1000, enable_disk_cache: bool = True, 
-                 max_disk_cache_mb: int = 100):
+                 max_disk_cache_mb: int = 100, max_memory_mb: int = 64, shards: Optional[int] = None):
         self.default_ttl = default_ttl
         self.max_size = max_size
         self.enable_disk_cache = enable_disk_cache
         self.max_disk_cache_mb = max_disk_cache_mb
         self.max_disk_cache_bytes = max_disk_cache_mb * 1024 * 1024  # Convert MB to bytes
 
-        # Memory cache
-        self._memory_cache: Dict[str, CacheEntry] = {}
-        self._access_order = []  # For LRU eviction
-        self._lock = Lock()
+        # Memory tier: N lock stripes, each an LRU-ordered dict with its own
+        # lock. Capacity (entries and approximate bytes) is split evenly
+        # across shards, so eviction order is LRU per shard.
+        self.max_memory_mb = max_memory_mb
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        if shards is None:
+            shards = max(1, min(self.MAX_SHARDS, max_size // self.ENTRIES_PER_SHARD))
+        self._shards = tuple(_CacheShard() for _ in range(shards))
+        self._memory_cache = _MemoryTierView(self)
 
         # Mapping of hashed cache keys to their original representations
         # Used for pattern-based invalidation after enforcing hashed keys for security
+        # Written under the owning shard's lock.
         self._key_map: Dict[str, str] = {}
         
-        # Disk cache directory
+        # Disk cache directory (one SQLite store, opened on first use)
         if enable_disk_cache:
             self.cache_dir = Path.cwd() / ".streamlit_cache"
             self.cache_dir.mkdir(exist_ok=True)
         else:
             self.cache_dir = None
+        self._disk: Optional[DiskCacheStore] = None
+        self._disk_dir: Optional[Path] = None
+        self._disk_lock = Lock()
         
-        # Cache statistics
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0,
+        # Disk tier statistics (memory tier counters live on the shards).
+        # Only guards counter updates; disk I/O never runs under any lock.
+        self._stats_lock = Lock()
+        self._disk_stats = {
             "disk_hits": 0,
             "disk_writes": 0,
             "disk_evictions": 0
@@ -140,6 +247,66 @@ class AdvancedCache:
         self._invalidation_patterns = set()
         self._invalidation_callbacks = {}
 
+    # ---------- Memory tier ----------
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters summed over shards, plus disk counters."""
+        totals = {"hits": 0, "misses": 0, "evictions": 0}
+        for shard in self._shards:
+            for name, value in shard.stats.items():
+                totals[name] += value
+        totals.update(self._disk_stats)
+        return totals
+
+    def _count_disk(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._disk_stats[name] += amount
+
+    def _shard_for(self, cache_key: str) -> _CacheShard:
+        return self._shards[hash(cache_key) % len(self._shards)]
+
+    def _store(self, shard: _CacheShard, cache_key: str, entry: CacheEntry,
+               original_key: Optional[str] = None) -> List[str]:
+        """Insert ``entry`` as most recent and evict LRU entries over budget.
+
+        Must be called with ``shard.lock`` held. Returns the evicted keys so
+        the caller can drop their disk files after releasing the lock.
+        """
+        shard.pop(cache_key)
+        capacity = max(1, self.max_size // len(self._shards))
+        byte_budget = self.max_memory_bytes // len(self._shards)
+        if entry.size <= byte_budget:
+            shard.entries[cache_key] = entry
+            shard.bytes += entry.size
+        if original_key is not None:
+            self._key_map[cache_key] = original_key
+
+        evicted = []
+        while shard.entries and (len(shard.entries) > capacity or shard.bytes > byte_budget):
+            lru_key, lru_entry = shard.entries.popitem(last=False)
+            shard.bytes -= lru_entry.size
+            self._key_map.pop(lru_key, None)
+            shard.stats["evictions"] += 1
+            evicted.append(lru_key)
+        return evicted
+
+    def _drop_evicted_from_disk(self, evicted: List[str]) -> None:
+        # Evicted entries must not be resurrected from disk on the next get.
+        if not evicted or not self.enable_disk_cache or not self.cache_dir:
+            return
+        for lru_key in evicted:
+            if self._delete_from_disk(lru_key):
+                self._count_disk("disk_evictions")
+
+    def _clear_memory(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                for cache_key in shard.entries:
+                    self._key_map.pop(cache_key, None)
+                shard.entries.clear()
+                shard.bytes = 0
+                shard.version += 1
+
     # ---------- Key generation ----------
     def _stable_key(self, func: Callable, args: tuple, kwargs: dict) -> str:
         """Create a deterministic hash for function+args/kwargs."""
@@ -240,39 +407,38 @@ class AdvancedCache:
     def get(self, key: Union[str, tuple, dict], default: Any = None) -> Any:
         """Get value from cache with fallback chain: memory -> disk -> default."""
         cache_key = self._generate_key(key)
+        shard = self._shard_for(cache_key)
         
-        with self._lock:
-            # Check memory cache first
-            if cache_key in self._memory_cache:
-                entry = self._memory_cache[cache_key]
-                
+        with shard.lock:
+            entry = shard.entries.get(cache_key)
+            if entry is not None:
                 if entry.is_valid():
-                    self.stats["hits"] += 1
-                    # Update access order for LRU
-                    if cache_key in self._access_order:
-                        self._access_order.remove(cache_key)
-                    self._access_order.append(cache_key)
-                    
+                    shard.stats["hits"] += 1
+                    shard.entries.move_to_end(cache_key)
                     return entry.access()
-                else:
-                    # Entry expired, remove from memory
-                    del self._memory_cache[cache_key]
-                    if cache_key in self._access_order:
-                        self._access_order.remove(cache_key)
-            
-            # Try disk cache if enabled
-            if self.enable_disk_cache:
-                disk_value = self._get_from_disk(cache_key)
-                if disk_value is not None:
-                    self.stats["disk_hits"] += 1
-                    # Store in memory cache for faster access
-                    self._memory_cache[cache_key] = CacheEntry(disk_value, self.default_ttl)
-                    self._access_order.append(cache_key)
-                    return disk_value
-            
-            # Cache miss
-            self.stats["misses"] += 1
-            return default
+                # Entry expired, remove from memory
+                shard.pop(cache_key)
+            version = shard.version
+        
+        # Try disk cache if enabled (outside the shard lock)
+        if self.enable_disk_cache:
+            disk_value = self._get_from_disk(cache_key)
+            if disk_value is not None:
+                self._count_disk("disk_hits")
+                # Store in memory cache for faster access, unless a write
+                # landed during the read (disk_value may predate it)
+                entry = CacheEntry(disk_value, self.default_ttl, _approximate_size(disk_value))
+                evicted = []
+                with shard.lock:
+                    if shard.version == version:
+                        evicted = self._store(shard, cache_key, entry)
+                self._drop_evicted_from_disk(evicted)
+                return disk_value
+        
+        # Cache miss
+        with shard.lock:
+            shard.stats["misses"] += 1
+        return default
     
     def set(self, key: Union[str, tuple, dict], value: Any, ttl: int = None) -> None:
         """Set value in cache with optional TTL."""
@@ -280,25 +446,23 @@ class AdvancedCache:
         if ttl is None:
             ttl = self.default_ttl
         
-        with self._lock:
-            # Create cache entry
-            entry = CacheEntry(value, ttl)
-            
-            # Check if we need to evict entries
-            self._maybe_evict()
-            
-            # Store in memory cache
-            self._memory_cache[cache_key] = entry
-            self._key_map[cache_key] = str(key)
-            
-            # Update access order
-            if cache_key in self._access_order:
-                self._access_order.remove(cache_key)
-            self._access_order.append(cache_key)
-            
-            # Store in disk cache if enabled
-            if self.enable_disk_cache:
-                self._set_to_disk(cache_key, value, ttl)
+        entry = CacheEntry(value, ttl, _approximate_size(value))
+        encoded = self._encode_for_disk(cache_key, value) if self.enable_disk_cache else None
+        shard = self._shard_for(cache_key)
+        backlog = False
+        with shard.lock:
+            evicted = self._store(shard, cache_key, entry, str(key))
+            shard.version += 1
+            # Queued under the lock (a dict insert, no I/O) so memory and
+            # disk see concurrent set/delete of the key in the same order;
+            # a back-pressure flush is I/O, so it waits for the lock release
+            if encoded is not None:
+                store, blob = encoded
+                backlog = store.put(cache_key, blob, time.time() + ttl, defer_flush=True)
+        
+        if backlog:
+            store.flush()
+        self._drop_evicted_from_disk(evicted)
     
     def delete(self, key: Union[str, tuple, dict]) -> bool:
         """Delete key from cache."""
@@ -307,52 +471,40 @@ class AdvancedCache:
         else:
             cache_key = self._generate_key(key)
         
-        with self._lock:
-            deleted = False
-            
-            # Remove from memory cache and key mapping
-            if cache_key in self._memory_cache:
-                del self._memory_cache[cache_key]
-                deleted = True
-            if cache_key in self._key_map:
-                del self._key_map[cache_key]
-            
-            # Remove from access order
-            if cache_key in self._access_order:
-                self._access_order.remove(cache_key)
-            
-            # Remove from disk cache
-            if self.enable_disk_cache:
-                disk_deleted = self._delete_from_disk(cache_key)
-                deleted = deleted or disk_deleted
-            
-            return deleted
+        store = self._checked_disk_store(cache_key) if self.enable_disk_cache else None
+        disk_deleted = self._stored_on_disk(store, cache_key)
+        
+        shard = self._shard_for(cache_key)
+        backlog = False
+        with shard.lock:
+            deleted = shard.pop(cache_key) is not None
+            self._key_map.pop(cache_key, None)
+            shard.version += 1
+            # Queued under the lock, after any earlier set of the key
+            if store is not None:
+                backlog = store.discard(cache_key, defer_flush=True)
+        
+        if backlog:
+            store.flush()
+        return deleted or disk_deleted
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._memory_cache.clear()
-            self._access_order.clear()
-            self._key_map.clear()
-            
-            if self.enable_disk_cache and self.cache_dir:
-                # Clear disk cache
-                for cache_file in self.cache_dir.glob("*.cache"):
-                    try:
-                        cache_file.unlink()
-                    except OSError:
-                        pass
+        self._clear_memory()
+        
+        store = self._disk_store()
+        if store is not None:
+            store.clear()
     
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all cache entries matching a pattern."""
         count = 0
 
-        with self._lock:
-            keys_to_remove = [
-                original_key
-                for original_key in self._key_map.values()
-                if pattern in original_key
-            ]
+        keys_to_remove = [
+            original_key
+            for original_key in list(self._key_map.values())
+            if pattern in original_key
+        ]
 
         for original_key in keys_to_remove:
             if self.delete(original_key):
@@ -380,297 +532,204 @@ class AdvancedCache:
             "size_after_mb": round(final_size / (1024 * 1024), 2)
         }
     
+    def stats_snapshot(self) -> Dict[str, Any]:
+        """Counters and memory tier size without taking locks or touching disk (for metrics scrapes)."""
+        return {
+            **self.stats,
+            "memory_entries": len(self._memory_cache),
+            "memory_bytes": sum(shard.bytes for shard in self._shards),
+            "max_size": self.max_size,
+        }
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            hit_rate = self.stats["hits"] / (self.stats["hits"] + self.stats["misses"]) if (self.stats["hits"] + self.stats["misses"]) > 0 else 0
+        stats = self.stats
+        hit_rate = stats["hits"] / (stats["hits"] + stats["misses"]) if (stats["hits"] + stats["misses"]) > 0 else 0
+        memory_bytes = sum(shard.bytes for shard in self._shards)
+        
+        # Get disk cache stats
+        disk_size_bytes = self._get_disk_cache_size()
+        disk_size_mb = disk_size_bytes / (1024 * 1024)
+        disk_usage_percent = (disk_size_bytes / self.max_disk_cache_bytes * 100) if self.max_disk_cache_bytes > 0 else 0
+        
+        store = self._disk_store()
+        disk_files_count = store.count() if store is not None else 0
+        
+        return {
+            **stats,
+            "hit_rate": hit_rate,
+            "memory_entries": len(self._memory_cache),
+            "memory_size_kb": memory_bytes // 1024,
+            "memory_bytes": memory_bytes,
+            "max_memory_mb": self.max_memory_mb,
+            "memory_shards": len(self._shards),
+            "disk_cache_enabled": self.enable_disk_cache,
+            "disk_files_count": disk_files_count,
+            "disk_size_mb": round(disk_size_mb, 2),
+            "disk_usage_percent": round(disk_usage_percent, 1),
+            "max_disk_cache_mb": self.max_disk_cache_mb,
+            "max_size": self.max_size
+        }
+    
+    def _disk_store(self) -> Optional[DiskCacheStore]:
+        """Open (or reuse) the SQLite store for the current ``cache_dir``.
+
+        Opened lazily so callers may point ``cache_dir`` elsewhere after
+        construction; the previous store is flushed and closed.
+        """
+        if not self.enable_disk_cache or not self.cache_dir:
+            return None
+        store = self._disk
+        if store is not None and self._disk_dir == self.cache_dir:
+            store.max_bytes = self.max_disk_cache_bytes
+            return store
+        
+        with self._disk_lock:
+            if self._disk is not None and self._disk_dir == self.cache_dir:
+                return self._disk
             
-            # Get disk cache stats
-            disk_size_bytes = self._get_disk_cache_size()
-            disk_size_mb = disk_size_bytes / (1024 * 1024)
-            disk_usage_percent = (disk_size_bytes / self.max_disk_cache_bytes * 100) if self.max_disk_cache_bytes > 0 else 0
+            cache_dir = self.cache_dir
+            db_file = cache_dir / DISK_CACHE_FILENAME
             
-            disk_files_count = 0
-            if self.cache_dir and self.cache_dir.exists():
-                try:
-                    disk_files_count = len(list(self.cache_dir.glob("*.cache")))
-                except OSError:
-                    pass
+            # Safety check: Ensure the resolved path is within cache directory
+            try:
+                resolved_db_file = db_file.resolve()
+                resolved_cache_dir = cache_dir.resolve()
+                
+                if not str(resolved_db_file).startswith(str(resolved_cache_dir)):
+                    security_logger = logging.getLogger('security.cache')
+                    security_logger.error(f"SECURITY VIOLATION: Path traversal detected in resolved path: {resolved_db_file}")
+                    return None
+            except (OSError, ValueError) as e:
+                security_logger = logging.getLogger('security.cache')
+                security_logger.error(f"SECURITY ERROR: Path resolution failed: {e}")
+                return None
             
-            return {
-                **self.stats.copy(),
-                "hit_rate": hit_rate,
-                "memory_entries": len(self._memory_cache),
-                "memory_size_kb": sys.getsizeof(self._memory_cache) // 1024,
-                "disk_cache_enabled": self.enable_disk_cache,
-                "disk_files_count": disk_files_count,
-                "disk_size_mb": round(disk_size_mb, 2),
-                "disk_usage_percent": round(disk_usage_percent, 1),
-                "max_disk_cache_mb": self.max_disk_cache_mb,
-                "max_size": self.max_size
-            }
-    
-    def _maybe_evict(self) -> None:
-        """Evict entries if cache is full (LRU eviction)."""
-        while len(self._memory_cache) >= self.max_size:
-            if not self._access_order:
-                break
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                new_store = DiskCacheStore(db_file, self.max_disk_cache_bytes, on_stat=self._count_disk)
+            except (OSError, sqlite3.Error) as e:
+                logging.getLogger(__name__).warning(f"Disk cache unavailable at {cache_dir}: {e}")
+                return None
             
-            # Remove least recently used entry
-            lru_key = self._access_order.pop(0)
-            if lru_key in self._memory_cache:
-                del self._memory_cache[lru_key]
-                
-                # CRITICAL FIX: Also remove corresponding disk cache file
-                if self.enable_disk_cache and self.cache_dir:
-                    cache_file = self.cache_dir / f"{lru_key}.cache"
-                    try:
-                        if cache_file.exists():
-                            cache_file.unlink()
-                            self.stats["disk_evictions"] += 1
-                    except OSError:
-                        # File might have been deleted already, continue
-                        pass
-                
-                self.stats["evictions"] += 1
+            if self._disk is not None:
+                self._disk.close()
+            self._disk, self._disk_dir = new_store, cache_dir
+            return new_store
     
-    def _get_from_disk(self, cache_key: str) -> Optional[Any]:
-        """Get value from disk cache."""
-        if not self.cache_dir:
-            return None
-        
-        # SECURITY VALIDATION: Ensure cache_key is safe for filesystem
+    def _checked_disk_store(self, cache_key: str) -> Optional[DiskCacheStore]:
+        # SECURITY VALIDATION: Keys reaching the disk tier must be SHA-256 digests
         if not self._validate_cache_key_for_filesystem(cache_key):
             security_logger = logging.getLogger('security.cache')
             security_logger.error(f"SECURITY VIOLATION: Invalid cache key for filesystem: {cache_key}")
             return None
-        
-        cache_file = self.cache_dir / f"{cache_key}.cache"
-        
-        # Additional safety check: Ensure the resolved path is within cache directory
-        try:
-            resolved_cache_file = cache_file.resolve()
-            resolved_cache_dir = self.cache_dir.resolve()
-            
-            if not str(resolved_cache_file).startswith(str(resolved_cache_dir)):
-                security_logger = logging.getLogger('security.cache')
-                security_logger.error(f"SECURITY VIOLATION: Path traversal detected in resolved path: {resolved_cache_file}")
-                return None
-        except (OSError, ValueError) as e:
-            security_logger = logging.getLogger('security.cache')
-            security_logger.error(f"SECURITY ERROR: Path resolution failed: {e}")
+        return self._disk_store()
+    
+    def _get_from_disk(self, cache_key: str) -> Optional[Any]:
+        """Get value from disk cache."""
+        store = self._checked_disk_store(cache_key)
+        if store is None:
             return None
         
         try:
-            if cache_file.exists():
-                with open(cache_file, 'rb') as f:
-                    cache_data = msgpack.unpackb(f.read(), raw=False)
-                
-                # Convert ISO format string back to datetime for expiration check
-                expires_at_str = cache_data['expires_at']
-                expires_at = datetime.fromisoformat(expires_at_str)
-                
-                # Check expiration
-                if datetime.now() <= expires_at:
-                    return cache_data['value']
-                else:
-                    # Expired, remove file
-                    cache_file.unlink()
-                    
-        except (msgpack.exceptions.ExtraData, msgpack.exceptions.UnpackException, 
-                KeyError, OSError, ValueError):
-            # Corrupted cache file or invalid datetime format, remove it
-            try:
-                cache_file.unlink()
-            except OSError:
-                pass
+            blob = store.get(cache_key)
+            if blob is not None:
+                return msgpack.unpackb(blob, raw=False)
+        except (msgpack.exceptions.ExtraData, msgpack.exceptions.UnpackException, ValueError):
+            # Corrupted entry, remove it
+            store.delete(cache_key)
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).debug(f"Disk cache read failed: {e}")
         
         return None
     
-    def _set_to_disk(self, cache_key: str, value: Any, ttl: int) -> None:
-        """Set value to disk cache."""
-        if not self.cache_dir:
-            return
-        
-        # SECURITY VALIDATION: Ensure cache_key is safe for filesystem
-        if not self._validate_cache_key_for_filesystem(cache_key):
-            security_logger = logging.getLogger('security.cache')
-            security_logger.error(f"SECURITY VIOLATION: Invalid cache key for filesystem: {cache_key}")
-            return
-        
-        cache_file = self.cache_dir / f"{cache_key}.cache"
+    def _encode_for_disk(self, cache_key: str, value: Any) -> Optional[Tuple[DiskCacheStore, bytes]]:
+        """Resolve the store and serialise ``value``; None if it cannot go to disk."""
+        store = self._checked_disk_store(cache_key)
+        if store is None:
+            return None
         
-        # Additional safety check: Ensure the resolved path is within cache directory
         try:
-            resolved_cache_file = cache_file.resolve()
-            resolved_cache_dir = self.cache_dir.resolve()
-            
-            if not str(resolved_cache_file).startswith(str(resolved_cache_dir)):
-                security_logger = logging.getLogger('security.cache')
-                security_logger.error(f"SECURITY VIOLATION: Path traversal detected in resolved path: {resolved_cache_file}")
-                return
-        except (OSError, ValueError) as e:
-            security_logger = logging.getLogger('security.cache') 
-            security_logger.error(f"SECURITY ERROR: Path resolution failed: {e}")
-            return
-        
+            return store, msgpack.packb(value, use_bin_type=True)
+        except msgpack.exceptions.PackException:
+            # Value not serialisable, continue without disk cache
+            return None
+    
+    def _set_to_disk(self, cache_key: str, value: Any, ttl: int) -> None:
+        """Queue value for the disk cache (written behind by the store)."""
+        encoded = self._encode_for_disk(cache_key, value)
+        if encoded is not None:
+            store, blob = encoded
+            store.put(cache_key, blob, time.time() + ttl)
+    
+    def _stored_on_disk(self, store: Optional[DiskCacheStore], cache_key: str) -> bool:
+        if store is None:
+            return False
         try:
-            # Convert datetime objects to ISO format strings for msgpack compatibility
-            now = datetime.now()
-            expires_at = now + timedelta(seconds=ttl)
-            
-            cache_data = {
-                'value': value,
-                'created_at': now.isoformat(),
-                'expires_at': expires_at.isoformat()
-            }
-            
-            with open(cache_file, 'wb') as f:
-                f.write(msgpack.packb(cache_data, use_bin_type=True))
-            
-            self.stats["disk_writes"] += 1
-            
-            # Check if disk cache needs cleanup after writing
-            self._cleanup_disk_cache()
-            
-        except (msgpack.exceptions.PackException, OSError):
-            # Failed to write to disk, continue without disk cache
-            pass
+            return store.contains(cache_key)
+        except sqlite3.Error:
+            return False
     
     def _delete_from_disk(self, cache_key: str) -> bool:
         """Delete value from disk cache."""
-        if not self.cache_dir:
+        store = self._checked_disk_store(cache_key)
+        if store is None:
             return False
         
-        # SECURITY VALIDATION: Ensure cache_key is safe for filesystem
-        if not self._validate_cache_key_for_filesystem(cache_key):
-            security_logger = logging.getLogger('security.cache')
-            security_logger.error(f"SECURITY VIOLATION: Invalid cache key for filesystem: {cache_key}")
-            return False
-        
-        cache_file = self.cache_dir / f"{cache_key}.cache"
-        
-        # Additional safety check: Ensure the resolved path is within cache directory
         try:
-            resolved_cache_file = cache_file.resolve()
-            resolved_cache_dir = self.cache_dir.resolve()
-            
-            if not str(resolved_cache_file).startswith(str(resolved_cache_dir)):
-                security_logger = logging.getLogger('security.cache')
-                security_logger.error(f"SECURITY VIOLATION: Path traversal detected in resolved path: {resolved_cache_file}")
-                return False
-        except (OSError, ValueError) as e:
-            security_logger = logging.getLogger('security.cache')
-            security_logger.error(f"SECURITY ERROR: Path resolution failed: {e}")
+            return store.delete(cache_key)
+        except sqlite3.Error:
             return False
-        
-        try:
-            if cache_file.exists():
-                cache_file.unlink()
-                return True
-        except OSError:
-            pass
-        
-        return False
     
     def _get_disk_cache_size(self) -> int:
-        """Get total size of disk cache in bytes."""
-        if not self.cache_dir or not self.cache_dir.exists():
-            return 0
-        
-        total_size = 0
-        try:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    total_size += cache_file.stat().st_size
-                except OSError:
-                    # File might have been deleted, skip it
-                    continue
-        except OSError:
-            # Directory might not be accessible
-            pass
-        
-        return total_size
-    
-    def _get_disk_cache_files_by_age(self) -> list:
-        """Get disk cache files sorted by last access time (oldest first)."""
-        if not self.cache_dir or not self.cache_dir.exists():
-            return []
-        
-        files = []
-        try:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    stat = cache_file.stat()
-                    files.append((cache_file, stat.st_atime))
-                except OSError:
-                    continue
-        except OSError:
-            return []
-        
-        # Sort by access time (oldest first)
-        files.sort(key=lambda x: x[1])
-        return [f[0] for f in files]
+        """Get total size of disk cache entries in bytes."""
+        store = self._disk_store()
+        return store.size_bytes() if store is not None else 0
     
     def _cleanup_disk_cache(self) -> None:
-        """Clean up disk cache if it exceeds size limit."""
-        if not self.enable_disk_cache or not self.cache_dir:
-            return
-        
-        current_size = self._get_disk_cache_size()
-        
-        if current_size <= self.max_disk_cache_bytes:
-            return
+        """Flush pending writes and evict down to the size limit.
         
-        # Remove oldest files until we're under the limit
-        files_by_age = self._get_disk_cache_files_by_age()
-        
-        for cache_file in files_by_age:
-            if current_size <= self.max_disk_cache_bytes * 0.8:  # Leave 20% buffer
-                break
-            
-            try:
-                file_size = cache_file.stat().st_size
-                cache_file.unlink()
-                current_size -= file_size
-                self.stats["disk_evictions"] += 1
-            except OSError:
-                # File might have been deleted already
-                continue
+        The store also does this incrementally after every write batch; this
+        forces a pass now.
+        """
+        store = self._disk_store()
+        if store is not None:
+            store.flush()
+    
+    def flush_disk_cache(self) -> None:
+        """Block until queued disk writes are persisted."""
+        self._cleanup_disk_cache()
     
     def cleanup_orphaned_cache_files(self) -> int:
         """
-        Remove orphaned cache files that don't have corresponding memory entries.
+        Remove orphaned disk entries that don't have corresponding memory entries,
+        plus leftover per-key ``*.cache`` files from the old disk layout.
         
         Returns:
-            int: Number of orphaned files removed
+            int: Number of orphaned entries removed
         """
-        if not self.enable_disk_cache or not self.cache_dir:
+        store = self._disk_store()
+        if store is None:
             return 0
         
         removed_count = 0
         
         try:
+            orphans = [key for key in store.keys() if key not in self._memory_cache]
+            removed_count += store.delete_many(orphans)
+            
             for cache_file in self.cache_dir.glob("*.cache"):
-                # Extract key from filename
-                cache_key = cache_file.stem
-                
-                # If key not in memory cache, it's orphaned
-                if cache_key not in self._memory_cache:
-                    try:
-                        cache_file.unlink()
-                        removed_count += 1
-                        self.stats["disk_evictions"] += 1
-                    except OSError:
-                        # File might have been deleted already
-                        continue
-        
-        except Exception as e:
-            # If directory doesn't exist or other error, log and return 0
-            import logging
+                try:
+                    cache_file.unlink()
+                    removed_count += 1
+                except OSError:
+                    # File might have been deleted already
+                    continue
+        
+        except (OSError, sqlite3.Error) as e:
             logging.getLogger(__name__).debug(f"Cache directory cleanup failed: {e}")
-            # Return 0 as no files were removed due to the error
         
+        self._count_disk("disk_evictions", removed_count)
         return removed_count
 
 
@@ -914,12 +973,11 @@ def cleanup_expired_cache():
     """Remove expired entries from all caches."""
     cache = get_cache()
 
-    with cache._lock:
-        expired_keys = [
-            key
-            for key, entry in cache._memory_cache.items()
-            if entry.is_expired() or entry.expires_at <= entry.created_at
-        ]
+    expired_keys = [
+        key
+        for key, entry in cache._memory_cache.items()
+        if entry.is_expired() or entry.expires_at <= entry.created_at
+    ]
 
     for key in expired_keys:
         cache.delete(key)
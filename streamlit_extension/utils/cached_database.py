@@ -270,7 +270,7 @@ class CachedDatabaseManager:
                     conn
                 )
                 # Convert to expected format
-                result = result[0] if result else None
+                result = dict(result[0]) if result else None
             
             response_time = time.time() - start_time
             operation_type = "cache_hits" if hasattr(self, '_from_cache') else "db_direct_calls"
@@ -434,7 +434,7 @@ class CachedDatabaseManager:
                     (epic_id,),
                     conn
                 )
-                result = result[0] if result else None
+                result = dict(result[0]) if result else None
             
             response_time = time.time() - start_time
             operation_type = "cache_hits" if hasattr(self, '_from_cache') else "db_direct_calls"
@@ -536,7 +536,7 @@ class CachedDatabaseManager:
                     (task_id,),
                     conn
                 )
-                result = result[0] if result else None
+                result = dict(result[0]) if result else None
             
             response_time = time.time() - start_time
             operation_type = "cache_hits" if hasattr(self, '_from_cache') else "db_direct_calls"
@@ -0,0 +1,366 @@
+"""
+SQLite-backed disk tier for ``AdvancedCache``.
+
+All entries live in one table (``cache_entries``) with indexes on expiry and
+last access, replacing the previous one-file-per-key layout:
+
+- Writes are write-behind: ``put``/``delete``/``touch`` only record the latest
+  operation per key in a pending map and wake a background writer, which
+  applies them in a single transaction. Readers consult the pending map
+  first, so they always see their own writes.
+- Expiry and size eviction run incrementally on each writer pass, touching
+  at most ``batch_size`` rows, instead of scanning the directory per write.
+- The total stored size is tracked in memory, so size checks are O(1).
+- Reads use a small pool of at most ``max_readers`` connections, so the
+  number of open connections does not grow with the number of threads.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DISK_CACHE_FILENAME = "cache.sqlite3"
+
+# Pending operation markers (values are ``(blob, expires_at)`` tuples).
+_DELETE = object()
+_TOUCH = object()
+
+_open_stores: "weakref.WeakSet[DiskCacheStore]" = weakref.WeakSet()
+
+
+class DiskCacheStore:
+    """Single-file SQLite store with a write-behind queue."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int,
+        on_stat: Optional[Callable[[str, int], None]] = None,
+        flush_interval: float = 0.05,
+        batch_size: int = 256,
+        max_pending: int = 10_000,
+        max_readers: int = 4,
+    ) -> None:
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_readers = max_readers
+        self._on_stat = on_stat
+
+        self._pending: Dict[str, object] = {}
+        self._inflight: Dict[str, object] = {}  # batch being applied by flush()
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False  # no new writes accepted
+        self._conn_closed = False
+
+        # One connection for writes (serialised by _write_lock) and a bounded
+        # pool of read connections; WAL lets readers run alongside the writer.
+        self._write_lock = threading.RLock()
+        self._conn = self._connect()
+        self._reader_slots = threading.BoundedSemaphore(max_readers)
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._ensure_schema()
+        self._bytes = int(
+            self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        )
+        _open_stores.add(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._write_lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries(
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires ON cache_entries(expires_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed ON cache_entries(accessed_at)"
+            )
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read connection (waits while ``max_readers`` are busy)."""
+        with self._reader_slots:
+            with self._pending_lock:
+                conn = self._idle_readers.pop() if self._idle_readers else None
+            if conn is None:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                with self._pending_lock:
+                    if not self._conn_closed:
+                        self._idle_readers.append(conn)
+                        conn = None
+                if conn is not None:
+                    conn.close()  # store closed while this read ran
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        if amount and self._on_stat is not None:
+            self._on_stat(name, amount)
+
+    # ---------- Reads ----------
+    def _pending_op(self, key: str) -> Optional[object]:
+        with self._pending_lock:
+            op = self._pending.get(key)
+            return self._inflight.get(key) if op is None or op is _TOUCH else op
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored blob for ``key``, or None if absent or expired."""
+        now = time.time()
+        op = self._pending_op(key)
+        if op is _DELETE:
+            return None
+        if isinstance(op, tuple):
+            blob, expires_at = op
+            return blob if expires_at >= now else None
+
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key=?", (key,)
+            ).fetchone()
+        if row is None or row[1] < now:
+            return None  # expired rows are reclaimed by the writer
+        self._enqueue(key, _TOUCH)
+        return row[0]
+
+    def contains(self, key: str) -> bool:
+        op = self._pending_op(key)
+        if op is _DELETE:
+            return False
+        if isinstance(op, tuple):
+            return True
+        with self._reader() as conn:
+            row = conn.execute("SELECT 1 FROM cache_entries WHERE key=?", (key,)).fetchone()
+        return row is not None
+
+    def keys(self) -> List[str]:
+        """All stored keys (pending writes are flushed first)."""
+        self.flush()
+        with self._reader() as conn:
+            return [row[0] for row in conn.execute("SELECT key FROM cache_entries")]
+
+    def count(self) -> int:
+        self.flush()
+        with self._reader() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0])
+
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    # ---------- Writes (write-behind) ----------
+    def put(self, key: str, blob: bytes, expires_at: float, *, defer_flush: bool = False) -> bool:
+        """Queue a write of ``key``.
+
+        A full queue is flushed here (back-pressure) unless ``defer_flush``;
+        then the return value says whether the caller owes a ``flush()``,
+        e.g. once it has released its own lock.
+        """
+        return self._enqueue(key, (blob, expires_at), defer_flush)
+
+    def delete(self, key: str) -> bool:
+        """Schedule removal of ``key``; returns whether it was stored."""
+        existed = self.contains(key)
+        self.discard(key)
+        return existed
+
+    def discard(self, key: str, *, defer_flush: bool = False) -> bool:
+        """Schedule removal of ``key`` without reading whether it is stored.
+
+        The removal is always queued, so it also covers a put that was not
+        visible yet when the caller decided to delete. ``defer_flush`` works
+        as in ``put``.
+        """
+        return self._enqueue(key, _DELETE, defer_flush)
+
+    def _enqueue(self, key: str, op: object, defer_flush: bool = False) -> bool:
+        with self._pending_lock:
+            if self._closed:
+                return False
+            if op is _TOUCH and key in self._pending:
+                return False  # a pending put/delete already supersedes the touch
+            self._pending[key] = op
+            backlog = len(self._pending) >= self.max_pending
+            if self._writer is None and not backlog:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="disk-cache-writer", daemon=True
+                )
+                self._writer.start()
+        if not backlog:
+            self._wakeup.set()
+            return False
+        if defer_flush:
+            return True
+        self.flush()  # back-pressure instead of unbounded growth
+        return False
+
+    def _writer_loop(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as exc:
+                logger.warning("Disk cache flush failed: %s", exc)
+            with self._pending_lock:
+                if not self._pending or self._closed:
+                    self._writer = None
+                    return
+
+    def flush(self) -> None:
+        """Apply pending writes in one transaction, then run one maintenance step."""
+        with self._write_lock:
+            if self._conn_closed:
+                return
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+            try:
+                if pending:
+                    self._apply(pending)
+            finally:
+                with self._pending_lock:
+                    self._inflight = {}
+            self._maintain()
+
+    def _apply(self, pending: Dict[str, object]) -> None:
+        now = time.time()
+        writes = 0
+        with self._conn:
+            for key, op in pending.items():
+                if op is _TOUCH:
+                    self._conn.execute(
+                        "UPDATE cache_entries SET accessed_at=? WHERE key=?", (now, key)
+                    )
+                    continue
+                row = self._conn.execute(
+                    "SELECT size FROM cache_entries WHERE key=?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._bytes -= row[0]
+                if op is _DELETE:
+                    self._conn.execute("DELETE FROM cache_entries WHERE key=?", (key,))
+                    continue
+                blob, expires_at = op
+                self._conn.execute(
+                    """
+                    INSERT INTO cache_entries(key, value, size, expires_at, accessed_at)
+                    VALUES(?,?,?,?,?)
+                    ON CONFLICT(key) DO UPDATE SET value=excluded.value, size=excluded.size,
+                        expires_at=excluded.expires_at, accessed_at=excluded.accessed_at
+                    """,
+                    (key, blob, len(blob), expires_at, now),
+                )
+                self._bytes += len(blob)
+                writes += 1
+        self._count("disk_writes", writes)
+
+    def _delete_rows(self, rows: List[Tuple[str, int]]) -> int:
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany("DELETE FROM cache_entries WHERE key=?", [(key,) for key, _ in rows])
+        self._bytes -= sum(size for _, size in rows)
+        return len(rows)
+
+    def _maintain(self) -> None:
+        """Reclaim up to ``batch_size`` expired rows, then evict LRU rows over budget."""
+        expired = self._conn.execute(
+            "SELECT key, size FROM cache_entries WHERE expires_at < ? ORDER BY expires_at LIMIT ?",
+            (time.time(), self.batch_size),
+        ).fetchall()
+        self._delete_rows(expired)
+
+        evicted = 0
+        target = self.max_bytes * 0.8  # leave 20% headroom
+        while self._bytes > self.max_bytes or (evicted and self._bytes > target):
+            rows = self._conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+            victims, freed = [], 0
+            for key, size in rows:
+                if self._bytes - freed <= target:
+                    break
+                victims.append((key, size))
+                freed += size
+            if not victims:
+                break
+            evicted += self._delete_rows(victims)
+        self._count("disk_evictions", evicted)
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Remove ``keys`` immediately; returns how many were stored."""
+        self.flush()
+        with self._write_lock:
+            rows = []
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT size FROM cache_entries WHERE key=?", (key,)
+                ).fetchone()
+                if row is not None:
+                    rows.append((key, row[0]))
+            return self._delete_rows(rows)
+
+    def clear(self) -> None:
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM cache_entries")
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Flush pending writes and close all connections."""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self.flush()
+        except sqlite3.Error as exc:
+            logger.warning("Disk cache flush on close failed: %s", exc)
+        with self._write_lock:
+            with self._pending_lock:
+                self._conn_closed = True
+                readers, self._idle_readers = self._idle_readers, []
+            for conn in readers + [self._conn]:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+        _open_stores.discard(self)
+
+
+@atexit.register
+def _flush_open_stores() -> None:
+    for store in list(_open_stores):
+        store.close()
@@ -10,7 +10,8 @@ Usage:
         topological_sort_simple,
         longest_path_weighted,
         find_strongly_connected_components,
-        detect_cycles
+        detect_cycles,
+        ReachabilityIndex,
     )
 
 Features:
@@ -19,6 +20,7 @@ Features:
 - Detecção de ciclos com DFS colorido
 - Strongly Connected Components (Tarjan)
 - Validação de DAG
+- Índice de alcançabilidade com bitsets (ReachabilityIndex)
 """
 
 import logging
@@ -41,6 +43,259 @@ class GraphNode:
         if self.metadata is None:
             self.metadata = {}
 
+
+@dataclass
+class CriticalPathResult:
+    """
+    Resultado do CPM (Critical Path Method).
+
+    Tempos em unidades de peso (ex.: minutos), com início do projeto em 0.
+    ``slack`` é a folga total: quanto a tarefa pode atrasar sem atrasar o projeto.
+    """
+    critical_path: List[str]
+    critical_nodes: List[str]
+    project_duration: int
+    earliest_start: Dict[str, int]
+    earliest_finish: Dict[str, int]
+    latest_start: Dict[str, int]
+    latest_finish: Dict[str, int]
+    slack: Dict[str, int]
+
+    def schedule(self) -> Dict[str, Dict[str, int]]:
+        """Visão por tarefa: {node: {earliest_start, ..., slack}}."""
+        return {
+            node: {
+                "earliest_start": self.earliest_start[node],
+                "earliest_finish": self.earliest_finish[node],
+                "latest_start": self.latest_start[node],
+                "latest_finish": self.latest_finish[node],
+                "slack": self.slack[node],
+            }
+            for node in self.earliest_start
+        }
+
+
+def _iter_bits(bits: int):
+    """Itera os índices dos bits ligados de um inteiro (menor primeiro)."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class ReachabilityIndex:
+    """
+    Índice de alcançabilidade (fechamento transitivo) baseado em bitsets.
+
+    Cada nó recebe um ID inteiro; ``_reach[i]`` é um ``int`` Python cujo bit
+    ``j`` indica que existe caminho (com ao menos uma aresta) de ``i`` até
+    ``j``, e ``_ancestors[j]`` é o bitset inverso. O fechamento é calculado
+    sobre a condensação em SCCs (Tarjan iterativo, que emite componentes em
+    ordem topológica reversa), então grafos com ciclos também são aceitos.
+
+    - ``reaches(a, b)``: consulta O(1) por bitset
+    - ``add_edge(u, v)``: atualização incremental (ancestrais de ``u`` x descendentes de ``v``)
+
+    Args:
+        adjacency: Grafo dirigido {node: {neighbors}}
+    """
+
+    def __init__(self, adjacency: Optional[Dict[str, Set[str]]] = None):
+        if adjacency is not None and not isinstance(adjacency, dict):
+            raise TypeError(f"adjacency deve ser dict, recebido: {type(adjacency)}")
+
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._edges: List[Set[int]] = []
+        self._reach: List[int] = []
+        self._ancestors: List[int] = []
+
+        for node, neighbors in (adjacency or {}).items():
+            if not isinstance(neighbors, (set, list, tuple, frozenset)):
+                raise TypeError(f"neighbors de {node} deve ser set/list/tuple, recebido: {type(neighbors)}")
+            source = self._node_id(node)
+            for neighbor in neighbors:
+                self._edges[source].add(self._node_id(neighbor))
+
+        self._build()
+
+    # ---------- Construção ----------
+
+    def _node_id(self, key: str) -> int:
+        node_id = self._ids.get(key)
+        if node_id is None:
+            node_id = len(self._keys)
+            self._ids[key] = node_id
+            self._keys.append(key)
+            self._edges.append(set())
+            self._reach.append(0)
+            self._ancestors.append(0)
+        return node_id
+
+    def _strongly_connected_components(self) -> List[List[int]]:
+        """Tarjan iterativo; componentes saem em ordem topológica reversa."""
+        n = len(self._keys)
+        index = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, iter(self._edges[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                node, neighbors = work[-1]
+                advanced = False
+                for neighbor in neighbors:
+                    if index[neighbor] == -1:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack[neighbor] = True
+                        work.append((neighbor, iter(self._edges[neighbor])))
+                        advanced = True
+                        break
+                    if on_stack[neighbor]:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def _build(self) -> None:
+        components = self._strongly_connected_components()
+        comp_of = [0] * len(self._keys)
+        comp_bits: List[int] = []
+        for cid, members in enumerate(components):
+            bits = 0
+            for member in members:
+                comp_of[member] = cid
+                bits |= 1 << member
+            comp_bits.append(bits)
+
+        # Descendentes: sumidouros primeiro (ordem de emissão do Tarjan)
+        comp_reach = [0] * len(components)
+        predecessors: List[Set[int]] = [set() for _ in components]
+        for cid, members in enumerate(components):
+            reach = 0
+            cyclic = len(members) > 1
+            for member in members:
+                for neighbor in self._edges[member]:
+                    target = comp_of[neighbor]
+                    if target == cid:
+                        cyclic = True
+                    else:
+                        reach |= comp_bits[target] | comp_reach[target]
+                        predecessors[target].add(cid)
+            if cyclic:
+                reach |= comp_bits[cid]
+            comp_reach[cid] = reach
+
+        # Ancestrais: fontes primeiro (ordem inversa)
+        comp_anc = [0] * len(components)
+        for cid in range(len(components) - 1, -1, -1):
+            anc = 0
+            for pred in predecessors[cid]:
+                anc |= comp_bits[pred] | comp_anc[pred]
+            if comp_reach[cid] & comp_bits[cid]:
+                anc |= comp_bits[cid]
+            comp_anc[cid] = anc
+
+        for node, cid in enumerate(comp_of):
+            self._reach[node] = comp_reach[cid]
+            self._ancestors[node] = comp_anc[cid]
+
+    # ---------- Consultas ----------
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._ids
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def reaches(self, source: str, target: str) -> bool:
+        """True se existe caminho (>= 1 aresta) de ``source`` até ``target``."""
+        source_id = self._ids.get(source)
+        target_id = self._ids.get(target)
+        if source_id is None or target_id is None:
+            return False
+        return (self._reach[source_id] >> target_id) & 1 == 1
+
+    def descendants(self, key: str) -> Set[str]:
+        """Todos os nós alcançáveis a partir de ``key``."""
+        node_id = self._ids.get(key)
+        if node_id is None:
+            return set()
+        return {self._keys[i] for i in _iter_bits(self._reach[node_id])}
+
+    def ancestors(self, key: str) -> Set[str]:
+        """Todos os nós que alcançam ``key``."""
+        node_id = self._ids.get(key)
+        if node_id is None:
+            return set()
+        return {self._keys[i] for i in _iter_bits(self._ancestors[node_id])}
+
+    def would_create_cycle(self, source: str, target: str) -> bool:
+        """True se adicionar a aresta ``source -> target`` fecharia um ciclo."""
+        return source == target or self.reaches(target, source)
+
+    def to_closure(self) -> Dict[str, Set[str]]:
+        """Fechamento transitivo no formato {node: {alcançáveis}}."""
+        return {key: self.descendants(key) for key in self._keys}
+
+    # ---------- Atualização incremental ----------
+
+    def add_node(self, key: str) -> None:
+        """Adiciona um nó isolado (no-op se já existir)."""
+        self._node_id(key)
+
+    def add_edge(self, source: str, target: str) -> None:
+        """
+        Adiciona a aresta ``source -> target`` atualizando o fechamento.
+
+        Todo ancestral de ``source`` (e ele próprio) passa a alcançar ``target``
+        e seus descendentes; custo proporcional a esses dois conjuntos.
+        Use ``would_create_cycle`` antes se o grafo precisa continuar DAG.
+        """
+        u = self._node_id(source)
+        v = self._node_id(target)
+        if v in self._edges[u]:
+            return
+        self._edges[u].add(v)
+
+        if (self._reach[u] >> v) & 1:
+            return  # já alcançável: fechamento não muda
+
+        new_targets = self._reach[v] | (1 << v)
+        new_sources = self._ancestors[u] | (1 << u)
+        for node in _iter_bits(new_sources):
+            self._reach[node] |= new_targets
+        for node in _iter_bits(new_targets):
+            self._ancestors[node] |= new_sources
+
+
 class GraphAlgorithms:
     # Delegation to GraphAlgorithmsValidation
     def __init__(self):
@@ -117,8 +372,8 @@ class GraphAlgorithms:
             current = queue.popleft()
             result.append(current)
             
-            # Atualizar in-degree dos vizinhos
-            for neighbor in adjacency[current]:
+            # Atualizar in-degree dos vizinhos (nós só-vizinhos não têm entrada)
+            for neighbor in adjacency.get(current, ()):
                 if neighbor in in_degree:
                     in_degree[neighbor] -= 1
                     if in_degree[neighbor] == 0:
@@ -371,6 +626,8 @@ class GraphAlgorithms:
         """
         Constrói fechamento transitivo do grafo
         Útil para verificar alcançabilidade
+        OTIMIZAÇÃO: bitsets por nó sobre a condensação em SCCs (ReachabilityIndex),
+        em vez de Floyd-Warshall O(V³). Para consultas repetidas, use o índice direto.
         
         Args:
             adjacency: Grafo dirigido
@@ -378,21 +635,89 @@ class GraphAlgorithms:
         Returns:
             Grafo com todas as relações transitivas
         """
-        # Inicializar com adjacências diretas
-        closure = {node: adjacency.get(node, set()).copy() for node in adjacency}
+        closure = ReachabilityIndex(adjacency).to_closure()
+        return {node: closure.get(node, set()) for node in adjacency}
+    
+    @staticmethod
+    def critical_path_analysis(
+        adjacency: Dict[str, Set[str]],
+        weights: Dict[str, int]
+    ) -> CriticalPathResult:
+        """
+        CPM em tempo linear O(V + E)
+        Uma ordenação topológica, índice reverso de predecessores construído uma
+        vez e argmax do predecessor registrado durante a passada direta.
         
-        # Floyd-Warshall adaptado
-        nodes = list(adjacency.keys())
+        Args:
+            adjacency: Grafo dirigido {node: {successors}}
+            weights: Peso (duração) de cada nó; mínimo 1
+            
+        Returns:
+            CriticalPathResult com caminho crítico e ES/EF/LS/LF/folga por nó
+            
+        Raises:
+            ValueError: Se o grafo contém ciclos
+            TypeError: Se inputs não são do tipo correto
+        """
+        if not isinstance(adjacency, dict) or not isinstance(weights, dict):
+            raise TypeError("adjacency e weights devem ser dicionários")
         
-        for k in nodes:
-            for i in nodes:
-                for j in nodes:
-                    if k in closure.get(i, set()) and j in closure.get(k, set()):
-                        if i not in closure:
-                            closure[i] = set()
-                        closure[i].add(j)
+        topo_order = GraphAlgorithms.topological_sort_simple(adjacency)
+        if not topo_order:
+            return CriticalPathResult([], [], 0, {}, {}, {}, {}, {})
         
-        return closure
+        duration = {node: max(weights.get(node, 1), 1) for node in topo_order}
+        predecessors: Dict[str, List[str]] = {node: [] for node in topo_order}
+        for node, neighbors in adjacency.items():
+            for neighbor in neighbors:
+                predecessors[neighbor].append(node)
+        
+        # Passada direta: ES/EF + predecessor que define o ES (argmax)
+        earliest_start: Dict[str, int] = {}
+        earliest_finish: Dict[str, int] = {}
+        best_pred: Dict[str, Optional[str]] = {}
+        for node in topo_order:
+            start, argmax = 0, None
+            for pred in predecessors[node]:
+                if earliest_finish[pred] > start:
+                    start, argmax = earliest_finish[pred], pred
+            earliest_start[node] = start
+            earliest_finish[node] = start + duration[node]
+            best_pred[node] = argmax
+        
+        project_duration = max(earliest_finish.values())
+        
+        # Passada reversa: LS/LF a partir dos sucessores
+        latest_start: Dict[str, int] = {}
+        latest_finish: Dict[str, int] = {}
+        for node in reversed(topo_order):
+            finish = project_duration
+            for successor in adjacency.get(node, ()):
+                finish = min(finish, latest_start[successor])
+            latest_finish[node] = finish
+            latest_start[node] = finish - duration[node]
+        
+        slack = {node: latest_start[node] - earliest_start[node] for node in topo_order}
+        
+        # Cadeia crítica: do nó que termina por último, seguindo os argmax
+        end_node = max(topo_order, key=earliest_finish.__getitem__)
+        chain = []
+        current: Optional[str] = end_node
+        while current is not None:
+            chain.append(current)
+            current = best_pred[current]
+        chain.reverse()
+        
+        return CriticalPathResult(
+            critical_path=chain,
+            critical_nodes=[node for node in topo_order if slack[node] == 0],
+            project_duration=project_duration,
+            earliest_start=earliest_start,
+            earliest_finish=earliest_finish,
+            latest_start=latest_start,
+            latest_finish=latest_finish,
+            slack=slack,
+        )
     
     @staticmethod
     def find_critical_path_nodes(
@@ -401,17 +726,16 @@ class GraphAlgorithms:
     ) -> List[str]:
         """
         Encontra nós no caminho crítico
-        OTIMIZAÇÃO: Versão iterativa para evitar stack overflow
+        OTIMIZAÇÃO: CPM linear (critical_path_analysis) - nós com folga zero
         
         Args:
             adjacency: Grafo dirigido
             weights: Peso de cada nó
             
         Returns:
-            Lista de nós no caminho crítico
+            Lista de nós no caminho crítico, em ordem topológica
             
         Raises:
-            ValueError: Se o grafo contém ciclos
             TypeError: Se inputs não são do tipo correto
         """
         # Input validation
@@ -419,41 +743,7 @@ class GraphAlgorithms:
             raise TypeError("adjacency e weights devem ser dicionários")
         
         try:
-            # Calcular distâncias (tempo total até conclusão)
-            distances = GraphAlgorithms.longest_path_weighted(adjacency, weights)
-            
-            if not distances:
-                return []
-            
-            # Encontrar nó com maior distância (fim do caminho crítico)
-            max_distance = max(distances.values())
-            end_nodes = [node for node, dist in distances.items() if dist == max_distance]
-            
-            # OTIMIZAÇÃO: Versão iterativa para evitar recursão profunda
-            critical_nodes = set()
-            processing_stack = [(node, distances[node]) for node in end_nodes]
-            
-            while processing_stack:
-                current_node, target_distance = processing_stack.pop()
-                
-                if current_node in critical_nodes:
-                    continue
-                    
-                critical_nodes.add(current_node)
-                node_weight = max(weights.get(current_node, 1), 1)
-                predecessor_distance = target_distance - node_weight
-                
-                # Encontrar predecessores que levam ao caminho crítico
-                for pred_node in adjacency:
-                    if current_node in adjacency.get(pred_node, set()):
-                        pred_actual_distance = distances.get(pred_node, 0)
-                        if pred_actual_distance == predecessor_distance:
-                            processing_stack.append((pred_node, predecessor_distance))
-            
-            # Retornar em ordem topológica
-            topo_order = GraphAlgorithms.topological_sort_simple(adjacency)
-            return [node for node in topo_order if node in critical_nodes]
-            
+            return GraphAlgorithms.critical_path_analysis(adjacency, weights).critical_nodes
         except Exception as e:
             logger.error(f"Erro ao encontrar caminho crítico: {e}")
             return []
@@ -554,6 +844,10 @@ def longest_path_weighted(adjacency: Dict[str, Set[str]], weights: Dict[str, int
     """Função de conveniência para caminho crítico ponderado"""
     return GraphAlgorithms.longest_path_weighted(adjacency, weights)
 
+def critical_path_analysis(adjacency: Dict[str, Set[str]], weights: Dict[str, int]) -> CriticalPathResult:
+    """Função de conveniência para CPM com folgas"""
+    return GraphAlgorithms.critical_path_analysis(adjacency, weights)
+
 def detect_cycles(adjacency: Dict[str, Set[str]]):
     """Alias para detect_cycles_dfs para compatibilidade externa."""
     return GraphAlgorithms.detect_cycles_dfs(adjacency)
@@ -564,4 +858,8 @@ def find_strongly_connected_components(adjacency: Dict[str, Set[str]]) -> List[L
 
 def validate_dag(adjacency: Dict[str, Set[str]]) -> Tuple[bool, Optional[str]]:
     """Função de conveniência para validação DAG"""
-    return GraphAlgorithms.validate_dag(adjacency)
\ No newline at end of file
+    return GraphAlgorithms.validate_dag(adjacency)
+
+def build_reachability_index(adjacency: Dict[str, Set[str]]) -> ReachabilityIndex:
+    """Função de conveniência para o índice de alcançabilidade"""
+    return ReachabilityIndex(adjacency)
@@ -0,0 +1,270 @@
+"""Weighted load test scenarios against a scratch SQLite database.
+
+`ScratchScenario` creates a throwaway database shaped like the framework
+schema (epics, tasks, dependencies, work sessions, epic revisions), seeds it,
+and exposes the operations the UI issues most often as load test actions:
+
+* ``list_tasks`` - the ``TasksRepo.list_by_epic`` query
+* ``start_timer`` / ``stop_timer`` - the work session writes of the timer
+* ``plan_execution`` - ``TaskExecutionPlanner.plan_execution`` for an epic
+  (opt-in, weight 0 by default: ``TasksRepo`` cannot build ``Task`` rows on
+  this tree, so every call fails)
+
+Each worker thread gets its own connection. Typical use with the open-loop
+mode of `LoadTester`::
+
+    with ScratchScenario() as scenario:
+        actions, weights = scenario.weighted_actions()
+        find_saturation_point(actions, [50, 100, 200, 400], weights=weights)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from streamlit_extension.database.rollups import create_epic_revisions
+
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "plan_execution": 0.0,  # enable once TasksRepo parses rows into Task again
+    "list_tasks": 6.0,
+    "start_timer": 1.5,
+    "stop_timer": 1.5,
+}
+
+_SCRATCH_SCHEMA = """
+CREATE TABLE framework_epics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    epic_key TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT DEFAULT 'active',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE framework_tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_key TEXT UNIQUE NOT NULL,
+    epic_id INTEGER NOT NULL REFERENCES framework_epics (id),
+    title TEXT NOT NULL,
+    description TEXT,
+    tdd_phase TEXT,
+    tdd_order INTEGER,
+    task_type TEXT DEFAULT 'implementation',
+    status TEXT DEFAULT 'pending',
+    estimate_minutes INTEGER,
+    story_points INTEGER,
+    priority INTEGER DEFAULT 3,
+    task_group TEXT,
+    task_sequence INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deleted_at TIMESTAMP
+);
+CREATE TABLE task_dependencies (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL REFERENCES framework_tasks (id),
+    depends_on_task_key TEXT NOT NULL,
+    depends_on_task_id INTEGER,
+    dependency_type TEXT DEFAULT 'blocking',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE work_sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER,
+    session_type TEXT DEFAULT 'focus',
+    status TEXT DEFAULT 'active',
+    start_time TIMESTAMP,
+    end_time TIMESTAMP,
+    duration_minutes INTEGER,
+    planned_duration_minutes INTEGER,
+    focus_rating INTEGER,
+    interruption_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP
+);
+CREATE INDEX idx_tasks_epic ON framework_tasks (epic_id);
+CREATE INDEX idx_deps_task ON task_dependencies (task_id);
+CREATE INDEX idx_sessions_status ON work_sessions (status);
+"""
+
+
+def create_scratch_database(
+    path: str, epics: int = 5, tasks_per_epic: int = 40, seed: int = 0
+) -> None:
+    """Create and seed a scratch database at ``path`` (overwritten)."""
+
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(_SCRATCH_SCHEMA)
+        create_epic_revisions(conn)
+        for epic_id in range(1, epics + 1):
+            conn.execute(
+                "INSERT INTO framework_epics (id, epic_key, name) VALUES (?, ?, ?)",
+                (epic_id, f"EPIC-{epic_id}", f"Epic {epic_id}"),
+            )
+            keys: List[Tuple[int, str]] = []
+            for position in range(1, tasks_per_epic + 1):
+                key = f"E{epic_id}-T{position:03d}"
+                cursor = conn.execute(
+                    """
+                    INSERT INTO framework_tasks (task_key, epic_id, title, tdd_phase, status,
+                        estimate_minutes, story_points, priority, task_sequence)
+                    VALUES (?, ?, ?, ?, 'pending', ?, ?, ?, ?)
+                    """,
+                    (key, epic_id, f"Task {key}", rng.choice(["red", "green", "refactor"]),
+                     rng.choice([15, 30, 60, 120]), rng.choice([1, 2, 3, 5, 8]),
+                     rng.randint(1, 5), position),
+                )
+                # Dependências só para tarefas anteriores: grafo acíclico
+                for prerequisite_id, prerequisite_key in rng.sample(keys, min(len(keys), rng.randint(0, 2))):
+                    conn.execute(
+                        "INSERT INTO task_dependencies (task_id, depends_on_task_key, depends_on_task_id) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, prerequisite_key, prerequisite_id),
+                    )
+                keys.append((cursor.lastrowid, key))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class ScratchScenario:
+    """Scratch database plus the load test actions that run against it.
+
+    Args:
+        path: Database file (default: a new temporary directory, removed on close)
+        epics: Number of epics seeded
+        tasks_per_epic: Tasks seeded per epic
+        seed: Seed for data generation and action parameters
+        use_plan_cache: Let ``plan_execution`` use the process plan cache
+            (off by default: its entries would evict the application's plans)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        epics: int = 5,
+        tasks_per_epic: int = 40,
+        seed: int = 0,
+        use_plan_cache: bool = False,
+    ):
+        self._tempdir = None if path else tempfile.mkdtemp(prefix="load-scenario-")
+        self.path = path or os.path.join(self._tempdir, "framework.db")
+        self.epics = epics
+        self.use_plan_cache = use_plan_cache
+        create_scratch_database(self.path, epics, tasks_per_epic, seed)
+        self._task_ids = self._load_task_ids()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+
+    def _load_task_ids(self) -> List[int]:
+        conn = sqlite3.connect(self.path)
+        try:
+            return [row[0] for row in conn.execute("SELECT id FROM framework_tasks")]
+        finally:
+            conn.close()
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _pick(self, values):
+        with self._lock:
+            return self._rng.choice(values)
+
+    # ---------- Actions ----------
+
+    def plan_execution(self) -> None:
+        from streamlit_extension.services.task_execution_planner import TaskExecutionPlanner
+
+        planner = TaskExecutionPlanner(self.connection())
+        result = planner.plan_execution(self._pick(range(1, self.epics + 1)), use_cache=self.use_plan_cache)
+        if not result.success:
+            raise RuntimeError("; ".join(result.get_error_messages()))
+
+    def list_tasks(self) -> None:
+        # Same query as TasksRepo.list_by_epic, without the Task parsing
+        from streamlit_extension.repos.tasks_repo import BASE_FIELDS
+
+        self.connection().execute(
+            f"""
+            SELECT {BASE_FIELDS}
+            FROM framework_tasks
+            WHERE epic_id = ? AND deleted_at IS NULL
+            ORDER BY COALESCE(task_sequence, 1e9), task_key
+            """,
+            (self._pick(range(1, self.epics + 1)),),
+        ).fetchall()
+
+    def start_timer(self) -> None:
+        conn = self.connection()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO work_sessions (task_id, session_type, status, start_time, planned_duration_minutes)
+                VALUES (?, 'focus', 'active', ?, 25)
+                """,
+                (self._pick(self._task_ids), datetime.now()),
+            )
+
+    def stop_timer(self) -> None:
+        conn = self.connection()
+        with conn:
+            row = conn.execute(
+                "SELECT id, start_time FROM work_sessions WHERE status = 'active' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return
+            conn.execute(
+                """
+                UPDATE work_sessions
+                SET status = 'completed', end_time = ?, duration_minutes = 25, updated_at = ?
+                WHERE id = ? AND status = 'active'
+                """,
+                (datetime.now(), datetime.now(), row["id"]),
+            )
+
+    def weighted_actions(
+        self, weights: Optional[Dict[str, float]] = None
+    ) -> Tuple[List[Callable[[], None]], List[float]]:
+        """Actions and weights for ``LoadTester(actions=..., weights=...)``."""
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        names = [name for name, weight in weights.items() if weight > 0]
+        return [getattr(self, name) for name in names], [weights[name] for name in names]
+
+    # ---------- Lifecycle ----------
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if self._tempdir:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+
+    def __enter__(self) -> "ScratchScenario":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
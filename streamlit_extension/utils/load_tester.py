@@ -6,12 +6,26 @@ The implementation focuses on deterministic behaviour and low resource
 usage rather than absolute performance. It supports spawning a number of
 virtual users that execute a set of actions for a given duration while
 collecting metrics and basic system statistics.
+
+Two modes are available:
+
+* closed loop (default): ``users`` threads call the actions back-to-back.
+  When the system slows down the offered load drops with it, so latencies
+  look better than they are.
+* open loop (``schedule=...``): requests are issued at the times given by an
+  arrival schedule (constant, ramp, step or Poisson), independently of how
+  fast earlier requests complete. Latency is measured from the *intended*
+  start time, so queueing behind a saturated system is counted.
+  ``find_saturation_point`` steps the rate up until the system falls behind.
 """
 
+import math
+import random
 import threading
 import time
+from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from .metrics_collector import MetricsCollector
 from .performance_monitor import PerformanceMonitor
@@ -20,16 +34,156 @@ from streamlit_extension.auth.middleware import require_auth, require_admin
 from streamlit_extension.auth.user_model import UserRole
 
 
+# ---------------------------------------------------------------------------
+# Arrival schedules (open loop)
+# ---------------------------------------------------------------------------
+
+
+class ArrivalSchedule(ABC):
+    """Intended request start times, as offsets in seconds from the run start."""
+
+    @abstractmethod
+    def offsets(self, duration: float) -> Iterator[float]:
+        """Ascending offsets (seconds) of the arrivals within ``duration``."""
+
+
+class ConstantRate(ArrivalSchedule):
+    """``rate`` requests per second, evenly spaced."""
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+
+    def offsets(self, duration: float) -> Iterator[float]:
+        count = int(math.ceil(duration * self.rate - 1e-9))
+        for k in range(count):
+            yield k / self.rate
+
+
+class RampRate(ArrivalSchedule):
+    """Rate changing linearly from ``start_rate`` to ``end_rate`` over the run."""
+
+    def __init__(self, start_rate: float, end_rate: float):
+        if start_rate < 0 or end_rate < 0 or start_rate + end_rate <= 0:
+            raise ValueError("rates must be non-negative and not both zero")
+        self.start_rate = float(start_rate)
+        self.end_rate = float(end_rate)
+
+    def offsets(self, duration: float) -> Iterator[float]:
+        # Cumulative arrivals N(t) = r0*t + a*t^2/2; the k-th request is at N(t) = k
+        r0 = self.start_rate
+        a = (self.end_rate - r0) / duration
+        expected = r0 * duration + a * duration * duration / 2
+        for k in range(int(math.ceil(expected - 1e-9))):
+            if abs(a) < 1e-12:
+                yield k / r0
+            else:
+                yield (-r0 + math.sqrt(max(0.0, r0 * r0 + 2 * a * k))) / a
+
+
+class StepRate(ArrivalSchedule):
+    """Constant rate per step: ``rates[i]`` during step ``i`` (``step_seconds`` each)."""
+
+    def __init__(self, rates: Sequence[float], step_seconds: float):
+        if not rates or any(r < 0 for r in rates) or step_seconds <= 0:
+            raise ValueError("expected non-negative rates and a positive step length")
+        self.rates = [float(r) for r in rates]
+        self.step_seconds = float(step_seconds)
+
+    def offsets(self, duration: float) -> Iterator[float]:
+        for index, rate in enumerate(self.rates):
+            step_start = index * self.step_seconds
+            if step_start >= duration:
+                return
+            if rate <= 0:
+                continue
+            step_length = min(self.step_seconds, duration - step_start)
+            for k in range(int(math.ceil(step_length * rate - 1e-9))):
+                yield step_start + k / rate
+
+
+class PoissonRate(ArrivalSchedule):
+    """Poisson arrivals (exponential gaps) with mean ``rate`` per second."""
+
+    def __init__(self, rate: float, seed: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.seed = seed
+
+    def offsets(self, duration: float) -> Iterator[float]:
+        rng = random.Random(self.seed)
+        offset = rng.expovariate(self.rate)
+        while offset < duration:
+            yield offset
+            offset += rng.expovariate(self.rate)
+
+
+# ---------------------------------------------------------------------------
+# Load tester
+# ---------------------------------------------------------------------------
+
+
 class LoadTester:
-    """Execute simple load test scenarios."""
+    """Execute simple load test scenarios.
+
+    Args:
+        users: Closed loop: concurrent virtual users. Open loop: worker threads
+            available to serve arrivals.
+        duration: Run length in seconds (open loop: length of the schedule)
+        actions: Callables to run
+        on_error: Optional callback for exceptions raised by actions
+        schedule: Arrival schedule; enables the open-loop mode
+        weights: Open loop: relative weight of each action (default: equal);
+            each arrival runs one action picked by weight
+        max_backlog: Open loop: arrivals waiting for a worker beyond this are
+            dropped instead of queued (bounds memory past saturation)
+        drain_timeout: Open loop: time allowed after the schedule ends for
+            queued requests; the rest are dropped
+        seed: Seed for the weighted action choice
+    """
 
-    def __init__(self, users: int, duration: float, actions: Iterable[Callable[[], None]], on_error: Optional[Callable[[BaseException], None]] = None):
+    def __init__(
+        self,
+        users: int,
+        duration: float,
+        actions: Iterable[Callable[[], None]],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        schedule: Optional[ArrivalSchedule] = None,
+        weights: Optional[Sequence[float]] = None,
+        max_backlog: int = 10_000,
+        drain_timeout: float = 5.0,
+        seed: Optional[int] = None,
+    ):
         self.users = users
         self.duration = duration
         self.actions: List[Callable[[], None]] = list(actions)
         self.metrics = MetricsCollector()
         self.monitor = PerformanceMonitor()
         self._on_error = on_error
+        self.schedule = schedule
+        if weights is not None and len(weights) != len(self.actions):
+            raise ValueError("weights must match actions")
+        self.weights = list(weights) if weights is not None else None
+        self.max_backlog = max_backlog
+        self.drain_timeout = drain_timeout
+        self.seed = seed
+        # Open loop only: time from the actual start, per action latency
+        self.service_metrics = MetricsCollector()
+        self.action_metrics: Dict[str, MetricsCollector] = {}
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._dropped = 0
+        self._succeeded = 0
+        self._abandon = threading.Event()
+
+    def _notify_error(self, exc: BaseException) -> None:
+        if self._on_error:
+            try:
+                self._on_error(exc)
+            except Exception:
+                pass
 
     def _user_loop(self, stop_time: float) -> None:
         while time.perf_counter() < stop_time:
@@ -40,11 +194,7 @@ class LoadTester:
                     action()
                 except Exception as exc:  # captura exceção para telemetria
                     success = False
-                    if self._on_error:
-                        try:
-                            self._on_error(exc)
-                        except Exception:
-                            pass
+                    self._notify_error(exc)
                     self.metrics.record_exception(exc, (time.perf_counter() - start) * 1000)
                     # Verifica tempo novamente para não ultrapassar duração
                     if time.perf_counter() >= stop_time:
@@ -58,6 +208,9 @@ class LoadTester:
     def run(self) -> dict:
         """Run the configured scenario and return collected metrics."""
 
+        if self.schedule is not None:
+            return self._run_open_loop()
+
         self.metrics.start()
         stop_time = time.perf_counter() + self.duration
         with ThreadPoolExecutor(max_workers=self.users) as executor:
@@ -66,4 +219,168 @@ class LoadTester:
         self.metrics.end()
         summary = self.metrics.summary()
         summary["resources"] = self.monitor.sample()
-        return summary
\ No newline at end of file
+        return summary
+
+    # ---------- Open loop ----------
+
+    @staticmethod
+    def _action_name(action: Callable[[], None]) -> str:
+        return getattr(action, "__name__", None) or repr(action)
+
+    def _open_loop_call(self, action: Callable[[], None], name: str, intended: float) -> None:
+        try:
+            if self._abandon.is_set():
+                with self._lock:
+                    self._dropped += 1
+                return
+            started = time.perf_counter()
+            success = True
+            try:
+                action()
+            except Exception as exc:
+                success = False
+                self._notify_error(exc)
+            finished = time.perf_counter()
+            # Latência a partir do início pretendido: inclui a fila
+            latency_ms = (finished - intended) * 1000
+            self.metrics.record(latency_ms, success)
+            self.action_metrics[name].record(latency_ms, success)
+            self.service_metrics.record((finished - started) * 1000, success)
+            if success:
+                with self._lock:
+                    self._succeeded += 1
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+
+    def _run_open_loop(self) -> dict:
+        rng = random.Random(self.seed)
+        names = [self._action_name(action) for action in self.actions]
+        for name in names:
+            self.action_metrics.setdefault(name, MetricsCollector())
+        cumulative = None
+        if self.weights is not None:
+            total, cumulative = 0.0, []
+            for weight in self.weights:
+                total += weight
+                cumulative.append(total)
+
+        scheduled = 0
+        max_lag = 0.0
+        self._abandon.clear()
+        executor = ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="open-loop")
+        self.metrics.start()
+        self.service_metrics.start()
+        start = time.perf_counter()
+        try:
+            for offset in self.schedule.offsets(self.duration):
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+                scheduled += 1
+                if cumulative is None:
+                    index = rng.randrange(len(self.actions))
+                else:
+                    index = rng.choices(range(len(self.actions)), cum_weights=cumulative)[0]
+                with self._lock:
+                    if self._outstanding - self.users >= self.max_backlog:
+                        self._dropped += 1
+                        continue
+                    self._outstanding += 1
+                executor.submit(self._open_loop_call, self.actions[index], names[index], intended)
+
+            deadline = time.perf_counter() + self.drain_timeout
+            while time.perf_counter() < deadline:
+                with self._lock:
+                    if self._outstanding == 0:
+                        break
+                time.sleep(0.005)
+            self._abandon.set()
+        finally:
+            executor.shutdown(wait=True)
+        self.metrics.end()
+        self.service_metrics.end()
+
+        elapsed = self.metrics.end_time - self.metrics.start_time
+        summary = self.metrics.summary()
+        summary["service_time"] = self.service_metrics.summary()["response_time"]
+        summary["by_action"] = {
+            name: collector.summary()["response_time"]
+            for name, collector in self.action_metrics.items()
+        }
+        summary["load"] = {
+            "mode": "open_loop",
+            "scheduled": scheduled,
+            "completed": scheduled - self._dropped,
+            "succeeded": self._succeeded,
+            "dropped": self._dropped,
+            "offered_rps": scheduled / self.duration if self.duration > 0 else 0.0,
+            "elapsed_seconds": elapsed,
+            "max_dispatch_lag_ms": max_lag * 1000,
+        }
+        summary["resources"] = self.monitor.sample()
+        return summary
+
+
+def find_saturation_point(
+    actions: Iterable[Callable[[], None]],
+    rates: Sequence[float],
+    step_seconds: float = 10.0,
+    users: int = 16,
+    p99_slo_ms: float = 500.0,
+    weights: Optional[Sequence[float]] = None,
+    min_throughput_ratio: float = 0.95,
+    seed: Optional[int] = None,
+) -> dict:
+    """Run one open-loop step per rate (ascending) until the system saturates.
+
+    A step is saturated when requests are dropped, successful throughput
+    falls below ``min_throughput_ratio`` of the offered rate, or the p99
+    latency (from intended start) exceeds ``p99_slo_ms``. Failed requests
+    do not count as achieved throughput.
+
+    Returns:
+        ``{"steps": [...], "max_sustainable_rps": float | None,
+        "saturation_rps": float | None}``
+    """
+
+    actions = list(actions)
+    steps = []
+    sustainable: Optional[float] = None
+    saturation: Optional[float] = None
+    for rate in sorted(rates):
+        tester = LoadTester(
+            users, step_seconds, actions, schedule=ConstantRate(rate),
+            weights=weights, seed=seed,
+        )
+        summary = tester.run()
+        load = summary["load"]
+        elapsed = load["elapsed_seconds"]
+        achieved = load["succeeded"] / elapsed if elapsed > 0 else 0.0
+        p99 = summary["response_time"].get("p99", 0.0)
+        saturated = (
+            load["dropped"] > 0
+            or achieved < rate * min_throughput_ratio
+            or p99 > p99_slo_ms
+        )
+        steps.append({
+            "offered_rps": rate,
+            "achieved_rps": achieved,
+            "p50_ms": summary["response_time"].get("p50", 0.0),
+            "p99_ms": p99,
+            "error_rate": summary["errors"]["error_rate"],
+            "dropped": load["dropped"],
+            "saturated": saturated,
+        })
+        if saturated:
+            saturation = rate
+            break
+        sustainable = rate
+    return {
+        "steps": steps,
+        "max_sustainable_rps": sustainable,
+        "saturation_rps": saturation,
+    }
@@ -6,45 +6,27 @@ This module provides a minimal `MetricsCollector` class that records
 response times and error counts while a load test is running. It can
 calculate common statistics such as percentiles and throughput which are
 useful for basic performance analysis.
+
+Response times go into a fixed-memory log-bucketed histogram (one per
+recording thread, merged on ``summary``), so long runs do not grow a list
+of samples and summarizing does not sort them.
 """
 
 from dataclasses import dataclass, field
-import math
-import statistics
 import time
 from typing import Dict, List, Optional
+
+from tdah_tools.histogram import ConcurrentHistogram
 # Auth imports
 from streamlit_extension.auth.middleware import require_auth, require_admin
 from streamlit_extension.auth.user_model import UserRole
 
 
-def _percentile(values: List[float], percent: float) -> float:
-    """Return the requested percentile from a list of values.
-
-    This implementation avoids an optional numpy dependency while still
-    providing deterministic results for small datasets used in tests.
-    """
-
-    if not values:
-        return 0.0
-    if not 0 <= percent <= 100:
-        raise ValueError("percent must be in the range 0..100")
-    sorted_vals = sorted(values)
-    k = (len(sorted_vals) - 1) * (percent / 100)
-    f = math.floor(k)
-    c = math.ceil(k)
-    if f == c:
-        return sorted_vals[int(k)]
-    d0 = sorted_vals[f] * (c - k)
-    d1 = sorted_vals[c] * (k - f)
-    return d0 + d1
-
-
 @dataclass
 class MetricsCollector:
     """Collect response time and error metrics during load tests."""
 
-    response_times: List[float] = field(default_factory=list)
+    latency: ConcurrentHistogram = field(default_factory=ConcurrentHistogram)
     errors: int = 0
     start_time: float | None = None
     end_time: float | None = None
@@ -65,7 +47,7 @@ class MetricsCollector:
         if elapsed_ms < 0:
             # Protege contra valores negativos por clock skew/erros
             elapsed_ms = 0.0
-        self.response_times.append(float(elapsed_ms))
+        self.latency.record(elapsed_ms)
         if not success:
             self.errors += 1
 
@@ -79,23 +61,23 @@ class MetricsCollector:
     def summary(self) -> Dict[str, Dict[str, float]]:
         """Return a summary of all collected metrics."""
 
+        histogram = self.latency.snapshot()
         rt_stats: Dict[str, float] = {}
-        if self.response_times:
-            rts = self.response_times
+        if histogram.count:
+            percentiles = histogram.percentiles((50, 90, 95, 99, 99.9))
             rt_stats = {
-                "min": min(rts),
-                "max": max(rts),
-                "mean": statistics.mean(rts),
-                "median": statistics.median(rts),
-                "p95": _percentile(rts, 95),
-                "p99": _percentile(rts, 99),
+                "min": histogram.min,
+                "max": histogram.max,
+                "mean": histogram.mean,
+                "median": percentiles["p50"],
+                **percentiles,
             }
         duration = 0.0
         if self.start_time is not None and self.end_time is not None:
             duration = self.end_time - self.start_time
-        throughput = len(self.response_times) / duration if duration > 0 else 0.0
+        throughput = histogram.count / duration if duration > 0 else 0.0
         error_rate = (
-            self.errors / len(self.response_times) if self.response_times else 0.0
+            self.errors / histogram.count if histogram.count else 0.0
         )
         return {
             "response_time": rt_stats,
@@ -37,6 +37,8 @@ from pathlib import Path
 import datetime
 import gc
 
+from tdah_tools.histogram import ConcurrentHistogram, LatencyHistogram
+
 # Modular database imports - complete migration from DatabaseManager
 from streamlit_extension.database import (
     get_connection, transaction, list_epics, list_tasks, list_projects,
@@ -78,6 +80,9 @@ class PerformanceProfiler:
     
     def __init__(self):
         self.metrics: List[PerformanceMetrics] = []
+        # Response times per operation (fixed memory, per-thread, mergeable)
+        self.latency: Dict[str, ConcurrentHistogram] = {}
+        self._latency_lock = threading.Lock()
         self.baseline_metrics: Dict[str, float] = {}
         self.start_time: Optional[float] = None
         self.memory_tracker_active = False
@@ -120,6 +125,23 @@ class PerformanceProfiler:
             )
             
             self.metrics.append(metric)
+            self._operation_histogram(operation_name).record(metric.response_time)
+    
+    def _operation_histogram(self, operation_name: str) -> ConcurrentHistogram:
+        histogram = self.latency.get(operation_name)
+        if histogram is None:
+            with self._latency_lock:
+                histogram = self.latency.setdefault(operation_name, ConcurrentHistogram())
+        return histogram
+    
+    def latency_snapshot(self, operation_name: Optional[str] = None) -> LatencyHistogram:
+        """Merged response time histogram for one operation (or all of them)."""
+        names = [operation_name] if operation_name else list(self.latency)
+        merged = LatencyHistogram()
+        for name in names:
+            if name in self.latency:
+                merged.merge(self.latency[name].snapshot())
+        return merged
     
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
@@ -140,29 +162,21 @@ class PerformanceProfiler:
         if not filtered_metrics:
             return {"error": "No metrics found"}
 
-        response_times = [m.response_time for m in filtered_metrics]
+        latency = self.latency_snapshot(operation_name)
         mem_deltas = [abs(m.memory_usage) for m in filtered_metrics]
         successes = sum(1 for m in filtered_metrics if m.success)
         total_ops = len(filtered_metrics)
         success_rate = (successes / total_ops) * 100 if total_ops else 0.0
         throughput = total_ops / max(1e-6, (filtered_metrics[-1].timestamp - filtered_metrics[0].timestamp).total_seconds())
 
-        def pct(arr, p):
-            if not arr:
-                return 0.0
-            s = sorted(arr)
-            k = int(max(0, min(len(s)-1, round((p/100) * (len(s)-1)))))
-            return float(s[k])
-
         stats = {
             "total_operations": total_ops,
             "success_rate": success_rate,
             "throughput": throughput,
             "response_time": {
-                "avg": float(sum(response_times)/len(response_times)),
-                "p50": pct(response_times, 50),
-                "p95": pct(response_times, 95),
-                "max": max(response_times),
+                "avg": latency.mean,
+                **latency.percentiles((50, 90, 95, 99, 99.9)),
+                "max": latency.max,
             },
             "memory": {
                 "avg_delta_mb": float(sum(mem_deltas)/len(mem_deltas)),
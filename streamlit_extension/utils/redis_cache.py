@@ -11,8 +11,10 @@ Features:
 - Thread-safe Redis operations
 - Graceful fallback when Redis unavailable
 - Configurable TTL per operation type
-- Cache invalidation strategies
+- Cache invalidation strategies (tag sets, SCAN-based patterns)
+- Batched reads/writes (MGET, pipelines) with a compact msgpack codec
 - Performance metrics tracking
+- Optional per-process near cache (L1) kept coherent via Redis pub/sub
 - Security-aware key generation
 - Integration with existing DatabaseManager
 """
@@ -20,9 +22,13 @@ Features:
 import sys
 import json
 import time
+import msgpack
 import hashlib
 import logging
 import threading
+import uuid
+from collections import OrderedDict
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable, Union, Tuple
 from datetime import datetime, timedelta
@@ -65,6 +71,23 @@ except ImportError:
     sanitize_display = lambda x, **kwargs: str(x)
 
 
+# Payloads written by this module start with a byte that is never valid
+# msgpack or JSON, so entries written in the old JSON format still decode.
+_MSGPACK_MARKER = b"\xc1"
+_TAG_KEY_PREFIX = "tdd_cache_tag:"
+_DELETE_BATCH = 500
+
+# Errors that mean the server is unreachable (as opposed to a bad value)
+_CONNECTION_ERRORS = (
+    (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) if REDIS_AVAILABLE else ()
+)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    # Same fallback as the former ``json.dumps(..., default=str)``
+    return str(obj)
+
+
 class CacheStrategy:
     """Cache strategy definitions for different operation types."""
     
@@ -104,6 +127,8 @@ class CacheMetrics:
             "errors": 0,
             "total_requests": 0,
             "avg_response_time": 0.0,
+            "l1_hits": 0,
+            "l1_misses": 0,
             "last_reset": time.time()
         }
         self._lock = threading.Lock()
@@ -122,6 +147,16 @@ class CacheMetrics:
             self.stats["total_requests"] += 1
             self._update_avg_response_time(response_time)
     
+    def record_l1_hit(self):
+        """Record near-cache (L1) hit; no Redis round trip was made."""
+        with self._lock:
+            self.stats["l1_hits"] += 1
+    
+    def record_l1_miss(self):
+        """Record near-cache (L1) miss; the lookup falls through to Redis."""
+        with self._lock:
+            self.stats["l1_misses"] += 1
+    
     def record_error(self):
         """Record cache error."""
         with self._lock:
@@ -150,6 +185,8 @@ class CacheMetrics:
         with self._lock:
             stats = self.stats.copy()
             stats["hit_rate_percent"] = self.get_hit_rate()
+            l1_requests = stats["l1_hits"] + stats["l1_misses"]
+            stats["l1_hit_rate_percent"] = (stats["l1_hits"] / l1_requests) * 100 if l1_requests else 0.0
             return stats
     
     def reset_stats(self):
@@ -161,10 +198,69 @@ class CacheMetrics:
                 "errors": 0,
                 "total_requests": 0,
                 "avg_response_time": 0.0,
+                "l1_hits": 0,
+                "l1_misses": 0,
                 "last_reset": time.time()
             }
 
 
+class NearCache:
+    """Bounded, short-TTL, per-process LRU in front of Redis.
+    
+    Coherence comes from the owning manager's invalidation channel; every
+    invalidation bumps ``generation`` so a Redis read that raced with one is
+    not stored (see ``put``).
+    """
+    
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+    
+    def put(self, key: str, value: Any, ttl: Optional[float] = None,
+            generation: Optional[int] = None) -> None:
+        """Store ``value``; skipped if an invalidation arrived since ``generation``."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, keys=(), pattern: Optional[str] = None) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+            if pattern is not None:
+                for key in [k for k in self._entries if fnmatchcase(k, pattern)]:
+                    del self._entries[key]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class RedisCache:
     """Thin wrapper with key hashing, TTL and graceful fallback."""
 
@@ -249,7 +345,11 @@ class RedisCacheManager:
                  socket_timeout: float = 5.0,
                  socket_connect_timeout: float = 5.0,
                  retry_on_timeout: bool = True,
-                 health_check_interval: int = 30):
+                 health_check_interval: int = 30,
+                 client: Optional[Any] = None,
+                 near_cache_size: int = 0,
+                 near_cache_ttl: float = 5.0,
+                 invalidation_channel: str = "tdd_cache:invalidate"):
         """
         Initialize Redis cache manager.
         
@@ -262,7 +362,14 @@ class RedisCacheManager:
             socket_timeout: Socket timeout in seconds
             socket_connect_timeout: Socket connect timeout in seconds
             retry_on_timeout: Whether to retry on timeout
-            health_check_interval: Health check interval in seconds
+            health_check_interval: Seconds between reconnection probes while
+                Redis is marked unavailable
+            client: Pre-built Redis client (e.g. ``fakeredis.FakeRedis``);
+                skips pool creation
+            near_cache_size: Entries kept in the per-process L1 (0 disables it)
+            near_cache_ttl: Upper bound in seconds on how long L1 serves a value
+            invalidation_channel: Pub/sub channel used to keep L1 caches of
+                all processes coherent
         """
         self.host = host
         self.port = port
@@ -288,7 +395,101 @@ class RedisCacheManager:
         self._last_health_check = 0
         
         # Initialize connection
-        self._initialize_connection()
+        if client is not None:
+            self.client = client
+            self.is_available = True
+        else:
+            self._initialize_connection()
+        
+        # Near cache (L1): only served while subscribed to invalidations
+        self.invalidation_channel = invalidation_channel
+        self._origin = uuid.uuid4().hex
+        self.near_cache = NearCache(near_cache_size, near_cache_ttl) if near_cache_size > 0 else None
+        self._near_coherent = threading.Event()
+        self._stop_listener = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+        if self.near_cache is not None and self.client is not None:
+            self._listener = threading.Thread(
+                target=self._listen_for_invalidations, name="redis-cache-invalidations", daemon=True
+            )
+            self._listener.start()
+    
+    # ---------- Near cache coherence ----------
+    def _listen_for_invalidations(self) -> None:
+        """Apply invalidations published by any process to the local L1."""
+        while not self._stop_listener.is_set():
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.invalidation_channel)
+                # Anything cached before (re)subscribing may have missed messages
+                self.near_cache.clear()
+                self._near_coherent.set()
+                while not self._stop_listener.is_set():
+                    message = pubsub.get_message(timeout=0.25)
+                    if message and message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except Exception as e:
+                if not self._stop_listener.is_set():
+                    self.logger.warning(f"Near cache invalidation listener lost: {e}")
+            finally:
+                self._near_coherent.clear()
+                self.near_cache.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop_listener.wait(self.health_check_interval)
+    
+    def _apply_invalidation(self, data: Union[bytes, str]) -> None:
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("origin") == self._origin:
+            return  # already applied locally
+        if message.get("all"):
+            self.near_cache.clear()
+        else:
+            self.near_cache.invalidate(message.get("keys", ()), message.get("pattern"))
+    
+    def _near_enabled(self) -> bool:
+        return self.near_cache is not None and self._near_coherent.is_set()
+    
+    def _invalidate_near(self, keys=(), pattern: Optional[str] = None,
+                         all_keys: bool = False) -> None:
+        """Drop entries from the local L1 (bumping its generation)."""
+        if self.near_cache is None:
+            return
+        if all_keys:
+            self.near_cache.clear()
+        else:
+            self.near_cache.invalidate(keys, pattern)
+    
+    def _publish_invalidation(self, pipe=None, keys=(), pattern: Optional[str] = None,
+                              all_keys: bool = False) -> None:
+        """
+        Drop entries from the local L1 and tell other processes to do the same.
+        
+        With ``pipe`` the write and the publish run later, in ``pipe.execute()``;
+        a local read between now and then can still refill the L1 with the old
+        value, so callers run ``_invalidate_near`` again once it returns.
+        """
+        if self.near_cache is None:
+            return
+        self._invalidate_near(keys, pattern, all_keys)
+        payload = json.dumps({
+            "origin": self._origin, "keys": list(keys), "pattern": pattern, "all": all_keys
+        })
+        (pipe or self.client).publish(self.invalidation_channel, payload)
+    
+    def close(self) -> None:
+        """Stop the invalidation listener (the L1 stops serving)."""
+        self._stop_listener.set()
+        self._near_coherent.clear()
+        if self._listener is not None:
+            self._listener.join(timeout=2)
     
     def _setup_logging(self):
         """Setup secure logging."""
@@ -341,30 +542,44 @@ class RedisCacheManager:
             self.pool = None
     
     def _check_health(self) -> bool:
-        """Check Redis health with throttling."""
-        current_time = time.time()
-        
-        # Throttle health checks
-        if current_time - self._last_health_check < self.health_check_interval:
-            return self.is_available
+        """Return the cached health state.
         
-        self._last_health_check = current_time
+        While Redis is available this is a plain attribute read; operations
+        that hit a connection error flip the state (see ``_record_error``).
+        While unavailable, a ping is attempted at most once per
+        ``health_check_interval`` to detect recovery.
+        """
+        if self.is_available:
+            return True
         
         if not self.client:
             return False
         
-        try:
-            self.client.ping()
-            if not self.is_available:
+        current_time = time.time()
+        if current_time - self._last_health_check < self.health_check_interval:
+            return False
+        
+        with self._lock:
+            if self.is_available or current_time - self._last_health_check < self.health_check_interval:
+                return self.is_available
+            self._last_health_check = current_time
+            
+            try:
+                self.client.ping()
                 self.logger.info("Redis connection restored")
                 self.is_available = True
-            return True
-            
-        except Exception as e:
-            if self.is_available:
-                self.logger.warning(f"Redis health check failed: {e}")
-                self.is_available = False
-            return False
+            except Exception as e:
+                self.logger.debug(f"Redis still unavailable: {e}")
+        
+        return self.is_available
+    
+    def _record_error(self, error: Exception) -> None:
+        """Count an operation error; connection errors mark Redis unavailable."""
+        self.metrics.record_error()
+        if isinstance(error, _CONNECTION_ERRORS) and self.is_available:
+            self.logger.warning(f"Redis connection lost: {error}")
+            self._last_health_check = time.time()
+            self.is_available = False
     
     def _generate_cache_key(self, prefix: str, *args, **kwargs) -> str:
         """
@@ -411,22 +626,39 @@ class RedisCacheManager:
         # Return prefixed hash (limited length for Redis efficiency)
         return f"tdd_cache:{prefix}:{key_hash[:16]}"
     
-    def _serialize_data(self, data: Any) -> str:
-        """Serialize data for Redis storage."""
+    def _serialize_data(self, data: Any) -> bytes:
+        """Serialize data for Redis storage (msgpack, marker-prefixed)."""
         try:
-            return json.dumps(data, default=str, ensure_ascii=False)
+            return _MSGPACK_MARKER + msgpack.packb(data, use_bin_type=True, default=_msgpack_default)
         except Exception as e:
             self.logger.error(f"Serialization error: {e}")
             raise ValueError(f"Cannot serialize data: {e}")
     
-    def _deserialize_data(self, data: str) -> Any:
-        """Deserialize data from Redis."""
+    def _deserialize_data(self, data: Union[bytes, str]) -> Any:
+        """Deserialize data from Redis (msgpack, or legacy JSON)."""
         try:
+            if isinstance(data, (bytes, bytearray)) and data[:1] == _MSGPACK_MARKER:
+                return msgpack.unpackb(data[1:], raw=False)
+            if isinstance(data, (bytes, bytearray)):
+                data = data.decode('utf-8')
             return json.loads(data)
         except Exception as e:
             self.logger.error(f"Deserialization error: {e}")
             raise ValueError(f"Cannot deserialize data: {e}")
     
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"{_TAG_KEY_PREFIX}{tag}"
+    
+    def _queue_set(self, pipe, key: str, payload: bytes, ttl: int, tags: Optional[List[str]]) -> None:
+        pipe.setex(key, ttl, payload)
+        for tag in tags or ():
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, key)
+            # Tag sets live as long as their longest-lived member
+            pipe.expire(tag_key, ttl, nx=True)
+            pipe.expire(tag_key, ttl, gt=True)
+    
     @contextmanager
     def _measure_time(self):
         """Context manager to measure operation time."""
@@ -450,6 +682,15 @@ class RedisCacheManager:
         if not self._check_health():
             return None
         
+        generation = None
+        if self._near_enabled():
+            hit, payload = self.near_cache.get(key)
+            if hit:
+                self.metrics.record_l1_hit()
+                return self._deserialize_data(payload)
+            self.metrics.record_l1_miss()
+            generation = self.near_cache.generation
+        
         try:
             with self._measure_time():
                 data = self.client.get(key)
@@ -458,18 +699,74 @@ class RedisCacheManager:
                 self.metrics.record_miss(self.response_time)
                 return None
             
-            result = self._deserialize_data(data.decode('utf-8'))
+            result = self._deserialize_data(data)
             self.metrics.record_hit(self.response_time)
+            if generation is not None:
+                self.near_cache.put(key, data, generation=generation)
             
             self.logger.debug(f"Cache hit for key: {key[:20]}...")
             return result
             
         except Exception as e:
-            self.metrics.record_error()
+            self._record_error(e)
             self.logger.error(f"Cache get error for key {key[:20]}...: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: int = 900) -> bool:
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values in one round trip (MGET).
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of the keys that were found to their values
+        """
+        if not keys or not self._check_health():
+            return {}
+        
+        results = {}
+        generation = None
+        if self._near_enabled():
+            generation = self.near_cache.generation
+            remote_keys = []
+            for key in keys:
+                hit, payload = self.near_cache.get(key)
+                if hit:
+                    self.metrics.record_l1_hit()
+                    results[key] = self._deserialize_data(payload)
+                else:
+                    self.metrics.record_l1_miss()
+                    remote_keys.append(key)
+            if not remote_keys:
+                return results
+        else:
+            remote_keys = list(keys)
+        
+        try:
+            with self._measure_time():
+                values = self.client.mget(remote_keys)
+        except Exception as e:
+            self._record_error(e)
+            self.logger.error(f"Cache get_many error for {len(remote_keys)} keys: {e}")
+            return results
+        
+        per_key_time = self.response_time / len(remote_keys)
+        for key, data in zip(remote_keys, values):
+            if data is None:
+                self.metrics.record_miss(per_key_time)
+                continue
+            try:
+                results[key] = self._deserialize_data(data)
+                self.metrics.record_hit(per_key_time)
+            except ValueError:
+                self.metrics.record_error()
+                continue
+            if generation is not None:
+                self.near_cache.put(key, data, generation=generation)
+        return results
+    
+    def set(self, key: str, value: Any, ttl: int = 900, tags: Optional[List[str]] = None) -> bool:
         """
         Set value in cache.
         
@@ -477,6 +774,7 @@ class RedisCacheManager:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
+            tags: Tags to register the key under (see ``invalidate_tags``)
             
         Returns:
             True if successful, False otherwise
@@ -488,16 +786,64 @@ class RedisCacheManager:
             serialized_data = self._serialize_data(value)
             
             with self._measure_time():
-                result = self.client.setex(key, ttl, serialized_data)
+                if tags or self.near_cache is not None:
+                    pipe = self.client.pipeline(transaction=False)
+                    self._queue_set(pipe, key, serialized_data, ttl, tags)
+                    self._publish_invalidation(pipe, keys=[key])
+                    result = pipe.execute()[0]
+                    self._invalidate_near(keys=[key])
+                else:
+                    result = self.client.setex(key, ttl, serialized_data)
+            
+            if result and self._near_enabled():
+                self.near_cache.put(key, serialized_data, ttl)
             
             self.logger.debug(f"Cache set for key: {key[:20]}... (TTL: {ttl}s)")
             return bool(result)
             
         except Exception as e:
-            self.metrics.record_error()
+            self._record_error(e)
             self.logger.error(f"Cache set error for key {key[:20]}...: {e}")
             return False
     
+    def set_many(self, items: Dict[str, Any], ttl: int = 900, tags: Optional[List[str]] = None) -> bool:
+        """
+        Set several values in one pipelined round trip.
+        
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (applied to every key)
+            tags: Tags to register every key under
+            
+        Returns:
+            True if all keys were written, False otherwise
+        """
+        if not items or not self._check_health():
+            return False
+        
+        try:
+            payloads = {key: self._serialize_data(value) for key, value in items.items()}
+            
+            with self._measure_time():
+                pipe = self.client.pipeline(transaction=False)
+                for key, payload in payloads.items():
+                    self._queue_set(pipe, key, payload, ttl, tags)
+                self._publish_invalidation(pipe, keys=list(payloads))
+                pipe.execute()
+                self._invalidate_near(keys=list(payloads))
+            
+            if self._near_enabled():
+                for key, payload in payloads.items():
+                    self.near_cache.put(key, payload, ttl)
+            
+            self.logger.debug(f"Cache set_many for {len(items)} keys (TTL: {ttl}s)")
+            return True
+            
+        except Exception as e:
+            self._record_error(e)
+            self.logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -513,20 +859,44 @@ class RedisCacheManager:
         
         try:
             with self._measure_time():
-                result = self.client.delete(key)
+                if self.near_cache is not None:
+                    pipe = self.client.pipeline(transaction=False)
+                    pipe.delete(key)
+                    self._publish_invalidation(pipe, keys=[key])
+                    result = pipe.execute()[0]
+                    self._invalidate_near(keys=[key])
+                else:
+                    result = self.client.delete(key)
             
             self.logger.debug(f"Cache delete for key: {key[:20]}...")
             return bool(result)
             
         except Exception as e:
-            self.metrics.record_error()
+            self._record_error(e)
             self.logger.error(f"Cache delete error for key {key[:20]}...: {e}")
             return False
     
+    def _unlink_batched(self, keys) -> int:
+        """UNLINK keys in fixed-size batches; returns the number removed."""
+        deleted = 0
+        batch = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= _DELETE_BATCH:
+                deleted += self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += self.client.unlink(*batch)
+        return deleted
+    
     def delete_pattern(self, pattern: str) -> int:
         """
         Delete keys matching pattern.
         
+        Walks the keyspace with incremental SCAN rather than KEYS, so Redis
+        is never blocked for the whole keyspace. Prefer ``invalidate_tags``
+        where keys were written with tags.
+        
         Args:
             pattern: Key pattern (e.g., 'project:*')
             
@@ -537,21 +907,56 @@ class RedisCacheManager:
             return 0
         
         try:
-            keys = self.client.keys(pattern)
-            if not keys:
-                return 0
-            
             with self._measure_time():
-                result = self.client.delete(*keys)
+                result = self._unlink_batched(self.client.scan_iter(match=pattern, count=_DELETE_BATCH))
+                self._publish_invalidation(pattern=pattern)
             
             self.logger.info(f"Deleted {result} keys matching pattern: {pattern}")
             return result
             
         except Exception as e:
-            self.metrics.record_error()
+            self._record_error(e)
             self.logger.error(f"Cache pattern delete error for {pattern}: {e}")
             return 0
     
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Delete every key registered under any of ``tags``.
+        
+        Each tag set is read and removed atomically (MULTI/EXEC), so keys
+        tagged concurrently land in a fresh set instead of being lost.
+        
+        Args:
+            *tags: Tags passed to ``set``/``set_many``
+            
+        Returns:
+            Number of keys deleted
+        """
+        if not tags or not self._check_health():
+            return 0
+        
+        try:
+            with self._measure_time():
+                pipe = self.client.pipeline(transaction=True)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.smembers(tag_key)
+                    pipe.delete(tag_key)
+                replies = pipe.execute()
+                members = set().union(*replies[::2])
+                result = self._unlink_batched(members)
+                self._publish_invalidation(keys=[
+                    member.decode() if isinstance(member, bytes) else member for member in members
+                ])
+            
+            self.logger.info(f"Deleted {result} keys tagged: {', '.join(tags)}")
+            return result
+            
+        except Exception as e:
+            self._record_error(e)
+            self.logger.error(f"Cache tag invalidation error for {tags}: {e}")
+            return 0
+    
     def flush_all(self) -> bool:
         """
         Flush all cache data.
@@ -565,12 +970,13 @@ class RedisCacheManager:
         try:
             with self._measure_time():
                 result = self.client.flushdb()
+                self._publish_invalidation(all_keys=True)
             
             self.logger.warning("Cache flushed - all data cleared")
             return bool(result)
             
         except Exception as e:
-            self.metrics.record_error()
+            self._record_error(e)
             self.logger.error(f"Cache flush error: {e}")
             return False
     
@@ -582,7 +988,12 @@ class RedisCacheManager:
             "port": self.port,
             "db": self.db,
             "max_connections": self.max_connections,
-            "metrics": self.metrics.get_stats()
+            "metrics": self.metrics.get_stats(),
+            "near_cache": {
+                "enabled": self.near_cache is not None,
+                "coherent": self._near_enabled(),
+                "entries": len(self.near_cache) if self.near_cache is not None else 0,
+            }
         }
         
         if self.is_available and self.client:
@@ -659,7 +1070,7 @@ def cached(prefix: str, ttl: int = 900, operation_type: str = "medium"):
             
             # Cache result
             actual_ttl = ttl if ttl != 900 else CacheStrategy.get_ttl(operation_type)
-            cache.set(cache_key, result, actual_ttl)
+            cache.set(cache_key, result, actual_ttl, tags=[prefix])
             
             return result
         
@@ -683,9 +1094,11 @@ def invalidate_cache(prefix: str, *args, **kwargs):
         cache_key = cache._generate_cache_key(prefix, *args, **kwargs)
         cache.delete(cache_key)
     else:
-        # Invalidate all keys with prefix
-        pattern = f"tdd_cache:{prefix}:*"
-        cache.delete_pattern(pattern)
+        # Invalidate all keys cached under the prefix (``cached`` tags them).
+        # Entries written before tagging are in no tag set and may sit next
+        # to tagged ones, so the SCAN sweep always runs after the tags
+        cache.invalidate_tags(prefix)
+        cache.delete_pattern(f"tdd_cache:{prefix}:*")
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -4,6 +4,9 @@ TDAH Tools - TDD Task Management and Analytics
 Convenience package exports for error handling, performance utils and analytics.
 """
 
+from importlib import import_module
+from typing import Any, Dict, List
+
 __all__ = [
     "__version__",
     # error handler
@@ -30,14 +33,52 @@ __all__ = [
     "get_performance_monitor",
     "cached",
     "performance_critical",
+    # histogram
+    "LatencyHistogram",
+    "ConcurrentHistogram",
 ]
 
 __version__ = "0.1.0"
 
-from .error_handler import (  # noqa: E402
-    get_error_handler, handle_error, log_info, log_warning, log_error,
-    with_error_handling, TDDErrorHandler, ErrorSeverity, ErrorCategory,
-    TDDBaseException, ValidationError, ConfigurationError, DependencyError,
-    FileSystemError, ProcessError, UserInputError, AnalyticsError, GitError, GitHubError,
-)
-from .performance_utils import get_performance_monitor, cached, performance_critical  # noqa: E402
\ No newline at end of file
+# name -> submodule. Resolved on first access so that importing a light
+# submodule (e.g. ``tdah_tools.histogram``) does not load performance_utils,
+# whose module-level caches create ``performance_cache.db`` in the CWD.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "get_error_handler": ".error_handler",
+    "handle_error": ".error_handler",
+    "log_info": ".error_handler",
+    "log_warning": ".error_handler",
+    "log_error": ".error_handler",
+    "with_error_handling": ".error_handler",
+    "TDDErrorHandler": ".error_handler",
+    "ErrorSeverity": ".error_handler",
+    "ErrorCategory": ".error_handler",
+    "TDDBaseException": ".error_handler",
+    "ValidationError": ".error_handler",
+    "ConfigurationError": ".error_handler",
+    "DependencyError": ".error_handler",
+    "FileSystemError": ".error_handler",
+    "ProcessError": ".error_handler",
+    "UserInputError": ".error_handler",
+    "AnalyticsError": ".error_handler",
+    "GitError": ".error_handler",
+    "GitHubError": ".error_handler",
+    "get_performance_monitor": ".performance_utils",
+    "cached": ".performance_utils",
+    "performance_critical": ".performance_utils",
+    "LatencyHistogram": ".histogram",
+    "ConcurrentHistogram": ".histogram",
+}
+
+
+def __getattr__(name: str) -> Any:  # PEP 562
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, package=__name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + list(__all__))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+📊 Latency Histogram - Fixed-memory log-bucketed recording
+
+HDR-style histogram for response times: values are counted in log-linear
+buckets (each power of two split into ``2 ** precision_bits`` linear
+sub-buckets), so memory is fixed by the tracked range and precision, not by
+the number of samples.
+
+- ``record`` is O(1) (``math.frexp`` + one list increment)
+- percentile queries walk the bucket counts once, O(buckets)
+- relative error of reported percentiles is below ``2 ** -precision_bits``
+  (0.8% with the default 7 bits); count, sum, min and max are exact
+- histograms with the same configuration are mergeable, which is how
+  ``ConcurrentHistogram`` keeps one lock-free instance per live thread
+
+Usage:
+    from tdah_tools.histogram import LatencyHistogram
+
+    hist = LatencyHistogram()
+    hist.record(12.5)
+    hist.percentiles()  # {"p50": ..., "p90": ..., "p99": ..., "p99.9": ...}
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (50, 90, 99, 99.9)
+
+
+def percentile_label(percent: float) -> str:
+    """``50 -> 'p50'``, ``99.9 -> 'p99.9'``."""
+    return f"p{percent:g}"
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram of non-negative values (e.g. milliseconds).
+
+    Args:
+        lowest: Smallest distinguishable value; smaller values share bucket 0
+        highest: Largest tracked value; larger values are counted in the last
+            bucket (``max`` stays exact)
+        precision_bits: Linear sub-buckets per power of two (``2 ** bits``)
+    """
+
+    __slots__ = (
+        "lowest", "highest", "precision_bits", "_sub_buckets", "_counts",
+        "count", "total", "min", "max",
+    )
+
+    def __init__(self, lowest: float = 0.001, highest: float = 3_600_000.0, precision_bits: int = 7):
+        if lowest <= 0 or highest <= lowest:
+            raise ValueError("expected 0 < lowest < highest")
+        if not 1 <= precision_bits <= 16:
+            raise ValueError("precision_bits must be in the range 1..16")
+        self.lowest = float(lowest)
+        self.highest = float(highest)
+        self.precision_bits = precision_bits
+        self._sub_buckets = 1 << precision_bits
+        buckets = self._index(self.highest) + 1
+        self._counts: List[int] = [0] * buckets
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ---------- Bucketing ----------
+
+    def _index(self, value: float) -> int:
+        scaled = value / self.lowest
+        if scaled < 1.0:
+            return 0
+        mantissa, exponent = math.frexp(scaled)  # scaled = mantissa * 2**exponent, 0.5 <= m < 1
+        sub = int((mantissa * 2.0 - 1.0) * self._sub_buckets)
+        return 1 + (exponent - 1) * self._sub_buckets + sub
+
+    def _bucket_bounds(self, index: int) -> Tuple[float, float]:
+        if index == 0:
+            return 0.0, self.lowest
+        exponent, sub = divmod(index - 1, self._sub_buckets)
+        base = self.lowest * (1 << exponent)
+        width = base / self._sub_buckets
+        return base + sub * width, base + (sub + 1) * width
+
+    # ---------- Recording ----------
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Count ``value`` (negative values are clamped to 0)."""
+        value = float(value)
+        if value < 0.0 or value != value:  # negative or NaN
+            value = 0.0
+        index = self._index(value)
+        if index >= len(self._counts):
+            index = len(self._counts) - 1
+        self._counts[index] += count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add ``other``'s samples into this histogram (same configuration)."""
+        if (other.lowest, other.highest, other.precision_bits) != (
+            self.lowest, self.highest, self.precision_bits
+        ):
+            raise ValueError("cannot merge histograms with different configurations")
+        counts = self._counts
+        for index, value in enumerate(other._counts):
+            if value:
+                counts[index] += value
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram(self.lowest, self.highest, self.precision_bits)
+        return clone.merge(self)
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ---------- Queries ----------
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Value at ``percent`` (nearest rank), 0.0 when empty.
+
+        Reports the midpoint of the bucket holding the rank, clamped to the
+        exact min/max (the top rank reports the exact max).
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be in the range 0..100")
+        return self.percentiles((percent,))[percentile_label(percent)]
+
+    def percentiles(self, percents: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Several percentiles in one pass over the buckets."""
+        wanted = sorted(float(p) for p in percents)
+        results: Dict[str, float] = {}
+        if not self.count:
+            return {percentile_label(p): 0.0 for p in wanted}
+
+        ranks = [max(1, math.ceil(p / 100.0 * self.count)) for p in wanted]
+        position = 0
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while position < len(ranks) and ranks[position] <= seen:
+                if ranks[position] >= self.count:
+                    value = self.max  # the top rank is the exact maximum
+                else:
+                    low, high = self._bucket_bounds(index)
+                    value = min(max((low + high) / 2.0, self.min), self.max)
+                results[percentile_label(wanted[position])] = value
+                position += 1
+            if position == len(ranks):
+                break
+        return results
+
+    def summary(self, percents: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """count/min/max/mean plus the requested percentiles."""
+        if not self.count:
+            return {}
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            **self.percentiles(percents),
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class ConcurrentHistogram:
+    """
+    One ``LatencyHistogram`` per recording thread, merged on read.
+
+    Recording touches only the calling thread's instance (no lock on the
+    hot path); ``snapshot`` merges all of them into a new histogram.
+    Histograms of finished threads are folded into one retired aggregate
+    whenever a thread registers or a snapshot is taken, so memory is
+    bounded by the number of live threads, not by how many ever recorded.
+    """
+
+    def __init__(self, lowest: float = 0.001, highest: float = 3_600_000.0, precision_bits: int = 7):
+        self._config = (lowest, highest, precision_bits)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._histograms: List[Tuple[threading.Thread, LatencyHistogram]] = []
+        self._retired = LatencyHistogram(*self._config)
+
+    def _retire_finished(self) -> None:
+        """Fold histograms of finished threads into ``_retired`` (with ``_lock``)."""
+        live = []
+        for thread, histogram in self._histograms:
+            if thread.is_alive():
+                live.append((thread, histogram))
+            else:
+                self._retired.merge(histogram)  # no more writers
+        self._histograms = live
+
+    def _thread_histogram(self) -> LatencyHistogram:
+        histogram: Optional[LatencyHistogram] = getattr(self._local, "histogram", None)
+        if histogram is None:
+            histogram = LatencyHistogram(*self._config)
+            with self._lock:
+                self._retire_finished()
+                self._histograms.append((threading.current_thread(), histogram))
+            self._local.histogram = histogram
+        return histogram
+
+    def record(self, value: float, count: int = 1) -> None:
+        self._thread_histogram().record(value, count)
+
+    def snapshot(self) -> LatencyHistogram:
+        """Merged copy of every thread's samples."""
+        merged = LatencyHistogram(*self._config)
+        with self._lock:
+            self._retire_finished()
+            merged.merge(self._retired)
+            histograms = [histogram for _, histogram in self._histograms]
+        for histogram in histograms:
+            merged.merge(histogram)
+        return merged
+
+    def reset(self) -> None:
+        with self._lock:
+            self._retired.reset()
+            for _, histogram in self._histograms:
+                histogram.reset()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._retired.count + sum(h.count for _, h in self._histograms)
@@ -32,6 +32,7 @@ import logging
 
 # Import standardized error handling
 from .error_handler import get_error_handler, handle_error, log_info, ErrorSeverity
+from .histogram import ConcurrentHistogram
 
 
 @dataclass
@@ -405,6 +406,17 @@ class PerformanceMonitor:
         self.metrics: List[PerformanceMetrics] = []
         self.cache_requests = 0
         self.cache_hits = 0
+        # Duration histograms per operation, in milliseconds
+        self.latency: Dict[str, ConcurrentHistogram] = {}
+        self._latency_lock = threading.Lock()
+    
+    def record_duration(self, operation: str, duration_seconds: float) -> None:
+        """Record an operation duration in the operation's histogram."""
+        histogram = self.latency.get(operation)
+        if histogram is None:
+            with self._latency_lock:
+                histogram = self.latency.setdefault(operation, ConcurrentHistogram())
+        histogram.record(duration_seconds * 1000)
     
     def time_operation(self, operation_name: str):
         """Decorator to time operations and collect metrics."""
@@ -442,6 +454,7 @@ class PerformanceMonitor:
                         cache_hit_rate=self.get_cache_hit_rate()
                     )
                     self.metrics.append(metrics)
+                    self.record_duration(operation_name, duration)
                     
                     log_info(
                         f"Performance: {operation_name}",
@@ -465,6 +478,7 @@ class PerformanceMonitor:
                         items_processed=0
                     )
                     self.metrics.append(metrics)
+                    self.record_duration(metrics.operation, duration)
                     raise
             
             return wrapper
@@ -523,6 +537,10 @@ class PerformanceMonitor:
             stats['avg_duration'] = stats['total_duration'] / count
             stats['avg_memory'] = stats['total_memory'] / count
             stats['avg_items_per_second'] = stats['total_items'] / max(stats['total_duration'], 0.001)
+            histogram = self.latency.get(operation)
+            if histogram is not None:
+                for label, value_ms in histogram.snapshot().percentiles().items():
+                    stats[f'{label}_duration'] = value_ms / 1000
         
         return {
             "summary": {
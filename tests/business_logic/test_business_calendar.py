@@ -522,6 +522,85 @@ class TestErrorHandlingAndEdgeCases:
         assert stats["business_day_cache_size"] <= 1000  # Reasonable limit
 
 
+class TestPrefixIndex:
+    """Test the lazily built business-day prefix index and batch APIs."""
+    
+    def setup_method(self):
+        """Calendar with custom holidays spread over several years."""
+        self.calendar = BusinessCalendar(
+            calendar_type=BusinessCalendarType.GENERIC,
+            custom_holidays={date(2023, 12, 25), date(2024, 6, 10), date(2025, 1, 1), date(2026, 4, 3)}
+        )
+    
+    def _reference_add(self, start_date, business_days):
+        step = 1 if business_days > 0 else -1
+        current, added = start_date, 0
+        while added < abs(business_days):
+            current += timedelta(days=step)
+            if self.calendar.is_business_day(current):
+                added += 1
+        return current
+    
+    def test_count_matches_direct_counting(self):
+        """Prefix lookups match day-by-day counting, across years."""
+        start = date(2023, 11, 1)
+        for offset in range(0, 900, 37):
+            for length in (0, 1, 6, 45, 400):
+                a = start + timedelta(days=offset)
+                b = a + timedelta(days=length)
+                assert self.calendar.count_business_days_optimized(a, b) == \
+                    self.calendar._count_business_days_direct(a, b)
+    
+    def test_add_and_subtract_match_day_by_day(self):
+        """Binary search on the index matches stepping day by day."""
+        start = date(2024, 6, 7)
+        for days in (1, 2, 3, 30, 31, 250, 800, -1, -5, -260, -700):
+            assert self.calendar.add_business_days_optimized(start, days) == \
+                self._reference_add(start, days)
+    
+    def test_index_extends_backwards(self):
+        """Indexing an earlier year keeps later lookups consistent."""
+        later = self.calendar.count_business_days_optimized(date(2024, 1, 1), date(2024, 12, 31))
+        self.calendar.count_business_days_optimized(date(2019, 1, 1), date(2019, 1, 31))
+        
+        assert self.calendar.count_business_days_optimized(date(2024, 1, 1), date(2024, 12, 31)) == later
+        assert self.calendar.get_cache_stats()["business_day_cache_size"] == 6  # 2019..2024
+    
+    def test_clear_cache_resets_index(self):
+        """clear_cache drops the prefix index."""
+        self.calendar.count_business_days_optimized(date(2024, 1, 1), date(2024, 12, 31))
+        self.calendar.clear_cache()
+        
+        assert self.calendar.get_cache_stats()["prefix_index_days"] == 0
+    
+    def test_batch_apis_match_scalar(self):
+        """Batch count/add over NumPy arrays match the scalar methods."""
+        np = pytest.importorskip("numpy")
+        starts = [date(2023, 12, 20) + timedelta(days=7 * i) for i in range(60)]
+        ends = [s + timedelta(days=(i * 13) % 200 - 5) for i, s in enumerate(starts)]
+        offsets = [(i * 17) % 120 - 60 for i in range(60)]
+        
+        counts = self.calendar.count_business_days_batch(np.array(starts, dtype="datetime64[D]"), ends)
+        added = self.calendar.add_business_days_batch(starts, offsets)
+        
+        assert counts.tolist() == [
+            self.calendar.count_business_days_optimized(a, b) for a, b in zip(starts, ends)
+        ]
+        assert [d.astype(object) for d in added] == [
+            self.calendar.add_business_days_optimized(a, n) for a, n in zip(starts, offsets)
+        ]
+    
+    def test_batch_apis_handle_missing_dates(self):
+        """NaT inputs yield 0 counts and NaT dates."""
+        np = pytest.importorskip("numpy")
+        
+        counts = self.calendar.count_business_days_batch([date(2024, 6, 3), None], [date(2024, 6, 7), date(2024, 6, 7)])
+        added = self.calendar.add_business_days_batch([None], [5])
+        
+        assert counts.tolist() == [5, 0]
+        assert np.isnat(added[0])
+
+
 @pytest.mark.benchmark
 # TODO: Consider extracting this block into a separate method
 # TODO: Consider extracting this block into a separate method
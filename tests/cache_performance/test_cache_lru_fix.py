@@ -52,6 +52,10 @@ class TestCacheLRUFix:
         if hasattr(self, 'temp_dir') and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir)
     
+    def disk_keys(self):
+        """Chaves persistidas no tier de disco (SQLite), após o flush do write-behind."""
+        return self.cache._disk_store().keys()
+    
     def skip_test(self, reason):
         """Helper para pular testes quando dependências não disponíveis."""
         print(f"⚠️ SKIP: {reason}")
@@ -69,8 +73,8 @@ class TestCacheLRUFix:
         self.cache.set("key2", "value2", ttl=3600)
         self.cache.set("key3", "value3", ttl=3600)
         
-        # Verify files exist on disk
-        disk_files_before = list(self.temp_dir.glob("*.cache"))
+        # Verify entries exist on disk
+        disk_files_before = self.disk_keys()
         assert len(disk_files_before) == 3, f"Expected 3 files, got {len(disk_files_before)}"
         
         # Add one more item to trigger LRU eviction
@@ -79,11 +83,13 @@ class TestCacheLRUFix:
         # Verify that LRU item was evicted from memory
         assert "key1" not in self.cache._memory_cache, "key1 should be evicted from memory"
         
-        # CRITICAL: Verify that disk file was also removed
-        disk_files_after = list(self.temp_dir.glob("*.cache"))
-        disk_file_names = [f.stem for f in disk_files_after]
+        # CRITICAL: Verify that disk entry was also removed
+        disk_files_after = self.disk_keys()
+        disk_file_names = disk_files_after
         
-        assert "key1" not in disk_file_names, "key1.cache should be removed from disk"
+        import hashlib
+        key1_hash = hashlib.sha256("key1".encode('utf-8')).hexdigest()
+        assert key1_hash not in disk_file_names, "key1.cache should be removed from disk"
         assert len(disk_files_after) == 3, f"Expected 3 files after eviction, got {len(disk_files_after)}"
         
         print("   ✅ LRU eviction correctly removes disk files")
@@ -120,7 +126,7 @@ class TestCacheLRUFix:
         self.cache.set("key1", "value1", ttl=3600)
         self.cache.set("key2", "value2", ttl=3600)
         
-        # Manually create orphaned file
+        # Manually create orphaned file (leftover from the old per-file layout)
         orphan_file = self.temp_dir / "orphan_key.cache"
         orphan_file.write_text("orphaned data")
         
@@ -139,10 +145,9 @@ class TestCacheLRUFix:
         import hashlib
         key1_hash = hashlib.sha256("key1".encode('utf-8')).hexdigest()
         key2_hash = hashlib.sha256("key2".encode('utf-8')).hexdigest()
-        key1_file = self.temp_dir / f"{key1_hash}.cache"
-        key2_file = self.temp_dir / f"{key2_hash}.cache"
-        assert key1_file.exists(), f"Hashed key1 file ({key1_hash}.cache) should still exist"
-        assert key2_file.exists(), f"Hashed key2 file ({key2_hash}.cache) should still exist"
+        disk_keys = self.disk_keys()
+        assert key1_hash in disk_keys, f"Hashed key1 entry ({key1_hash}) should still exist"
+        assert key2_hash in disk_keys, f"Hashed key2 entry ({key2_hash}) should still exist"
         
         print("   ✅ Orphaned files cleanup works correctly")
     
@@ -162,8 +167,7 @@ class TestCacheLRUFix:
         assert len(self.cache._memory_cache) <= self.cache.max_size
         
         # Verify disk files match memory cache
-        disk_files = list(self.temp_dir.glob("*.cache"))
-        disk_keys = [f.stem for f in disk_files]
+        disk_keys = self.disk_keys()
         memory_keys = list(self.cache._memory_cache.keys())
         
         # All memory keys should have corresponding disk files
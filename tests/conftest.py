@@ -8,6 +8,7 @@ Shared fixtures and configuration for all tests:
 - Environment setup
 """
 
+import logging
 import pytest
 import tempfile
 import shutil
@@ -78,6 +79,38 @@ def temp_db():
         pass
 
 
+class SqliteDbManager:
+    """Minimal db_manager over a sqlite3 connection (queries return dicts)."""
+
+    def __init__(self, conn):
+        conn.row_factory = sqlite3.Row
+        self.conn = conn
+        self.logger = logging.getLogger("test")
+        self.queries = []
+
+    def execute_query(self, query, params=()):
+        self.queries.append(query)
+        return [dict(row) for row in self.conn.execute(query, list(params))]
+
+    def execute_update(self, query, params=()):
+        return self.conn.execute(query, list(params)).rowcount
+
+    def execute_insert(self, query, params=()):
+        return self.conn.execute(query, list(params)).lastrowid
+
+    def repo(self, cls):
+        """Service repository bound to this manager (its __init__ needs the global db_manager)."""
+        repository = cls.__new__(cls)
+        repository.db_manager = self
+        return repository
+
+
+@pytest.fixture
+def sqlite_db_manager():
+    """Factory wrapping a sqlite3 connection in a ``SqliteDbManager``."""
+    return SqliteDbManager
+
+
 @pytest.fixture
 def sample_epic_data():
     """Sample epic data for testing."""
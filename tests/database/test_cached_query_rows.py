@@ -0,0 +1,91 @@
+"""
+Testes do caminho rápido de execute_cached: IDs compactos de statement,
+linhas em tupla no cache e RowView como visão dict-like.
+"""
+
+import pickle
+import sqlite3
+
+import pytest
+
+from streamlit_extension.database import connection as db_connection
+from streamlit_extension.database.connection import (
+    OptimizedConnectionPool,
+    RowView,
+    _statement_info,
+)
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    db_file = tmp_path / "framework.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, title TEXT, status TEXT)")
+    conn.executemany(
+        "INSERT INTO framework_tasks (title, status) VALUES (?, ?)",
+        [(f"Task {i}", "todo" if i % 2 else "completed") for i in range(10)],
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv(db_connection.ENV_DB_PATH, str(db_file))
+
+    test_pool = OptimizedConnectionPool()
+    yield test_pool
+    test_pool._close_all()
+
+
+def test_statement_info_is_compact_and_memoized():
+    sql = "SELECT id FROM framework_tasks WHERE status = ?"
+    statement_id, tables = _statement_info(sql)
+
+    assert len(statement_id) == 16
+    assert tables == {"framework_tasks"}
+    assert _statement_info(sql) is _statement_info(sql)
+
+
+def test_cache_stores_columns_and_tuples(pool):
+    rows = pool.execute_cached("SELECT id, title FROM framework_tasks ORDER BY id")
+
+    (item,) = pool._query_cache.values()
+    assert item["columns"] == ("id", "title")
+    assert all(type(r) is tuple for r in item["rows"])
+    assert len(rows) == 10
+    assert all(isinstance(r, RowView) for r in rows)
+
+
+def test_row_view_behaves_like_dict(pool):
+    row = pool.execute_cached("SELECT id, title FROM framework_tasks WHERE id = ?", (1,))[0]
+
+    assert row == {"id": 1, "title": "Task 0"}
+    assert row["title"] == "Task 0"
+    assert row.get("missing", "x") == "x"
+    assert list(row) == ["id", "title"]
+    assert "id" in row and len(row) == 2
+    assert dict(row) == {"id": 1, "title": "Task 0"}
+    with pytest.raises(KeyError):
+        row["missing"]
+
+
+def test_row_view_mutation_does_not_touch_cache(pool):
+    sql = "SELECT id, title FROM framework_tasks WHERE id = ?"
+    first = pool.execute_cached(sql, (1,))
+    first[0]["title"] = "changed"
+    first[0]["extra"] = True
+    del first[0]["id"]
+
+    assert first[0] == {"title": "changed", "extra": True}
+    assert pool.execute_cached(sql, (1,)) == [{"id": 1, "title": "Task 0"}]
+    assert pool.get_performance_metrics()["cache_hits"] == 1
+
+
+def test_params_distinguish_entries(pool):
+    sql = "SELECT COUNT(*) AS n FROM framework_tasks WHERE status = ?"
+    assert pool.execute_cached(sql, ("todo",))[0]["n"] == 5
+    assert pool.execute_cached(sql, ["completed"])[0]["n"] == 5
+    assert pool.get_performance_metrics()["cache_entries"] == 2
+
+
+def test_row_view_is_picklable(pool):
+    rows = pool.execute_cached("SELECT id, title FROM framework_tasks ORDER BY id LIMIT 2")
+    restored = pickle.loads(pickle.dumps(rows))
+    assert restored == [{"id": 1, "title": "Task 0"}, {"id": 2, "title": "Task 1"}]
@@ -0,0 +1,130 @@
+"""
+Testes do carregamento concorrente com single-flight.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from streamlit_extension.database.loader import ConcurrentLoader
+
+
+@pytest.fixture
+def loader():
+    loader = ConcurrentLoader(max_workers=4)
+    yield loader
+    loader.shutdown()
+
+
+def _slow(value, seconds=0.2):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def test_independent_calls_run_in_parallel(loader):
+    started = time.perf_counter()
+
+    results = loader.load({name: ((name,), _slow(name)) for name in ("a", "b", "c", "d")})
+
+    assert results == {"a": "a", "b": "b", "c": "c", "d": "d"}
+    assert time.perf_counter() - started < 0.6
+
+
+def test_identical_in_flight_calls_execute_once(loader):
+    release = threading.Event()
+    executions = []
+
+    def query():
+        executions.append(1)
+        release.wait(5)
+        return {"rows": 3}
+
+    results = []
+    viewers = [
+        threading.Thread(target=lambda: results.append(loader.load({"q": (("same",), query)})))
+        for _ in range(8)
+    ]
+    for viewer in viewers:
+        viewer.start()
+    while loader.get_stats()["coalesced"] < 7:
+        time.sleep(0.005)
+    release.set()
+    for viewer in viewers:
+        viewer.join()
+
+    assert len(executions) == 1
+    assert results == [{"q": {"rows": 3}}] * 8
+    assert loader.get_stats()["in_flight"] == 0
+
+
+def test_completed_keys_run_again(loader):
+    calls = []
+
+    for _ in range(2):
+        loader.load({"q": (("k",), lambda: calls.append(1))})
+
+    assert len(calls) == 2
+
+
+def test_first_error_is_raised_after_all_finish(loader):
+    done = []
+
+    def fail():
+        raise ValueError("boom")
+
+    def slow_ok():
+        time.sleep(0.05)
+        done.append(1)
+
+    with pytest.raises(ValueError, match="boom"):
+        loader.load({"bad": (("bad",), fail), "ok": (("ok",), slow_ok)})
+
+    assert done == [1]
+    assert loader.get_stats()["errors"] == 1
+
+
+def test_nested_loads_run_inline():
+    small = ConcurrentLoader(max_workers=1)
+
+    def outer():
+        return small.load({"inner": (("inner",), lambda: "x")})["inner"]
+
+    try:
+        assert small.load({"outer": (("outer",), outer)}, timeout=2) == {"outer": "x"}
+        assert small.get_stats()["inline"] == 1
+    finally:
+        small.shutdown()
+
+
+def test_dashboard_summary_loads_metrics_concurrently(monkeypatch):
+    analytics = pytest.importorskip("streamlit_extension.services.analytics_service")
+    loader = ConcurrentLoader(max_workers=4)
+    monkeypatch.setattr(analytics, "load_concurrently", loader.load)
+
+    def slow(value):
+        return lambda *args, **kwargs: _slow(value)()
+
+    service = analytics.AnalyticsService.__new__(analytics.AnalyticsService)
+    service.logger = SimpleNamespace(info=lambda *a, **k: None)
+    service.repository = SimpleNamespace(
+        db_manager=object(),
+        get_project_progress_metrics=slow([{"total_epics": 2, "total_tasks": 5}]),
+        get_tdd_cycle_metrics=slow({}),
+        get_productivity_metrics=slow({}),
+        get_gamification_metrics=slow({"total_points_earned": 7}),
+    )
+
+    started = time.perf_counter()
+    try:
+        result = service.get_dashboard_summary(days=30)
+    finally:
+        loader.shutdown()
+
+    assert time.perf_counter() - started < 0.6
+    assert result.success
+    assert result.data["overview"]["total_tasks"] == 5
+    assert result.data["gamification"]["points_earned"] == 7
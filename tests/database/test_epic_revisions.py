@@ -0,0 +1,99 @@
+"""
+Testes de epic_revisions (revisão por épico mantida por triggers).
+
+Toda escrita em tarefas ou dependências de um épico deve incrementar a sua
+revisão, inclusive quando ``task_dependencies`` é criada depois dos rollups.
+"""
+
+import sqlite3
+
+import pytest
+
+from streamlit_extension.database.rollups import (
+    create_epic_revisions,
+    ensure_dependency_revision_triggers,
+    read_epic_revision,
+)
+
+DEPENDENCIES_TABLE = """
+    CREATE TABLE task_dependencies (
+        id INTEGER PRIMARY KEY,
+        task_id INTEGER,
+        depends_on_task_id INTEGER
+    )
+"""
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, epic_id INTEGER, status TEXT);
+        INSERT INTO framework_tasks (id, epic_id) VALUES (1, 1), (2, 1), (3, NULL);
+        """
+    )
+    yield conn
+    conn.close()
+
+
+def _revision_rows(conn):
+    return conn.execute("SELECT epic_id, revision FROM epic_revisions ORDER BY epic_id").fetchall()
+
+
+def test_dependency_writes_bump_the_epic(conn):
+    conn.execute(DEPENDENCIES_TABLE)
+    create_epic_revisions(conn)
+    before = read_epic_revision(conn, 1)
+
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (2, 1)")
+
+    assert read_epic_revision(conn, 1) == before + 1
+
+
+def test_dependencies_table_created_later_gets_triggers(conn):
+    create_epic_revisions(conn)
+    assert not ensure_dependency_revision_triggers(conn)
+    conn.execute(DEPENDENCIES_TABLE)
+    before = read_epic_revision(conn, 1)
+    assert not conn.in_transaction
+
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (2, 1)")
+
+    assert read_epic_revision(conn, 1) == before + 1
+
+
+def test_late_triggers_bump_existing_revisions(conn):
+    create_epic_revisions(conn)
+    conn.execute(DEPENDENCIES_TABLE)
+    # Dependência gravada antes dos triggers: planos da revisão 0 estão velhos
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (2, 1)")
+
+    assert read_epic_revision(conn, 1) == 1
+
+
+def test_rows_without_epic_are_not_recorded(conn):
+    conn.execute(DEPENDENCIES_TABLE)
+    create_epic_revisions(conn)
+    before = _revision_rows(conn)
+
+    conn.execute("UPDATE framework_tasks SET status = 'done' WHERE id = 3")
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (99, 1)")
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (3, 1)")
+
+    assert _revision_rows(conn) == before
+
+
+def test_outdated_trigger_bodies_are_replaced(conn):
+    conn.execute(DEPENDENCIES_TABLE)
+    create_epic_revisions(conn)
+    conn.execute("DROP TRIGGER trg_revision_deps_insert")
+    conn.execute(
+        "CREATE TRIGGER trg_revision_deps_insert AFTER INSERT ON task_dependencies BEGIN "
+        "INSERT OR IGNORE INTO epic_revisions (epic_id) VALUES (NULL); END"
+    )
+
+    create_epic_revisions(conn)
+    conn.execute("INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (99, 1)")
+
+    assert [epic_id for epic_id, _ in _revision_rows(conn)] == [1]
@@ -0,0 +1,154 @@
+"""
+Testes do pool multi-leitor / escritor único do OptimizedConnectionPool.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from streamlit_extension.database import connection as db_connection
+from streamlit_extension.database.connection import OptimizedConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    db_file = tmp_path / "framework.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("INSERT INTO items (name) VALUES ('a')")
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv(db_connection.ENV_DB_PATH, str(db_file))
+    return db_file
+
+
+@pytest.fixture
+def pool(db_path):
+    test_pool = OptimizedConnectionPool(max_connections=3, checkout_timeout=0.2)
+    yield test_pool
+    test_pool._close_all()
+
+
+def test_readers_reject_writes(pool):
+    with pool.get_optimized_connection(read_only=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO items (name) VALUES ('b')")
+
+
+def test_writer_uses_wal(pool):
+    with pool.get_optimized_connection(read_only=False) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+
+
+def test_readers_are_reused_across_threads(pool):
+    def worker():
+        for _ in range(5):
+            with pool.get_optimized_connection(read_only=True) as conn:
+                conn.execute("SELECT * FROM items").fetchall()
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    metrics = pool.get_performance_metrics()
+    assert metrics["read_checkouts"] == 30
+    # max_connections=3 -> 2 leitores + 1 escritor, nunca mais que isso
+    assert metrics["connections_created"] <= 3
+    assert metrics["active_connections"] <= 3
+
+
+def test_reader_exhaustion_times_out(pool):
+    held = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with pool.get_optimized_connection(read_only=True):
+            held.set()
+            release.wait(2)
+
+    threads = [threading.Thread(target=holder) for _ in range(pool.max_readers)]
+    for t in threads:
+        t.start()
+    while pool.get_performance_metrics()["read_checkouts"] < pool.max_readers:
+        time.sleep(0.01)
+
+    try:
+        with pytest.raises(PoolTimeoutError):
+            with pool.get_optimized_connection(read_only=True):
+                pass
+    finally:
+        release.set()
+        for t in threads:
+            t.join()
+
+    assert pool.get_performance_metrics()["checkout_timeouts"] == 1
+
+
+def test_writer_is_serialized_and_wait_is_measured(pool):
+    inside = threading.Event()
+    order = []
+
+    def first():
+        with pool.get_optimized_connection(read_only=False) as conn:
+            inside.set()
+            time.sleep(0.1)
+            conn.execute("INSERT INTO items (name) VALUES ('first')")
+            conn.commit()
+            order.append("first")
+
+    t = threading.Thread(target=first)
+    t.start()
+    inside.wait(1)
+    with pool.get_optimized_connection(read_only=False) as conn:
+        order.append("second")
+        count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    t.join()
+
+    assert order == ["first", "second"]
+    assert count == 2
+    metrics = pool.get_performance_metrics()
+    assert metrics["write_checkouts"] == 2
+    assert metrics["checkout_waits"] >= 1
+    assert metrics["max_wait_ms"] >= 50
+
+
+def test_nested_checkout_reuses_writer(pool):
+    with pool.get_optimized_connection(read_only=False) as writer:
+        writer.execute("INSERT INTO items (name) VALUES ('pending')")
+        with pool.get_optimized_connection(read_only=True) as reader:
+            assert reader is writer
+            assert reader.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+        writer.commit()
+
+
+def test_uncommitted_transaction_is_rolled_back_on_return(pool, caplog):
+    with pool.get_optimized_connection(read_only=False) as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('forgotten')")
+
+    with pool.get_optimized_connection(read_only=False) as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+    assert "aplicando rollback" in caplog.text
+
+
+def test_failed_block_is_rolled_back(pool):
+    with pytest.raises(RuntimeError):
+        with pool.get_optimized_connection(read_only=False) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('discarded')")
+            raise RuntimeError("falhou")
+
+    with pool.get_optimized_connection(read_only=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+
+def test_checkout_defaults_to_writer(pool):
+    with pool.get_optimized_connection() as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('b')")
+        conn.commit()
+
+    assert pool.get_performance_metrics()["write_checkouts"] == 1
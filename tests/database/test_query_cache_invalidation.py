@@ -0,0 +1,165 @@
+"""
+Testes da invalidação de cache por tabela do OptimizedConnectionPool.
+
+Escritas devem descartar somente as consultas cacheadas que leem a tabela
+alterada, preservando as demais entradas.
+"""
+
+import contextlib
+import sqlite3
+
+import pytest
+
+from streamlit_extension.database import connection as db_connection
+from streamlit_extension.database.connection import (
+    ALL_TABLES,
+    OptimizedConnectionPool,
+    extract_read_tables,
+    extract_write_tables,
+)
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    db_file = tmp_path / "framework.db"
+    conn = sqlite3.connect(db_file)
+    conn.executescript(
+        """
+        CREATE TABLE framework_epics (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, epic_id INTEGER, title TEXT);
+        CREATE TABLE work_sessions (id INTEGER PRIMARY KEY, task_id INTEGER, duration_minutes INTEGER);
+        INSERT INTO framework_epics (id, name) VALUES (1, 'Epic');
+        INSERT INTO framework_tasks (id, epic_id, title) VALUES (1, 1, 'Task');
+        """
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv(db_connection.ENV_DB_PATH, str(db_file))
+
+    test_pool = OptimizedConnectionPool()
+    monkeypatch.setattr(db_connection, "_optimized_pool", test_pool)
+    yield test_pool
+    test_pool._close_all()
+
+
+class TestTableExtraction:
+    def test_read_tables_from_joins(self):
+        sql = """
+            SELECT t.id FROM framework_tasks AS t
+            JOIN framework_epics e ON e.id = t.epic_id
+            LEFT JOIN "work_sessions" ws ON ws.task_id = t.id
+        """
+        assert extract_read_tables(sql) == {"framework_tasks", "framework_epics", "work_sessions"}
+
+    def test_read_tables_from_comma_join(self):
+        sql = """
+            SELECT t.id FROM framework_tasks t, framework_epics AS e, work_sessions
+            WHERE e.id = t.epic_id ORDER BY t.id, e.id
+        """
+        assert extract_read_tables(sql) == {"framework_tasks", "framework_epics", "work_sessions"}
+        assert extract_read_tables("SELECT * FROM a,b") == {"a", "b"}
+        assert extract_read_tables("SELECT * FROM a LIMIT 1, 2") == {"a"}
+
+    def test_unknown_read_tables_are_conservative(self):
+        assert extract_read_tables("SELECT 1") == {ALL_TABLES}
+
+    @pytest.mark.parametrize(
+        "sql, expected",
+        [
+            ("INSERT INTO work_sessions (task_id) VALUES (1)", {"work_sessions"}),
+            ("INSERT OR REPLACE INTO work_sessions VALUES (1)", {"work_sessions"}),
+            ("update Framework_Tasks SET title = 'x'", {"framework_tasks"}),
+            ("DELETE FROM framework_epics WHERE id = 1", {"framework_epics"}),
+            ("CREATE TABLE IF NOT EXISTS extra (id INTEGER)", {"extra"}),
+            ("PRAGMA optimize", {ALL_TABLES}),
+        ],
+    )
+    def test_write_tables(self, sql, expected):
+        assert extract_write_tables(sql) == expected
+
+
+class TestTableAwareInvalidation:
+    def test_write_keeps_unrelated_entries(self, pool):
+        pool.execute_cached("SELECT * FROM framework_epics")
+        pool.execute_cached("SELECT * FROM framework_tasks")
+
+        db_connection.execute("INSERT INTO work_sessions (task_id, duration_minutes) VALUES (1, 25)")
+
+        pool.execute_cached("SELECT * FROM framework_epics")
+        pool.execute_cached("SELECT * FROM framework_tasks")
+        metrics = pool.get_performance_metrics()
+        assert metrics["cache_hits"] == 2
+        assert metrics["cache_invalidations"] == 0
+
+    def test_write_invalidates_dependent_entries(self, pool):
+        sql = "SELECT t.title FROM framework_tasks t JOIN framework_epics e ON e.id = t.epic_id"
+        assert pool.execute_cached(sql) == [{"title": "Task"}]
+        pool.execute_cached("SELECT * FROM work_sessions")
+
+        db_connection.execute("UPDATE framework_epics SET name = 'Renamed' WHERE id = 1")
+        db_connection.execute("UPDATE framework_tasks SET title = 'Changed' WHERE id = 1")
+
+        assert pool.execute_cached(sql) == [{"title": "Changed"}]
+        metrics = pool.get_performance_metrics()
+        assert metrics["cache_invalidations"] == 1
+        assert metrics["cache_entries"] == 2
+
+    def test_write_invalidates_comma_join_entries(self, pool):
+        sql = "SELECT e.name FROM framework_tasks t, framework_epics e WHERE e.id = t.epic_id"
+        assert pool.execute_cached(sql) == [{"name": "Epic"}]
+
+        db_connection.execute("UPDATE framework_epics SET name = 'Renamed' WHERE id = 1")
+
+        assert pool.execute_cached(sql) == [{"name": "Renamed"}]
+
+    def test_declared_tables_override_parsing(self, pool):
+        pool.execute_cached("SELECT 1 AS one", tables=["framework_tasks"])
+
+        assert pool.invalidate_tables(["framework_epics"]) == 0
+        assert pool.invalidate_tables(["framework_tasks"]) == 1
+
+    def test_unknown_dependencies_invalidated_by_any_write(self, pool):
+        pool.execute_cached("SELECT 1 AS one")
+        pool.execute_cached("SELECT * FROM framework_epics")
+
+        assert pool.invalidate_tables(["work_sessions"]) == 1
+        assert pool.get_performance_metrics()["cache_entries"] == 1
+
+    def test_unrecognized_write_clears_everything(self, pool):
+        pool.execute_cached("SELECT * FROM framework_epics")
+        pool.execute_cached("SELECT * FROM framework_tasks")
+
+        assert pool.invalidate_tables(extract_write_tables("PRAGMA optimize")) == 2
+        metrics = pool.get_performance_metrics()
+        assert metrics["cache_entries"] == 0
+        assert metrics["cached_tables"] == 0
+
+    def test_lru_eviction_cleans_table_index(self, pool):
+        pool._query_cache_capacity = 1
+        pool.execute_cached("SELECT * FROM framework_epics")
+        pool.execute_cached("SELECT * FROM framework_tasks")
+
+        assert "framework_epics" not in pool._table_index
+        assert pool.invalidate_tables(["framework_epics"]) == 0
+
+    @pytest.mark.parametrize("invalidated", [["framework_epics"], ["work_sessions"], [ALL_TABLES]])
+    def test_invalidation_during_query_skips_cache_insert(self, pool, monkeypatch, invalidated):
+        checkout = pool.get_optimized_connection
+
+        @contextlib.contextmanager
+        def racing_checkout(*, read_only=False):
+            with checkout(read_only=read_only) as conn:
+                yield conn
+            # Escrita concorrente confirmada após o SELECT, antes de cachear
+            pool.invalidate_tables(invalidated)
+
+        monkeypatch.setattr(pool, "get_optimized_connection", racing_checkout)
+        sql = "SELECT * FROM framework_epics"
+        assert pool.execute_cached(sql) == [{"id": 1, "name": "Epic"}]
+        assert pool.execute_cached("SELECT 1 AS one") == [{"one": 1}]
+        monkeypatch.undo()
+
+        assert pool.get_performance_metrics()["cache_entries"] == (
+            1 if invalidated == ["work_sessions"] else 0
+        )
+
@@ -0,0 +1,98 @@
+"""
+Testes do índice FTS5 ``search_index`` (tarefas e épicos).
+"""
+
+import sqlite3
+
+import pytest
+
+from streamlit_extension.database import search
+from streamlit_extension.database.search import (
+    build_match_query,
+    create_search_index,
+    fts5_available,
+    rebuild_search_index,
+)
+
+task_service = pytest.importorskip("streamlit_extension.services.task_service")
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE framework_epics (
+            id INTEGER PRIMARY KEY, epic_key TEXT, name TEXT, description TEXT, status TEXT
+        );
+        CREATE TABLE framework_tasks (
+            id INTEGER PRIMARY KEY, task_key TEXT, epic_id INTEGER, title TEXT,
+            description TEXT, status TEXT, test_criteria TEXT
+        );
+        INSERT INTO framework_epics VALUES (1, 'EPIC_AUTH', 'Autenticação', 'Login e sessões', 'active');
+        INSERT INTO framework_tasks VALUES
+            (1, 'AUTH-1', 1, 'Tela de login', 'Formulário de acesso', 'todo', '["valida senha"]'),
+            (2, 'AUTH-2', 1, 'Logout', 'Encerrar sessão do usuário', 'todo', NULL),
+            (3, 'UI-1', 1, 'Kanban board', 'Arrastar cards de login rápido', 'todo', '["drag and drop"]');
+        """
+    )
+    if not fts5_available(conn):
+        pytest.skip("SQLite sem FTS5")
+    create_search_index(conn)
+    yield conn
+    conn.close()
+
+
+def _ids(results, entity="task"):
+    return [r["entity_id"] for r in results if r["entity"] == entity]
+
+
+def test_match_query_is_quoted_and_prefixed():
+    assert build_match_query('login "OR bu') == '"login" "OR" "bu"*'
+    assert build_match_query("login ") == '"login"'
+    assert build_match_query("  -- ") is None
+
+
+def test_existing_rows_are_indexed_and_ranked(conn):
+    results = search.search(conn, "login")
+
+    # Título pesa mais que a descrição; épico também aparece
+    assert _ids(results) == [1, 3]
+    assert _ids(results, "epic") == [1]
+
+
+def test_prefix_diacritics_and_json_criteria(conn):
+    assert _ids(search.search(conn, "sess", entity="task")) == [2]
+    assert _ids(search.search(conn, "autenticacao", entity="epic"), "epic") == [1]
+    assert _ids(search.search(conn, "senha")) == [1]
+
+
+def test_triggers_keep_index_in_sync(conn):
+    conn.execute("INSERT INTO framework_tasks VALUES (4, 'API-1', 1, 'Endpoint de login', NULL, 'todo', NULL)")
+    conn.execute("UPDATE framework_tasks SET title = 'Botão sair' WHERE id = 2")
+    conn.execute("DELETE FROM framework_tasks WHERE id = 1")
+
+    assert sorted(_ids(search.search(conn, "login"))) == [3, 4]
+    assert _ids(search.search(conn, "botao")) == [2]
+    assert _ids(search.search(conn, "logout")) == []
+    assert rebuild_search_index(conn) == 4  # 3 tarefas + 1 épico
+
+
+def test_like_fallback_without_index(conn):
+    conn.execute("DROP TABLE search_index")
+
+    assert sorted(_ids(search.search(conn, "login", entity="task"))) == [1, 3]
+
+
+@pytest.mark.parametrize("drop_index", [False, True], ids=["fts5", "like-fallback"])
+def test_task_repository_search(conn, drop_index, sqlite_db_manager):
+    conn.execute("ALTER TABLE framework_epics ADD COLUMN title TEXT")
+    if drop_index:
+        conn.execute("DROP TABLE search_index")
+    repo = sqlite_db_manager(conn).repo(task_service.TaskRepository)
+
+    results = repo.search("login", limit=10)
+
+    assert [r["task_key"] for r in results] == ["AUTH-1", "UI-1"]
+    assert repo.search("login", epic_id=2) == []
+    assert repo.has_search_index() is not drop_index
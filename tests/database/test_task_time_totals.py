@@ -0,0 +1,150 @@
+"""
+Testes de task_time_totals (tempo por tarefa mantido por triggers).
+
+A tabela deve sempre coincidir com o antigo
+``SELECT task_id, SUM(duration_minutes) FROM work_sessions GROUP BY task_id``.
+"""
+
+import sqlite3
+
+import pytest
+
+from streamlit_extension.database import connection as db_connection
+from streamlit_extension.database.connection import OptimizedConnectionPool
+from streamlit_extension.database.rollups import rebuild_rollups
+from streamlit_extension.database.schema import create_schema_if_needed
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    db_file = tmp_path / "framework.db"
+    monkeypatch.setenv(db_connection.ENV_DB_PATH, str(db_file))
+    test_pool = OptimizedConnectionPool()
+    monkeypatch.setattr(db_connection, "_optimized_pool", test_pool)
+
+    create_schema_if_needed()
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(
+        """
+        INSERT INTO framework_epics (id, epic_key, name) VALUES (1, 'E1', 'Epic 1');
+        INSERT INTO framework_tasks (id, task_key, epic_id, title) VALUES
+            (1, 'T1', 1, 'a'), (2, 'T2', 1, 'b'), (3, 'T3', 1, 'c');
+        INSERT INTO work_sessions (task_id, start_time, end_time, duration_minutes) VALUES
+            (1, '2025-01-01 09:00', '2025-01-01 09:25', 25),
+            (1, '2025-01-02 09:00', '2025-01-02 09:50', 50),
+            (2, '2025-01-03 10:00', '2025-01-03 10:15', 15);
+        """
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+    test_pool._close_all()
+
+
+def _totals(conn):
+    return {
+        row[0]: row[1:]
+        for row in conn.execute(
+            "SELECT task_id, total_minutes, session_count, last_session_at FROM task_time_totals"
+        )
+    }
+
+
+def _expected(conn):
+    """Agregado direto sobre todo o histórico (a consulta substituída)."""
+    return {
+        row[0]: row[1:]
+        for row in conn.execute(
+            """
+            SELECT task_id, COALESCE(SUM(duration_minutes), 0), COUNT(*),
+                   MAX(COALESCE(end_time, start_time))
+            FROM work_sessions GROUP BY task_id
+            """
+        )
+    }
+
+
+def test_existing_sessions_are_backfilled(db):
+    assert _totals(db) == {
+        1: (75, 2, "2025-01-02 09:50"),
+        2: (15, 1, "2025-01-03 10:15"),
+    }
+
+
+def test_session_lifecycle_keeps_totals_in_sync(db):
+    # Início (ativa, sem duração), fim, edição, troca de tarefa e remoção
+    db.execute("INSERT INTO work_sessions (id, task_id, start_time) VALUES (10, 3, '2025-02-01 08:00')")
+    assert _totals(db)[3] == (0, 1, "2025-02-01 08:00")
+
+    db.execute(
+        "UPDATE work_sessions SET end_time = '2025-02-01 08:40', duration_minutes = 40 WHERE id = 10"
+    )
+    assert _totals(db)[3] == (40, 1, "2025-02-01 08:40")
+
+    db.executescript(
+        """
+        UPDATE work_sessions SET duration_minutes = 30 WHERE task_id = 1 AND duration_minutes = 25;
+        UPDATE work_sessions SET task_id = 2 WHERE id = 10;
+        DELETE FROM work_sessions WHERE task_id = 1 AND duration_minutes = 50;
+        """
+    )
+    assert _totals(db) == _expected(db)
+    assert _totals(db)[1] == (30, 1, "2025-01-01 09:25")
+
+
+def test_last_session_is_dropped_with_its_row(db):
+    db.execute("DELETE FROM work_sessions WHERE task_id = 2")
+    db.execute("DELETE FROM framework_tasks WHERE id = 1")  # sessões em cascata
+
+    assert _totals(db) == {}
+
+
+def test_rebuild_repairs_drift(db):
+    db.execute("UPDATE task_time_totals SET total_minutes = 999 WHERE task_id = 1")
+    db.execute("DELETE FROM task_time_totals WHERE task_id = 2")
+    db.commit()
+
+    assert rebuild_rollups()["task_time_totals"] == 2
+    assert _totals(db) == _expected(db)
+
+
+@pytest.fixture
+def legacy_manager(sqlite_db_manager):
+    """db_manager sobre um banco criado sem create_schema_if_needed."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE framework_projects (id INTEGER PRIMARY KEY, name TEXT, status TEXT, created_at TEXT);
+        CREATE TABLE framework_epics (
+            id INTEGER PRIMARY KEY, project_id INTEGER, epic_key TEXT, title TEXT, status TEXT
+        );
+        CREATE TABLE framework_tasks (
+            id INTEGER PRIMARY KEY, task_key TEXT, epic_id INTEGER, title TEXT, status TEXT,
+            priority INTEGER, estimated_hours REAL, created_at TEXT
+        );
+        CREATE TABLE work_sessions (id INTEGER PRIMARY KEY, task_id INTEGER, duration_minutes INTEGER);
+        INSERT INTO framework_projects VALUES (1, 'P1', 'active', NULL);
+        INSERT INTO framework_epics VALUES (1, 1, 'E1', 'Epic 1', 'active');
+        INSERT INTO framework_tasks VALUES
+            (1, 'T1', 1, 'a', 'todo', 1, 2, NULL), (2, 'T2', 1, 'b', 'completed', 2, 1, NULL);
+        INSERT INTO work_sessions (task_id, duration_minutes) VALUES (1, 25), (1, 50), (2, 15);
+        """
+    )
+    return sqlite_db_manager(conn)
+
+
+def test_repositories_fall_back_without_rollup_table(legacy_manager):
+    task_service = pytest.importorskip("streamlit_extension.services.task_service")
+    analytics_service = pytest.importorskip("streamlit_extension.services.analytics_service")
+    tasks = legacy_manager.repo(task_service.TaskRepository)
+    analytics = legacy_manager.repo(analytics_service.AnalyticsRepository)
+
+    page = tasks.find_all(None, None, page_size=10)
+    by_epic = tasks.find_by_epic(1)
+    progress = analytics.get_project_progress_metrics()
+
+    assert {t["id"]: t["total_time_minutes"] for t in page.items} == {1: 75, 2: 15}
+    assert page.total == 2
+    assert {t["id"]: t["total_time_minutes"] for t in by_epic} == {1: 75, 2: 15}
+    assert progress[0]["total_time_minutes"] == 90
@@ -0,0 +1,141 @@
+"""
+Testes do rollup user_stats_rollup mantido por triggers.
+
+O rollup deve sempre coincidir com os agregados calculados diretamente
+sobre as tabelas base, sem o fan-out do antigo JOIN de quatro tabelas.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from streamlit_extension.components.analytics_cards import _validate_stats_input
+from streamlit_extension.database import connection as db_connection
+from streamlit_extension.database.connection import OptimizedConnectionPool
+from streamlit_extension.database.queries import get_epic_summary_optimized, get_user_stats_optimized
+from streamlit_extension.database.rollups import ROLLUP_GLOBAL_ID, rebuild_rollups
+from streamlit_extension.database.schema import create_schema_if_needed
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    db_file = tmp_path / "framework.db"
+    monkeypatch.setenv(db_connection.ENV_DB_PATH, str(db_file))
+    test_pool = OptimizedConnectionPool()
+    monkeypatch.setattr(db_connection, "_optimized_pool", test_pool)
+
+    create_schema_if_needed()
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(
+        """
+        INSERT INTO framework_epics (id, epic_key, name) VALUES (1, 'E1', 'Epic 1'), (2, 'E2', 'Epic 2');
+        INSERT INTO framework_tasks (id, task_key, epic_id, title, status) VALUES
+            (1, 'T1', 1, 'a', 'completed'),
+            (2, 'T2', 1, 'b', 'todo'),
+            (3, 'T3', 2, 'c', NULL);
+        INSERT INTO work_sessions (task_id, duration_minutes, focus_score) VALUES
+            (1, 25, 8), (1, 50, NULL), (2, 15, 6);
+        INSERT INTO achievement_types (id, name) VALUES (1, 'first'), (2, 'second');
+        INSERT INTO user_achievements (user_id, achievement_type_id) VALUES (1, 1), (1, 2), (2, 1);
+        """
+    )
+    conn.commit()
+    yield conn
+    conn.close()
+    test_pool._close_all()
+
+
+def _expected(conn, user_id):
+    """Agregados calculados diretamente, uma tabela por vez."""
+    q = lambda sql, *p: conn.execute(sql, p).fetchone()[0]
+    focus = conn.execute(
+        "SELECT AVG(ws.focus_score) FROM work_sessions ws JOIN framework_tasks t ON t.id = ws.task_id"
+    ).fetchone()[0]
+    return {
+        "total_epics": q("SELECT COUNT(*) FROM framework_epics"),
+        "total_tasks": q("SELECT COUNT(*) FROM framework_tasks"),
+        "completed_tasks": q("SELECT COUNT(*) FROM framework_tasks WHERE status = 'completed'"),
+        "total_sessions": q("SELECT COUNT(*) FROM work_sessions"),
+        "total_minutes": q("SELECT COALESCE(SUM(duration_minutes), 0) FROM work_sessions"),
+        "avg_focus_score": focus or 0,
+        "total_achievements": q("SELECT COUNT(*) FROM user_achievements WHERE user_id = ?", user_id),
+    }
+
+
+def test_initial_stats_have_no_fan_out(db):
+    stats = get_user_stats_optimized(user_id=1, cache_ttl=0)
+
+    assert dict(stats) == _expected(db, 1)
+    assert stats["total_minutes"] == 90
+    assert stats["avg_focus_score"] == 7
+    assert stats["total_achievements"] == 2
+
+
+def test_triggers_track_incremental_writes(db):
+    db.executescript(
+        """
+        UPDATE framework_tasks SET status = 'completed' WHERE id = 2;
+        UPDATE framework_tasks SET status = 'todo' WHERE id = 1;
+        UPDATE framework_tasks SET status = 'completed' WHERE id = 3;
+        INSERT INTO work_sessions (task_id, duration_minutes, focus_score) VALUES (3, 30, 10);
+        UPDATE work_sessions SET duration_minutes = 45, focus_score = 9 WHERE id = 1;
+        DELETE FROM work_sessions WHERE id = 3;
+        INSERT INTO user_achievements (user_id, achievement_type_id) VALUES (3, 2);
+        DELETE FROM user_achievements WHERE user_id = 1 AND achievement_type_id = 1;
+        """
+    )
+    db.commit()
+
+    for user_id in (1, 2, 3, 99):
+        assert dict(get_user_stats_optimized(user_id=user_id, cache_ttl=0)) == _expected(db, user_id)
+
+
+def test_cascading_epic_delete_updates_rollup(db):
+    db.execute("DELETE FROM framework_epics WHERE id = 1")
+    db.commit()
+
+    stats = get_user_stats_optimized(user_id=1, cache_ttl=0)
+    assert dict(stats) == _expected(db, 1)
+    assert stats["total_tasks"] == 1
+    assert stats["total_sessions"] == 0
+
+
+def test_rebuild_repairs_drift(db):
+    db.execute(f"UPDATE user_stats_rollup SET total_tasks = 999 WHERE user_id = {ROLLUP_GLOBAL_ID}")
+    db.commit()
+
+    assert rebuild_rollups() == {"user_stats_rollup": 3, "task_time_totals": 2}
+    assert dict(get_user_stats_optimized(user_id=1, cache_ttl=0)) == _expected(db, 1)
+
+
+def test_cached_stats_invalidated_by_source_writes(db):
+    get_user_stats_optimized(user_id=1)
+    db_connection.execute(
+        "INSERT INTO work_sessions (task_id, duration_minutes) VALUES (?, ?)", (2, 10)
+    )
+
+    assert get_user_stats_optimized(user_id=1)["total_minutes"] == 100
+
+
+def test_missing_rollup_is_created_on_demand(db):
+    db.execute("DROP TABLE user_stats_rollup")
+    db.commit()
+
+    assert dict(get_user_stats_optimized(user_id=1)) == _expected(db, 1)
+
+
+def test_stats_reach_analytics_cards_as_dict(db):
+    stats = get_user_stats_optimized(user_id=1, cache_ttl=60)
+
+    assert type(stats) is dict
+    assert _validate_stats_input(stats) == _expected(db, 1)  # antes: RowView descartado como {}
+    assert json.loads(json.dumps(stats))["total_tasks"] == 3
+
+
+def test_epic_summary_is_plain_dict(db):
+    summary = get_epic_summary_optimized(1, cache_ttl=60)
+
+    assert type(summary) is dict
+    assert summary["total_tasks"] == 2
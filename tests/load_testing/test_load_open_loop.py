@@ -0,0 +1,149 @@
+"""Open-loop load tests: arrival schedules, intended-start latency, scenarios."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from streamlit_extension.utils.load_tester import (
+    ArrivalSchedule,
+    ConstantRate,
+    LoadTester,
+    PoissonRate,
+    RampRate,
+    StepRate,
+    find_saturation_point,
+)
+from streamlit_extension.utils.load_scenarios import ScratchScenario
+
+
+class TestArrivalSchedules:
+    def test_constant_rate(self) -> None:
+        offsets = list(ConstantRate(100).offsets(0.5))
+        assert len(offsets) == 50
+        assert offsets[1] - offsets[0] == pytest.approx(0.01)
+
+    def test_ramp_accelerates(self) -> None:
+        offsets = list(RampRate(0, 200).offsets(1.0))
+        gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+        assert len(offsets) == 100
+        assert gaps[-1] < gaps[len(gaps) // 2] < gaps[0]
+        assert offsets[-1] < 1.0
+
+    def test_step_rates(self) -> None:
+        offsets = list(StepRate([10, 0, 40], step_seconds=1.0).offsets(3.0))
+        assert len([o for o in offsets if o < 1]) == 10
+        assert not [o for o in offsets if 1 <= o < 2]
+        assert len([o for o in offsets if o >= 2]) == 40
+
+    def test_schedule_must_implement_offsets(self) -> None:
+        with pytest.raises(TypeError):
+            ArrivalSchedule()
+
+    def test_poisson_mean_rate(self) -> None:
+        offsets = list(PoissonRate(500, seed=7).offsets(10.0))
+        assert 4500 < len(offsets) < 5500
+        assert offsets == sorted(offsets)
+
+
+class TestOpenLoop:
+    def test_latency_counts_queueing_behind_slow_system(self) -> None:
+        """1 worker, 10ms actions, 200 rps offered: the queue must show up."""
+
+        def slow() -> None:
+            time.sleep(0.01)
+
+        tester = LoadTester(users=1, duration=0.3, actions=[slow], schedule=ConstantRate(200))
+        result = tester.run()
+
+        assert result["load"]["scheduled"] == 60
+        assert result["service_time"]["p50"] < 30
+        assert result["response_time"]["max"] > 5 * result["service_time"]["p50"]
+
+    def test_weighted_mix_and_errors(self) -> None:
+        calls = {"read": 0, "write": 0}
+
+        def read() -> None:
+            calls["read"] += 1
+
+        def write() -> None:
+            calls["write"] += 1
+            raise RuntimeError("write failed")
+
+        tester = LoadTester(
+            users=4, duration=0.5, actions=[read, write], weights=[9, 1],
+            schedule=ConstantRate(400), seed=3,
+        )
+        result = tester.run()
+
+        assert calls["read"] + calls["write"] == 200
+        assert calls["read"] > 5 * calls["write"] > 0
+        assert result["errors"]["total_errors"] == calls["write"]
+        assert set(result["by_action"]) == {"read", "write"}
+
+    def test_backlog_limit_drops_excess_arrivals(self) -> None:
+        def slow() -> None:
+            time.sleep(0.05)
+
+        tester = LoadTester(
+            users=1, duration=0.2, actions=[slow], schedule=ConstantRate(200),
+            max_backlog=5, drain_timeout=0.5,
+        )
+        result = tester.run()
+
+        assert result["load"]["dropped"] > 0
+        assert result["load"]["completed"] + result["load"]["dropped"] == 40
+
+    def test_finds_saturation_point(self) -> None:
+        def fixed_cost() -> None:
+            time.sleep(0.005)  # ~200 rps per worker
+
+        report = find_saturation_point(
+            [fixed_cost], rates=[20, 1000], step_seconds=0.3, users=1, p99_slo_ms=100,
+        )
+
+        assert report["max_sustainable_rps"] == 20
+        assert report["saturation_rps"] == 1000
+        assert report["steps"][-1]["saturated"]
+
+    def test_failures_are_not_achieved_throughput(self) -> None:
+        def broken() -> None:
+            raise RuntimeError("down")
+
+        report = find_saturation_point([broken], rates=[20], step_seconds=0.3, users=1)
+        step = report["steps"][0]
+
+        assert step["achieved_rps"] == 0
+        assert step["saturated"]
+        assert report["max_sustainable_rps"] is None
+
+
+class TestScratchScenario:
+    def test_default_mix(self) -> None:
+        with ScratchScenario(epics=1, tasks_per_epic=3) as scenario:
+            actions, weights = scenario.weighted_actions()
+
+            assert [a.__name__ for a in actions] == ["list_tasks", "start_timer", "stop_timer"]
+            assert weights == [6.0, 1.5, 1.5]
+
+            actions, _ = scenario.weighted_actions({"plan_execution": 1.0})
+            assert "plan_execution" in [a.__name__ for a in actions]  # opt-in
+            assert not scenario.use_plan_cache  # keeps off the app's plan cache
+
+    def test_weighted_scenario_runs_against_scratch_db(self) -> None:
+        with ScratchScenario(epics=2, tasks_per_epic=15) as scenario:
+            actions, weights = scenario.weighted_actions()
+            tester = LoadTester(
+                users=4, duration=0.5, actions=actions, weights=weights,
+                schedule=PoissonRate(100, seed=1), seed=1,
+            )
+            result = tester.run()
+
+            assert result["errors"]["total_errors"] == 0
+            assert result["load"]["completed"] > 0
+            assert set(result["by_action"]) == {"list_tasks", "start_timer", "stop_timer"}
+            counts = dict(scenario.connection().execute(
+                "SELECT status, COUNT(*) FROM work_sessions GROUP BY status"
+            ).fetchall())
+            assert sum(counts.values()) > 0 and set(counts) <= {"active", "completed"}
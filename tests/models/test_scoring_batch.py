@@ -0,0 +1,118 @@
+"""
+Testes do cálculo de scores em lote (colunar) de models.scoring.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from streamlit_extension.models import scoring
+from streamlit_extension.models.scoring import (
+    SCORING_PRESET_BALANCED,
+    SCORING_PRESET_CRITICAL_PATH_FOCUS,
+    SCORING_PRESET_TDD_WORKFLOW,
+    ScoringSystem,
+    aging_score,
+    calc_task_scores,
+    calc_task_scores_batch,
+    critical_path_score,
+    tdd_bonus_score,
+    unblock_score,
+    value_density_score,
+)
+
+
+def _task(key, **fields):
+    defaults = dict(priority=3, effort_estimate=None, estimate_minutes=None,
+                    story_points=None, tdd_order=None, created_at=None)
+    defaults.update(fields)
+    return SimpleNamespace(task_key=key, **defaults)
+
+
+def _scalar_total(task, adjacency, critical_time, critical_nodes, w):
+    """Referência: soma escalar dos componentes, na ordem original."""
+    return (
+        w.priority * (6 - (task.priority or 3))
+        + w.value_density * value_density_score(task)
+        + w.unblock * unblock_score(task.task_key, adjacency)
+        + w.critical_path * critical_path_score(task.task_key, critical_time, critical_nodes)
+        + w.tdd_bonus * tdd_bonus_score(task)
+        + w.aging * aging_score(task)
+    )
+
+
+def _workload(seed, size=50):
+    rng = random.Random(seed)
+    tasks = [
+        _task(
+            f"T{i}",
+            priority=rng.choice([None, 0, 1, 2, 3, 4, 5]),
+            effort_estimate=rng.choice([None, 0, 2, 8]),
+            estimate_minutes=rng.choice([None, 30]),
+            tdd_order=rng.choice([None, 1, 2, 3, 9]),
+            created_at=rng.choice([None, "2025-01-01"]),
+        )
+        for i in range(size)
+    ]
+    adjacency = {f"T{i}": {f"T{j}" for j in range(size) if rng.random() < 0.1} for i in range(size)}
+    critical_time = {f"T{i}": rng.randint(0, 40) for i in range(size) if rng.random() < 0.8}
+    critical_nodes = {key for key in critical_time if rng.random() < 0.5}
+    return tasks, adjacency, critical_time, critical_nodes
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def numpy_mode(request, monkeypatch):
+    if request.param and not scoring.NUMPY_AVAILABLE:
+        pytest.skip("NumPy não instalado")
+    monkeypatch.setattr(scoring, "NUMPY_AVAILABLE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_scalar_scores_for_all_presets(numpy_mode, seed):
+    tasks, adjacency, critical_time, critical_nodes = _workload(seed)
+    presets = {
+        "balanced": SCORING_PRESET_BALANCED,
+        "critical": SCORING_PRESET_CRITICAL_PATH_FOCUS,
+        "tdd": SCORING_PRESET_TDD_WORKFLOW,
+    }
+
+    result = calc_task_scores_batch(tasks, adjacency, critical_time, critical_nodes, presets)
+
+    assert set(result) == set(presets)
+    for name, weights in presets.items():
+        for task in tasks:
+            score = result[name][task.task_key]
+            assert score.total_score == _scalar_total(task, adjacency, critical_time, critical_nodes, weights)
+            assert score.tdd_bonus_score == tdd_bonus_score(task)
+            assert score.critical_path_score == critical_path_score(
+                task.task_key, critical_time, critical_nodes
+            )
+
+
+def test_calc_task_scores_returns_same_objects_as_batch(numpy_mode):
+    tasks, adjacency, critical_time, critical_nodes = _workload(7)
+
+    single = calc_task_scores(tasks, adjacency, critical_time, critical_nodes)
+    batch = calc_task_scores_batch(
+        tasks, adjacency, critical_time, critical_nodes, {"balanced": SCORING_PRESET_BALANCED}
+    )["balanced"]
+
+    assert single == batch
+    assert all(isinstance(s.total_score, float) for s in single.values())
+
+
+def test_empty_inputs(numpy_mode):
+    assert calc_task_scores([], {}, {}, set()) == {}
+    assert calc_task_scores_batch([_task("T1")], {}, {}, set(), {}) == {}
+
+
+def test_scoring_system_batch_matches_single(numpy_mode):
+    system = ScoringSystem()
+    preset = system.get_preset("business_value")
+    tasks = [_task("A", priority=1, tdd_order=1), _task("B", priority=5, effort_estimate=8)]
+
+    assert system.calculate_scores(tasks, preset) == {
+        task.task_key: system.calculate_score(task, preset) for task in tasks
+    }
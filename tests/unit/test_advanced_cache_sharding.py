@@ -0,0 +1,143 @@
+"""
+Testes do tier em memória do AdvancedCache: LRU O(1), shards e orçamento em bytes.
+"""
+
+import threading
+
+from streamlit_extension.utils.cache import AdvancedCache
+
+
+def test_lru_order_follows_access():
+    cache = AdvancedCache(max_size=3, enable_disk_cache=False)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["a", "c", "d"]
+    assert cache.stats["evictions"] == 1
+
+
+def test_shard_count_scales_with_max_size():
+    assert len(AdvancedCache(max_size=100, enable_disk_cache=False)._shards) == 1
+    assert len(AdvancedCache(max_size=1000, enable_disk_cache=False)._shards) == 15
+    assert len(AdvancedCache(max_size=100_000, enable_disk_cache=False)._shards) == AdvancedCache.MAX_SHARDS
+
+
+def test_eviction_respects_byte_budget():
+    cache = AdvancedCache(max_size=100, enable_disk_cache=False)
+    cache.max_memory_bytes = 10_000
+    for i in range(3):
+        cache.set(f"k{i}", "x" * 4000)
+
+    assert cache.get("k0") is None  # 3 x ~4 KB estoura 10 KB
+    assert cache.get("k2") is not None
+    assert cache.get_stats()["memory_bytes"] <= 10_000
+
+    cache.set("huge", "x" * 20_000)  # maior que o orçamento: não fica em memória
+    assert cache._generate_key("huge") not in cache._memory_cache
+
+
+def test_disk_io_never_runs_under_memory_lock(tmp_path):
+    cache = AdvancedCache(max_size=2, enable_disk_cache=True)
+    cache.cache_dir = tmp_path
+    locked_during_io = []
+
+    def spy(method):
+        def wrapper(*args, **kwargs):
+            locked_during_io.append(any(shard.lock.locked() for shard in cache._shards))
+            return method(*args, **kwargs)
+        return wrapper
+
+    cache._get_from_disk = spy(cache._get_from_disk)
+    cache._encode_for_disk = spy(cache._encode_for_disk)
+    cache._stored_on_disk = spy(cache._stored_on_disk)
+    cache._delete_from_disk = spy(cache._delete_from_disk)
+
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    cache.get("a")  # evicted da memória e do disco
+    cache.delete("b")
+
+    assert locked_during_io and not any(locked_during_io)
+
+
+def test_back_pressure_flush_runs_after_releasing_the_shard_lock(tmp_path):
+    cache = AdvancedCache(max_size=10, enable_disk_cache=True)
+    cache.cache_dir = tmp_path
+    store = cache._disk_store()
+    store.max_pending = 1  # toda escrita enfileirada enche a fila
+    flush = store.flush
+    locked_during_flush = []
+
+    def spy_flush():
+        locked_during_flush.append(any(shard.lock.locked() for shard in cache._shards))
+        flush()
+
+    store.flush = spy_flush
+    cache.set("k", "v")
+    cache.delete("k")
+
+    assert locked_during_flush == [False, False]
+    assert not store.contains("k")
+
+
+def test_delete_right_after_set_also_removes_the_disk_copy(tmp_path):
+    cache = AdvancedCache(max_size=10, enable_disk_cache=True)
+    cache.cache_dir = tmp_path
+    drop = cache._drop_evicted_from_disk
+
+    def delete_once(evicted):  # roda logo após o set soltar o lock do shard
+        cache._drop_evicted_from_disk = drop
+        cache.delete("k")
+        drop(evicted)
+
+    cache._drop_evicted_from_disk = delete_once
+    cache.set("k", "v1")
+
+    assert cache.get("k") is None
+    cache.flush_disk_cache()
+    assert cache.get("k") is None
+
+
+def test_disk_hit_does_not_overwrite_a_concurrent_set(tmp_path):
+    cache = AdvancedCache(max_size=10, enable_disk_cache=True)
+    cache.cache_dir = tmp_path
+    cache.set("j", "old")
+    cache._memory_cache.clear()
+    read = cache._get_from_disk
+
+    def read_then_set(cache_key):  # set concorrente durante a leitura do disco
+        value = read(cache_key)
+        cache.set("j", "new")
+        return value
+
+    cache._get_from_disk = read_then_set
+    assert cache.get("j") == "old"
+    cache._get_from_disk = read
+
+    assert cache.get("j") == "new"
+
+
+def test_concurrent_access_keeps_bookkeeping_consistent():
+    cache = AdvancedCache(max_size=256, enable_disk_cache=False)
+
+    def worker(offset):
+        for i in range(500):
+            key = f"k{(offset + i) % 400}"
+            if cache.get(key) is None:
+                cache.set(key, [i] * (i % 10))
+
+    threads = [threading.Thread(target=worker, args=(n * 37,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache._memory_cache) <= cache.max_size
+    for shard in cache._shards:
+        assert shard.bytes == sum(entry.size for entry in shard.entries.values())
+    stats = cache.stats
+    assert stats["hits"] + stats["misses"] == 8 * 500
@@ -0,0 +1,67 @@
+"""
+Testes do CPM linear (critical_path_analysis / find_critical_path_nodes).
+"""
+
+import random
+
+import pytest
+
+graph_mod = pytest.importorskip("streamlit_extension.utils.graph_algorithms")
+GraphAlgorithms = graph_mod.GraphAlgorithms
+
+
+def test_schedule_and_slack_on_diamond():
+    #   a(2) -> b(5) -> d(1)
+    #   a(2) -> c(1) -> d(1)
+    adjacency = {"a": {"b", "c"}, "b": {"d"}, "c": {"d"}, "d": set()}
+    weights = {"a": 2, "b": 5, "c": 1, "d": 1}
+
+    result = GraphAlgorithms.critical_path_analysis(adjacency, weights)
+
+    assert result.project_duration == 8
+    assert result.critical_path == ["a", "b", "d"]
+    assert result.critical_nodes == ["a", "b", "d"]
+    assert result.slack == {"a": 0, "b": 0, "c": 4, "d": 0}
+    assert result.schedule()["c"] == {
+        "earliest_start": 2,
+        "earliest_finish": 3,
+        "latest_start": 6,
+        "latest_finish": 7,
+        "slack": 4,
+    }
+
+
+def test_neighbor_only_nodes_and_minimum_weight():
+    result = GraphAlgorithms.critical_path_analysis({"a": {"b"}}, {"a": 0})
+
+    assert result.project_duration == 2
+    assert result.critical_path == ["a", "b"]
+
+
+def test_cycle_raises_and_legacy_api_returns_empty():
+    cyclic = {"a": {"b"}, "b": {"a"}}
+
+    with pytest.raises(ValueError):
+        GraphAlgorithms.critical_path_analysis(cyclic, {})
+    assert GraphAlgorithms.find_critical_path_nodes(cyclic, {}) == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_critical_nodes_match_longest_paths(seed):
+    rng = random.Random(seed)
+    size = 40
+    adjacency = {
+        str(i): {str(j) for j in range(i + 1, size) if rng.random() < 0.1} for i in range(size)
+    }
+    weights = {str(i): rng.randint(1, 8) for i in range(size)}
+
+    result = GraphAlgorithms.critical_path_analysis(adjacency, weights)
+    distances = GraphAlgorithms.longest_path_weighted(adjacency, weights)
+
+    assert result.project_duration == max(distances.values())
+    assert sum(weights[n] for n in result.critical_path) == result.project_duration
+    assert set(result.critical_path) <= set(result.critical_nodes)
+    for node, successors in adjacency.items():
+        for successor in successors:
+            assert result.earliest_finish[node] <= result.earliest_start[successor]
+            assert result.latest_finish[node] <= result.latest_start[successor]
@@ -0,0 +1,127 @@
+"""
+Testes do tier de disco SQLite do AdvancedCache (write-behind, expiração e orçamento).
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from streamlit_extension.utils.cache import AdvancedCache
+from streamlit_extension.utils.disk_cache import DISK_CACHE_FILENAME, DiskCacheStore
+
+
+def test_reads_see_pending_writes_and_flush_persists(tmp_path):
+    path = tmp_path / DISK_CACHE_FILENAME
+    store = DiskCacheStore(path, max_bytes=1 << 20, flush_interval=60)
+
+    store.put("a", b"1", time.time() + 60)
+    store.put("b", b"2", time.time() + 60)
+    assert store.get("a") == b"1"  # ainda na fila do write-behind
+    assert store.delete("b") is True
+    assert store.get("b") is None
+
+    store.close()
+    reopened = DiskCacheStore(path, max_bytes=1 << 20)
+    assert reopened.keys() == ["a"]
+    assert reopened.size_bytes() == 1
+    reopened.close()
+
+
+def test_delete_is_queued_even_if_the_key_is_not_visible(tmp_path, monkeypatch):
+    store = DiskCacheStore(tmp_path / DISK_CACHE_FILENAME, max_bytes=1 << 20, flush_interval=60)
+    store.put("k", b"v", time.time() + 60)
+    store.flush()
+    monkeypatch.setattr(store, "contains", lambda key: False)  # put ainda não visível
+
+    assert store.delete("k") is False
+    store.flush()
+
+    assert store.get("k") is None
+    assert store.keys() == []
+    store.close()
+
+
+def test_deferred_back_pressure_leaves_the_flush_to_the_caller(tmp_path):
+    store = DiskCacheStore(tmp_path / DISK_CACHE_FILENAME, max_bytes=1 << 20, flush_interval=60)
+    store.max_pending = 2
+
+    assert store.put("a", b"1", time.time() + 60, defer_flush=True) is False
+    assert store.put("b", b"2", time.time() + 60, defer_flush=True) is True
+    assert len(store._pending) == 2  # nada gravado ainda
+
+    store.flush()
+    assert sorted(store.keys()) == ["a", "b"]
+    store.put("c", b"3", time.time() + 60)
+    assert store.discard("a") is False  # sem defer_flush: flush imediato na fila cheia
+    assert not store._pending
+    store.close()
+
+
+def test_expired_rows_are_reclaimed_incrementally(tmp_path):
+    store = DiskCacheStore(tmp_path / DISK_CACHE_FILENAME, max_bytes=1 << 20, batch_size=2)
+    for i in range(5):
+        store.put(f"k{i}", b"x", time.time() - 1)
+
+    assert store.get("k0") is None
+    store.flush()  # aplica a fila e remove no máximo batch_size expirados
+    assert store.count() <= 3
+    store.flush()
+    store.flush()
+    assert store.count() == 0 and store.size_bytes() == 0
+    store.close()
+
+
+def test_size_budget_evicts_least_recently_accessed(tmp_path):
+    events = []
+    store = DiskCacheStore(
+        tmp_path / DISK_CACHE_FILENAME, max_bytes=1000,
+        on_stat=lambda name, amount: events.append((name, amount)),
+    )
+    for i in range(4):
+        store.put(f"k{i}", b"x" * 300, time.time() + 60)
+        store.flush()
+        time.sleep(0.01)
+
+    assert store.size_bytes() <= 1000
+    assert "k0" not in store.keys() and "k3" in store.keys()
+    assert ("disk_evictions", 2) in events
+    store.close()
+
+
+def test_short_lived_threads_share_bounded_readers(tmp_path):
+    store = DiskCacheStore(tmp_path / DISK_CACHE_FILENAME, max_bytes=1 << 20, max_readers=4)
+    store.put("k", b"v", time.time() + 60)
+    store.flush()
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(store.get("k"))) for _ in range(200)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"v"] * 200
+    readers = list(store._idle_readers)
+    assert 1 <= len(readers) <= 4  # não uma conexão por thread
+    store.close()
+    for conn in readers:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")  # fechada pelo close()
+
+
+def test_advanced_cache_uses_single_store(tmp_path):
+    cache = AdvancedCache(max_size=10, enable_disk_cache=True)
+    cache.cache_dir = tmp_path
+    for i in range(200):
+        cache.set(f"key_{i}", {"i": i})
+
+    cache._memory_cache.clear()
+    assert cache.get("key_195") == {"i": 195}  # lido do disco
+    assert cache.get("key_0") is None  # removido do disco ao sair da memória
+
+    cache.flush_disk_cache()
+    assert not list(tmp_path.glob("*.cache"))
+    assert (tmp_path / DISK_CACHE_FILENAME).exists()
+    assert cache.get_stats()["disk_writes"] >= 1
@@ -0,0 +1,200 @@
+"""
+Testes do cache de planos de execução por revisão do épico.
+"""
+
+import copy
+import random
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+planner_mod = pytest.importorskip("streamlit_extension.services.task_execution_planner")
+TaskExecutionPlanner = planner_mod.TaskExecutionPlanner
+from streamlit_extension.database.rollups import create_epic_revisions  # noqa: E402
+from streamlit_extension.services.plan_cache import ExecutionPlanCache  # noqa: E402
+
+
+def _task(key, minutes=60, priority=3, tdd_order=None):
+    return SimpleNamespace(
+        id=int(key[1:]), task_key=key, epic_id=1, title=key, tdd_phase=None,
+        tdd_order=tdd_order, priority=priority, story_points=None, task_type="implementation",
+        status="todo", task_group=None, task_sequence=None, estimate_minutes=minutes,
+        effort_estimate=None, created_at=None,
+    )
+
+
+class _Store:
+    """Fonte de dados fake: cada carga devolve cópias novas (como o banco)."""
+
+    def __init__(self, tasks, edges):
+        self.tasks = {t.task_key: t for t in tasks}
+        self.edges = list(edges)
+        self.loads = 0
+
+    def list_by_epic(self, epic_id):
+        self.loads += 1
+        return [copy.copy(t) for t in self.tasks.values()]
+
+    def deps(self, epic_id):
+        return [SimpleNamespace(dependent_task_key=d, depends_on_task_key=p) for d, p in self.edges]
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, epic_id INTEGER, status TEXT)")
+    create_epic_revisions(conn)
+    conn.execute("INSERT INTO framework_tasks (id, epic_id) VALUES (1, 1)")
+    yield conn
+    conn.close()
+
+
+def _planner(conn, store, cache):
+    planner = TaskExecutionPlanner(conn, plan_cache=cache)
+    planner.tasks_repo = SimpleNamespace(list_by_epic=store.list_by_epic)
+    planner.deps_repo = SimpleNamespace(list_by_epic=store.deps)
+    return planner
+
+
+def _bump(conn):
+    conn.execute("UPDATE framework_tasks SET status = 'changed' WHERE id = 1")
+
+
+def _fresh_plan(conn, store):
+    result = _planner(conn, store, ExecutionPlanCache()).plan_execution(1, use_cache=False)
+    assert result.success, result.get_error_messages()
+    return result.data
+
+
+def _same_plan(a, b):
+    assert a.execution_order == b.execution_order
+    assert a.task_scores == b.task_scores
+    assert a.critical_path == b.critical_path
+    assert a.task_schedule == b.task_schedule
+
+
+@pytest.fixture
+def store():
+    tasks = [_task(f"T{i}", minutes=10 * i, priority=1 + i % 5) for i in range(1, 9)]
+    edges = [("T3", "T1"), ("T4", "T2"), ("T5", "T3"), ("T6", "T4"), ("T7", "T5"), ("T8", "T1")]
+    return _Store(tasks, edges)
+
+
+def test_unchanged_revision_is_a_hit(conn, store):
+    cache = ExecutionPlanCache()
+    planner = _planner(conn, store, cache)
+
+    first = planner.plan_execution(1).data
+    second = planner.plan_execution(1).data
+
+    assert second is first
+    assert store.loads == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_key_includes_preset_and_weights(conn, store):
+    cache = ExecutionPlanCache()
+    planner = _planner(conn, store, cache)
+
+    planner.plan_execution(1, "balanced")
+    planner.plan_execution(1, "tdd_workflow")
+
+    assert cache.get_stats()["rebuilds"] == 2
+    assert ExecutionPlanCache.make_key("db", 1, "balanced", {"a": 1, "b": 2}) == ExecutionPlanCache.make_key(
+        "db", 1, "balanced", {"b": 2, "a": 1}
+    )
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("status", "completed"), ("estimate_minutes", 500), ("priority", 1), ("tdd_order", 1)],
+)
+def test_single_task_change_is_patched(conn, store, field, value):
+    cache = ExecutionPlanCache()
+    planner = _planner(conn, store, cache)
+    planner.plan_execution(1)
+
+    setattr(store.tasks["T4"], field, value)
+    _bump(conn)
+    patched = planner.plan_execution(1).data
+
+    assert cache.get_stats()["patches"] == 1
+    _same_plan(patched, _fresh_plan(conn, store))
+
+
+def test_structural_change_rebuilds(conn, store):
+    cache = ExecutionPlanCache()
+    planner = _planner(conn, store, cache)
+    planner.plan_execution(1)
+
+    store.edges.append(("T2", "T1"))
+    _bump(conn)
+    plan = planner.plan_execution(1).data
+
+    stats = cache.get_stats()
+    assert (stats["patches"], stats["rebuilds"]) == (0, 2)
+    _same_plan(plan, _fresh_plan(conn, store))
+
+
+def _file_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, epic_id INTEGER, status TEXT)")
+    create_epic_revisions(conn)
+    return conn
+
+
+def test_same_epic_in_different_databases_is_not_shared(tmp_path, store):
+    cache = ExecutionPlanCache()
+    first_db, second_db = _file_db(tmp_path / "a.db"), _file_db(tmp_path / "b.db")
+    other = _Store([_task("T1"), _task("T2")], [])
+
+    plan = _planner(first_db, store, cache).plan_execution(1).data
+    other_plan = _planner(second_db, other, cache).plan_execution(1).data
+
+    assert other_plan is not plan
+    assert set(other_plan.execution_order) == {"T1", "T2"}
+    # Outro planner sobre o mesmo arquivo reaproveita o plano
+    assert _planner(sqlite3.connect(tmp_path / "a.db"), store, cache).plan_execution(1).data is plan
+    assert cache.get_stats()["entries"] == 2
+
+
+def test_in_memory_databases_are_keyed_per_owner(conn, store):
+    cache = ExecutionPlanCache()
+    planner = _planner(conn, store, cache)
+    planner.plan_execution(1)
+
+    other = _file_db(":memory:")
+    _planner(other, _Store([_task("T1")], []), cache).plan_execution(1)
+
+    assert cache.get_stats()["rebuilds"] == 2
+
+
+def test_without_revision_table_nothing_is_cached(store):
+    cache = ExecutionPlanCache()
+    planner = _planner(sqlite3.connect(":memory:"), store, cache)
+
+    planner.plan_execution(1)
+    planner.plan_execution(1)
+
+    assert store.loads == 2
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_random_patches_match_full_rebuild(conn, seed):
+    rng = random.Random(seed)
+    size = 30
+    tasks = [_task(f"T{i}", minutes=rng.randint(5, 90), priority=rng.randint(1, 5)) for i in range(1, size + 1)]
+    edges = [
+        (f"T{j}", f"T{i}") for j in range(2, size + 1) for i in range(1, j) if rng.random() < 0.08
+    ]
+    store = _Store(tasks, edges)
+    planner = _planner(conn, store, ExecutionPlanCache())
+    planner.plan_execution(1)
+
+    for _ in range(5):
+        task = store.tasks[f"T{rng.randint(1, size)}"]
+        setattr(task, rng.choice(["estimate_minutes", "priority"]), rng.randint(1, 5) * 7)
+        _bump(conn)
+        _same_plan(planner.plan_execution(1).data, _fresh_plan(conn, store))
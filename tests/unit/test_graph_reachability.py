@@ -0,0 +1,99 @@
+"""
+Testes do ReachabilityIndex (fechamento transitivo com bitsets).
+"""
+
+import random
+
+import pytest
+
+graph_mod = pytest.importorskip("streamlit_extension.utils.graph_algorithms")
+ReachabilityIndex = graph_mod.ReachabilityIndex
+GraphAlgorithms = graph_mod.GraphAlgorithms
+
+
+def _naive_closure(adjacency):
+    """Fechamento por BFS de cada nó (referência)."""
+    nodes = set(adjacency) | {n for neighbors in adjacency.values() for n in neighbors}
+    closure = {}
+    for start in nodes:
+        seen, frontier = set(), list(adjacency.get(start, ()))
+        while frontier:
+            node = frontier.pop()
+            if node not in seen:
+                seen.add(node)
+                frontier.extend(adjacency.get(node, ()))
+        closure[start] = seen
+    return closure
+
+
+def _random_graph(rng, size, max_degree=3):
+    return {
+        str(i): {str(rng.randrange(size)) for _ in range(rng.randint(0, max_degree))}
+        for i in range(size)
+    }
+
+
+def test_reaches_and_views_on_dag():
+    index = ReachabilityIndex({"a": {"b"}, "b": {"c"}, "d": set()})
+
+    assert index.reaches("a", "c")
+    assert not index.reaches("c", "a")
+    assert not index.reaches("a", "a")
+    assert index.descendants("a") == {"b", "c"}
+    assert index.ancestors("c") == {"a", "b"}
+    assert index.descendants("missing") == set()
+
+
+def test_cycles_reach_themselves():
+    index = ReachabilityIndex({"a": {"b"}, "b": {"a", "c"}, "s": {"s"}})
+
+    assert index.reaches("a", "a")
+    assert index.reaches("s", "s")
+    assert index.descendants("b") == {"a", "b", "c"}
+    assert not index.reaches("c", "c")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_naive_closure_on_random_graphs(seed):
+    rng = random.Random(seed)
+    adjacency = _random_graph(rng, rng.randint(1, 25))
+    expected = _naive_closure(adjacency)
+
+    index = ReachabilityIndex(adjacency)
+    assert index.to_closure() == expected
+    for node in expected:
+        assert index.ancestors(node) == {a for a, reach in expected.items() if node in reach}
+    assert GraphAlgorithms.build_transitive_closure(adjacency) == {
+        node: expected[node] for node in adjacency
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_add_edge_matches_rebuild(seed):
+    rng = random.Random(seed)
+    adjacency = _random_graph(rng, 15)
+    index = ReachabilityIndex({})
+    current = {}
+
+    for source, targets in adjacency.items():
+        for target in targets:
+            index.add_edge(source, target)
+            current.setdefault(source, set()).add(target)
+            current.setdefault(target, set())
+            assert index.to_closure() == _naive_closure(current)
+
+
+def test_would_create_cycle():
+    index = ReachabilityIndex({"a": {"b"}, "b": {"c"}})
+
+    assert index.would_create_cycle("c", "a")
+    assert index.would_create_cycle("a", "a")
+    assert not index.would_create_cycle("a", "c")
+
+
+def test_long_chain_has_no_recursion_limit():
+    chain = {str(i): {str(i + 1)} for i in range(5000)}
+    index = ReachabilityIndex(chain)
+
+    assert index.reaches("0", "5000")
+    assert len(index.descendants("0")) == 5000
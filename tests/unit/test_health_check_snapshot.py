@@ -0,0 +1,91 @@
+"""
+Testes do health check concorrente: prazos por check e snapshot em cache.
+"""
+
+import threading
+import time
+
+from monitoring.health_check import HealthCheck, HealthCheckManager, HealthStatus
+
+
+def _manager(**kwargs):
+    manager = HealthCheckManager(**kwargs)
+    manager.checks = []  # só os checks do teste
+    return manager
+
+
+def test_checks_run_concurrently_with_own_deadlines():
+    manager = _manager()
+    for name in ("a", "b", "c"):
+        manager.add_check(name, lambda: time.sleep(0.3) or {"status": HealthStatus.HEALTHY}, timeout=1.0)
+    manager.add_check("hung", lambda: time.sleep(2), timeout=0.2, critical=False)
+
+    start = time.time()
+    result = manager.run_checks()
+    elapsed = time.time() - start
+
+    statuses = {check["name"]: check["status"] for check in result["checks"]}
+    assert elapsed < 0.8  # sequencial seria >= 1.1s
+    assert statuses == {"a": "healthy", "b": "healthy", "c": "healthy", "hung": "unhealthy"}
+    assert "timed out" in result["checks"][-1]["message"]
+    assert result["status"] == HealthStatus.DEGRADED
+    manager.shutdown()
+
+
+def test_timeout_works_off_the_main_thread():
+    check = HealthCheck("slow", lambda: time.sleep(1), timeout=0.1)
+    results = []
+
+    worker = threading.Thread(target=lambda: results.append(check.run()))
+    worker.start()
+    worker.join(timeout=0.5)
+
+    assert results and results[0]["status"] == HealthStatus.UNHEALTHY
+
+
+def test_hung_check_is_not_resubmitted():
+    calls = []
+    release = threading.Event()
+
+    def hung():
+        calls.append(1)
+        release.wait(2)
+
+    check = HealthCheck("hung", hung, timeout=0.05)
+    check.run()
+    check.run()
+    release.set()
+
+    assert len(calls) == 1
+
+
+def test_snapshot_is_cached_until_stale():
+    calls = []
+    manager = _manager(refresh_interval=60)
+    manager.add_check("db", lambda: calls.append(1) or {"status": HealthStatus.HEALTHY})
+
+    for _ in range(5):
+        snapshot = manager.get_snapshot()
+
+    assert len(calls) == 1
+    assert snapshot["status"] == HealthStatus.HEALTHY and "snapshot_age_seconds" in snapshot
+
+    manager.get_snapshot(max_age=0)
+    assert len(calls) == 2
+    manager.shutdown()
+
+
+def test_scheduler_refreshes_snapshot_in_background():
+    calls = []
+    manager = _manager(refresh_interval=0.05)
+    manager.add_check("db", lambda: calls.append(1) or {"status": HealthStatus.HEALTHY})
+
+    manager.start_scheduler()
+    time.sleep(0.3)
+    manager.stop_scheduler()
+    refreshed = len(calls)
+    manager.get_snapshot(max_age=60)
+
+    assert refreshed >= 3
+    assert len(calls) == refreshed  # a sonda não roda o check
+    manager.shutdown()
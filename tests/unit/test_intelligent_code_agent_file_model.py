@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import ast
+import time
+from pathlib import Path
+
+import pytest
+
+agent_mod = pytest.importorskip("audit_system.agents.intelligent_code_agent")
+FileModel = agent_mod.FileModel
+
+SOURCE = '''import os
+from typing import List
+
+
+class Repo:
+    def load(self, ids: List[int],
+             limit: int = 10) -> List[int]:
+        # comentário
+        result = [
+            i for i in ids
+        ]
+        if not result: return []
+        try:
+            os.listdir(".")
+        except OSError:
+            pass
+        return result
+'''
+
+
+def test_line_nodes_are_innermost_statements() -> None:
+    model = FileModel.build("repo.py", SOURCE, ast.parse(SOURCE))
+
+    assert isinstance(model.node_at(1), ast.Import)
+    assert isinstance(model.node_at(6), ast.FunctionDef)
+    assert isinstance(model.node_at(7), ast.FunctionDef)  # assinatura em duas linhas
+    assert model.node_at(8) is None  # comentário
+    assert all(isinstance(model.node_at(n), ast.Assign) for n in (9, 10, 11))
+    assert isinstance(model.node_at(12), ast.If)  # cabeçalho vence o corpo na mesma linha
+    assert isinstance(model.node_at(14), ast.Call)  # Expr desembrulhado
+    assert isinstance(model.node_at(15), ast.ExceptHandler)
+    assert isinstance(model.node_at(17), ast.Return)
+
+
+def test_context_is_built_once() -> None:
+    model = FileModel.build("repo.py", SOURCE, ast.parse(SOURCE))
+
+    assert model.context == {
+        "total_lines": 17,
+        "file_path": "repo.py",
+        "imports": ["import os", "from typing import List"],
+        "classes": ["Repo"],
+        "functions": ["load"],
+    }
+
+
+def test_window_is_a_view_over_shared_lines() -> None:
+    model = FileModel.build("repo.py", SOURCE, None)
+    window = model.window(1)
+
+    assert list(window) == model.lines[0:6]
+    assert list(model.window(17)) == model.lines[11:17]
+    assert window[1:3] == model.lines[1:3]
+    assert window[-1] == model.lines[5]
+    assert model.node_at(1) is None  # sem AST (erro de sintaxe)
+
+
+def test_analysis_scales_linearly(tmp_path: Path) -> None:
+    agent = agent_mod.IntelligentCodeAgent(tmp_path, agent_mod.AnalysisDepth.BASIC, dry_run=True)
+    functions = "".join(
+        f"def f{i}(x):\n    y = x + {i}\n    return y\n\n" for i in range(700)
+    )
+    target = tmp_path / "big.py"
+    target.write_text("import os\n" + functions)
+
+    start = time.perf_counter()
+    analysis = agent.analyze_file_intelligently(str(target))
+    elapsed = time.perf_counter() - start
+
+    assert len(analysis.lines_analyzed) == 2801
+    assert analysis.lines_analyzed[2].semantic_type == "variable_assignment"
+    assert elapsed < 10  # antes: O(L²), minutos para um arquivo deste tamanho
@@ -0,0 +1,170 @@
+"""
+Testes da paginação por cursor (keyset) dos repositórios de tarefas, épicos
+e sessões.
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+base = pytest.importorskip("streamlit_extension.services.base")
+task_service = pytest.importorskip("streamlit_extension.services.task_service")
+epic_service = pytest.importorskip("streamlit_extension.services.epic_service")
+timer_service = pytest.importorskip("streamlit_extension.services.timer_service")
+
+KeysetPage = base.KeysetPage
+SortCriteria = base.SortCriteria
+
+
+@pytest.fixture
+def manager(sqlite_db_manager):
+    rng = random.Random(3)
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE framework_projects (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE framework_epics (
+            id INTEGER PRIMARY KEY, project_id INTEGER, epic_key TEXT, title TEXT,
+            status TEXT, priority INTEGER, difficulty TEXT, points INTEGER, created_at TEXT
+        );
+        CREATE TABLE framework_tasks (
+            id INTEGER PRIMARY KEY, task_key TEXT, epic_id INTEGER, title TEXT, status TEXT,
+            tdd_phase TEXT, priority INTEGER, due_date TEXT, created_at TEXT
+        );
+        CREATE TABLE task_time_totals (task_id INTEGER PRIMARY KEY, total_minutes INTEGER);
+        CREATE TABLE work_sessions (
+            id INTEGER PRIMARY KEY, task_id INTEGER, start_time TEXT, duration_minutes INTEGER
+        );
+        INSERT INTO framework_projects VALUES (1, 'P1'), (2, 'P2');
+        """
+    )
+    for epic_id in range(1, 13):
+        conn.execute(
+            "INSERT INTO framework_epics VALUES (?, ?, ?, ?, 'active', ?, NULL, ?, NULL)",
+            (epic_id, rng.choice([1, 2]), f"E{epic_id}", f"Epic {epic_id % 4}",
+             rng.choice([1, 2, 3, None]), rng.choice([5, 8, None])),
+        )
+    for task_id in range(1, 58):
+        conn.execute(
+            "INSERT INTO framework_tasks VALUES (?, ?, ?, ?, ?, 'red', ?, ?, NULL)",
+            (task_id, f"T{task_id}", rng.randint(1, 12), f"Task {task_id % 7}",
+             rng.choice(["todo", "completed"]), rng.choice([1, 2, 3, None]),
+             rng.choice([None, "2025-01-01", "2025-02-01"])),
+        )
+        if rng.random() < 0.5:
+            conn.execute("INSERT INTO task_time_totals VALUES (?, ?)", (task_id, rng.randint(0, 90)))
+    for session_id in range(1, 41):
+        conn.execute(
+            "INSERT INTO work_sessions VALUES (?, ?, ?, 25)",
+            (session_id, rng.randint(1, 5), f"2025-03-{rng.randint(1, 9):02d} 09:00"),
+        )
+    return sqlite_db_manager(conn)
+
+
+def _walk(find_page):
+    """Percorre todas as páginas seguindo next_cursor."""
+    keys, cursor, pages = [], None, 0
+    while True:
+        result = find_page(cursor)
+        keys.extend(item["id"] for item in result.items)
+        pages += 1
+        if result.next_cursor is None:
+            return keys, pages
+        cursor = result.next_cursor
+
+
+def _offset_order(manager, cls, sort):
+    repo = manager.repo(cls)
+    result = repo.find_all(None, sort, page=1, page_size=1000)
+    return [item["id"] for item in result.items]
+
+
+@pytest.mark.parametrize(
+    "field", ["priority", "title", "due_date", "project_name", "total_time", "epic_title"]
+)
+@pytest.mark.parametrize("ascending", [True, False])
+def test_task_cursor_walk_matches_full_ordering(manager, field, ascending):
+    repo = manager.repo(task_service.TaskRepository)
+    sort = SortCriteria(field, ascending)
+
+    keys, pages = _walk(
+        lambda cursor: repo.find_all(None, sort, page_size=7, cursor=cursor, include_total=False)
+    )
+
+    assert keys == _offset_order(manager, task_service.TaskRepository, sort)
+    assert len(keys) == 57 and pages == 9
+
+
+def test_cursor_pages_use_no_offset_or_count(manager):
+    repo = manager.repo(task_service.TaskRepository)
+    first = repo.find_all(None, SortCriteria("priority", False), page_size=10, include_total=False)
+    manager.queries.clear()
+
+    second = repo.find_all(
+        None, SortCriteria("priority", False), page_size=10,
+        cursor=first.next_cursor, include_total=False,
+    )
+
+    assert second.total is None and second.has_next
+    assert len(manager.queries) == 1 and "COUNT(*)" not in manager.queries[0]
+    assert "_keyset_sort" not in second.items[0]
+
+
+def test_page_numbers_still_work_and_return_a_cursor(manager):
+    repo = manager.repo(task_service.TaskRepository)
+
+    result = repo.find_all(None, SortCriteria("title", True), page=2, page_size=10)
+
+    assert result.total == 57 and result.total_pages == 6
+    assert result.next_cursor is not None and result.has_next
+
+
+def test_last_cursor_page_has_no_next_even_with_totals(manager):
+    repo = manager.repo(task_service.TaskRepository)
+    sort = SortCriteria("title", True)
+    page = repo.find_all(None, sort, page_size=10)
+    while page.next_cursor is not None:
+        page = repo.find_all(None, sort, page_size=10, cursor=page.next_cursor)
+
+    assert page.total_pages == 6 and page.page == 1
+    assert not page.has_next
+    assert not base.PaginatedResult([1], 25, 1, 10, 3, cursor_mode=True).has_next
+    assert base.PaginatedResult([1], 25, 1, 10, 3).has_next
+
+
+def test_invalid_cursor_and_sort_are_rejected(manager):
+    repo = manager.repo(task_service.TaskRepository)
+    first = repo.find_all(None, SortCriteria("title", True), page_size=5)
+
+    with pytest.raises(ValueError):
+        repo.find_all(None, SortCriteria("priority", True), cursor=first.next_cursor)
+    with pytest.raises(ValueError):
+        repo.find_all(None, SortCriteria("title", True), cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        repo.find_all(None, SortCriteria("title; DROP TABLE x", True))
+
+
+@pytest.mark.parametrize("field", ["priority", "points", "progress", "project_name"])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_epic_cursor_walk_matches_full_ordering(manager, field, ascending):
+    repo = manager.repo(epic_service.EpicRepository)
+    sort = SortCriteria(field, ascending)
+
+    keys, _ = _walk(lambda cursor: repo.find_all(None, sort, page_size=5, cursor=cursor))
+
+    assert keys == _offset_order(manager, epic_service.EpicRepository, sort)
+    assert len(keys) == 12
+
+
+def test_session_pages_are_newest_first(manager):
+    repo = manager.repo(timer_service.TimerRepository)
+
+    keys, pages = _walk(lambda cursor: repo.find_sessions_page(cursor=cursor, page_size=6))
+
+    expected = [
+        row["id"] for row in manager.execute_query(
+            "SELECT id FROM work_sessions ORDER BY start_time DESC, id DESC"
+        )
+    ]
+    assert keys == expected and pages == 7
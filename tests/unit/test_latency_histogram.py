@@ -0,0 +1,140 @@
+"""
+Testes do histograma de latência (buckets logarítmicos, memória fixa).
+"""
+
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from tdah_tools.histogram import ConcurrentHistogram, LatencyHistogram
+from streamlit_extension.utils.metrics_collector import MetricsCollector
+
+
+def _exact(values, percent):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percent / 100 * len(ordered))) - 1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_percentiles_within_relative_precision(seed):
+    rng = random.Random(seed)
+    values = [rng.lognormvariate(2.0, 1.5) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for value in values:
+        hist.record(value)
+
+    for percent in (50, 90, 99, 99.9):
+        expected = _exact(values, percent)
+        assert hist.percentile(percent) == pytest.approx(expected, rel=2 ** -7)
+    assert hist.count == len(values)
+    assert (hist.min, hist.max) == (min(values), max(values))
+    assert hist.mean == pytest.approx(sum(values) / len(values))
+
+
+def test_memory_is_fixed():
+    hist = LatencyHistogram()
+    buckets = len(hist._counts)
+
+    for i in range(100000):
+        hist.record(i % 5000 + 0.5)
+    hist.record(1e12)  # acima de highest: último bucket, max exato
+
+    assert len(hist._counts) == buckets
+    assert hist.max == 1e12 and hist.percentile(100) == 1e12
+
+
+def test_merge_equals_recording_everything():
+    rng = random.Random(1)
+    values = [rng.uniform(0, 500) for _ in range(3000)]
+    a, b, whole = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i, value in enumerate(values):
+        (a if i % 2 else b).record(value)
+        whole.record(value)
+
+    merged = a.copy().merge(b)
+
+    assert merged.percentiles() == whole.percentiles()
+    assert merged.count == whole.count
+    with pytest.raises(ValueError):
+        a.merge(LatencyHistogram(precision_bits=4))
+
+
+def test_edge_values():
+    hist = LatencyHistogram()
+    assert hist.percentile(99) == 0.0 and hist.summary() == {}
+
+    hist.record(-3)
+    hist.record(0)
+    assert hist.percentiles((50, 99.9)) == {"p50": 0.0, "p99.9": 0.0}
+    with pytest.raises(ValueError):
+        hist.percentile(101)
+
+
+def test_concurrent_histogram_merges_threads():
+    concurrent = ConcurrentHistogram()
+
+    def work(offset):
+        for i in range(1000):
+            concurrent.record(offset + i % 10)
+
+    threads = [threading.Thread(target=work, args=(t * 100,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = concurrent.snapshot()
+    assert snapshot.count == len(concurrent) == 4000
+    assert snapshot.min == 0 and snapshot.max == 309
+
+
+def test_finished_threads_are_folded_into_one_histogram():
+    concurrent = ConcurrentHistogram()
+
+    for i in range(200):  # uma thread por rerun, como no Streamlit
+        thread = threading.Thread(target=concurrent.record, args=(i + 1,))
+        thread.start()
+        thread.join()
+    concurrent.record(5)
+
+    assert len(concurrent._histograms) == 1  # só a thread viva
+    snapshot = concurrent.snapshot()
+    assert snapshot.count == len(concurrent) == 201
+    assert snapshot.min == 1 and snapshot.max == 200
+    concurrent.reset()
+    assert len(concurrent) == 0
+
+
+def test_metrics_collector_summary():
+    collector = MetricsCollector()
+    collector.start()
+    for i in range(1, 1001):
+        collector.record(float(i), success=i % 100 != 0)
+    collector.end()
+
+    summary = collector.summary()
+
+    rt = summary["response_time"]
+    assert rt["min"] == 1.0 and rt["max"] == 1000.0
+    assert rt["median"] == pytest.approx(500, rel=0.01)
+    assert rt["p99.9"] == pytest.approx(999, rel=0.01)
+    assert summary["errors"] == {"total_errors": 10, "error_rate": 0.01}
+
+
+def test_importing_histogram_has_no_side_effects(tmp_path):
+    root = Path(__file__).resolve().parents[2]
+    code = (
+        "import sys, tdah_tools.histogram, streamlit_extension.utils.metrics_collector\n"
+        "assert 'tdah_tools.performance_utils' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(root)}
+
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True)
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,113 @@
+"""
+Testes do planejamento por projeto (DAG global com dependências entre épicos).
+"""
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+planner_mod = pytest.importorskip("streamlit_extension.services.task_execution_planner")
+TaskExecutionPlanner = planner_mod.TaskExecutionPlanner
+DepsRepo = pytest.importorskip("streamlit_extension.repos.deps_repo").DepsRepo
+
+
+def _task(task_id, key, epic_id, minutes=60, priority=3):
+    return SimpleNamespace(
+        id=task_id, task_key=key, epic_id=epic_id, title=key, tdd_phase=None,
+        tdd_order=None, priority=priority, story_points=None, task_type="implementation",
+        status="todo", task_group=None, task_sequence=None, estimate_minutes=minutes,
+        effort_estimate=None, created_at=None,
+    )
+
+
+def _dep(dependent, prerequisite):
+    return SimpleNamespace(dependent_task_key=dependent, depends_on_task_key=prerequisite)
+
+
+class _FakeRepo:
+    def __init__(self, by_epic, by_project):
+        self.by_epic = by_epic
+        self.by_project = by_project
+        self.calls = []
+
+    def list_by_epic(self, epic_id):
+        self.calls.append(("epic", epic_id))
+        return self.by_epic.get(epic_id, [])
+
+    def list_by_project(self, project_id):
+        self.calls.append(("project", project_id))
+        return self.by_project.get(project_id, [])
+
+
+@pytest.fixture
+def planner():
+    # E1: A1 -> A2 ; E2: B1 depende de A2 (aresta entre épicos)
+    tasks = [_task(1, "A1", 1, 30), _task(2, "A2", 1, 30), _task(3, "B1", 2, 120), _task(4, "B2", 2, 10)]
+    deps = [_dep("A2", "A1"), _dep("B1", "A2")]
+    service = TaskExecutionPlanner(connection=None)
+    service.tasks_repo = _FakeRepo({1: tasks[:2], 2: tasks[2:]}, {7: tasks})
+    service.deps_repo = _FakeRepo({1: deps[:1], 2: deps[1:]}, {7: deps})
+    return service
+
+
+def test_project_plan_keeps_cross_epic_dependencies(planner):
+    result = planner.plan_project_execution(7)
+
+    assert result.success, result.get_error_messages()
+    plan = result.data
+    assert plan.project_id == 7 and plan.epic_id is None
+    order = plan.execution_order
+    assert order.index("A1") < order.index("A2") < order.index("B1")
+    assert plan.critical_path == ["A1", "A2", "B1"]
+    assert plan.task_schedule["B1"]["earliest_start"] == 60
+    assert plan.execution_metrics["epic_count"] == 2
+    assert plan.execution_metrics["cross_epic_dependencies"] == 1
+    assert planner.tasks_repo.calls == [("project", 7)]
+    assert planner.deps_repo.calls == [("project", 7)]
+
+
+def test_epic_plan_still_drops_cross_epic_edges(planner):
+    result = planner.plan_execution(2)
+
+    assert result.success, result.get_error_messages()
+    assert result.data.task_schedule["B1"]["earliest_start"] == 0
+    assert result.data.execution_metrics["cross_epic_dependencies"] == 0
+
+
+def test_invalid_and_empty_projects(planner):
+    assert not planner.plan_project_execution(0).success
+    assert not planner.plan_project_execution(99).success
+
+
+def test_duplicate_task_keys_across_epics_are_rejected(planner):
+    tasks = planner.tasks_repo.by_project[7] + [_task(5, "A1", 2, 45)]
+    planner.tasks_repo.by_project[7] = tasks
+
+    result = planner.plan_project_execution(7)
+
+    assert not result.success
+    assert "A1" in " ".join(result.get_error_messages())
+
+
+def test_deps_repo_lists_project_dependencies_in_one_query():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE framework_epics (id INTEGER PRIMARY KEY, project_id INTEGER);
+        CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, task_key TEXT, epic_id INTEGER);
+        CREATE TABLE task_dependencies (
+            id INTEGER PRIMARY KEY, task_id INTEGER, depends_on_task_key TEXT,
+            depends_on_task_id INTEGER, dependency_type TEXT DEFAULT 'blocking',
+            created_at TEXT, updated_at TEXT
+        );
+        INSERT INTO framework_epics VALUES (1, 7), (2, 7), (3, 8);
+        INSERT INTO framework_tasks VALUES (1, 'A1', 1), (2, 'A2', 1), (3, 'B1', 2), (4, 'C1', 3);
+        INSERT INTO task_dependencies (id, task_id, depends_on_task_key) VALUES
+            (1, 2, 'A1'), (2, 3, 'A2'), (3, 4, 'B1');
+        """
+    )
+
+    deps = DepsRepo(conn).list_by_project(7)
+
+    assert [(d.dependent_task_key, d.depends_on_task_key) for d in deps] == [("A2", "A1"), ("B1", "A2")]
@@ -0,0 +1,217 @@
+"""
+Testes do exportador Prometheus (/metrics em formato texto).
+"""
+
+import re
+import socket
+import sys
+import threading
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+
+from duration_system import rate_limiter
+from monitoring import health_check
+from monitoring.health_check import HealthCheckManager, HealthCheckServer, HealthStatus
+from monitoring.prometheus_metrics import MetricsRegistry, create_default_registry
+from streamlit_extension.services.base import BaseService, ServiceResult, timed_operation
+from streamlit_extension.services.operation_metrics import get_operation_metrics
+from streamlit_extension.services.plan_cache import get_plan_cache
+from streamlit_extension.utils import cache
+
+_SAMPLE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_]+="[^"]*",?)*\})? \S+$')
+
+
+def _assert_exposition(text):
+    assert text.endswith("\n")
+    for line in text.splitlines():
+        assert line.startswith("# HELP ") or line.startswith("# TYPE ") or _SAMPLE.match(line), line
+
+
+class _ExampleService(BaseService):
+    @timed_operation
+    def succeed(self):
+        return self.helper()
+
+    @timed_operation
+    def fail(self):
+        return ServiceResult.validation_error("inválido")
+
+    @timed_operation
+    def explode(self):
+        raise RuntimeError("falhou")
+
+    def helper(self):
+        return ServiceResult.ok(1)
+
+
+@pytest.fixture
+def manager():
+    manager = HealthCheckManager(refresh_interval=60)
+    manager.checks = []
+    manager.add_check("db", lambda: {"status": HealthStatus.HEALTHY})
+    yield manager
+    manager.shutdown()
+
+
+def test_service_operations_are_timed():
+    service = _ExampleService()
+    service.succeed()
+    service.fail()
+    with pytest.raises(RuntimeError):
+        service.explode()
+
+    snapshot = get_operation_metrics().snapshot()
+
+    assert snapshot[("_ExampleService", "succeed")][0].count >= 1
+    assert snapshot[("_ExampleService", "succeed")][1] == 0
+    assert snapshot[("_ExampleService", "fail")][1] >= 1
+    assert snapshot[("_ExampleService", "explode")][1] >= 1
+    assert _ExampleService.succeed.__name__ == "succeed"
+    assert ("_ExampleService", "helper") not in snapshot
+
+
+def test_default_registry_renders_valid_exposition(manager):
+    _ExampleService().succeed()
+    manager.run_checks()
+
+    text = create_default_registry(manager).render()
+
+    _assert_exposition(text)
+    assert "# TYPE tdd_framework_service_operation_duration_seconds summary" in text
+    assert 'operation="succeed",quantile="0.99"' in text
+    assert "tdd_framework_db_pool_cache_hits_total" in text
+    assert 'tdd_framework_health_check_status{check="db",critical="true"} 1' in text
+    assert 'tdd_framework_collector_errors_total' not in text
+
+
+def test_optional_components_export_their_snapshots(monkeypatch):
+    advanced = cache.AdvancedCache(enable_disk_cache=False)
+    advanced.set("chave", "valor")
+    advanced.get("chave")
+    limiter = rate_limiter.RateLimiter()
+    limiter.check_limit("db_queries", user_id="user-1")
+    monkeypatch.setattr(cache, "_global_cache", advanced)
+    monkeypatch.setattr(rate_limiter, "_global_rate_limiter", limiter)
+
+    text = create_default_registry().render()
+
+    _assert_exposition(text)
+    assert "tdd_framework_advanced_cache_hits_total 1" in text
+    assert "tdd_framework_advanced_cache_memory_entries 1" in text
+    assert "tdd_framework_rate_limiter_active_entities 1" in text
+    assert "tdd_framework_collector_errors_total" not in text
+
+
+def test_scrape_never_runs_health_checks():
+    calls = []
+    manager = HealthCheckManager(refresh_interval=60)
+    manager.checks = []
+    manager.add_check("db", lambda: calls.append(1) or {"status": HealthStatus.HEALTHY})
+
+    create_default_registry(manager).render()
+
+    assert calls == []
+    manager.shutdown()
+
+
+def test_failing_collector_is_isolated():
+    registry = MetricsRegistry(namespace="test")
+    registry.register("ok", lambda reg: [reg.metric("up", "gauge", "Up").add(1)])
+    registry.register("broken", lambda reg: 1 / 0)
+
+    text = registry.render()
+
+    _assert_exposition(text)
+    assert "test_up 1" in text
+    assert 'test_collector_errors_total{collector="broken"} 1' in text
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry(namespace="test")
+    registry.register("labels", lambda reg: [
+        reg.metric("info", "gauge", "Info").add(1, {"name": 'a"b\\c\nd'})
+    ])
+
+    assert 'test_info{name="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+
+def test_metrics_endpoint_negotiates_format():
+    server = HealthCheckServer(host="127.0.0.1", port=0, refresh_interval=60)
+    server.start(blocking=False)
+    base_url = f"http://127.0.0.1:{server.server.server_address[1]}/metrics"
+    try:
+        with urllib.request.urlopen(f"{base_url}?format=prometheus", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            _assert_exposition(response.read().decode("utf-8"))
+
+        with urllib.request.urlopen(base_url, timeout=5) as response:
+            assert response.headers["Content-Type"] == "application/json"
+    finally:
+        server.stop()
+
+
+def test_scrape_does_not_wait_on_cache_locks():
+    registry = create_default_registry()
+    rendered = []
+    with get_plan_cache()._lock:  # um request segurando o cache de planos
+        scrape = threading.Thread(target=lambda: rendered.append(registry.render()))
+        scrape.start()
+        scrape.join(timeout=5)
+
+    assert rendered, "scrape bloqueou no lock do cache"
+    assert 'cache="execution_plan"' in rendered[0]
+
+
+@pytest.fixture
+def fresh_embedded(monkeypatch):
+    monkeypatch.setattr(health_check, "_embedded_attempted", False)
+    monkeypatch.setattr(health_check, "_health_server", None)
+
+
+def test_embedded_server_can_be_disabled(fresh_embedded, monkeypatch):
+    monkeypatch.setenv("HEALTH_CHECK_PORT", "0")
+
+    assert health_check.start_embedded_health_server() is None
+
+
+def test_embedded_server_tolerates_taken_port(fresh_embedded):
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+
+        assert health_check.start_embedded_health_server("127.0.0.1", port) is None
+        assert health_check._health_server is None
+        # Reruns do Streamlit não tentam de novo
+        assert health_check.start_embedded_health_server("127.0.0.1", port) is None
+
+
+def test_embedded_server_binds_loopback_by_default(fresh_embedded, monkeypatch):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    monkeypatch.delenv("HEALTH_CHECK_HOST", raising=False)
+
+    server = health_check.start_embedded_health_server(port=port)
+    try:
+        assert server is not None and server.host == "127.0.0.1"
+    finally:
+        health_check.stop_health_check_server()
+
+
+@pytest.mark.parametrize("metrics, health", [(False, True), (True, False), (True, True)])
+def test_app_exporter_follows_monitoring_config(monkeypatch, metrics, health):
+    app = pytest.importorskip("streamlit_extension.streamlit_app")
+    monitoring = SimpleNamespace(
+        enable_metrics=metrics, enable_health_check=health, health_check_port=9123
+    )
+    config = SimpleNamespace(get_config=lambda: SimpleNamespace(monitoring=monitoring))
+    monkeypatch.setitem(sys.modules, "config.environment", config)
+    calls = []
+    monkeypatch.setattr(health_check, "start_embedded_health_server", lambda **kw: calls.append(kw))
+
+    app.start_metrics_exporter()
+
+    assert calls == ([{"port": 9123}] if metrics and health else [])
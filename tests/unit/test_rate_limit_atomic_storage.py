@@ -0,0 +1,147 @@
+"""
+Testes dos scripts atômicos de rate limiting (Redis via fakeredis + Lua).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from streamlit_extension.middleware.rate_limiting.algorithms import (
+    FixedWindowRateLimiter,
+    SlidingWindowRateLimiter,
+    TokenBucketRateLimiter,
+)
+from streamlit_extension.middleware.rate_limiting import storage as storage_module
+from streamlit_extension.middleware.rate_limiting.storage import (
+    MemoryRateLimitStorage,
+    RedisRateLimitStorage,
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # scripting do fakeredis
+
+
+@pytest.fixture
+def client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def storage(client):
+    return RedisRateLimitStorage(client)
+
+
+def test_token_bucket_refills_and_expires(storage, client):
+    kwargs = dict(capacity=2, refill_rate=1, refill_period=1.0)
+
+    assert storage.acquire_token("u", now=100.0, **kwargs)
+    assert storage.acquire_token("u", now=100.0, **kwargs)
+    assert not storage.acquire_token("u", now=100.0, **kwargs)
+    assert storage.acquire_token("u", now=101.0, **kwargs)  # 1 token/s
+
+    assert 0 < client.ttl("rl:bucket:u") <= 3  # cheio após capacity/rate segundos
+    client.delete("rl:bucket:u")
+    assert storage.get_bucket_state("u") == {}  # chave expirada = balde cheio
+
+
+def test_token_bucket_uses_redis_clock(storage, client, monkeypatch):
+    kwargs = dict(capacity=2, refill_rate=1, refill_period=1.0)
+    assert storage.acquire_token("s", **kwargs)
+    assert storage.acquire_token("s", **kwargs)
+
+    # Worker com relógio adiantado 1h não ganha tokens extras
+    skewed = time.time() + 3600
+    monkeypatch.setattr(storage_module, "time", SimpleNamespace(time=lambda: skewed))
+    assert not storage.acquire_token("s", **kwargs)
+
+    seconds, micros = client.time()
+    assert abs(storage.get_bucket_state("s")["last_refill"] - (seconds + micros / 1e6)) < 5
+
+
+def test_sliding_window_counts_only_admitted_requests(storage, client):
+    for _ in range(3):
+        assert storage.acquire_window_slot("w", window_size=10, max_requests=3, timestamp=50.0)
+    assert not storage.acquire_window_slot("w", window_size=10, max_requests=3, timestamp=55.0)
+    assert client.zcard("rl:win:w") == 3  # mesmo timestamp, membros distintos; rejeição não conta
+    assert storage.acquire_window_slot("w", window_size=10, max_requests=3, timestamp=60.5)
+    assert 0 < client.ttl("rl:win:w") <= 11
+
+
+def test_fixed_window_resets_and_expires(storage, client):
+    args = dict(window_size=60, max_requests=2)
+
+    assert storage.acquire_fixed_window("f", timestamp=120.0, **args)
+    assert storage.acquire_fixed_window("f", timestamp=150.0, **args)
+    assert not storage.acquire_fixed_window("f", timestamp=179.0, **args)
+    assert storage.acquire_fixed_window("f", timestamp=180.0, **args)  # nova janela
+
+    assert storage.get_counter_state("f") == {"window_start": 3, "counter": 1}
+    assert 0 < client.ttl("rl:fixed:f") <= 61
+
+
+def test_concurrent_workers_never_exceed_limit(client):
+    # Cada thread tem seu próprio limiter, como processos distintos compartilhando o Redis
+    allowed = []
+    lock = threading.Lock()
+
+    def worker():
+        limiter = SlidingWindowRateLimiter(60, 50, storage=RedisRateLimitStorage(client), key="shared")
+        results = [limiter.is_allowed() for _ in range(25)]
+        with lock:
+            allowed.extend(results)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(allowed) == 50
+
+
+def test_algorithms_agree_across_backends(client):
+    redis_storage = RedisRateLimitStorage(client)
+    memory_storage = MemoryRateLimitStorage()
+
+    def decisions(storage):
+        limiters = [
+            TokenBucketRateLimiter(5, 1, storage=storage, key="tb"),
+            SlidingWindowRateLimiter(60, 4, storage=storage, key="sw"),
+            FixedWindowRateLimiter(3600, 3, storage=storage, key="fw"),
+        ]
+        return [[limiter.is_allowed() for _ in range(7)] for limiter in limiters]
+
+    assert decisions(redis_storage) == decisions(memory_storage)
+
+
+def test_token_bucket_init_does_not_reset_shared_bucket(client):
+    storage = RedisRateLimitStorage(client)
+    first = TokenBucketRateLimiter(2, 0.001, storage=storage, key="k")
+    assert first.is_allowed() and first.is_allowed()
+
+    second = TokenBucketRateLimiter(2, 0.001, storage=storage, key="k")  # outro worker
+    assert not second.is_allowed()
+
+
+def test_client_without_scripting_uses_fallback():
+    class _PlainClient:
+        def __init__(self):
+            self.h = {}
+
+        def hgetall(self, key):
+            return dict(self.h.get(key, {}))
+
+        def hset(self, key, mapping):
+            self.h.setdefault(key, {}).update({k.encode(): str(v).encode() for k, v in mapping.items()})
+
+    storage = RedisRateLimitStorage(_PlainClient())
+    limiter = TokenBucketRateLimiter(1, 1, storage=storage, key="p")
+
+    assert storage.atomic is False
+    assert limiter.is_allowed()
+    assert float(storage.get_bucket_state("p")["tokens"]) < 1
+    assert time.time() - storage.get_bucket_state("p")["last_refill"] < 5
@@ -0,0 +1,203 @@
+"""
+Testes do RedisCacheManager contra fakeredis: tags, operações em lote e codec.
+"""
+
+import json
+import time
+from datetime import date
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from streamlit_extension.utils import redis_cache
+from streamlit_extension.utils.redis_cache import RedisCacheManager
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def manager(server):
+    return RedisCacheManager(client=fakeredis.FakeRedis(server=server))
+
+
+def test_invalidate_tags_deletes_only_tagged_keys(manager):
+    manager.set("tdd_cache:project:1", {"id": 1}, ttl=60, tags=["project", "user:7"])
+    manager.set("tdd_cache:project:2", {"id": 2}, ttl=600, tags=["project"])
+    manager.set("tdd_cache:epic:1", {"id": 3}, ttl=60, tags=["epic"])
+
+    assert manager.client.ttl("tdd_cache_tag:project") == 600  # maior TTL dos membros
+    assert manager.invalidate_tags("project") == 2
+    assert manager.get("tdd_cache:project:1") is None
+    assert manager.get("tdd_cache:epic:1") == {"id": 3}
+    assert not manager.client.exists("tdd_cache_tag:project")
+
+
+def test_get_many_and_set_many_use_single_round_trips(manager):
+    assert manager.set_many({"a": [1, 2], "b": {"x": "y"}}, ttl=60, tags=["batch"])
+
+    calls = []
+    original_mget = manager.client.mget
+    manager.client.mget = lambda keys: calls.append(list(keys)) or original_mget(keys)
+
+    assert manager.get_many(["a", "b", "missing"]) == {"a": [1, 2], "b": {"x": "y"}}
+    assert calls == [["a", "b", "missing"]]
+    assert manager.metrics.stats["hits"] == 2 and manager.metrics.stats["misses"] == 1
+    assert manager.invalidate_tags("batch") == 2
+
+
+def test_msgpack_codec_and_legacy_json(manager):
+    manager.set("k", {"when": date(2024, 1, 2), "n": 1})
+    raw = manager.client.get("k")
+
+    assert raw[:1] == b"\xc1"
+    assert manager.get("k") == {"when": "2024-01-02", "n": 1}
+
+    manager.client.set("legacy", json.dumps({"n": 1}))
+    assert manager.get("legacy") == {"n": 1}
+
+
+def test_delete_pattern_scans_instead_of_keys(manager):
+    for i in range(1200):
+        manager.client.set(f"tdd_cache:bulk:{i}", b"1")
+    manager.client.set("other", b"1")
+    manager.client.keys = lambda *args, **kwargs: pytest.fail("KEYS não deve ser usado")
+
+    assert manager.delete_pattern("tdd_cache:bulk:*") == 1200
+    assert manager.client.exists("other")
+
+
+def test_health_state_is_cached(manager):
+    pings = []
+    manager.client.ping = lambda: pings.append(1) or True
+
+    for _ in range(10):
+        manager.set("k", 1)
+        manager.get("k")
+    assert pings == []
+
+    manager._record_error(redis_cache.redis.exceptions.ConnectionError("down"))
+    assert manager.get("k") is None  # indisponível: nem tenta a operação
+    manager._last_health_check = 0
+    assert manager.get("k") == 1  # sonda de recuperação
+    assert pings == [1]
+
+
+def test_cached_decorator_invalidates_by_prefix(manager, monkeypatch):
+    monkeypatch.setattr(redis_cache, "_cache_manager", manager)
+    calls = []
+
+    @redis_cache.cached("project", operation_type="quick")
+    def load(project_id):
+        calls.append(project_id)
+        return {"id": project_id}
+
+    load(1), load(1), load(2)
+    redis_cache.invalidate_cache("project")
+    load(1)
+
+    assert calls == [1, 2, 1]
+
+
+def test_invalidate_cache_scans_untagged_legacy_keys(manager, monkeypatch):
+    monkeypatch.setattr(redis_cache, "_cache_manager", manager)
+    manager.set("tdd_cache:project:legacy", {"id": 1}, ttl=60)  # gravada antes das tags
+    manager.set("tdd_cache:epic:legacy", {"id": 2}, ttl=60)
+    manager.set("tdd_cache:project:tagged", {"id": 3}, ttl=60, tags=["project"])
+
+    redis_cache.invalidate_cache("project")
+
+    assert manager.get("tdd_cache:project:legacy") is None
+    assert manager.get("tdd_cache:project:tagged") is None
+    assert manager.get("tdd_cache:epic:legacy") == {"id": 2}
+
+
+def _eventually(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def near_pair(server):
+    managers = [
+        RedisCacheManager(client=fakeredis.FakeRedis(server=server), near_cache_size=100, near_cache_ttl=60)
+        for _ in range(2)
+    ]
+    assert all(_eventually(m._near_enabled) for m in managers)
+    yield managers
+    for m in managers:
+        m.close()
+
+
+def test_near_cache_serves_hot_keys_locally(near_pair):
+    writer, reader = near_pair
+    generation = reader.near_cache.generation
+    writer.set("epic_list", [1, 2, 3], ttl=600)
+    assert _eventually(lambda: reader.near_cache.generation > generation)  # aviso entregue
+
+    assert reader.get("epic_list") == [1, 2, 3]  # busca no Redis e guarda no L1
+    reader.client.get = lambda key: pytest.fail("deveria vir do L1")
+    for _ in range(5):
+        assert reader.get("epic_list") == [1, 2, 3]
+
+    stats = reader.metrics.get_stats()
+    assert stats["l1_hits"] == 5 and stats["l1_misses"] == 1
+    assert stats["l1_hit_rate_percent"] > 80
+
+
+def test_near_cache_is_invalidated_across_processes(near_pair):
+    writer, reader = near_pair
+    writer.set("epic:1", {"v": 1}, ttl=600, tags=["epic"])
+    writer.set("epic:2", {"v": 1}, ttl=600)
+    assert reader.get_many(["epic:1", "epic:2"]) == {"epic:1": {"v": 1}, "epic:2": {"v": 1}}
+
+    writer.set("epic:2", {"v": 2}, ttl=600)
+    assert _eventually(lambda: reader.get("epic:2") == {"v": 2})
+
+    writer.invalidate_tags("epic")
+    assert _eventually(lambda: reader.get("epic:1") is None)
+
+    writer.delete("epic:2")
+    assert _eventually(lambda: reader.get("epic:2") is None)
+
+
+def test_near_cache_values_are_not_shared_objects(near_pair):
+    manager = near_pair[0]
+    manager.set("list", [1, 2], ttl=600)
+
+    manager.get("list").append(3)
+
+    assert manager.get("list") == [1, 2]
+
+
+@pytest.mark.parametrize("write", ["set", "delete"])
+def test_local_read_racing_a_pipelined_write_is_not_kept(near_pair, write):
+    manager = near_pair[0]
+    manager.set("epic:1", {"v": 1}, ttl=600)
+    pipeline = manager.client.pipeline
+
+    def racing_pipeline(*args, **kwargs):
+        pipe = pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        def execute_after_read():
+            manager.get("epic:1")  # ainda lê o valor antigo e repõe no L1
+            return execute()
+
+        pipe.execute = execute_after_read
+        return pipe
+
+    manager.client.pipeline = racing_pipeline
+    if write == "set":
+        manager.set("epic:1", {"v": 2}, ttl=600)
+        assert manager.get("epic:1") == {"v": 2}
+    else:
+        manager.delete("epic:1")
+        assert manager.get("epic:1") is None
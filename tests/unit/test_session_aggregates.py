@@ -0,0 +1,287 @@
+"""
+Testes da agregação de sessões em uma única passada (timer e analytics).
+"""
+
+import random
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import pytest
+
+timer_service = pytest.importorskip("streamlit_extension.services.timer_service")
+analytics_service = pytest.importorskip("streamlit_extension.services.analytics_service")
+aggregates = pytest.importorskip("streamlit_extension.services.session_aggregates")
+
+DAYS = 20
+
+
+def _random_session(rng, today):
+    start = datetime.combine(today, datetime.min.time()) - timedelta(
+        days=rng.randint(0, DAYS + 5), minutes=rng.randint(0, 24 * 60 - 1)
+    )
+    return (
+        rng.choice([1, 2, 3, None]),
+        rng.choice(["focus", "break", "review", None]),
+        rng.choice(["completed", "completed", "cancelled", "active"]),
+        start.isoformat(" "),
+        rng.choice([None, 5, 25, 25, 50, 90]),
+        rng.choice([None, 3, 7, 9]),
+        rng.choice([None, 4, 8]),
+        rng.choice([None, 6]),
+        rng.choice([None, 0, 1, 4]),
+    )
+
+
+@pytest.fixture
+def manager(sqlite_db_manager):
+    aggregates.get_session_aggregate_cache().clear()
+    rng = random.Random(11)
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        """
+        CREATE TABLE work_sessions (
+            id INTEGER PRIMARY KEY, task_id INTEGER, epic_id INTEGER, session_type TEXT,
+            status TEXT, start_time TEXT, end_time TEXT, duration_minutes INTEGER,
+            planned_duration_minutes INTEGER, focus_rating INTEGER, energy_level INTEGER,
+            mood_rating INTEGER, environment_notes TEXT, interruption_count INTEGER,
+            notes TEXT, created_at TEXT, updated_at TEXT
+        )
+        """
+    )
+    conn.execute("CREATE TABLE framework_tasks (id INTEGER PRIMARY KEY, estimated_hours REAL, created_at TEXT)")
+    conn.execute("CREATE TABLE task_time_totals (task_id INTEGER PRIMARY KEY, total_minutes INTEGER)")
+    today = date.today()
+    conn.executemany(
+        """
+        INSERT INTO work_sessions (task_id, session_type, status, start_time, duration_minutes,
+            focus_rating, energy_level, mood_rating, interruption_count)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [_random_session(rng, today) for _ in range(300)],
+    )
+    yield sqlite_db_manager(conn)
+    aggregates.get_session_aggregate_cache().clear()
+
+
+def _since():
+    return aggregates.window_start(DAYS)
+
+
+def _expected_patterns(manager):
+    """As três consultas originais (uma varredura cada)."""
+    results = {}
+    for name, column, expression, order in [
+        ("hourly_patterns", "hour_of_day", "CAST(strftime('%H', start_time) AS INTEGER)", "ORDER BY 1"),
+        ("daily_patterns", "day_of_week", "CAST(strftime('%w', start_time) AS INTEGER)", "ORDER BY 1"),
+        ("type_distribution", "session_type", "session_type", "ORDER BY 1"),
+    ]:
+        results[name] = manager.execute_query(
+            f"""
+            SELECT {expression} AS {column}, COUNT(*) AS session_count,
+                   SUM(duration_minutes) AS total_minutes, AVG(focus_rating) AS avg_focus
+            FROM work_sessions
+            WHERE start_time >= ? AND status = 'completed'
+            GROUP BY 1 {order}
+            """,
+            [_since()],
+        )
+    return results
+
+
+def _expected_statistics(manager, task_id=None):
+    task_filter = "AND task_id = ?" if task_id else ""
+    params = [_since()] + ([task_id] if task_id else [])
+    return manager.execute_query(
+        f"""
+        SELECT COUNT(*) AS total_sessions, SUM(duration_minutes) AS total_minutes,
+               AVG(duration_minutes) AS avg_duration, MAX(duration_minutes) AS max_duration,
+               MIN(duration_minutes) AS min_duration, AVG(focus_rating) AS avg_focus_rating,
+               AVG(energy_level) AS avg_energy_level, AVG(mood_rating) AS avg_mood_rating,
+               SUM(interruption_count) AS total_interruptions,
+               AVG(interruption_count) AS avg_interruptions_per_session
+        FROM work_sessions
+        WHERE start_time >= ? AND status = 'completed' {task_filter}
+        """,
+        params,
+    )[0]
+
+
+def _expected_metrics(manager):
+    daily = manager.execute_query(
+        """
+        SELECT DATE(start_time) AS work_date, COUNT(DISTINCT task_id) AS tasks_worked,
+               COUNT(id) AS total_sessions, SUM(duration_minutes) AS total_minutes,
+               AVG(duration_minutes) AS avg_session_minutes
+        FROM work_sessions WHERE start_time >= ?
+        GROUP BY DATE(start_time) ORDER BY work_date DESC
+        """,
+        [_since()],
+    )
+    focus = manager.execute_query(
+        """
+        SELECT CAST(strftime('%H', start_time) AS INTEGER) AS hour_of_day,
+               COUNT(*) AS session_count, SUM(duration_minutes) AS total_minutes,
+               AVG(duration_minutes) AS avg_session_minutes
+        FROM work_sessions WHERE start_time >= ?
+        GROUP BY hour_of_day ORDER BY hour_of_day
+        """,
+        [_since()],
+    )
+    return daily, focus
+
+
+def _approx(value):
+    if isinstance(value, dict):
+        return {k: _approx(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_approx(v) for v in value]
+    if isinstance(value, float):
+        return pytest.approx(value)
+    return value
+
+
+def _check_timer(manager, repo):
+    assert repo.get_productivity_patterns(DAYS) == _approx(_expected_patterns(manager))
+    stats = repo.get_session_statistics(days=DAYS)
+    assert {k: v for k, v in stats.items() if k in _expected_statistics(manager)} == _approx(
+        _expected_statistics(manager)
+    )
+
+
+def _check_analytics(manager):
+    repo = manager.repo(analytics_service.AnalyticsRepository)
+    daily, focus = _expected_metrics(manager)
+    metrics = repo.get_productivity_metrics(DAYS)
+    assert metrics["daily_productivity"] == _approx(daily)
+    assert metrics["focus_patterns"] == _approx(focus)
+
+
+def test_single_pass_matches_original_queries(manager):
+    repo = manager.repo(timer_service.TimerRepository)
+
+    _check_timer(manager, repo)
+    _check_analytics(manager)
+    for task_id in (1, 3):
+        stats = repo.get_session_statistics(task_id=task_id, days=DAYS)
+        expected = _expected_statistics(manager, task_id)
+        assert {k: stats[k] for k in expected} == _approx(expected)
+
+
+def test_patterns_and_statistics_share_one_scan(manager):
+    repo = manager.repo(timer_service.TimerRepository)
+    hits = aggregates.get_session_aggregate_cache().get_stats()["hits"]
+    manager.queries.clear()
+
+    repo.get_productivity_patterns(DAYS)
+    repo.get_session_statistics(days=DAYS)
+    repo.get_productivity_patterns(DAYS)
+
+    assert len(manager.queries) == 1
+    assert aggregates.get_session_aggregate_cache().get_stats()["hits"] - hits == 2
+
+
+def test_percentiles(manager):
+    durations = sorted(
+        row["duration_minutes"] for row in manager.execute_query(
+            "SELECT duration_minutes FROM work_sessions "
+            "WHERE start_time >= ? AND status = 'completed' AND duration_minutes IS NOT NULL",
+            [_since()],
+        )
+    )
+    stats = manager.repo(timer_service.TimerRepository).get_session_statistics(days=DAYS)
+
+    assert stats["p50_duration"] == pytest.approx(
+        durations[(len(durations) - 1) // 2] if len(durations) % 2 else
+        (durations[len(durations) // 2 - 1] + durations[len(durations) // 2]) / 2
+    )
+    assert stats["min_duration"] <= stats["p50_duration"] <= stats["p90_duration"]
+    assert stats["p90_duration"] <= stats["p95_duration"] <= stats["max_duration"]
+
+
+def test_writes_update_cached_aggregates_without_rescan(manager):
+    repo = manager.repo(timer_service.TimerRepository)
+    _check_timer(manager, repo)
+    _check_analytics(manager)
+    before = aggregates.get_session_aggregate_cache().get_stats()
+
+    session_id = repo.create_session({
+        "task_id": 2, "session_type": "focus", "start_time": datetime.now().isoformat(" "),
+        "focus_rating": 8,
+    })
+    repo.update_session(session_id, {
+        "status": "completed", "end_time": datetime.now(), "duration_minutes": 42,
+        "focus_rating": 9, "interruption_count": 2,
+    })
+    repo.update_session(3, {"status": "completed", "duration_minutes": 17, "focus_rating": 2})
+    repo.delete_session(5)
+    manager.queries.clear()
+
+    _check_timer(manager, repo)
+    _check_analytics(manager)
+    after = aggregates.get_session_aggregate_cache().get_stats()
+    assert (after["builds"] - before["builds"], after["applied"] - before["applied"]) == (0, 4)
+
+
+def test_cache_is_keyed_by_day_boundary(manager):
+    since = aggregates.window_start(7, today=date(2025, 3, 10))
+
+    assert since == "2025-03-03 00:00:00"
+    assert aggregates.session_facts_query("completed", since, 4) == (
+        aggregates.SESSION_FACTS_SQL + " WHERE start_time >= ? AND status = 'completed' AND task_id = ?",
+        [since, 4],
+    )
+
+
+def test_expired_entries_are_rebuilt(manager):
+    cache = aggregates.SessionAggregateCache(max_age_seconds=-1)
+    load_calls = []
+
+    def load(sql, params):
+        load_calls.append(sql)
+        return manager.execute_query(sql, params)
+
+    for _ in range(2):
+        cache.read(manager, aggregates.SCOPE_ALL, DAYS, None, load, lambda agg: agg.statistics())
+
+    assert len(load_calls) == 2
+
+
+def test_owner_identity_is_never_reused():
+    cache = aggregates.SessionAggregateCache()
+    load = lambda sql, params: []
+
+    for _ in range(20):
+        owner = type("Owner", (), {})()  # ids de objetos coletados são reutilizados
+        cache.read(owner, aggregates.SCOPE_ALL, DAYS, None, load, lambda agg: None)
+        del owner
+
+    assert cache.get_stats()["builds"] == 20
+
+
+def test_file_databases_are_keyed_by_path(tmp_path):
+    cache = aggregates.SessionAggregateCache()
+    first = type("Manager", (), {"db_path": str(tmp_path / "a.db")})()
+    second = type("Manager", (), {"db_path": str(tmp_path / "a.db")})()
+
+    cache.read(first, aggregates.SCOPE_ALL, DAYS, None, lambda sql, params: [], lambda agg: None)
+
+    assert cache.tracks(second)
+    assert not cache.tracks(type("Manager", (), {"db_path": str(tmp_path / "b.db")})())
+
+
+def test_build_racing_a_write_is_not_cached(manager):
+    cache = aggregates.SessionAggregateCache()
+    fact = {"task_id": 1, "status": "completed", "start_time": datetime.now().isoformat(" "),
+            "duration_minutes": 30}
+
+    def load_with_concurrent_write(sql, params):
+        rows = manager.execute_query(sql, params)
+        assert cache.tracks(manager)  # escritas durante a carga são aplicadas
+        cache.apply_change(manager, None, fact)
+        return rows
+
+    cache.read(manager, aggregates.SCOPE_ALL, DAYS, None, load_with_concurrent_write, lambda agg: None)
+    cache.read(manager, aggregates.SCOPE_ALL, DAYS, None, manager.execute_query, lambda agg: None)
+
+    stats = cache.get_stats()
+    assert (stats["stale_builds"], stats["builds"], stats["hits"]) == (1, 1, 0)